@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from domain.blog.entities.blog import BlogDomain
 
 
@@ -14,3 +14,6 @@ class BlogRepository:
 
     def list_all(self) -> List[BlogDomain]:
         raise NotImplementedError
+
+    def iter_all(self, chunk_size: int = 500) -> Iterator[BlogDomain]:
+        raise NotImplementedError
@@ -0,0 +1,30 @@
+"""Módulo que implementa o repositório abstrato da busca textual de posts"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from domain.blog.value_objects.resultado_busca_post import ResultadoBuscaPostDomain
+
+
+class BuscaPostsRepository(ABC):
+    """
+    Repositório abstrato da busca textual de posts.
+
+    Métodos:
+        buscar(termos, limite, deslocamento, blog_id): Posts publicados que
+        contêm os termos, do mais para o menos relevante.
+    """
+
+    @abstractmethod
+    def buscar(
+        self,
+        termos: str,
+        limite: int = 20,
+        deslocamento: int = 0,
+        blog_id: Optional[int] = None
+    ) -> List[ResultadoBuscaPostDomain]:
+        """
+        Retorna os posts publicados que contêm os termos, ordenados pela
+        relevância. Os termos aceitam a sintaxe de busca web: "frase exata",
+        OR e -exclusão.
+        """
+        pass
@@ -0,0 +1,27 @@
+"""Módulo que implementa o repositório abstrato do conteúdo renderizado de posts"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
+from domain.blog.value_objects.conteudo_renderizado_post import (
+    ConteudoRenderizadoPostDomain)
+
+
+class ConteudoPostRepository(ABC):
+    """
+    Repositório abstrato do conteúdo renderizado de posts. O conteúdo é
+    renderizado quando o post é salvo; a leitura não reprocessa o HTML.
+
+    Métodos:
+        obter(post_id): Conteúdo renderizado de um post.
+        obter_varios(post_ids): Conteúdo renderizado de vários posts.
+    """
+
+    @abstractmethod
+    def obter(self, post_id: int) -> Optional[ConteudoRenderizadoPostDomain]:
+        """Retorna o conteúdo renderizado do post, ou None se o post não existir."""
+        pass
+
+    @abstractmethod
+    def obter_varios(self, post_ids: Iterable[int]) -> Dict[int, ConteudoRenderizadoPostDomain]:
+        """Retorna o conteúdo renderizado dos posts existentes, por ID."""
+        pass
@@ -0,0 +1,72 @@
+"""Módulo que implementa o repositório abstrato de engajamento agregado"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+from domain.blog.value_objects.engajamento_agregado import EngajamentoAgregadoDomain
+
+
+class EngajamentoAgregadoRepository(ABC):
+    """
+    Repositório abstrato para consultas analíticas de engajamento de posts
+    sobre os agregados por hora e por dia.
+
+    As métricas são 'visualizacoes' e 'compartilhamentos' (dimensão: cidade),
+    'reacoes' (dimensão: tipo de reação) e 'votos' (dimensão: voto). As
+    granularidades são 'hora' e 'dia'.
+
+    Métodos:
+        serie(...): Série temporal de uma métrica.
+        totais_por_dimensao(...): Total de uma métrica por dimensão.
+        totais_por_post(...): Total de uma métrica por post.
+    """
+
+    @abstractmethod
+    def serie(
+        self,
+        metrica: str,
+        granularidade: str,
+        inicio: datetime,
+        fim: datetime,
+        post_id: Optional[int] = None,
+        por_dimensao: bool = False
+    ) -> List[EngajamentoAgregadoDomain]:
+        """
+        Retorna a série temporal de uma métrica no período [inicio, fim),
+        ordenada por intervalo.
+
+        Args:
+            metrica (str): Métrica consultada.
+            granularidade (str): 'hora' ou 'dia'.
+            inicio (datetime): Início do período (inclusivo).
+            fim (datetime): Fim do período (exclusivo).
+            post_id (Optional[int]): Restringe a um post; por padrão, todos.
+            por_dimensao (bool): Separa cada intervalo por dimensão.
+        """
+        pass
+
+    @abstractmethod
+    def totais_por_dimensao(
+        self,
+        metrica: str,
+        inicio: datetime,
+        fim: datetime,
+        post_id: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Retorna o total de uma métrica no período por dimensão."""
+        pass
+
+    @abstractmethod
+    def totais_por_post(
+        self,
+        metrica: str,
+        inicio: datetime,
+        fim: datetime,
+        dimensao: Optional[str] = None,
+        limite: Optional[int] = None
+    ) -> Dict[int, int]:
+        """
+        Retorna o total de uma métrica no período por post, do maior para o
+        menor, limitado aos `limite` primeiros.
+        """
+        pass
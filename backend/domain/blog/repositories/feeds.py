@@ -0,0 +1,32 @@
+"""Módulo que implementa o repositório abstrato dos feeds de posts"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from domain.blog.value_objects.feed_serializado import FeedSerializadoDomain
+
+
+class FeedsRepository(ABC):
+    """
+    Repositório abstrato dos feeds (RSS, Atom e JSON Feed) dos posts de um
+    blog, de uma tag ou de uma categoria.
+
+    Métodos:
+        obter(escopo, escopo_id, formato): Feed serializado.
+        regenerar(escopo, escopo_id): Gera novamente os feeds do escopo.
+    """
+
+    @abstractmethod
+    def obter(self, escopo: str, escopo_id: int, formato: str) -> Optional[FeedSerializadoDomain]:
+        """
+        Retorna o feed serializado do escopo no formato, ou None se o escopo
+        não existir. O feed não é gerado a cada chamada.
+        """
+        pass
+
+    @abstractmethod
+    def regenerar(self, escopo: str, escopo_id: int) -> int:
+        """
+        Gera novamente os feeds do escopo em todos os formatos e retorna a
+        quantidade de feeds cujo conteúdo mudou.
+        """
+        pass
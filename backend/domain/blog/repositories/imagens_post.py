@@ -0,0 +1,33 @@
+"""Módulo que implementa o repositório abstrato das imagens responsivas de posts"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable
+from domain.blog.value_objects.imagem_responsiva import ImagemResponsivaDomain
+
+
+class ImagensPostRepository(ABC):
+    """
+    Repositório abstrato das versões redimensionadas (derivadas) das imagens
+    dos posts.
+
+    Métodos:
+        obter_responsivas(imagem_ids): Imagens com os srcsets das derivadas.
+        gerar_derivadas(imagem_ids): Gera as derivadas das imagens.
+    """
+
+    @abstractmethod
+    def obter_responsivas(self, imagem_ids: Iterable[int]) -> Dict[int, ImagemResponsivaDomain]:
+        """
+        Retorna as imagens, indexadas pelo ID, com os srcsets das derivadas
+        já registradas, sem acessar o storage.
+        """
+        pass
+
+    @abstractmethod
+    def gerar_derivadas(self, imagem_ids: Iterable[int], forcar: bool = False) -> int:
+        """
+        Gera as derivadas das imagens cujo arquivo mudou desde a última
+        geração (ou de todas, com `forcar`), aguardando o término, e retorna
+        a quantidade de imagens processadas.
+        """
+        pass
@@ -0,0 +1,29 @@
+"""Módulo que implementa o repositório abstrato da listagem de posts"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from domain.blog.value_objects.post_listagem import PostListagemDomain
+from domain.shared.value_objects.pagina import Pagina
+
+
+class ListagemPostsRepository(ABC):
+    """
+    Repositório abstrato da listagem de posts dos blogs.
+
+    Métodos:
+        listar(blog_id, status, after, limit): Página dos posts de um blog.
+    """
+
+    @abstractmethod
+    def listar(
+        self,
+        blog_id: int,
+        status: str = 'publicado',
+        after: Optional[str] = None,
+        limit: int = 20
+    ) -> Pagina[PostListagemDomain]:
+        """
+        Retorna uma página dos posts do blog com o status, dos mais recentes
+        para os mais antigos, paginada por chave.
+        """
+        pass
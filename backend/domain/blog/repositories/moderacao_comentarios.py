@@ -0,0 +1,46 @@
+"""Módulo que implementa o repositório abstrato de moderação de comentários"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from domain.blog.value_objects.comentario_moderacao import ComentarioModeracaoDomain
+from domain.shared.value_objects.pagina import Pagina
+
+
+class ModeracaoComentariosRepository(ABC):
+    """
+    Repositório abstrato da moderação de comentários de posts.
+
+    Métodos:
+        fila(status, after, limit, post_id): Página de comentários com o status.
+        alterar_status(ids, status_origem, status_destino): Altera o status de
+        vários comentários de uma vez.
+    """
+
+    @abstractmethod
+    def fila(
+        self,
+        status: str,
+        after: Optional[str] = None,
+        limit: int = 50,
+        post_id: Optional[int] = None
+    ) -> Pagina[ComentarioModeracaoDomain]:
+        """
+        Retorna uma página dos comentários com o status, dos mais antigos
+        para os mais recentes, paginada por chave.
+        """
+        pass
+
+    @abstractmethod
+    def alterar_status(
+        self,
+        ids: Iterable[int],
+        status_origem: Iterable[str],
+        status_destino: str
+    ) -> int:
+        """
+        Altera para `status_destino` os comentários informados que estiverem
+        em um dos `status_origem`, mantendo os contadores de comentários
+        aprovados dos posts na mesma transação. Retorna a quantidade de
+        comentários alterados.
+        """
+        pass
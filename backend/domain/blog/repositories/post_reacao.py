@@ -0,0 +1,39 @@
+"""Módulo que implementa o repositório abstrato de post_reacao"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+
+class PostReacaoRepository(ABC):
+    """
+    Repositório abstrato para manipulação das reações a posts (PostReacao).
+
+    Métodos:
+        post_publicado(post_id: int): Indica se o post existe e está publicado.
+        save(...): Registra uma reação a um post.
+    """
+
+    @abstractmethod
+    def post_publicado(self, post_id: int) -> bool:
+        """Indica se o post existe, não foi excluído e está publicado."""
+        pass
+
+    @abstractmethod
+    def save(
+        self,
+        post_id: int,
+        reacao_tipo: str,
+        ip_origem: Optional[str] = None,
+        data_reacao: Optional[datetime] = None
+    ) -> None:
+        """
+        Registra uma reação a um post.
+
+        Args:
+            post_id (int): ID do post.
+            reacao_tipo (str): Nome do tipo de reação.
+            ip_origem (Optional[str]): IP de origem da reação.
+            data_reacao (Optional[datetime]): Data e hora da reação.
+        """
+        pass
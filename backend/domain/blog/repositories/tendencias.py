@@ -0,0 +1,25 @@
+"""Módulo que implementa o repositório abstrato de tendências"""
+
+from abc import ABC, abstractmethod
+from typing import List
+from domain.blog.value_objects.post_tendencia import PostTendenciaDomain
+
+
+class TendenciasRepository(ABC):
+    """
+    Repositório abstrato dos rankings de posts em alta.
+
+    Métodos:
+        ranking_blog(blog_id, limite): Posts em alta de um blog.
+        ranking_site(site_id, limite): Posts em alta de um site.
+    """
+
+    @abstractmethod
+    def ranking_blog(self, blog_id: int, limite: int = 10) -> List[PostTendenciaDomain]:
+        """Retorna os posts publicados em alta do blog, do maior para o menor."""
+        pass
+
+    @abstractmethod
+    def ranking_site(self, site_id: int, limite: int = 10) -> List[PostTendenciaDomain]:
+        """Retorna os posts publicados em alta do site, do maior para o menor."""
+        pass
@@ -0,0 +1,40 @@
+"""Módulo que implementa o repositório abstrato de visitantes únicos"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, List, Optional
+from domain.shared.utils.hyperloglog import HyperLogLog
+
+
+class VisitantesUnicosRepository(ABC):
+    """
+    Repositório abstrato dos sketches HyperLogLog diários de visitantes
+    únicos de posts.
+
+    Métodos:
+        sketch(...): União dos sketches de um período e de um conjunto de posts.
+        sketches_por_post(...): União dos sketches de um período, por post.
+    """
+
+    @abstractmethod
+    def sketch(
+        self,
+        desde: date,
+        ate: date,
+        post_ids: Optional[List[int]] = None
+    ) -> HyperLogLog:
+        """
+        Retorna a união dos sketches diários de `desde` a `ate` (inclusive)
+        dos posts informados (por padrão, de todos).
+        """
+        pass
+
+    @abstractmethod
+    def sketches_por_post(
+        self,
+        desde: date,
+        ate: date,
+        post_ids: List[int]
+    ) -> Dict[int, HyperLogLog]:
+        """Retorna, por post, a união dos seus sketches diários no período."""
+        pass
@@ -0,0 +1,88 @@
+"""Módulo que implementa o serviço de análise de audiência do blog"""
+
+import calendar
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from domain.blog.repositories.visitantes_unicos import VisitantesUnicosRepository
+from domain.blog.value_objects.estimativa_visitantes import EstimativaVisitantesDomain
+from domain.shared.exceptions.invalid_input_exception import InvalidInputException
+
+
+class AnaliseBlogService:
+    """
+    Serviço de análise de audiência do blog.
+
+    Os visitantes únicos (pessoas físicas autenticadas ou, para visitantes
+    anônimos, IPs) são estimados com HyperLogLog a partir dos sketches
+    diários, com erro padrão relativo de 0,81% (95% das estimativas a menos
+    de 1,6% do valor real). O custo de uma consulta depende apenas da
+    quantidade de dias e posts, não da quantidade de visualizações.
+
+    Atributos:
+        visitantes_repository (VisitantesUnicosRepository): Repositório dos
+        sketches de visitantes únicos.
+    """
+
+    def __init__(self, visitantes_repository: VisitantesUnicosRepository):
+        self.visitantes_repository = visitantes_repository
+
+    def visitantes_unicos(
+        self,
+        desde: date,
+        ate: date,
+        post_ids: Optional[List[int]] = None
+    ) -> EstimativaVisitantesDomain:
+        """
+        Estima os visitantes únicos de um período, contando uma única vez o
+        visitante que viu vários posts ou voltou em vários dias.
+
+        Args:
+            desde (date): Primeiro dia do período.
+            ate (date): Último dia do período (inclusivo).
+            post_ids (Optional[List[int]]): Posts considerados; por padrão,
+            todos.
+
+        Raises:
+            InvalidInputException: Se o período for inválido.
+        """
+        self._validar_periodo(desde, ate)
+        sketch = self.visitantes_repository.sketch(desde, ate, post_ids)
+        return EstimativaVisitantesDomain(sketch.estimar(), sketch.erro_padrao, desde, ate)
+
+    def visitantes_unicos_por_post(
+        self,
+        desde: date,
+        ate: date,
+        post_ids: List[int]
+    ) -> Dict[int, EstimativaVisitantesDomain]:
+        """
+        Estima os visitantes únicos de cada post no período.
+
+        Raises:
+            InvalidInputException: Se o período for inválido.
+        """
+        self._validar_periodo(desde, ate)
+        sketches = self.visitantes_repository.sketches_por_post(desde, ate, post_ids)
+        return {
+            post_id: EstimativaVisitantesDomain(sketch.estimar(), sketch.erro_padrao, desde, ate)
+            for post_id, sketch in sketches.items()
+        }
+
+    def visitantes_unicos_dia(self, post_id: int, dia: date) -> EstimativaVisitantesDomain:
+        """Estima os visitantes únicos do post no dia."""
+        return self.visitantes_unicos(dia, dia, [post_id])
+
+    def visitantes_unicos_semana(self, post_id: int, dia: date) -> EstimativaVisitantesDomain:
+        """Estima os visitantes únicos do post na semana (de segunda a domingo) de `dia`."""
+        inicio = dia - timedelta(days=dia.weekday())
+        return self.visitantes_unicos(inicio, inicio + timedelta(days=6), [post_id])
+
+    def visitantes_unicos_mes(self, post_id: int, ano: int, mes: int) -> EstimativaVisitantesDomain:
+        """Estima os visitantes únicos do post no mês."""
+        ultimo_dia = calendar.monthrange(ano, mes)[1]
+        return self.visitantes_unicos(date(ano, mes, 1), date(ano, mes, ultimo_dia), [post_id])
+
+    @staticmethod
+    def _validar_periodo(desde: date, ate: date) -> None:
+        if desde > ate:
+            raise InvalidInputException("O início do período deve ser anterior ao fim.")
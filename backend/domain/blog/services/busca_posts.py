@@ -0,0 +1,77 @@
+"""Módulo que implementa o serviço de busca textual de posts"""
+
+from typing import List, Optional
+from domain.blog.repositories.busca_posts import BuscaPostsRepository
+from domain.blog.value_objects.resultado_busca_post import ResultadoBuscaPostDomain
+from domain.shared.exceptions.invalid_input_exception import InvalidInputException
+
+TAMANHO_MINIMO_TERMOS = 2
+TAMANHO_MAXIMO_TERMOS = 200
+LIMITE_MAXIMO = 100
+DESLOCAMENTO_MAXIMO = 1000
+
+
+class BuscaPostsService:
+    """
+    Serviço de busca textual de posts.
+
+    A busca usa o índice textual dos posts (título, tags e conteúdo sem HTML,
+    em português e sem acentos), de modo que o custo de uma consulta depende
+    da quantidade de posts que contêm os termos, e não do tamanho do acervo.
+
+    Atributos:
+        busca_repository (BuscaPostsRepository): Repositório da busca textual.
+    """
+
+    def __init__(self, busca_repository: BuscaPostsRepository):
+        self.busca_repository = busca_repository
+
+    def buscar(
+        self,
+        termos: str,
+        limite: int = 20,
+        deslocamento: int = 0,
+        blog_id: Optional[int] = None
+    ) -> List[ResultadoBuscaPostDomain]:
+        """
+        Busca os posts publicados que contêm os termos, do mais para o menos
+        relevante.
+
+        Args:
+            termos (str): Termos buscados ("frase exata", OR e -exclusão são
+            aceitos).
+            limite (int): Quantidade máxima de resultados (1 a LIMITE_MAXIMO).
+            deslocamento (int): Resultados a pular, para paginação (até
+            DESLOCAMENTO_MAXIMO).
+            blog_id (Optional[int]): Restringe a busca a um blog.
+
+        Raises:
+            InvalidInputException: Se os termos, o limite ou o deslocamento
+            forem inválidos.
+        """
+        termos = self.normalizar_termos(termos)
+        if not 1 <= limite <= LIMITE_MAXIMO:
+            raise InvalidInputException(
+                f"O limite da busca deve estar entre 1 e {LIMITE_MAXIMO}."
+            )
+        if not 0 <= deslocamento <= DESLOCAMENTO_MAXIMO:
+            raise InvalidInputException(
+                f"O deslocamento da busca deve estar entre 0 e {DESLOCAMENTO_MAXIMO}."
+            )
+        return self.busca_repository.buscar(termos, limite, deslocamento, blog_id)
+
+    @staticmethod
+    def normalizar_termos(termos: Optional[str]) -> str:
+        """
+        Remove os espaços excedentes dos termos e valida o seu tamanho.
+
+        Raises:
+            InvalidInputException: Se os termos forem curtos ou longos demais.
+        """
+        termos = ' '.join((termos or '').split())
+        if not TAMANHO_MINIMO_TERMOS <= len(termos) <= TAMANHO_MAXIMO_TERMOS:
+            raise InvalidInputException(
+                f"Os termos da busca devem ter entre {TAMANHO_MINIMO_TERMOS} e "
+                f"{TAMANHO_MAXIMO_TERMOS} caracteres."
+            )
+        return termos
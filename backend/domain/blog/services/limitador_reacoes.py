@@ -0,0 +1,56 @@
+"""Módulo que implementa o serviço abstrato de limitação de reações"""
+
+from abc import ABC, abstractmethod
+
+
+class LimitadorReacoes(ABC):
+    """
+    Serviço abstrato que decide se uma reação pode ser registrada, antes de
+    qualquer acesso ao banco de dados.
+
+    Métodos:
+        duplicada(post_id, origem, reacao_tipo): Indica se a reação repete
+        uma reação recente da mesma origem.
+        excede_limite(origem): Indica se a origem excedeu a taxa de reações.
+        liberar(post_id, origem, reacao_tipo): Desfaz o registro de uma
+        reação que não pôde ser gravada.
+    """
+
+    @abstractmethod
+    def duplicada(self, post_id: int, origem: str, reacao_tipo: str) -> bool:
+        """
+        Indica se a mesma origem já reagiu ao post com o mesmo tipo dentro da
+        janela de deduplicação. Uma reação não duplicada é registrada na
+        janela.
+
+        Args:
+            post_id (int): ID do post.
+            origem (str): Identificador da origem (usuário ou IP).
+            reacao_tipo (str): Nome do tipo de reação.
+        """
+        pass
+
+    @abstractmethod
+    def excede_limite(self, origem: str) -> bool:
+        """
+        Indica se a origem excedeu a quantidade de reações permitida na
+        janela de limitação. Uma reação dentro do limite é contabilizada.
+
+        Args:
+            origem (str): Identificador da origem (usuário ou IP).
+        """
+        pass
+
+    @abstractmethod
+    def liberar(self, post_id: int, origem: str, reacao_tipo: str) -> None:
+        """
+        Remove a reação da janela de deduplicação, quando ela foi aceita por
+        `duplicada` mas recusada pelo limite de taxa ou não pôde ser gravada,
+        para que uma nova tentativa não seja tratada como repetida.
+
+        Args:
+            post_id (int): ID do post.
+            origem (str): Identificador da origem (usuário ou IP).
+            reacao_tipo (str): Nome do tipo de reação.
+        """
+        pass
@@ -0,0 +1,106 @@
+"""Módulo que implementa o serviço de moderação de comentários"""
+
+from typing import Iterable, Optional
+from domain.blog.repositories.moderacao_comentarios import ModeracaoComentariosRepository
+from domain.blog.value_objects.comentario_moderacao import (
+    STATUS_AGUARDANDO, STATUS_APROVADO, STATUS_COMENTARIO, STATUS_REJEITADO,
+    ComentarioModeracaoDomain)
+from domain.shared.exceptions.invalid_input_exception import InvalidInputException
+from domain.shared.value_objects.pagina import Pagina
+
+# Status de destino -> status a partir dos quais a transição é permitida.
+TRANSICOES = {
+    STATUS_APROVADO: (STATUS_AGUARDANDO, STATUS_REJEITADO),
+    STATUS_REJEITADO: (STATUS_AGUARDANDO, STATUS_APROVADO),
+    STATUS_AGUARDANDO: (STATUS_APROVADO, STATUS_REJEITADO),
+}
+
+
+class ModeracaoComentariosService:
+    """
+    Serviço de moderação de comentários de posts.
+
+    As transições são aplicadas em massa: cada chamada altera todos os
+    comentários informados com uma única instrução UPDATE, em vez de salvar
+    um comentário por vez, e ajusta os contadores de comentários aprovados
+    dos posts na mesma transação. Comentários que já estiverem no status de
+    destino, ou em um status a partir do qual a transição não é permitida,
+    são ignorados.
+
+    Atributos:
+        moderacao_repository (ModeracaoComentariosRepository): Repositório da
+        moderação de comentários.
+    """
+
+    def __init__(self, moderacao_repository: ModeracaoComentariosRepository):
+        self.moderacao_repository = moderacao_repository
+
+    def fila(
+        self,
+        status: str = STATUS_AGUARDANDO,
+        after: Optional[str] = None,
+        limit: int = 50,
+        post_id: Optional[int] = None
+    ) -> Pagina[ComentarioModeracaoDomain]:
+        """
+        Retorna uma página da fila de moderação, dos comentários mais antigos
+        para os mais recentes.
+
+        Args:
+            status (str): Status dos comentários listados.
+            after (Optional[str]): Cursor retornado pela página anterior.
+            limit (int): Quantidade máxima de comentários da página.
+            post_id (Optional[int]): Restringe a fila a um post.
+
+        Raises:
+            InvalidInputException: Se o status, o cursor ou o limite forem
+            inválidos.
+        """
+        self._validar_status(status)
+        return self.moderacao_repository.fila(status, after, limit, post_id)
+
+    def aprovar(self, ids: Iterable[int]) -> int:
+        """
+        Aprova os comentários aguardando moderação ou rejeitados.
+
+        Returns:
+            int: Quantidade de comentários aprovados.
+        """
+        return self.alterar_status(ids, STATUS_APROVADO)
+
+    def rejeitar(self, ids: Iterable[int]) -> int:
+        """
+        Rejeita os comentários aguardando moderação ou aprovados.
+
+        Returns:
+            int: Quantidade de comentários rejeitados.
+        """
+        return self.alterar_status(ids, STATUS_REJEITADO)
+
+    def alterar_status(self, ids: Iterable[int], status: str) -> int:
+        """
+        Altera o status dos comentários em massa.
+
+        Args:
+            ids (Iterable[int]): IDs dos comentários.
+            status (str): Novo status.
+
+        Returns:
+            int: Quantidade de comentários alterados.
+
+        Raises:
+            InvalidInputException: Se o status for inválido.
+        """
+        self._validar_status(status)
+        ids = list(ids)
+        if not ids:
+            return 0
+        return self.moderacao_repository.alterar_status(ids, TRANSICOES[status], status)
+
+    @staticmethod
+    def _validar_status(status: str) -> None:
+        if status not in STATUS_COMENTARIO:
+            raise InvalidInputException(
+                f"Status de comentário inválido: '{status}'. "
+                f"Use um dos status: {', '.join(STATUS_COMENTARIO)}."
+            )
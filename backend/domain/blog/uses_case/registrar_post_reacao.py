@@ -1,23 +1,39 @@
 
 from domain.blog.repositories.post_reacao import PostReacaoRepository
 from domain.blog.repositories.reacao_tipo import ReacaoTipoRepository
-from infrastructure.models.blog.post import Post
+from domain.blog.services.limitador_reacoes import LimitadorReacoes
+from domain.shared.exceptions.entity_not_found_exception import EntityNotFoundException
+from domain.shared.exceptions.rate_limit_exceeded_exception import (
+                                            RateLimitExceededException)
 from django.utils import timezone
 
 class RegistrarReacaoPostUseCase:
     """
-    Caso de uso para registrar uma reação a um post. Pode ser realizada por 
+    Caso de uso para registrar uma reação a um post. Pode ser realizada por
     um usuário logado ou um visitante não logado.
 
+    A validação do post e do tipo de reação usa os conjuntos cacheados dos
+    repositórios, e reações repetidas ou acima do limite de taxa são
+    recusadas pelo limitador, de modo que somente reações aceitas chegam ao
+    banco de dados. Somente as reações não repetidas consomem o limite de
+    taxa da origem.
+
     Atributos:
-        post_reacao_repository (PostReacaoRepository): Repositório para interagir 
+        post_reacao_repository (PostReacaoRepository): Repositório para interagir
         com o armazenamento de reações de post.
         reacao_tipo_repository (ReacaoTipoRepository): Repositório para buscar tipos de reações.
+        limitador (LimitadorReacoes): Deduplicação e limitação de taxa das reações.
     """
 
-    def __init__(self, post_reacao_repository: PostReacaoRepository, reacao_tipo_repository: ReacaoTipoRepository):
+    def __init__(
+        self,
+        post_reacao_repository: PostReacaoRepository,
+        reacao_tipo_repository: ReacaoTipoRepository,
+        limitador: LimitadorReacoes
+    ):
         self.post_reacao_repository = post_reacao_repository
         self.reacao_tipo_repository = reacao_tipo_repository
+        self.limitador = limitador
 
     def execute(self, post_id: int, reacao_tipo_id: int, request) -> str:
         """
@@ -29,28 +45,42 @@ class RegistrarReacaoPostUseCase:
             request (HttpRequest): A requisição HTTP, usada para capturar o IP do usuário.
 
         Retorna:
-            str: Mensagem indicando o sucesso do registro da reação.
+            str: Mensagem indicando o sucesso do registro da reação ou que ela
+            já havia sido registrada.
+
+        Raises:
+            EntityNotFoundException: Se o post não estiver publicado ou o tipo
+            de reação não existir.
+            RateLimitExceededException: Se a origem exceder o limite de reações.
         """
         # Captura o IP do usuário (para não logados)
         ip_origem = request.META.get('REMOTE_ADDR', '0.0.0.0')
 
-        # Se o usuário estiver logado, pega a referência de pessoa física (opcional)
-        usuario_logado = None
+        # Usuários logados são identificados pela conta; visitantes, pelo IP
         if request.user.is_authenticated:
-            usuario_logado = request.user.pessoa_fisica  # Ajustar de acordo com sua estrutura de usuário
+            origem = f'usuario:{request.user.pk}'
+        else:
+            origem = f'ip:{ip_origem}'
 
-        # Buscar o post
-        post = Post.objects.get(id=post_id)
-
-        # Buscar o tipo de reação
+        # Validação sem consultas, sobre os conjuntos cacheados
+        if not self.post_reacao_repository.post_publicado(post_id):
+            raise EntityNotFoundException(f"Post {post_id} não encontrado.")
         reacao_tipo = self.reacao_tipo_repository.get_by_id(reacao_tipo_id)
+        if reacao_tipo is None:
+            raise EntityNotFoundException(f"Tipo de reação {reacao_tipo_id} não encontrado.")
+
+        if self.limitador.duplicada(post_id, origem, reacao_tipo.nome):
+            return "Reação já registrada"
+        if self.limitador.excede_limite(origem):
+            # A reação recusada não deve ser tratada como repetida depois
+            self.limitador.liberar(post_id, origem, reacao_tipo.nome)
+            raise RateLimitExceededException("Limite de reações excedido. Tente novamente mais tarde.")
 
         # Registrar a reação no post
         self.post_reacao_repository.save(
-            post=post,
-            reacao_tipo=reacao_tipo,
+            post_id=post_id,
+            reacao_tipo=reacao_tipo.nome,
             ip_origem=ip_origem,
-            pessoa_fisica=usuario_logado,  # Será None para não logados
             data_reacao=timezone.now()
         )
 
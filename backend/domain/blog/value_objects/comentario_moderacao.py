@@ -0,0 +1,32 @@
+"""Módulo implementa o objeto de valor comentario_moderacao"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+STATUS_AGUARDANDO = 'aguardando'
+STATUS_APROVADO = 'aprovado'
+STATUS_REJEITADO = 'rejeitado'
+
+STATUS_COMENTARIO = (STATUS_AGUARDANDO, STATUS_APROVADO, STATUS_REJEITADO)
+
+
+@dataclass(frozen=True)
+class ComentarioModeracaoDomain:
+    """
+    Objeto de valor que representa um comentário na fila de moderação.
+
+    Atributos:
+        id (int): O identificador do comentário.
+        post_id (int): O identificador do post comentado.
+        comentario (str): O texto do comentário.
+        data_comentario (datetime): Data e hora do comentário.
+        status (str): Situação de moderação do comentário.
+        ip_origem (Optional[str]): IP de origem do comentário.
+    """
+    id: int
+    post_id: int
+    comentario: str
+    data_comentario: datetime
+    status: str
+    ip_origem: Optional[str] = None
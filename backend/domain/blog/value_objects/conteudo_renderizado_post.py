@@ -0,0 +1,24 @@
+"""Módulo implementa o objeto de valor conteudo_renderizado_post"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ConteudoRenderizadoPostDomain:
+    """
+    Objeto de valor que representa o conteúdo de um post já renderizado.
+
+    Atributos:
+        post_id (int): O identificador do post.
+        html (str): O HTML final (sanitizado) do conteúdo.
+        resumo (str): As primeiras palavras do conteúdo, em texto simples.
+        texto (str): O conteúdo em texto simples.
+        numero_palavras (int): A quantidade de palavras do conteúdo.
+        tempo_leitura (int): O tempo estimado de leitura, em minutos.
+    """
+    post_id: int
+    html: str
+    resumo: str
+    texto: str
+    numero_palavras: int
+    tempo_leitura: int
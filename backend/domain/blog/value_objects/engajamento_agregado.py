@@ -0,0 +1,25 @@
+"""Módulo implementa o objeto de valor engajamento_agregado"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class EngajamentoAgregadoDomain:
+    """
+    Objeto de valor que representa a quantidade de eventos de engajamento
+    (visualizações, reações, votos ou compartilhamentos) em um intervalo de
+    tempo.
+
+    Atributos:
+        inicio (datetime): Início do intervalo (hora ou dia).
+        total (int): Quantidade de eventos no intervalo.
+        dimensao (Optional[str]): Cidade, tipo de reação ou voto, quando a
+        consulta é separada por dimensão.
+        post_id (Optional[int]): Post, quando a consulta é separada por post.
+    """
+    inicio: datetime
+    total: int
+    dimensao: Optional[str] = None
+    post_id: Optional[int] = None
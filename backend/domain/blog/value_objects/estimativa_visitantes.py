@@ -0,0 +1,32 @@
+"""Módulo implementa o objeto de valor estimativa_visitantes"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Tuple
+
+# Quantil da normal padrão para o intervalo de 95% de confiança.
+Z_95 = 1.96
+
+
+@dataclass(frozen=True)
+class EstimativaVisitantesDomain:
+    """
+    Objeto de valor que representa a estimativa (HyperLogLog) da quantidade
+    de visitantes únicos em um período.
+
+    Atributos:
+        valor (int): Visitantes únicos estimados.
+        erro_padrao (float): Erro padrão relativo da estimativa (ex.: 0.0081).
+        desde (date): Primeiro dia do período.
+        ate (date): Último dia do período (inclusivo).
+    """
+    valor: int
+    erro_padrao: float
+    desde: date
+    ate: date
+
+    @property
+    def intervalo_confianca(self) -> Tuple[int, int]:
+        """Intervalo que contém o valor real com cerca de 95% de confiança."""
+        margem = self.valor * self.erro_padrao * Z_95
+        return max(0, int(self.valor - margem)), int(round(self.valor + margem))
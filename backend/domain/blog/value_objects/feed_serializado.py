@@ -0,0 +1,22 @@
+"""Módulo implementa o objeto de valor feed_serializado"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class FeedSerializadoDomain:
+    """
+    Objeto de valor que representa um feed já serializado.
+
+    Atributos:
+        formato (str): O formato do feed ('rss', 'atom' ou 'json').
+        conteudo (bytes): O conteúdo serializado do feed.
+        etag (str): O hash do conteúdo, usado como ETag.
+        ultima_modificacao (datetime): Data e hora da última alteração do
+        conteúdo.
+    """
+    formato: str
+    conteudo: bytes
+    etag: str
+    ultima_modificacao: datetime
@@ -0,0 +1,28 @@
+"""Módulo implementa o objeto de valor imagem_responsiva"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class ImagemResponsivaDomain:
+    """
+    Objeto de valor que representa uma imagem de post com as suas versões
+    redimensionadas, pronta para ser exibida com `<picture>`/`srcset`.
+
+    Atributos:
+        imagem_id (int): O ID da imagem.
+        url (str): A URL da imagem original.
+        largura (Optional[int]): A largura da imagem original, em pixels.
+        altura (Optional[int]): A altura da imagem original, em pixels.
+        srcsets (Dict[str, str]): O valor do atributo `srcset` de cada
+        formato ('avif', 'webp' e 'jpeg'), em ordem crescente de largura.
+        fallback (str): A URL da maior derivada JPEG, ou a da original se
+        ainda não houver derivadas.
+    """
+    imagem_id: int
+    url: str
+    largura: Optional[int] = None
+    altura: Optional[int] = None
+    srcsets: Dict[str, str] = field(default_factory=dict)
+    fallback: str = ''
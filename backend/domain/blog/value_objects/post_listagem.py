@@ -0,0 +1,30 @@
+"""Módulo implementa o objeto de valor post_listagem"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class PostListagemDomain:
+    """
+    Objeto de valor que representa um post na listagem de um blog (card),
+    sem o conteúdo.
+
+    Atributos:
+        post_id (int): O identificador do post.
+        titulo (str): O título do post.
+        slug (str): O slug do post.
+        published_date (datetime): Data de publicação do post.
+        resumo (str): As primeiras palavras do conteúdo, em texto simples.
+        tempo_leitura (int): O tempo estimado de leitura, em minutos.
+        autor_id (int): O identificador do autor.
+        autor_nome (str): O nome completo do autor.
+    """
+    post_id: int
+    titulo: str
+    slug: str
+    published_date: datetime
+    resumo: str
+    tempo_leitura: int
+    autor_id: int
+    autor_nome: str
@@ -0,0 +1,17 @@
+"""Módulo implementa o objeto de valor post_tendencia"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PostTendenciaDomain:
+    """
+    Objeto de valor que representa um post no ranking de tendências.
+
+    Atributos:
+        post_id (int): O identificador do post.
+        pontuacao (float): Soma dos pesos dos eventos de engajamento do post,
+        com decaimento exponencial, no instante da consulta.
+    """
+    post_id: int
+    pontuacao: float
@@ -0,0 +1,25 @@
+"""Módulo implementa o objeto de valor resultado_busca_post"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ResultadoBuscaPostDomain:
+    """
+    Objeto de valor que representa um post encontrado pela busca textual.
+
+    Atributos:
+        post_id (int): O identificador do post.
+        titulo (str): O título do post.
+        slug (str): O slug do post.
+        published_date (datetime): Data de publicação do post.
+        relevancia (float): Relevância do post para os termos buscados; os
+        termos no título pesam mais que nas tags, e estas mais que no
+        conteúdo.
+    """
+    post_id: int
+    titulo: str
+    slug: str
+    published_date: datetime
+    relevancia: float
@@ -0,0 +1,283 @@
+"""
+Módulo responsável pelo serviço de importação em lote de pessoas jurídicas.
+
+O serviço recebe as linhas de um arquivo CSV de CNPJs (por exemplo, os dados
+abertos da Receita Federal já consolidados em um único arquivo), valida cada
+lote, associa as atividades econômicas pelo código CNAE e grava o lote com uma
+única operação em massa no repositório. Linhas inválidas são rejeitadas
+individualmente, sem interromper a carga.
+
+Classes:
+    RegistroImportacaoCNPJ: Linha validada e pronta para persistência.
+    ResumoImportacao: Totais e vazão da importação.
+    ImportarPessoasJuridicasService: Orquestra leitura, validação e gravação.
+
+Funções:
+    ler_csv: Lê um arquivo CSV linha a linha, sem carregá-lo em memória.
+"""
+import csv
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from django.core.exceptions import ValidationError
+from domain.shared.validations.valida_cnpj import formatar_cnpj
+from domain.shared.validations.valida_documentos_lote import validar_cnpjs
+from domain.shared.validations.valida_ie import validar_inscricao_estadual
+
+# Colunas esperadas no cabeçalho do CSV.
+COLUNA_CNPJ = 'cnpj'
+COLUNA_RAZAO_SOCIAL = 'razao_social'
+COLUNA_NOME_FANTASIA = 'nome_fantasia'
+COLUNA_INSCRICAO_ESTADUAL = 'inscricao_estadual'
+COLUNA_CNAE_PRINCIPAL = 'cnae_principal'
+COLUNA_CNAES_SECUNDARIOS = 'cnaes_secundarios'
+
+# Valores de inscrição estadual que indicam ausência de inscrição.
+INSCRICAO_ESTADUAL_ISENTA = {'', 'ISENTO', 'ISENTA'}
+
+TAMANHO_MAXIMO_RAZAO_SOCIAL = 255
+
+
+@dataclass(frozen=True)
+class RegistroImportacaoCNPJ:
+    """
+    Linha do arquivo já validada e normalizada.
+
+    Atributos:
+        linha (int): Número da linha no arquivo de origem.
+        cnpj (str): CNPJ no formato armazenado (00.000.000/0000-00).
+        razao_social (str): Razão social da empresa.
+        nome_fantasia (str): Nome fantasia; usa a razão social se ausente.
+        inscricao_estadual (Optional[str]): Inscrição estadual, se houver.
+        atividades_ids (Tuple[int, ...]): IDs das atividades econômicas
+        encontradas para os códigos CNAE da linha.
+    """
+    linha: int
+    cnpj: str
+    razao_social: str
+    nome_fantasia: str
+    inscricao_estadual: Optional[str]
+    atividades_ids: Tuple[int, ...] = ()
+
+
+@dataclass
+class ResumoImportacao:
+    """
+    Totais acumulados da importação.
+
+    Atributos:
+        lidas (int): Linhas lidas do arquivo.
+        importadas (int): Linhas gravadas (criadas ou atualizadas).
+        rejeitadas (int): Linhas rejeitadas por validação ou erro de gravação.
+        cnaes_desconhecidos (int): Códigos CNAE sem atividade cadastrada.
+        inicio (float): Instante de início, em segundos monotônicos.
+    """
+    lidas: int = 0
+    importadas: int = 0
+    rejeitadas: int = 0
+    cnaes_desconhecidos: int = 0
+    inicio: float = field(default_factory=time.monotonic)
+
+    @property
+    def segundos(self) -> float:
+        """Tempo decorrido desde o início da importação."""
+        return time.monotonic() - self.inicio
+
+    @property
+    def linhas_por_segundo(self) -> float:
+        """Vazão média de linhas processadas por segundo."""
+        return self.lidas / self.segundos if self.segundos else 0.0
+
+
+def ler_csv(
+    caminho: str, delimitador: str = ';', encoding: str = 'utf-8'
+) -> Iterator[Dict[str, str]]:
+    """
+    Lê um arquivo CSV com cabeçalho, entregando uma linha por vez.
+
+    Args:
+        caminho (str): Caminho do arquivo.
+        delimitador (str): Separador de colunas.
+        encoding (str): Codificação do arquivo (a Receita usa 'latin-1').
+
+    Yields:
+        Dict[str, str]: Linha com os nomes de coluna em minúsculas.
+    """
+    with open(caminho, newline='', encoding=encoding) as arquivo:
+        leitor = csv.DictReader(arquivo, delimiter=delimitador)
+        leitor.fieldnames = [nome.strip().lower() for nome in leitor.fieldnames or []]
+        yield from leitor
+
+
+def _somente_digitos(valor: Optional[str]) -> str:
+    return re.sub(r'\D', '', valor or '')
+
+
+class ImportarPessoasJuridicasService:
+    """
+    Serviço de importação em lote de pessoas jurídicas.
+
+    A carga é feita em lotes de `tamanho_lote` linhas: cada lote é validado
+    em memória e gravado com uma única chamada a
+    `pessoa_juridica_repository.importar_lote`. Se a gravação do lote falhar,
+    as linhas são regravadas uma a uma para isolar e rejeitar apenas as
+    problemáticas.
+    """
+
+    def __init__(
+        self,
+        pessoa_juridica_repository,
+        atividade_economica_repository,
+        tamanho_lote: int = 5000
+    ):
+        self.pessoa_juridica_repository = pessoa_juridica_repository
+        self.atividade_economica_repository = atividade_economica_repository
+        self.tamanho_lote = tamanho_lote
+
+    def executar(
+        self,
+        linhas: Iterable[Dict[str, str]],
+        iniciador_id: int,
+        ao_rejeitar: Optional[Callable[[int, Dict[str, str], str], None]] = None,
+        ao_concluir_lote: Optional[Callable[[ResumoImportacao], None]] = None
+    ) -> ResumoImportacao:
+        """
+        Executa a importação.
+
+        Args:
+            linhas (Iterable[Dict[str, str]]): Linhas do CSV, lidas sob demanda.
+            iniciador_id (int): Pessoa física registrada como iniciadora e
+            administradora das empresas importadas.
+            ao_rejeitar (Optional[Callable]): Chamado com o número da linha,
+            a linha original e o motivo de cada rejeição.
+            ao_concluir_lote (Optional[Callable]): Chamado com o resumo parcial
+            ao final de cada lote.
+
+        Returns:
+            ResumoImportacao: Totais da importação.
+        """
+        resumo = ResumoImportacao()
+        atividades_por_cnae = self.atividade_economica_repository.mapa_por_codigo()
+        cnpjs_vistos = set()
+        lote: List[Tuple[int, Dict[str, str]]] = []
+
+        def rejeitar(numero: int, linha: Dict[str, str], motivo: str) -> None:
+            resumo.rejeitadas += 1
+            if ao_rejeitar:
+                ao_rejeitar(numero, linha, motivo)
+
+        # A linha 1 é o cabeçalho
+        for numero, linha in enumerate(linhas, start=2):
+            resumo.lidas += 1
+            lote.append((numero, linha))
+            if len(lote) >= self.tamanho_lote:
+                self._processar_lote(
+                    lote, iniciador_id, atividades_por_cnae, cnpjs_vistos, resumo, rejeitar
+                )
+                lote = []
+                if ao_concluir_lote:
+                    ao_concluir_lote(resumo)
+
+        if lote:
+            self._processar_lote(
+                lote, iniciador_id, atividades_por_cnae, cnpjs_vistos, resumo, rejeitar
+            )
+            if ao_concluir_lote:
+                ao_concluir_lote(resumo)
+
+        return resumo
+
+    def _processar_lote(
+        self, lote, iniciador_id, atividades_por_cnae, cnpjs_vistos, resumo, rejeitar
+    ) -> None:
+        """Valida e grava um lote, isolando as linhas com erro de gravação."""
+        registros: List[RegistroImportacaoCNPJ] = []
+        linhas_por_numero = {}
+        validacao_cnpjs = validar_cnpjs(linha.get(COLUNA_CNPJ) for _, linha in lote)
+        for (numero, linha), motivo_cnpj in zip(lote, validacao_cnpjs.motivos):
+            if motivo_cnpj:
+                rejeitar(numero, linha, motivo_cnpj)
+                continue
+            try:
+                registro = self._validar_linha(numero, linha, atividades_por_cnae, resumo)
+            except ValueError as exc:
+                rejeitar(numero, linha, str(exc))
+                continue
+            if registro.cnpj in cnpjs_vistos:
+                rejeitar(numero, linha, "CNPJ duplicado no arquivo.")
+                continue
+            cnpjs_vistos.add(registro.cnpj)
+            registros.append(registro)
+            linhas_por_numero[numero] = linha
+
+        if not registros:
+            return
+
+        try:
+            resumo.importadas += self.pessoa_juridica_repository.importar_lote(
+                registros, iniciador_id
+            )
+        except Exception:  # pylint: disable=broad-except
+            # Regrava individualmente para rejeitar apenas as linhas com erro
+            for registro in registros:
+                try:
+                    resumo.importadas += self.pessoa_juridica_repository.importar_lote(
+                        [registro], iniciador_id
+                    )
+                except Exception as exc:  # pylint: disable=broad-except
+                    rejeitar(registro.linha, linhas_por_numero[registro.linha], str(exc))
+
+    def _validar_linha(
+        self,
+        numero: int,
+        linha: Dict[str, str],
+        atividades_por_cnae: Dict[str, int],
+        resumo: ResumoImportacao
+    ) -> RegistroImportacaoCNPJ:
+        """
+        Valida e normaliza uma linha do arquivo. O CNPJ já foi validado em
+        lote por `_processar_lote` e é normalizado para o formato armazenado,
+        usado pelo conflito de unicidade na gravação.
+
+        Raises:
+            ValueError: Com o motivo da rejeição, se a linha for inválida.
+        """
+        cnpj = formatar_cnpj(_somente_digitos(linha.get(COLUNA_CNPJ)))
+
+        razao_social = (linha.get(COLUNA_RAZAO_SOCIAL) or '').strip()
+        if not razao_social:
+            raise ValueError("A razão social não pode ser vazia.")
+        if len(razao_social) > TAMANHO_MAXIMO_RAZAO_SOCIAL:
+            raise ValueError(
+                f"A razão social excede {TAMANHO_MAXIMO_RAZAO_SOCIAL} caracteres."
+            )
+
+        inscricao_estadual = (linha.get(COLUNA_INSCRICAO_ESTADUAL) or '').strip()
+        if inscricao_estadual.upper() in INSCRICAO_ESTADUAL_ISENTA:
+            inscricao_estadual = None
+        else:
+            try:
+                validar_inscricao_estadual(inscricao_estadual)
+            except ValidationError as exc:
+                raise ValueError(' '.join(exc.messages)) from exc
+            inscricao_estadual = _somente_digitos(inscricao_estadual)
+
+        codigos = [linha.get(COLUNA_CNAE_PRINCIPAL) or '']
+        codigos += (linha.get(COLUNA_CNAES_SECUNDARIOS) or '').split(',')
+        atividades_ids = []
+        for codigo in filter(None, map(_somente_digitos, codigos)):
+            atividade_id = atividades_por_cnae.get(codigo)
+            if atividade_id is None:
+                resumo.cnaes_desconhecidos += 1
+            elif atividade_id not in atividades_ids:
+                atividades_ids.append(atividade_id)
+
+        return RegistroImportacaoCNPJ(
+            linha=numero,
+            cnpj=cnpj,
+            razao_social=razao_social,
+            nome_fantasia=(linha.get(COLUNA_NOME_FANTASIA) or '').strip() or razao_social,
+            inscricao_estadual=inscricao_estadual,
+            atividades_ids=tuple(atividades_ids),
+        )
@@ -20,7 +20,7 @@ Classes:
   lógica e os dados de uma pessoa jurídica.
 """
 from typing import Optional, List
-from domain.shared.validations.valida_cnpj import validar_cnpj
+from domain.shared.validations.valida_cnpj import formatar_cnpj, validar_cnpj
 from domain.shared.exceptions.invalid_input_exception import (
                                             InvalidInputException)
 from domain.shared.exceptions.business_rule_violation_exception import (
@@ -134,7 +134,7 @@ class PessoaJuridicaDomain:
     def set_cnpj(self, cnpj: str) -> None:
         if not validar_cnpj(cnpj):
             raise InvalidInputException("O CNPJ informado é inválido.")
-        self._cnpj = cnpj
+        self._cnpj = formatar_cnpj(cnpj)
 
     @property
     def inscricao_estadual(self) -> Optional[str]:
@@ -11,9 +11,10 @@ Classes:
     entidade AtividadeEconomicaDomain.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, List, Optional
 from domain.marketing.entities.atividade_economica import (
                                     AtividadeEconomicaDomain)
+from domain.shared.value_objects.pagina import Pagina
 
 
 class AtividadeEconomicaContract(ABC):
@@ -27,6 +28,7 @@ class AtividadeEconomicaContract(ABC):
 
     Métodos:
         get_by_id: Retorna uma atividade econômica pelo ID.
+        get_by_ids: Retorna várias atividades econômicas pelos IDs.
         list_all: Retorna todas as atividades econômicas cadastradas.
         save: Salva ou atualiza uma atividade econômica.
         delete: Remove uma atividade econômica do repositório pelo ID.
@@ -51,6 +53,23 @@ class AtividadeEconomicaContract(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_by_ids(self, atividade_econ_ids: Iterable[int]) -> List[AtividadeEconomicaDomain]:
+        """
+        Recupera várias entidades AtividadeEconomicaDomain pelos seus IDs.
+
+        Args:
+            atividade_econ_ids (Iterable[int]): Os identificadores das atividades
+            econômicas. IDs inexistentes são ignorados.
+
+        Returns:
+            List[AtividadeEconomicaDomain]: As atividades econômicas encontradas.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado na operação.
+        """
+        pass
+
     @abstractmethod
     def list_all(self) -> List[AtividadeEconomicaDomain]:
         """
@@ -103,3 +122,28 @@ class AtividadeEconomicaContract(ABC):
             a entidade.
         """
         pass
+
+    @abstractmethod
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[AtividadeEconomicaDomain]:
+        """
+        Retorna uma página de atividades econômicas usando paginação por chave
+        (keyset). O custo de cada página independe de sua profundidade e
+        apenas `limit` registros são carregados em memória.
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior, ou
+            None para a primeira página.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Campo de ordenação, prefixado com '-' para ordem
+            decrescente.
+
+        Returns:
+            Pagina[AtividadeEconomicaDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+        """
+        pass
@@ -12,8 +12,9 @@ Classes:
     EnderecoDomain.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterable, List, Optional
 from domain.marketing.entities.endereco import EnderecoDomain
+from domain.shared.value_objects.pagina import Pagina
 
 
 class EnderecoContract(ABC):
@@ -132,3 +133,90 @@ class EnderecoContract(ABC):
             OperationFailedException: Se ocorrer um erro inesperado na operação.
         """
         pass
+
+    @abstractmethod
+    def get_by_ids(self, endereco_ids: Iterable[int]) -> List[EnderecoDomain]:
+        """
+        Recupera, em uma única consulta, os endereços cujos IDs foram
+        informados.
+
+        IDs inexistentes são ignorados, de modo que a lista retornada pode
+        conter menos elementos que a coleção de entrada.
+
+        Args:
+            endereco_ids (Iterable[int]): Os identificadores dos endereços.
+
+        Returns:
+            List[EnderecoDomain]: Lista de endereços encontrados.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado na operação.
+        """
+        pass
+
+    @abstractmethod
+    def list_by_pessoas_fisicas(
+        self, pessoa_fisica_ids: Iterable[int]
+    ) -> Dict[int, List[EnderecoDomain]]:
+        """
+        Retorna, em uma única consulta, os endereços de várias pessoas físicas.
+
+        Args:
+            pessoa_fisica_ids (Iterable[int]): Os identificadores das pessoas
+            físicas.
+
+        Returns:
+            Dict[int, List[EnderecoDomain]]: Dicionário que associa o ID de
+            cada pessoa física à sua lista de endereços. Pessoas sem endereço
+            cadastrado recebem uma lista vazia.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado na operação.
+        """
+        pass
+
+    @abstractmethod
+    def list_by_pessoas_juridicas(
+        self, pessoa_juridica_ids: Iterable[int]
+    ) -> Dict[int, List[EnderecoDomain]]:
+        """
+        Retorna, em uma única consulta, os endereços de várias pessoas jurídicas.
+
+        Args:
+            pessoa_juridica_ids (Iterable[int]): Os identificadores das pessoas
+            jurídicas.
+
+        Returns:
+            Dict[int, List[EnderecoDomain]]: Dicionário que associa o ID de
+            cada pessoa jurídica à sua lista de endereços. Pessoas sem endereço
+            cadastrado recebem uma lista vazia.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado na operação.
+        """
+        pass
+
+    @abstractmethod
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[EnderecoDomain]:
+        """
+        Retorna uma página de endereços usando paginação por chave
+        (keyset). O custo de cada página independe de sua profundidade e
+        apenas `limit` registros são carregados em memória.
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior, ou
+            None para a primeira página.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Campo de ordenação, prefixado com '-' para ordem
+            decrescente.
+
+        Returns:
+            Pagina[EnderecoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+        """
+        pass
@@ -9,6 +9,7 @@ fornecer a lógica específica para a interação com o banco de dados.
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from domain.marketing.entities.pessoa_fisica import PessoaFisicaDomain
+from domain.shared.value_objects.pagina import Pagina
 from infrastructure.repositories.marketing.endereco import EnderecoRepository
 
 
@@ -72,3 +73,15 @@ class PessoaFisicaContract(ABC):
     def remover_usuario_rede_social(self, pessoa_fisica_id: int, rede_social_id: int) -> None:
         """Remove a associação de um nome de usuário de uma rede social."""
         raise NotImplementedError
+
+    @abstractmethod
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[PessoaFisicaDomain]:
+        """
+        Retorna uma página de pessoas físicas usando paginação por chave.
+
+        O custo de cada página independe de sua profundidade e apenas
+        `limit` registros são carregados em memória.
+        """
+        raise NotImplementedError
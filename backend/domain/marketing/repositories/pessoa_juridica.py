@@ -14,6 +14,7 @@ Classes:
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from domain.marketing.entities.pessoa_juridica import PessoaJuridicaDomain
+from domain.shared.value_objects.pagina import Pagina
 
 
 class PessoaJuridicaContract(ABC):
@@ -137,3 +138,28 @@ class PessoaJuridicaContract(ABC):
             rede_social_id (int): O ID da rede social a ser removida.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[PessoaJuridicaDomain]:
+        """
+        Retorna uma página de pessoas jurídicas usando paginação por chave
+        (keyset). O custo de cada página independe de sua profundidade e
+        apenas `limit` registros são carregados em memória.
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior, ou
+            None para a primeira página.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Campo de ordenação, prefixado com '-' para ordem
+            decrescente.
+
+        Returns:
+            Pagina[PessoaJuridicaDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+        """
+        raise NotImplementedError
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from uuid import UUID
 from domain.marketing.entities.produto import ProdutoDomain
+from domain.shared.value_objects.pagina import Pagina
 
 
 class ProdutoContract(ABC):
@@ -58,3 +59,28 @@ class ProdutoContract(ABC):
             List[ProdutoDomain]: Lista de todas as entidades de domínio Produto.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[ProdutoDomain]:
+        """
+        Retorna uma página de produtos usando paginação por chave
+        (keyset). O custo de cada página independe de sua profundidade e
+        apenas `limit` registros são carregados em memória.
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior, ou
+            None para a primeira página.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Campo de ordenação, prefixado com '-' para ordem
+            decrescente.
+
+        Returns:
+            Pagina[ProdutoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+        """
+        raise NotImplementedError
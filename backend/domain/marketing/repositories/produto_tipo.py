@@ -2,6 +2,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from domain.marketing.entities.produto_tipo import TipoProdutoDomain
+from domain.shared.value_objects.pagina import Pagina
 
 
 class TipoProdutoContract(ABC):
@@ -61,3 +62,28 @@ class TipoProdutoContract(ABC):
             List[TipoProdutoDomain]: A lista de tipos de produtos.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[TipoProdutoDomain]:
+        """
+        Retorna uma página de tipos de produtos usando paginação por chave
+        (keyset). O custo de cada página independe de sua profundidade e
+        apenas `limit` registros são carregados em memória.
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior, ou
+            None para a primeira página.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Campo de ordenação, prefixado com '-' para ordem
+            decrescente.
+
+        Returns:
+            Pagina[TipoProdutoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+        """
+        raise NotImplementedError
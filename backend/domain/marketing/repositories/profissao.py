@@ -8,6 +8,7 @@ concreto para gerenciar profissões no sistema.
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from domain.marketing.entities.profissao import ProfissaoDomain
+from domain.shared.value_objects.pagina import Pagina
 
 
 class ProfissaoContract(ABC):
@@ -49,3 +50,28 @@ class ProfissaoContract(ABC):
             List[ProfissaoDomain]: Uma lista com todas as profissões.
         """
         pass
+
+    @abstractmethod
+    def listar_pagina(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[ProfissaoDomain]:
+        """
+        Retorna uma página de profissões usando paginação por chave
+        (keyset). O custo de cada página independe de sua profundidade e
+        apenas `limit` registros são carregados em memória.
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior, ou
+            None para a primeira página.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Campo de ordenação, prefixado com '-' para ordem
+            decrescente.
+
+        Returns:
+            Pagina[ProfissaoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+        """
+        pass
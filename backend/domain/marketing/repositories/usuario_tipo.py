@@ -8,6 +8,7 @@ concreto para gerenciar tipos de usuário no sistema.
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from domain.marketing.entities.usuario_tipo import UsuarioTipoDomain
+from domain.shared.value_objects.pagina import Pagina
 
 
 class UsuarioTipoContract(ABC):
@@ -50,3 +51,27 @@ class UsuarioTipoContract(ABC):
         """
         pass
 
+    @abstractmethod
+    def listar_pagina(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[UsuarioTipoDomain]:
+        """
+        Retorna uma página de tipos de usuário usando paginação por chave
+        (keyset). O custo de cada página independe de sua profundidade e
+        apenas `limit` registros são carregados em memória.
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior, ou
+            None para a primeira página.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Campo de ordenação, prefixado com '-' para ordem
+            decrescente.
+
+        Returns:
+            Pagina[UsuarioTipoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+        """
+        pass
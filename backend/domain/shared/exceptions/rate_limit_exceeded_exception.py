@@ -0,0 +1,5 @@
+# shared/exceptions/rate_limit_exceeded_exception.py
+
+class RateLimitExceededException(Exception):
+    """Exceção lançada quando uma origem excede o limite de requisições permitido."""
+    pass
@@ -52,10 +52,10 @@ class Plugin:
     categoria_id: UUID
     tipo_plugin_id: UUID
     versao: str
+    caminho_arquivo: str
     descricao: Optional[str] = None
     artefato_plugin_id: Optional[UUID] = None
     documentacao: Optional[str] = None
-    caminho_arquivo: str
     permissoes: Optional[List[UUID]] = None
     historico_modificacoes: Optional[List[UUID]] = None
     tags: Optional[List[UUID]] = None
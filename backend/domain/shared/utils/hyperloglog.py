@@ -0,0 +1,186 @@
+"""
+Módulo que implementa o HyperLogLog, estrutura probabilística para estimar a
+quantidade de elementos distintos de um conjunto usando memória fixa.
+
+Cada elemento é resumido por um hash de 64 bits: os `precisao` primeiros bits
+escolhem um dos m = 2^precisao registradores, e o registrador guarda o maior
+número de zeros à esquerda (mais um) já visto no restante do hash. A união de
+dois sketches é o máximo registrador a registrador, de modo que sketches de
+dias ou posts diferentes podem ser combinados sem recontar os elementos.
+
+Limites de erro: o erro padrão relativo da estimativa é 1,04 / sqrt(m). Com a
+precisão padrão (14, m = 16384 registradores de 1 byte) o erro padrão é de
+0,81%: cerca de 68% das estimativas ficam a menos de 0,81% do valor real, 95%
+a menos de 1,6% e 99,7% a menos de 2,4%. A estimativa usa o estimador
+aprimorado de Ertl ("New cardinality estimation algorithms for HyperLogLog
+sketches", 2017), calculado sobre o histograma dos registradores: ele é
+praticamente sem viés em toda a faixa de cardinalidades, sem tabelas
+empíricas de correção (como as do HyperLogLog++) nem a troca entre contagem
+linear e estimativa bruta em 2,5 m, perto da qual o estimador original
+superestima em mais de 2%. Para poucas centenas de elementos a estimativa é
+praticamente exata. A união não acumula erro: o sketch da união é idêntico
+ao que seria obtido inserindo todos os elementos em um único sketch.
+
+Classes:
+    HyperLogLog: Sketch de cardinalidade.
+"""
+import hashlib
+import math
+import zlib
+from typing import Iterable, Optional
+import numpy as np
+
+PRECISAO_PADRAO = 14
+PRECISAO_MINIMA = 11
+PRECISAO_MAXIMA = 16
+
+BITS_HASH = 64
+
+
+def _hash64(valor: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(valor.encode('utf-8'), digest_size=8).digest(), 'big'
+    )
+
+
+def _sigma(x: float) -> float:
+    """Função sigma de Ertl (correção da fração de registradores vazios)."""
+    if x == 1.0:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        z_anterior = z
+        z += x * y
+        y += y
+        if z == z_anterior:
+            return z
+
+
+def _tau(x: float) -> float:
+    """Função tau de Ertl (correção da fração de registradores saturados)."""
+    if x in (0.0, 1.0):
+        return 0.0
+    y, z = 1.0, 1.0 - x
+    while True:
+        x = math.sqrt(x)
+        z_anterior = z
+        y *= 0.5
+        z -= (1.0 - x) ** 2 * y
+        if z == z_anterior:
+            return z / 3
+
+
+class HyperLogLog:
+    """
+    Sketch HyperLogLog de cardinalidade.
+
+    Atributos:
+        precisao (int): Bits do hash usados para escolher o registrador.
+        registradores (np.ndarray): Os m = 2^precisao registradores (uint8).
+    """
+
+    def __init__(self, precisao: int = PRECISAO_PADRAO, registradores: Optional[np.ndarray] = None):
+        """
+        Args:
+            precisao (int): De PRECISAO_MINIMA a PRECISAO_MAXIMA.
+            registradores (Optional[np.ndarray]): Registradores iniciais; por
+            padrão, zerados (conjunto vazio).
+
+        Raises:
+            ValueError: Se a precisão estiver fora do intervalo permitido ou
+            os registradores não corresponderem a ela.
+        """
+        if not PRECISAO_MINIMA <= precisao <= PRECISAO_MAXIMA:
+            raise ValueError(
+                f"Precisão deve estar entre {PRECISAO_MINIMA} e {PRECISAO_MAXIMA}."
+            )
+        self.precisao = precisao
+        if registradores is None:
+            registradores = np.zeros(1 << precisao, dtype=np.uint8)
+        elif registradores.shape != (1 << precisao,):
+            raise ValueError("Quantidade de registradores incompatível com a precisão.")
+        self.registradores = registradores
+
+    @property
+    def m(self) -> int:
+        """Quantidade de registradores."""
+        return 1 << self.precisao
+
+    @property
+    def erro_padrao(self) -> float:
+        """Erro padrão relativo da estimativa (1,04 / sqrt(m))."""
+        return 1.04 / math.sqrt(self.m)
+
+    def adicionar(self, valor: str) -> None:
+        """Adiciona um elemento ao conjunto."""
+        self.adicionar_varios([valor])
+
+    def adicionar_varios(self, valores: Iterable[str]) -> None:
+        """Adiciona vários elementos ao conjunto."""
+        hashes = np.fromiter((_hash64(valor) for valor in valores), dtype=np.uint64)
+        if not hashes.size:
+            return
+        bits_restantes = BITS_HASH - self.precisao
+        indices = (hashes >> np.uint64(bits_restantes)).astype(np.intp)
+        # O restante do hash tem no máximo 53 bits (precisão >= 11), sendo
+        # representado exatamente em float64 para o cálculo do log2
+        restante = hashes & np.uint64((1 << bits_restantes) - 1)
+        posicoes = np.full(hashes.shape, bits_restantes + 1, dtype=np.uint8)
+        nao_nulos = restante > 0
+        posicoes[nao_nulos] = (
+            bits_restantes - np.floor(np.log2(restante[nao_nulos].astype(np.float64)))
+        ).astype(np.uint8)
+        np.maximum.at(self.registradores, indices, posicoes)
+
+    def unir(self, outro: 'HyperLogLog') -> 'HyperLogLog':
+        """
+        Incorpora os elementos de outro sketch de mesma precisão.
+
+        Returns:
+            HyperLogLog: O próprio sketch.
+
+        Raises:
+            ValueError: Se as precisões forem diferentes.
+        """
+        if outro.precisao != self.precisao:
+            raise ValueError("Só é possível unir sketches de mesma precisão.")
+        np.maximum(self.registradores, outro.registradores, out=self.registradores)
+        return self
+
+    @classmethod
+    def uniao(cls, sketches: Iterable['HyperLogLog'], precisao: int = PRECISAO_PADRAO) -> 'HyperLogLog':
+        """Retorna um novo sketch com a união dos sketches informados."""
+        resultado = cls(precisao)
+        for sketch in sketches:
+            resultado.unir(sketch)
+        return resultado
+
+    def estimar(self) -> int:
+        """
+        Retorna a estimativa da quantidade de elementos distintos (estimador
+        aprimorado de Ertl).
+        """
+        m = self.m
+        q = BITS_HASH - self.precisao
+        # Quantidade de registradores com cada valor, de 0 a q + 1
+        contagens = np.bincount(self.registradores, minlength=q + 2)
+        z = m * _tau(1.0 - contagens[q + 1] / m)
+        for valor in range(q, 0, -1):
+            z = 0.5 * (z + contagens[valor])
+        z += m * _sigma(contagens[0] / m)
+        return int(round(m * m / (2 * math.log(2)) / z))
+
+    def serializar(self) -> bytes:
+        """
+        Retorna os registradores compactados (zlib), precedidos da precisão.
+        Sketches de poucos elementos ocupam poucas dezenas de bytes.
+        """
+        return bytes([self.precisao]) + zlib.compress(self.registradores.tobytes())
+
+    @classmethod
+    def desserializar(cls, dados: bytes) -> 'HyperLogLog':
+        """Reconstrói um sketch gerado por `serializar`."""
+        dados = bytes(dados)
+        registradores = np.frombuffer(zlib.decompress(dados[1:]), dtype=np.uint8).copy()
+        return cls(dados[0], registradores)
@@ -1,5 +1,10 @@
 from django.core.exceptions import ValidationError
 
+# Pesos para o primeiro e segundo dígito verificador
+PESOS_PRIMEIRO_DIGITO = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+PESOS_SEGUNDO_DIGITO = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
 def validar_cnpj(cnpj: str) -> bool:
     """
     Valida se o CNPJ fornecido é válido.
@@ -30,15 +35,28 @@ def validar_cnpj(cnpj: str) -> bool:
         resto = soma % 11
         return 0 if resto < 2 else 11 - resto
 
-    # Pesos para o primeiro e segundo dígito verificador
-    pesos_primeiro = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    pesos_segundo = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-
-    primeiro_digito = calcular_digito(cnpj[:12], pesos_primeiro)
-    segundo_digito = calcular_digito(cnpj[:13], pesos_segundo)
+    primeiro_digito = calcular_digito(cnpj[:12], PESOS_PRIMEIRO_DIGITO)
+    segundo_digito = calcular_digito(cnpj[:13], PESOS_SEGUNDO_DIGITO)
 
     # Verifica se os dois dígitos verificadores estão corretos
     if cnpj[-2:] != f"{primeiro_digito}{segundo_digito}":
         raise ValidationError("CNPJ inválido.")
     
     return True
+
+
+def formatar_cnpj(cnpj: str) -> str:
+    """
+    Normaliza o CNPJ para o formato armazenado (00.000.000/0000-00), com ou
+    sem formatação na entrada.
+
+    Args:
+        cnpj (str): O CNPJ, com ou sem separadores.
+
+    Returns:
+        str: O CNPJ formatado, ou o valor original se não tiver 14 dígitos.
+    """
+    digitos = ''.join(filter(str.isdigit, cnpj or ''))
+    if len(digitos) != 14:
+        return cnpj
+    return f"{digitos[:2]}.{digitos[2:5]}.{digitos[5:8]}/{digitos[8:12]}-{digitos[12:]}"
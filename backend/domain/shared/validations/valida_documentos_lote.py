@@ -0,0 +1,144 @@
+"""
+Módulo de validação em lote de CPFs e CNPJs.
+
+As funções deste módulo aplicam as mesmas regras de `validar_cpf` e
+`validar_cnpj`, mas sobre coleções inteiras: os dígitos de todos os documentos
+são convertidos para uma matriz NumPy e os dígitos verificadores são
+calculados com produtos matriciais, sem laços Python por documento. São
+indicadas para importações, deduplicações e ações em massa do admin.
+
+Funções:
+    validar_cpfs(documentos) -> ResultadoValidacaoLote
+    validar_cnpjs(documentos) -> ResultadoValidacaoLote
+"""
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+import numpy as np
+from domain.shared.validations.valida_cnpj import (
+    PESOS_PRIMEIRO_DIGITO, PESOS_SEGUNDO_DIGITO)
+
+# Pesos dos dígitos verificadores, na mesma ordem usada pelas validações
+# unitárias.
+PESOS_CPF_PRIMEIRO = np.arange(10, 1, -1)
+PESOS_CPF_SEGUNDO = np.arange(11, 1, -1)
+PESOS_CNPJ_PRIMEIRO = np.array(PESOS_PRIMEIRO_DIGITO)
+PESOS_CNPJ_SEGUNDO = np.array(PESOS_SEGUNDO_DIGITO)
+
+_NAO_DIGITOS = re.compile(r'[^0-9]')
+
+
+@dataclass(frozen=True)
+class ResultadoValidacaoLote:
+    """
+    Resultado da validação de um lote de documentos.
+
+    Atributos:
+        validos (np.ndarray): Máscara booleana, na ordem de entrada, indicando
+        os documentos válidos.
+        motivos (List[Optional[str]]): Para cada documento, None se válido ou
+        a mesma mensagem que a validação unitária levantaria.
+    """
+    validos: np.ndarray
+    motivos: List[Optional[str]]
+
+    @property
+    def quantidade_invalidos(self) -> int:
+        """Quantidade de documentos inválidos no lote."""
+        return int(len(self.validos) - np.count_nonzero(self.validos))
+
+
+def validar_cpfs(documentos: Iterable[str]) -> ResultadoValidacaoLote:
+    """
+    Valida um lote de CPFs.
+
+    Args:
+        documentos (Iterable[str]): CPFs, com ou sem formatação.
+
+    Returns:
+        ResultadoValidacaoLote: Máscara de válidos e motivos das rejeições,
+        com as mensagens de `validar_cpf`.
+    """
+    digitos, tamanho_ok = _matriz_digitos(documentos, 11)
+    motivos = np.full(len(tamanho_ok), None, dtype=object)
+
+    validos = tamanho_ok.copy()
+    validos[tamanho_ok] = (
+        ~_todos_iguais(digitos)
+        & _confere_digitos(digitos, PESOS_CPF_PRIMEIRO, PESOS_CPF_SEGUNDO)
+    )
+    motivos[~validos] = "CPF inválido."
+
+    return ResultadoValidacaoLote(validos=validos, motivos=motivos.tolist())
+
+
+def validar_cnpjs(documentos: Iterable[str]) -> ResultadoValidacaoLote:
+    """
+    Valida um lote de CNPJs.
+
+    Args:
+        documentos (Iterable[str]): CNPJs, com ou sem formatação.
+
+    Returns:
+        ResultadoValidacaoLote: Máscara de válidos e motivos das rejeições,
+        com as mensagens de `validar_cnpj`.
+    """
+    digitos, tamanho_ok = _matriz_digitos(documentos, 14)
+    motivos = np.full(len(tamanho_ok), None, dtype=object)
+    motivos[~tamanho_ok] = "CNPJ deve ter 14 dígitos."
+
+    validos = tamanho_ok.copy()
+    validos[tamanho_ok] = (
+        ~_todos_iguais(digitos)
+        & _confere_digitos(digitos, PESOS_CNPJ_PRIMEIRO, PESOS_CNPJ_SEGUNDO)
+    )
+    motivos[tamanho_ok & ~validos] = "CNPJ inválido."
+
+    return ResultadoValidacaoLote(validos=validos, motivos=motivos.tolist())
+
+
+def _matriz_digitos(documentos: Iterable[str], tamanho: int):
+    """
+    Remove a formatação dos documentos e monta a matriz de dígitos dos que
+    têm o tamanho esperado.
+
+    Returns:
+        tuple: Matriz (n_validos x tamanho) de dígitos e a máscara, na ordem
+        de entrada, dos documentos com o tamanho esperado.
+    """
+    limpos = [_NAO_DIGITOS.sub('', documento or '') for documento in documentos]
+    tamanho_ok = np.fromiter(
+        (len(documento) == tamanho for documento in limpos),
+        dtype=bool,
+        count=len(limpos),
+    )
+    conteudo = ''.join(
+        documento for documento, ok in zip(limpos, tamanho_ok) if ok
+    ).encode('ascii')
+    digitos = (
+        np.frombuffer(conteudo, dtype=np.uint8).reshape(-1, tamanho).astype(np.int64)
+        - ord('0')
+    )
+    return digitos, tamanho_ok
+
+
+def _todos_iguais(digitos: np.ndarray) -> np.ndarray:
+    """Indica, por linha, se todos os dígitos são iguais (ex.: 111.111.111-11)."""
+    return (digitos == digitos[:, :1]).all(axis=1)
+
+
+def _confere_digitos(
+    digitos: np.ndarray, pesos_primeiro: np.ndarray, pesos_segundo: np.ndarray
+) -> np.ndarray:
+    """Calcula os dois dígitos verificadores e compara com os informados."""
+    primeiro = _digito_verificador(digitos[:, :len(pesos_primeiro)] @ pesos_primeiro)
+    segundo = _digito_verificador(digitos[:, :len(pesos_segundo)] @ pesos_segundo)
+    return (
+        (digitos[:, len(pesos_primeiro)] == primeiro)
+        & (digitos[:, len(pesos_segundo)] == segundo)
+    )
+
+
+def _digito_verificador(soma: np.ndarray) -> np.ndarray:
+    resto = soma % 11
+    return np.where(resto < 2, 0, 11 - resto)
@@ -0,0 +1,27 @@
+"""Módulo implementa o objeto de valor GeolocalizacaoIP"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class GeolocalizacaoIP:
+    """
+    Objeto de valor que representa a localização aproximada de uma faixa de
+    endereços IP, segundo uma base de geolocalização.
+
+    Atributos:
+        latitude (Optional[Decimal]): Latitude aproximada.
+        longitude (Optional[Decimal]): Longitude aproximada.
+        precisao (Optional[Decimal]): Raio de precisão, em quilômetros.
+        cidade (Optional[str]): Cidade.
+        estado (Optional[str]): Estado ou região.
+        pais (Optional[str]): País.
+    """
+    latitude: Optional[Decimal] = None
+    longitude: Optional[Decimal] = None
+    precisao: Optional[Decimal] = None
+    cidade: Optional[str] = None
+    estado: Optional[str] = None
+    pais: Optional[str] = None
@@ -0,0 +1,26 @@
+"""Módulo implementa o objeto de valor Pagina"""
+
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class Pagina(Generic[T]):
+    """
+    Objeto de valor que representa uma página de uma listagem paginada por
+    chave (keyset/seek pagination).
+
+    Atributos:
+        itens (List[T]): Os itens da página, na ordem solicitada.
+        proximo_cursor (Optional[str]): Cursor opaco a ser informado como
+        `after` para obter a próxima página, ou None se esta for a última.
+    """
+    itens: List[T] = field(default_factory=list)
+    proximo_cursor: Optional[str] = None
+
+    @property
+    def tem_proxima(self) -> bool:
+        """Indica se existe uma próxima página."""
+        return self.proximo_cursor is not None
@@ -1,5 +1,8 @@
 from django.contrib import admin
+from domain.blog.services.moderacao_comentarios import ModeracaoComentariosService
 from infrastructure.models.blog.comentario_post import ComentarioPost
+from infrastructure.repositories.blog.moderacao_comentarios import (
+    DjangoModeracaoComentariosRepository)
 
 @admin.register(ComentarioPost)
 class ComentarioPostAdmin(admin.ModelAdmin):
@@ -10,6 +13,8 @@ class ComentarioPostAdmin(admin.ModelAdmin):
     list_filter = ('status', 'data_comentario')
     search_fields = ('comentario', 'post__title')
     readonly_fields = ('data_comentario',)
+    list_select_related = ('post',)
+    actions = ['aprovar_selecionados', 'rejeitar_selecionados']
 
     fieldsets = (
         (None, {
@@ -33,3 +38,23 @@ class ComentarioPostAdmin(admin.ModelAdmin):
         Retorna as opções de status específicas para esta model no admin.
         """
         return ComentarioPost.STATUS_CHOICES
+
+    def aprovar_selecionados(self, request, queryset) -> None:
+        """
+        Ação que aprova os comentários selecionados em massa.
+        """
+        aprovados = self._moderacao().aprovar(queryset.values_list('pk', flat=True))
+        self.message_user(request, f"{aprovados} comentário(s) aprovado(s).")
+    aprovar_selecionados.short_description = "Aprovar comentários selecionados"
+
+    def rejeitar_selecionados(self, request, queryset) -> None:
+        """
+        Ação que rejeita os comentários selecionados em massa.
+        """
+        rejeitados = self._moderacao().rejeitar(queryset.values_list('pk', flat=True))
+        self.message_user(request, f"{rejeitados} comentário(s) rejeitado(s).")
+    rejeitar_selecionados.short_description = "Rejeitar comentários selecionados"
+
+    @staticmethod
+    def _moderacao() -> ModeracaoComentariosService:
+        return ModeracaoComentariosService(DjangoModeracaoComentariosRepository())
@@ -7,10 +7,10 @@ class CompartilhamentoPostAdmin(admin.ModelAdmin):
     Configuração do Django Admin para CompartilhamentoPost.
     Organiza a exibição dos campos em seções no formulário de administração.
     """
-    list_display = ('post', 'pessoa_fisica', 'data_compartilhamento', 'total_compartilhamentos')
+    list_display = ('post', 'pessoa_fisica', 'data_compartilhamento')
     list_filter = ('post', 'data_compartilhamento')
     search_fields = ('post__title', 'pessoa_fisica__primeiro_nome', 'pessoa_fisica__sobrenome')
-    readonly_fields = ('data_compartilhamento', 'total_compartilhamentos')
+    readonly_fields = ('data_compartilhamento',)
 
     fieldsets = (
         ('Informações do Post', {
@@ -19,7 +19,4 @@ class CompartilhamentoPostAdmin(admin.ModelAdmin):
         ('Pessoa Física', {
             'fields': ('pessoa_fisica',)
         }),
-        ('Total de Compartilhamentos', {
-            'fields': ('total_compartilhamentos',)
-        }),
     )
@@ -1,23 +1,39 @@
 from django.contrib import admin
+from infrastructure.models.blog.derivada_imagem_post import DerivadaImagemPost
 from infrastructure.models.blog.imagem_post import ImagemPost
 
+
+class DerivadaImagemPostInline(admin.TabularInline):
+    """ Versões redimensionadas da imagem, geradas automaticamente (somente leitura)"""
+    model = DerivadaImagemPost
+    extra = 0
+    can_delete = False
+    fields = ['formato', 'largura', 'altura', 'tamanho_bytes', 'arquivo', 'data_geracao']
+    readonly_fields = fields
+    ordering = ['formato', 'largura']
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(ImagemPost)
 class ImagemPostAdmin(admin.ModelAdmin):
     """
     Configuração do Django Admin para a model ImagemPost.
     Organiza a visualização em seções para melhor apresentação.
     """
-    list_display = ['nome', 'post', 'data_upload']
+    list_display = ['nome', 'post', 'largura', 'altura', 'data_upload']
     search_fields = ['nome', 'post__title']
     list_filter = ['data_upload', 'post__title']
+    inlines = [DerivadaImagemPostInline]
 
     fieldsets = (
         ('Informações da Imagem', {
-            'fields': ('nome', 'imagem', 'data_upload'),
+            'fields': ('nome', 'imagem', 'largura', 'altura', 'data_upload'),
         }),
         ('Relacionamentos', {
             'fields': ('post',),
         }),
     )
-    
-    readonly_fields = ['data_upload']
+
+    readonly_fields = ['largura', 'altura', 'data_upload']
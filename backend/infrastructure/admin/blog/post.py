@@ -5,12 +5,18 @@ Este módulo define as configurações de exibição e administração
 da model Post no Django Admin. As configurações incluem organização 
 dos campos em seções, filtros para busca e listagem de postagens, 
 além de campos de leitura somente para datas de criação e atualização.
+A busca por título, tags e conteúdo usa a busca textual dos posts, ordenada
+pela relevância.
 
 Classes:
     PostAdmin: Classe que define a configuração do Django Admin para a model Post.
 """
 from django.contrib import admin
+from django.contrib.admin.views.main import ORDER_VAR
+from django.db.models import Q
 from infrastructure.models.blog.post import Post
+from infrastructure.repositories.blog.busca_posts import DjangoBuscaPostsRepository
+
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
@@ -18,17 +24,24 @@ class PostAdmin(admin.ModelAdmin):
     Configuração do admin para Post.
     """
     list_display = ('title', 'slug', 'autor', 'published_date', 'status')
+    list_select_related = ('autor',)
     list_filter = ('status', 'published_date', 'autor')
-    search_fields = ('title', 'slug', 'content', 'autor__first_name', 'autor__last_name')
+    # Título, tags e conteúdo são buscados pela busca textual (get_search_results)
+    search_fields = (
+        'slug', 'autor__pessoa_fisica__first_name', 'autor__pessoa_fisica__last_name'
+    )
     prepopulated_fields = {'slug': ('title',)}
-    readonly_fields = ('published_date',)
+    readonly_fields = ('published_date', 'numero_palavras', 'tempo_leitura')
 
     fieldsets = (
         (None, {
             'fields': ('title', 'slug', 'content', 'autor', 'blog', 'status', 'tags')
         }),
         ('Informações Adicionais', {
-            'fields': ('published_date', 'numero_compartilhamentos', 'compartilhado'),
+            'fields': (
+                'published_date', 'numero_compartilhamentos', 'compartilhado',
+                'numero_palavras', 'tempo_leitura',
+            ),
             'classes': ('collapse',),
         }),
     )
@@ -36,3 +49,23 @@ class PostAdmin(admin.ModelAdmin):
     def get_form(self, request, obj=None, change=False, **kwargs):
         form = super().get_form(request, obj, change, **kwargs)
         return form
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Seleciona os posts que contêm os termos (busca textual) ou cujo slug
+        ou autor correspondem à busca, do mais para o menos relevante, salvo
+        se outra ordenação for escolhida na listagem.
+        """
+        termos = ' '.join(search_term.split())
+        if not termos:
+            return super().get_search_results(request, queryset, search_term)
+        outros, _ = super().get_search_results(
+            request, queryset, search_term
+        )
+        queryset = DjangoBuscaPostsRepository.filtrar(
+            queryset, termos, alternativa=Q(pk__in=outros.values('pk'))
+        )
+        if ORDER_VAR not in request.GET:
+            queryset = queryset.order_by('-relevancia', '-pk')
+        # A subconsulta de pk__in não duplica os posts
+        return queryset, False
@@ -1,6 +1,21 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class InfrastructureConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'backend.infrastructure'
+
+    def ready(self):
+        # pylint: disable=import-outside-toplevel,unused-import
+        import infrastructure.signals.busca_posts  # noqa: F401
+        import infrastructure.signals.conteudo_post  # noqa: F401
+        import infrastructure.signals.engajamento_post  # noqa: F401
+        import infrastructure.signals.feeds  # noqa: F401
+        import infrastructure.signals.imagens_post  # noqa: F401
+        import infrastructure.signals.tendencias  # noqa: F401
+
+        if getattr(settings, 'INSTRUMENTAR_REPOSITORIOS', False):
+            from infrastructure.repositories.shared.instrumentacao import (
+                instrumentar_repositorios)
+            instrumentar_repositorios()
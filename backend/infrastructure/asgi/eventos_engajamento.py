@@ -0,0 +1,290 @@
+"""
+Módulo responsável pelos endpoints assíncronos dos eventos de engajamento.
+
+Visualizações, reações, votos e compartilhamentos são gravações do tipo
+"dispare e esqueça": o cliente não precisa esperar a gravação, nem a
+requisição precisa passar pela pilha de middlewares do Django e do CMS
+(sessão, autenticação, página atual, toolbar, idioma...). A
+AplicacaoEventosEngajamento é uma aplicação ASGI mínima que atende apenas
+esses eventos:
+
+    POST <prefixo>posts/<post_id>/visualizacao
+    POST <prefixo>posts/<post_id>/reacao           {"reacao_tipo_id": 1}
+    POST <prefixo>posts/<post_id>/voto             {"voto": "positivo"}
+    POST <prefixo>posts/<post_id>/compartilhamento
+
+Cada requisição é validada sobre os conjuntos cacheados (post publicado, tipo
+de reação) e pelo limitador de reações, e o evento é apenas enfileirado no
+IngestorBufferizado do seu tipo; a resposta 202 é enviada em seguida. A
+thread de gravação de cada ingestor grava os eventos de todas as requisições
+concorrentes em lotes. A validação e o enfileiramento, que podem acessar o
+cache do Django, rodam no pool de threads (`sync_to_async`), sem bloquear o
+event loop.
+
+Os eventos são atribuídos ao IP do cliente (`scope['client']`; atrás de um
+proxy, o servidor ASGI deve repassar o IP original, ex.: `--proxy-headers`
+do uvicorn). Sem a sessão do Django, a pessoa física autenticada não é
+identificada.
+
+Reações, votos e compartilhamentos passam pelo limitador de reações: a taxa
+é limitada por IP, somando os três tipos, e o evento repetido é descartado
+(uma reação por post, IP e tipo; um voto e um compartilhamento por post e IP,
+dentro da janela de deduplicação). Um evento que não pôde ser enfileirado
+(503) é retirado da janela de deduplicação, para que a nova tentativa do
+cliente seja aceita. As visualizações têm uma taxa por IP própria
+(EVENTOS_VISUALIZACOES_LIMITE_POR_JANELA a cada
+EVENTOS_VISUALIZACOES_JANELA_LIMITE segundos), mais alta que a das reações.
+
+Respostas: 202 (aceito ou evento repetido), 400 (corpo inválido), 404 (rota
+ou post inexistente), 405 (método), 429 (limite de eventos excedido) e 503
+(ingestão saturada).
+
+A aplicação é combinada com a aplicação do Django por
+infrastructure.asgi.roteamento.rotear.
+
+Classes:
+    AplicacaoEventosEngajamento: Aplicação ASGI dos eventos de engajamento.
+"""
+import json
+import logging
+import re
+from typing import Dict, Optional, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from domain.shared.exceptions.entity_not_found_exception import (
+                                            EntityNotFoundException)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.exceptions.rate_limit_exceeded_exception import (
+                                            RateLimitExceededException)
+from infrastructure.repositories.blog.engajamento_post import METRICA_POR_VOTO
+from infrastructure.repositories.blog.eventos_engajamento import (
+    EventosEngajamentoRepository)
+from infrastructure.repositories.blog.limitador_reacoes import (
+    LimitadorReacoesJanelaDeslizante)
+from infrastructure.repositories.blog.post_reacao import DjangoPostReacaoRepository
+from infrastructure.repositories.blog.reacao_tipo import DjangoReacaoTipoRepository
+from infrastructure.repositories.blog.visualizacao_post import (
+    VisualizacaoPostRepository)
+from infrastructure.repositories.shared.limitador_taxa import (
+    LimitadorJanelaDeslizante)
+
+logger = logging.getLogger('ocorrencias')
+
+PREFIXO_PADRAO = '/eventos/'
+
+# Tamanho máximo do corpo de uma requisição de evento, em bytes.
+TAMANHO_MAXIMO_CORPO = 4096
+
+EVENTO_VISUALIZACAO = 'visualizacao'
+EVENTO_REACAO = 'reacao'
+EVENTO_VOTO = 'voto'
+EVENTO_COMPARTILHAMENTO = 'compartilhamento'
+
+_ROTA = re.compile(
+    r'^posts/(?P<post_id>\d+)/'
+    r'(?P<evento>visualizacao|reacao|voto|compartilhamento)/?$'
+)
+
+
+class _CorpoInvalido(Exception):
+    """Corpo da requisição ausente, grande demais ou com JSON inválido."""
+
+
+class AplicacaoEventosEngajamento:
+    """
+    Aplicação ASGI dos endpoints de eventos de engajamento.
+
+    Atributos:
+        prefixo (str): Prefixo dos caminhos atendidos (ex.: '/eventos/').
+    """
+
+    def __init__(self, prefixo: Optional[str] = None):
+        self.prefixo = prefixo or getattr(settings, 'EVENTOS_ASGI_PREFIXO', PREFIXO_PADRAO)
+        self.post_reacao_repository = DjangoPostReacaoRepository()
+        self.reacao_tipo_repository = DjangoReacaoTipoRepository()
+        self.visualizacao_repository = VisualizacaoPostRepository()
+        self.eventos_repository = EventosEngajamentoRepository()
+        self.limitador = LimitadorReacoesJanelaDeslizante.padrao()
+        self.limitador_visualizacoes = LimitadorJanelaDeslizante(
+            'eventos:visualizacoes',
+            limite=getattr(settings, 'EVENTOS_VISUALIZACOES_LIMITE_POR_JANELA', 120),
+            janela=getattr(settings, 'EVENTOS_VISUALIZACOES_JANELA_LIMITE', 60),
+            compartilhado=getattr(settings, 'REACOES_LIMITADOR_COMPARTILHADO', False),
+        )
+
+    async def __call__(self, scope, receive, send):
+        rota = _ROTA.match(scope['path'][len(self.prefixo):])
+        if rota is None:
+            await self._responder(send, scope, 404, {'erro': 'Rota não encontrada.'})
+            return
+        if scope['method'] == 'OPTIONS':
+            await self._responder(send, scope, 204)
+            return
+        if scope['method'] != 'POST':
+            await self._responder(send, scope, 405, {'erro': 'Método não permitido.'})
+            return
+
+        try:
+            dados = await self._ler_corpo(receive)
+        except _CorpoInvalido as e:
+            await self._responder(send, scope, 400, {'erro': str(e)})
+            return
+
+        cliente = scope.get('client')
+        ip_origem = cliente[0] if cliente else None
+        status, corpo = await sync_to_async(self._registrar, thread_sensitive=False)(
+            rota['evento'], int(rota['post_id']), dados, ip_origem
+        )
+        await self._responder(send, scope, status, corpo)
+
+    def _registrar(
+        self,
+        evento: str,
+        post_id: int,
+        dados: Dict[str, object],
+        ip_origem: Optional[str]
+    ) -> Tuple[int, Dict[str, str]]:
+        """Valida e enfileira o evento; retorna o status e o corpo da resposta."""
+        try:
+            if not self.post_reacao_repository.post_publicado(post_id):
+                raise EntityNotFoundException(f"Post {post_id} não encontrado.")
+            localizacao = {'ip_address': ip_origem} if ip_origem else None
+
+            if evento == EVENTO_VISUALIZACAO:
+                if not self.limitador_visualizacoes.permitir(f'ip:{ip_origem}'):
+                    raise RateLimitExceededException(
+                        "Limite de visualizações excedido. Tente novamente mais tarde."
+                    )
+                aceito = self.visualizacao_repository.registrar(post_id, localizacao=localizacao)
+            elif evento == EVENTO_REACAO:
+                chave = self._reacao_tipo(dados)
+                if self._duplicado(post_id, ip_origem, chave):
+                    return 202, {'status': 'Reação já registrada'}
+                aceito = self.eventos_repository.registrar_reacao(post_id, chave, ip_origem)
+            elif evento == EVENTO_VOTO:
+                voto = dados.get('voto')
+                if voto not in METRICA_POR_VOTO:
+                    raise InvalidInputException(
+                        f"Voto inválido. Use um dos valores: {', '.join(METRICA_POR_VOTO)}."
+                    )
+                # Um voto por post e IP, qualquer que seja o valor
+                chave = EVENTO_VOTO
+                if self._duplicado(post_id, ip_origem, chave):
+                    return 202, {'status': 'Voto já registrado'}
+                aceito = self.eventos_repository.registrar_voto(
+                    post_id, voto, localizacao=localizacao
+                )
+            else:
+                chave = EVENTO_COMPARTILHAMENTO
+                if self._duplicado(post_id, ip_origem, chave):
+                    return 202, {'status': 'Compartilhamento já registrado'}
+                aceito = self.eventos_repository.registrar_compartilhamento(
+                    post_id, localizacao=localizacao
+                )
+            if not aceito and evento != EVENTO_VISUALIZACAO:
+                # Nada foi gravado: a nova tentativa não deve ser tratada como repetida
+                self.limitador.liberar(post_id, f'ip:{ip_origem}', chave)
+        except EntityNotFoundException as e:
+            return 404, {'erro': str(e)}
+        except InvalidInputException as e:
+            return 400, {'erro': str(e)}
+        except RateLimitExceededException as e:
+            return 429, {'erro': str(e)}
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Falha ao registrar o evento '%s' do post %s.", evento, post_id)
+            return 500, {'erro': 'Erro ao registrar o evento.'}
+        finally:
+            # As consultas feitas em falta de cache abrem conexões nas
+            # threads do pool, fora do ciclo de requisição do Django
+            close_old_connections()
+
+        if not aceito:
+            return 503, {'erro': 'Serviço sobrecarregado. Tente novamente mais tarde.'}
+        return 202, {'status': 'Evento aceito'}
+
+    def _duplicado(self, post_id: int, ip_origem: Optional[str], chave: str) -> bool:
+        """
+        Aplica o limitador ao evento: indica se o evento repete um evento
+        recente do mesmo IP no post (mesma reação, mesmo voto ou
+        compartilhamento) e, se não repete, levanta
+        RateLimitExceededException se o IP excedeu a taxa de eventos. Eventos
+        repetidos não consomem o limite de taxa.
+        """
+        origem = f'ip:{ip_origem}'
+        if self.limitador.duplicada(post_id, origem, chave):
+            return True
+        if self.limitador.excede_limite(origem):
+            # O evento recusado não deve ser tratado como repetido depois
+            self.limitador.liberar(post_id, origem, chave)
+            raise RateLimitExceededException(
+                "Limite de eventos excedido. Tente novamente mais tarde."
+            )
+        return False
+
+    def _reacao_tipo(self, dados: Dict[str, object]) -> str:
+        reacao_tipo_id = dados.get('reacao_tipo_id')
+        if not isinstance(reacao_tipo_id, int) or isinstance(reacao_tipo_id, bool):
+            raise InvalidInputException("Informe o 'reacao_tipo_id' da reação.")
+        reacao_tipo = self.reacao_tipo_repository.get_by_id(reacao_tipo_id)
+        if reacao_tipo is None:
+            raise EntityNotFoundException(f"Tipo de reação {reacao_tipo_id} não encontrado.")
+        return reacao_tipo.nome
+
+    @staticmethod
+    async def _ler_corpo(receive) -> Dict[str, object]:
+        corpo = b''
+        while True:
+            mensagem = await receive()
+            if mensagem['type'] == 'http.disconnect':
+                raise _CorpoInvalido("Conexão encerrada pelo cliente.")
+            corpo += mensagem.get('body', b'')
+            if len(corpo) > TAMANHO_MAXIMO_CORPO:
+                raise _CorpoInvalido("Corpo da requisição muito grande.")
+            if not mensagem.get('more_body', False):
+                break
+        if not corpo.strip():
+            return {}
+        try:
+            dados = json.loads(corpo)
+        except ValueError as e:
+            raise _CorpoInvalido("Corpo da requisição não é um JSON válido.") from e
+        if not isinstance(dados, dict):
+            raise _CorpoInvalido("O corpo da requisição deve ser um objeto JSON.")
+        return dados
+
+    @staticmethod
+    async def _responder(send, scope, status: int, corpo: Optional[Dict[str, str]] = None):
+        conteudo = json.dumps(corpo).encode() if corpo is not None else b''
+        cabecalhos = [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(conteudo)).encode()),
+            (b'cache-control', b'no-store'),
+        ]
+        cabecalhos.extend(_cabecalhos_cors(scope))
+        await send({'type': 'http.response.start', 'status': status, 'headers': cabecalhos})
+        await send({'type': 'http.response.body', 'body': conteudo})
+
+
+def _cabecalhos_cors(scope):
+    """
+    Cabeçalhos CORS equivalentes aos do django-cors-headers (que não atua
+    nestes endpoints), segundo CORS_ALLOW_ALL_ORIGINS e CORS_ALLOWED_ORIGINS.
+    """
+    origem = dict(scope.get('headers', [])).get(b'origin')
+    if origem is None:
+        return []
+    if getattr(settings, 'CORS_ALLOW_ALL_ORIGINS', False):
+        permitida = b'*'
+    elif origem.decode('latin-1') in getattr(settings, 'CORS_ALLOWED_ORIGINS', []):
+        permitida = origem
+    else:
+        return []
+    return [
+        (b'access-control-allow-origin', permitida),
+        (b'access-control-allow-methods', b'POST, OPTIONS'),
+        (b'access-control-allow-headers', b'content-type'),
+        (b'vary', b'origin'),
+    ]
+
@@ -0,0 +1,127 @@
+"""
+Módulo responsável pelo endpoint assíncrono dos feeds de posts.
+
+    GET <prefixo>blog/<blog_id>.(rss|atom|json)
+    GET <prefixo>tag/<tag_id>.(rss|atom|json)
+    GET <prefixo>categoria/<categoria_id>.(rss|atom|json)
+
+Os feeds já estão serializados (veja DjangoFeedsRepository): a
+AplicacaoFeeds apenas os entrega, fora da pilha de middlewares do Django e
+do CMS, com ETag, Last-Modified e Cache-Control. Requisições condicionais
+(If-None-Match ou If-Modified-Since) de um feed inalterado recebem 304 sem
+corpo. Um feed presente no LRU do processo é atendido no próprio event loop,
+sem acessar o cache do Django nem o banco de dados; em falta, a leitura roda
+no pool de threads (`sync_to_async`).
+
+Respostas: 200, 304, 404 (rota ou escopo inexistente), 405 (método) e 500.
+
+Classes:
+    AplicacaoFeeds: Aplicação ASGI dos feeds.
+"""
+import logging
+import re
+from typing import Dict, Optional, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils.http import http_date, parse_http_date_safe
+from domain.blog.value_objects.feed_serializado import FeedSerializadoDomain
+from infrastructure.repositories.blog.feeds import TIPOS_CONTEUDO, DjangoFeedsRepository
+
+logger = logging.getLogger('ocorrencias')
+
+PREFIXO_PADRAO = '/feeds/'
+
+_ROTA = re.compile(
+    r'^(?P<escopo>blog|tag|categoria)/(?P<escopo_id>\d+)\.(?P<formato>rss|atom|json)$'
+)
+
+
+class AplicacaoFeeds:
+    """
+    Aplicação ASGI dos feeds de posts.
+
+    Atributos:
+        prefixo (str): Prefixo dos caminhos atendidos (ex.: '/feeds/').
+        max_age (int): Validade, em segundos, informada em Cache-Control.
+    """
+
+    def __init__(self, prefixo: Optional[str] = None):
+        self.prefixo = prefixo or getattr(settings, 'FEEDS_ASGI_PREFIXO', PREFIXO_PADRAO)
+        self.max_age = getattr(settings, 'FEEDS_MAX_AGE', 60)
+        self.feeds_repository = DjangoFeedsRepository()
+
+    async def __call__(self, scope, receive, send):
+        rota = _ROTA.match(scope['path'][len(self.prefixo):])
+        if rota is None:
+            await self._responder(send, 404)
+            return
+        if scope['method'] not in ('GET', 'HEAD'):
+            await self._responder(send, 405, [(b'allow', b'GET, HEAD')])
+            return
+
+        chave = (rota['escopo'], int(rota['escopo_id']), rota['formato'])
+        feed = self.feeds_repository.obter_local(*chave)
+        if feed is None:
+            status, feed = await sync_to_async(self._obter, thread_sensitive=False)(*chave)
+            if feed is None:
+                await self._responder(send, status)
+                return
+
+        cabecalhos = [
+            (b'etag', f'"{feed.etag}"'.encode()),
+            (b'last-modified', http_date(feed.ultima_modificacao.timestamp()).encode()),
+            (b'cache-control', f'public, max-age={self.max_age}'.encode()),
+        ]
+        if _nao_modificado(dict(scope.get('headers', [])), feed):
+            await self._responder(send, 304, cabecalhos)
+            return
+        cabecalhos.append((b'content-type', TIPOS_CONTEUDO[feed.formato].encode()))
+        await self._responder(
+            send, 200, cabecalhos, feed.conteudo, enviar_corpo=scope['method'] == 'GET'
+        )
+
+    def _obter(
+        self,
+        escopo: str,
+        escopo_id: int,
+        formato: str
+    ) -> Tuple[int, Optional[FeedSerializadoDomain]]:
+        """Lê (ou gera) o feed; retorna o status de erro, se não houver feed, e o feed."""
+        try:
+            feed = self.feeds_repository.obter(escopo, escopo_id, formato)
+            return (404 if feed is None else 200), feed
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Falha ao obter o feed %s de %s %s.", formato, escopo, escopo_id)
+            return 500, None
+        finally:
+            # As consultas feitas em falta de cache abrem conexões nas
+            # threads do pool, fora do ciclo de requisição do Django
+            close_old_connections()
+
+    @staticmethod
+    async def _responder(send, status: int, cabecalhos=None, conteudo: bytes = b'', enviar_corpo=True):
+        cabecalhos = list(cabecalhos or [])
+        if status != 304:
+            cabecalhos.append((b'content-length', str(len(conteudo)).encode()))
+        await send({'type': 'http.response.start', 'status': status, 'headers': cabecalhos})
+        await send({'type': 'http.response.body', 'body': conteudo if enviar_corpo else b''})
+
+
+def _nao_modificado(cabecalhos: Dict[bytes, bytes], feed: FeedSerializadoDomain) -> bool:
+    """
+    Indica se a cópia do cliente está atualizada. If-None-Match, quando
+    presente, prevalece sobre If-Modified-Since (RFC 9110).
+    """
+    if_none_match = cabecalhos.get(b'if-none-match')
+    if if_none_match is not None:
+        etags = {
+            etag.strip().removeprefix('W/')
+            for etag in if_none_match.decode('latin-1').split(',')
+        }
+        return '*' in etags or f'"{feed.etag}"' in etags
+    if_modified_since = cabecalhos.get(b'if-modified-since')
+    if if_modified_since is not None:
+        instante = parse_http_date_safe(if_modified_since.decode('latin-1'))
+        return instante is not None and int(feed.ultima_modificacao.timestamp()) <= instante
+    return False
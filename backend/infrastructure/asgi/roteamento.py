@@ -0,0 +1,41 @@
+"""
+Módulo responsável pelo roteamento das requisições ASGI entre as aplicações
+leves (eventos de engajamento, feeds) e a aplicação do Django.
+
+Funções:
+    rotear: Combina as aplicações leves com a aplicação do Django.
+"""
+
+
+def rotear(aplicacao_django, *aplicacoes):
+    """
+    Retorna a aplicação ASGI que encaminha as requisições HTTP sob o prefixo
+    de uma das `aplicacoes` (atributo `prefixo`) para ela, e as demais para
+    `aplicacao_django`.
+
+    Também atende o protocolo lifespan, não suportado pela aplicação do
+    Django.
+    """
+    async def aplicacao(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await _lifespan(receive, send)
+            return
+        if scope['type'] == 'http':
+            for aplicacao_leve in aplicacoes:
+                if scope['path'].startswith(aplicacao_leve.prefixo):
+                    await aplicacao_leve(scope, receive, send)
+                    return
+        await aplicacao_django(scope, receive, send)
+    return aplicacao
+
+
+async def _lifespan(receive, send):
+    # Os eventos ainda em memória são gravados pelos próprios ingestores no
+    # encerramento do processo (atexit)
+    while True:
+        mensagem = await receive()
+        if mensagem['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif mensagem['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
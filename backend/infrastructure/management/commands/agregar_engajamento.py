@@ -0,0 +1,32 @@
+"""
+Comando de gerenciamento para somar aos agregados de engajamento de posts os
+eventos registrados desde a última execução.
+
+Deve ser executado periodicamente (cron), por exemplo a cada 5 minutos.
+
+Exemplo:
+    python manage.py agregar_engajamento
+"""
+from django.core.management.base import BaseCommand
+from infrastructure.repositories.blog.engajamento_agregado import (
+    TAMANHO_LOTE_AGREGACAO, DjangoEngajamentoAgregadoRepository)
+
+
+class Command(BaseCommand):
+    """
+    Agrega, por hora e por dia, os eventos de engajamento ainda não agregados.
+    """
+
+    help = 'Agrega os eventos de engajamento de posts registrados desde a última execução.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tamanho-lote', type=int, default=TAMANHO_LOTE_AGREGACAO,
+            help='Quantidade máxima de IDs de eventos por transação.'
+        )
+
+    def handle(self, *args, **options):
+        agregados = DjangoEngajamentoAgregadoRepository().agregar(options['tamanho_lote'])
+        for metrica, quantidade in agregados.items():
+            self.stdout.write(f"{metrica}: {quantidade} eventos agregados.")
+        self.stdout.write(self.style.SUCCESS("Agregação concluída."))
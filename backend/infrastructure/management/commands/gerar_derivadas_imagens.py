@@ -0,0 +1,36 @@
+"""
+Comando de gerenciamento para gerar as versões redimensionadas (derivadas)
+das imagens dos posts enviadas antes da geração automática, ou cuja geração
+falhou. Com --todas, gera novamente as derivadas de todas as imagens (ex.:
+após alterar IMAGENS_POST_LARGURAS ou IMAGENS_POST_FORMATOS).
+
+Exemplo:
+    python manage.py gerar_derivadas_imagens
+    python manage.py gerar_derivadas_imagens --todas
+"""
+from django.core.management.base import BaseCommand
+from infrastructure.repositories.blog.imagens_post import DjangoImagensPostRepository
+
+
+class Command(BaseCommand):
+    """
+    Gera as derivadas das imagens de posts pendentes.
+    """
+
+    help = 'Gera as versões redimensionadas (AVIF/WebP/JPEG) das imagens de posts pendentes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--todas',
+            action='store_true',
+            help='Gera novamente as derivadas de todas as imagens.',
+        )
+
+    def handle(self, *args, **options):
+        repository = DjangoImagensPostRepository()
+        imagem_ids = repository.pendentes(forcar=options['todas'])
+        geradas = repository.gerar_derivadas(imagem_ids, forcar=options['todas'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Derivadas geradas para {geradas} de {len(imagem_ids)} imagens "
+            f"({', '.join(repository.formatos)})."
+        ))
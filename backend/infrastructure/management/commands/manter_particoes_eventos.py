@@ -0,0 +1,65 @@
+"""
+Comando de gerenciamento para manter as partições mensais das tabelas de
+eventos do blog: cria as partições dos próximos meses e aplica a retenção
+configurada em PARTICIONAMENTO_RETENCAO_MESES.
+
+Deve ser executado diariamente (cron).
+
+Exemplo:
+    python manage.py manter_particoes_eventos
+    python manage.py manter_particoes_eventos --meses-futuros 6 --arquivar
+    python manage.py manter_particoes_eventos --no-arquivar
+"""
+import argparse
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from infrastructure.repositories.shared.particionamento import (
+    ESQUEMA_ARQUIVO_PADRAO, TABELAS_PARTICIONADAS, GerenciadorParticoes)
+
+
+class Command(BaseCommand):
+    """
+    Cria as partições futuras e desanexa as partições fora da retenção.
+    """
+
+    help = 'Cria as partições futuras das tabelas de eventos do blog e aplica a retenção.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--meses-futuros', type=int, default=3,
+            help='Quantidade de meses, além do atual, com partições criadas antecipadamente.'
+        )
+        parser.add_argument(
+            '--sem-retencao', action='store_true',
+            help='Apenas cria partições, sem aplicar a retenção.'
+        )
+        parser.add_argument(
+            '--arquivar', action=argparse.BooleanOptionalAction,
+            default=getattr(settings, 'PARTICIONAMENTO_ARQUIVAR', False),
+            help='Arquiva as partições antigas em um esquema separado (--no-arquivar: '
+                 'apaga-as); por padrão, PARTICIONAMENTO_ARQUIVAR.'
+        )
+
+    def handle(self, *args, **options):
+        gerenciador = GerenciadorParticoes()
+        if not gerenciador.suportado:
+            self.stdout.write(self.style.WARNING(
+                "Particionamento disponível apenas no PostgreSQL; nada a fazer."
+            ))
+            return
+
+        retencao = getattr(settings, 'PARTICIONAMENTO_RETENCAO_MESES', {})
+        esquema = getattr(settings, 'PARTICIONAMENTO_ESQUEMA_ARQUIVO', ESQUEMA_ARQUIVO_PADRAO)
+        for tabela in TABELAS_PARTICIONADAS:
+            if not gerenciador.particionada(tabela):
+                self.stdout.write(self.style.WARNING(f"{tabela} não está particionada."))
+                continue
+            for nome in gerenciador.criar_particoes_futuras(tabela, options['meses_futuros']):
+                self.stdout.write(f"Partição {nome} criada.")
+            meses = retencao.get(tabela)
+            if options['sem_retencao'] or meses is None:
+                continue
+            for nome in gerenciador.aplicar_retencao(tabela, meses, options['arquivar'], esquema):
+                acao = f'arquivada em {esquema}' if options['arquivar'] else 'apagada'
+                self.stdout.write(f"Partição {nome} {acao}.")
+        self.stdout.write(self.style.SUCCESS("Manutenção das partições concluída."))
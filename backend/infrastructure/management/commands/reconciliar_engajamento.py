@@ -0,0 +1,49 @@
+"""
+Comando de gerenciamento para reconstruir os contadores de engajamento de
+posts a partir das tabelas de eventos (visualizações, reações, votos e
+compartilhamentos).
+
+Com --compartilhamentos, apenas copia o total do contador de
+compartilhamentos para Post.numero_compartilhamentos, sem ler as tabelas de
+eventos; deve ser agendado com frequência (cron), pois o campo não é
+atualizado a cada compartilhamento.
+
+Exemplo:
+    python manage.py reconciliar_engajamento
+    python manage.py reconciliar_engajamento --post 10 --post 11
+    python manage.py reconciliar_engajamento --compartilhamentos
+"""
+from django.core.management.base import BaseCommand
+from infrastructure.repositories.blog.engajamento_post import (
+    EngajamentoPostRepository)
+
+
+class Command(BaseCommand):
+    """
+    Reconstrói os contadores de engajamento de todos os posts ou dos
+    informados.
+    """
+
+    help = 'Reconstrói os contadores de engajamento de posts a partir dos eventos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--post', type=int, action='append', dest='posts',
+            help='ID de um post a reconciliar (pode ser repetido).'
+        )
+        parser.add_argument(
+            '--compartilhamentos', action='store_true',
+            help='Apenas sincroniza Post.numero_compartilhamentos com os contadores.'
+        )
+
+    def handle(self, *args, **options):
+        if options['compartilhamentos']:
+            atualizados = EngajamentoPostRepository().sincronizar_compartilhamentos()
+            self.stdout.write(self.style.SUCCESS(
+                f"Número de compartilhamentos de {atualizados} posts atualizado."
+            ))
+            return
+        reconciliados = EngajamentoPostRepository().reconciliar(options['posts'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Contadores de {reconciliados} posts reconciliados."
+        ))
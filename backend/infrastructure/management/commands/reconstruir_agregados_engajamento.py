@@ -0,0 +1,42 @@
+"""
+Comando de gerenciamento para recalcular os agregados de engajamento de posts
+a partir das tabelas de eventos (backfill).
+
+Sem período, reconstrói todo o histórico; é o que deve ser executado na
+implantação dos agregados.
+
+Exemplo:
+    python manage.py reconstruir_agregados_engajamento
+    python manage.py reconstruir_agregados_engajamento --desde 2026-01-01 --ate 2026-01-31
+"""
+from datetime import date
+from django.core.management.base import BaseCommand
+from infrastructure.repositories.blog.engajamento_agregado import (
+    DjangoEngajamentoAgregadoRepository)
+
+
+class Command(BaseCommand):
+    """
+    Recalcula os agregados de engajamento de um período ou de todo o
+    histórico.
+    """
+
+    help = 'Recalcula os agregados de engajamento de posts a partir dos eventos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--desde', type=date.fromisoformat,
+            help='Primeiro dia (AAAA-MM-DD); por padrão, o do evento mais antigo.'
+        )
+        parser.add_argument(
+            '--ate', type=date.fromisoformat,
+            help='Último dia (AAAA-MM-DD); por padrão, hoje.'
+        )
+
+    def handle(self, *args, **options):
+        agregados = DjangoEngajamentoAgregadoRepository().reconstruir(
+            options['desde'], options['ate']
+        )
+        for metrica, quantidade in agregados.items():
+            self.stdout.write(f"{metrica}: {quantidade} eventos agregados.")
+        self.stdout.write(self.style.SUCCESS("Reconstrução concluída."))
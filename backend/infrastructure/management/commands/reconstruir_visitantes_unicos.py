@@ -0,0 +1,38 @@
+"""
+Comando de gerenciamento para recalcular, a partir das visualizações, os
+sketches diários de visitantes únicos de posts.
+
+Exemplo:
+    python manage.py reconstruir_visitantes_unicos --desde 2026-01-01 --ate 2026-01-31
+"""
+from datetime import date
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from infrastructure.repositories.blog.visitantes_unicos import (
+    DjangoVisitantesUnicosRepository)
+
+
+class Command(BaseCommand):
+    """
+    Recalcula os sketches de visitantes únicos de um período.
+    """
+
+    help = 'Recalcula os sketches de visitantes únicos de posts a partir das visualizações.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--desde', type=date.fromisoformat, required=True,
+            help='Primeiro dia (AAAA-MM-DD).'
+        )
+        parser.add_argument(
+            '--ate', type=date.fromisoformat,
+            help='Último dia (AAAA-MM-DD); por padrão, hoje.'
+        )
+
+    def handle(self, *args, **options):
+        processadas = DjangoVisitantesUnicosRepository().reconstruir(
+            options['desde'], options['ate'] or timezone.localdate()
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"{processadas} visualizações processadas."
+        ))
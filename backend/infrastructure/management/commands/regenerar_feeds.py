@@ -0,0 +1,24 @@
+"""
+Comando de gerenciamento para gerar novamente os feeds (RSS, Atom e JSON) de
+todos os blogs, tags e categorias (ex.: após alterar as URLs dos feeds ou
+importar posts sem os sinais).
+
+Exemplo:
+    python manage.py regenerar_feeds
+"""
+from django.core.management.base import BaseCommand
+from infrastructure.repositories.blog.feeds import DjangoFeedsRepository
+
+
+class Command(BaseCommand):
+    """
+    Gera novamente os feeds de todos os escopos.
+    """
+
+    help = 'Gera novamente os feeds RSS, Atom e JSON de todos os blogs, tags e categorias.'
+
+    def handle(self, *args, **options):
+        alterados = DjangoFeedsRepository().regenerar_todos()
+        self.stdout.write(self.style.SUCCESS(
+            f"{alterados} feeds alterados."
+        ))
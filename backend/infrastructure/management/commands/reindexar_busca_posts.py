@@ -0,0 +1,24 @@
+"""
+Comando de gerenciamento para recalcular o vetor da busca textual de todos os
+posts (ex.: após alterar a configuração textual ou importar posts sem os
+sinais).
+
+Exemplo:
+    python manage.py reindexar_busca_posts
+"""
+from django.core.management.base import BaseCommand
+from infrastructure.repositories.blog.busca_posts import DjangoBuscaPostsRepository
+
+
+class Command(BaseCommand):
+    """
+    Recalcula o vetor de busca de todos os posts.
+    """
+
+    help = 'Recalcula o vetor da busca textual (título, tags e conteúdo) de todos os posts.'
+
+    def handle(self, *args, **options):
+        atualizados = DjangoBuscaPostsRepository().reindexar()
+        self.stdout.write(self.style.SUCCESS(
+            f"{atualizados} posts reindexados."
+        ))
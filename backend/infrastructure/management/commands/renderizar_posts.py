@@ -0,0 +1,30 @@
+"""
+Comando de gerenciamento para renderizar o conteúdo dos posts cujo conteúdo
+mudou sem passar pelos sinais (ex.: importações) ou após uma nova versão da
+renderização.
+
+Exemplo:
+    python manage.py renderizar_posts --forcar
+"""
+from django.core.management.base import BaseCommand
+from infrastructure.repositories.blog.conteudo_post import DjangoConteudoPostRepository
+
+
+class Command(BaseCommand):
+    """
+    Renderiza o conteúdo dos posts desatualizados.
+    """
+
+    help = 'Renderiza o conteúdo (HTML, resumo, texto e tempo de leitura) dos posts desatualizados.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--forcar', action='store_true',
+            help='Renderiza todos os posts, mesmo os atualizados.'
+        )
+
+    def handle(self, *args, **options):
+        renderizados = DjangoConteudoPostRepository().renderizar_todos(options['forcar'])
+        self.stdout.write(self.style.SUCCESS(
+            f"{renderizados} posts renderizados."
+        ))
@@ -0,0 +1,48 @@
+"""
+Comando de gerenciamento para regravar as visualizações, reações, votos e
+compartilhamentos de posts deixados no spool da ingestão bufferizada por
+processos encerrados abruptamente.
+
+Deve ser executado na inicialização da aplicação e periodicamente (cron).
+Com --mortos, também regrava os segmentos que esgotaram as tentativas de
+gravação (INGESTAO_MAX_TENTATIVAS), após a causa das falhas ser corrigida.
+
+Exemplo:
+    python manage.py reprocessar_spool_visualizacoes --idade-minima 300
+    python manage.py reprocessar_spool_visualizacoes --mortos
+"""
+from django.core.management.base import BaseCommand
+from infrastructure.repositories.blog.eventos_engajamento import (
+    EventosEngajamentoRepository)
+from infrastructure.repositories.blog.visualizacao_post import (
+    VisualizacaoPostRepository)
+
+
+class Command(BaseCommand):
+    """
+    Regrava os segmentos abandonados dos spools de eventos de engajamento.
+    """
+
+    help = 'Regrava os eventos de engajamento de posts pendentes no spool de ingestão.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--idade-minima', type=float, default=300.0,
+            help='Idade mínima, em segundos, dos segmentos considerados abandonados.'
+        )
+        parser.add_argument(
+            '--mortos', action='store_true',
+            help='Também regrava os segmentos da fila de mensagens mortas.'
+        )
+
+    def handle(self, *args, **options):
+        regravadas = VisualizacaoPostRepository().reprocessar_spool(
+            idade_minima=options['idade_minima'], incluir_mortos=options['mortos']
+        )
+        outros = EventosEngajamentoRepository().reprocessar_spool(
+            idade_minima=options['idade_minima'], incluir_mortos=options['mortos']
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"{regravadas} visualizações e {outros} reações, votos e "
+            f"compartilhamentos regravados a partir do spool."
+        ))
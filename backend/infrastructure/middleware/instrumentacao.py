@@ -0,0 +1,66 @@
+"""
+Middleware responsável por expor o custo das chamadas de repositório de cada
+requisição.
+
+Ao final de cada requisição os totais são enviados no cabeçalho
+`X-Repositorios` e registrados no logger 'ocorrencias', junto com os métodos
+mais custosos. Com `INSTRUMENTAR_REPOSITORIOS` desativado o middleware é
+removido da pilha na inicialização.
+
+Classes:
+    InstrumentacaoRepositoriosMiddleware: Coleta e publica os totais da
+    requisição.
+"""
+import logging
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from infrastructure.repositories.shared.instrumentacao import (
+    encerrar_coleta, iniciar_coleta)
+
+logger = logging.getLogger('ocorrencias')
+
+CABECALHO = 'X-Repositorios'
+
+# Quantidade de métodos detalhados na linha de log de cada requisição.
+METODOS_NO_LOG = 5
+
+
+class InstrumentacaoRepositoriosMiddleware:
+    """
+    Publica, por requisição, chamadas, consultas, linhas e tempos dos
+    repositórios.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'INSTRUMENTAR_REPOSITORIOS', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = iniciar_coleta()
+        try:
+            response = self.get_response(request)
+        finally:
+            coleta = encerrar_coleta(token)
+
+        total = coleta.total.como_dict()
+        response[CABECALHO] = '; '.join(f'{chave}={valor}' for chave, valor in total.items())
+
+        if coleta.total.chamadas:
+            metodos = sorted(
+                coleta.por_metodo.items(),
+                key=lambda item: item[1].tempo_total,
+                reverse=True,
+            )[:METODOS_NO_LOG]
+            logger.info(
+                "%s %s repositorios %s | %s",
+                request.method,
+                request.path,
+                total,
+                ', '.join(
+                    f"{metodo}: {estatistica.chamadas}x "
+                    f"{estatistica.consultas}q {estatistica.tempo_total * 1000:.1f}ms"
+                    for metodo, estatistica in metodos
+                ),
+            )
+        return response
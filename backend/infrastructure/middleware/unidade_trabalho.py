@@ -0,0 +1,35 @@
+"""
+Middleware responsável por abrir uma unidade de trabalho por requisição.
+
+Cada requisição recebe uma UnidadeDeTrabalho, ativada no contexto atual, e um
+ContainerRepositorios em `request.repositorios`. A gravação é explícita: o
+caso de uso chama `request.repositorios.unidade_trabalho.concluir(user)`
+quando as alterações devem ser persistidas. Ao final da requisição, as
+alterações não concluídas são descartadas, de modo que mutações acidentais em
+instâncias do mapa de identidade nunca são gravadas.
+
+Classes:
+    UnidadeDeTrabalhoMiddleware: Delimita a unidade de trabalho da requisição.
+"""
+from infrastructure.repositories.container import ContainerRepositorios
+from infrastructure.repositories.shared.unidade_trabalho import (
+    UnidadeDeTrabalho, ativar_unidade_trabalho, desativar_unidade_trabalho)
+
+
+class UnidadeDeTrabalhoMiddleware:
+    """
+    Abre uma unidade de trabalho por requisição e a descarta ao final.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        unidade = UnidadeDeTrabalho()
+        request.repositorios = ContainerRepositorios(unidade)
+        token = ativar_unidade_trabalho(unidade)
+        try:
+            return self.get_response(request)
+        finally:
+            unidade.descartar()
+            desativar_unidade_trabalho(token)
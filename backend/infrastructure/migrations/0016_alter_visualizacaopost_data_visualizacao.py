@@ -0,0 +1,19 @@
+# Generated by Django 5.0.9 on 2026-10-17 10:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0015_categoriaplugin_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='visualizacaopost',
+            name='data_visualizacao',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
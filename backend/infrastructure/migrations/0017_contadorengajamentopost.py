@@ -0,0 +1,47 @@
+# Generated by Django 5.0.9 on 2026-10-17 10:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0016_alter_visualizacaopost_data_visualizacao'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContadorEngajamentoPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metrica', models.CharField(max_length=60)),
+                ('shard', models.PositiveSmallIntegerField(default=0)),
+                ('valor', models.BigIntegerField(default=0)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contadores_engajamento', to='infrastructure.post')),
+            ],
+            options={
+                'verbose_name': 'Contador de Engajamento de Post',
+                'verbose_name_plural': 'Contadores de Engajamento de Posts',
+                'db_table': 'infrastructure_contador_engajamento_post',
+                'constraints': [models.UniqueConstraint(fields=('post', 'metrica', 'shard'), name='contador_engajamento_post_unico')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PostReacao',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reacao_tipo', models.CharField(max_length=20)),
+                ('ip_origem', models.GenericIPAddressField(blank=True, null=True)),
+                ('localizacao', models.CharField(blank=True, max_length=100, null=True)),
+                ('data_reacao', models.DateTimeField(auto_now_add=True)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reacoes', to='infrastructure.post')),
+            ],
+            options={
+                'verbose_name': 'Reação ao Post',
+                'verbose_name_plural': 'Reações aos Posts',
+                'db_table': 'infrastructure_post_reacao',
+                'ordering': ['-data_reacao'],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.0.9 on 2026-10-17 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0017_contadorengajamentopost'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MarcaAgregacaoEngajamento',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fonte', models.CharField(max_length=30, unique=True)),
+                ('ultimo_id', models.BigIntegerField(default=0)),
+                ('atualizado_em', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Marca de Agregação de Engajamento',
+                'verbose_name_plural': 'Marcas de Agregação de Engajamento',
+                'db_table': 'infrastructure_marca_agregacao_engajamento',
+            },
+        ),
+        migrations.CreateModel(
+            name='AgregadoEngajamentoPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularidade', models.CharField(choices=[('hora', 'Hora'), ('dia', 'Dia')], max_length=4)),
+                ('inicio', models.DateTimeField()),
+                ('metrica', models.CharField(max_length=30)),
+                ('dimensao', models.CharField(blank=True, default='', max_length=100)),
+                ('total', models.BigIntegerField(default=0)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='agregados_engajamento', to='infrastructure.post')),
+            ],
+            options={
+                'verbose_name': 'Agregado de Engajamento de Post',
+                'verbose_name_plural': 'Agregados de Engajamento de Posts',
+                'db_table': 'infrastructure_agregado_engajamento_post',
+                'indexes': [models.Index(fields=['granularidade', 'metrica', 'inicio'], name='agregado_engaj_periodo_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'granularidade', 'inicio', 'metrica', 'dimensao'), name='agregado_engajamento_post_unico')],
+            },
+        ),
+    ]
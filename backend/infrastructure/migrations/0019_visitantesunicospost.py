@@ -0,0 +1,30 @@
+# Generated by Django 5.0.9 on 2026-10-17 13:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0018_agregadoengajamentopost_marcaagregacaoengajamento'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VisitantesUnicosPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dia', models.DateField()),
+                ('sketch', models.BinaryField()),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='visitantes_unicos', to='infrastructure.post')),
+            ],
+            options={
+                'verbose_name': 'Visitantes Únicos de Post',
+                'verbose_name_plural': 'Visitantes Únicos de Posts',
+                'db_table': 'infrastructure_visitantes_unicos_post',
+                'indexes': [models.Index(fields=['dia'], name='visitantes_unicos_dia_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'dia'), name='visitantes_unicos_post_unico')],
+            },
+        ),
+    ]
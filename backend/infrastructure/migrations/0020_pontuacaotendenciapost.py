@@ -0,0 +1,31 @@
+# Generated by Django 5.0.9 on 2026-10-17 14:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0019_visitantesunicospost'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PontuacaoTendenciaPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pontuacao', models.FloatField()),
+                ('atualizado_em', models.DateTimeField(auto_now=True)),
+                ('blog', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='infrastructure.blog')),
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='pontuacao_tendencia', to='infrastructure.post')),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='infrastructure.customsite')),
+            ],
+            options={
+                'verbose_name': 'Pontuação de Tendência de Post',
+                'verbose_name_plural': 'Pontuações de Tendência de Posts',
+                'db_table': 'infrastructure_pontuacao_tendencia_post',
+                'indexes': [models.Index(fields=['blog', '-pontuacao'], name='tendencia_blog_idx'), models.Index(fields=['site', '-pontuacao'], name='tendencia_site_idx')],
+            },
+        ),
+    ]
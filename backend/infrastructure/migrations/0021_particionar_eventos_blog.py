@@ -0,0 +1,131 @@
+"""
+Converte as tabelas de eventos do blog em tabelas particionadas por mês
+(particionamento declarativo por intervalo do PostgreSQL), pela data do
+evento.
+
+Para cada tabela, sem copiar os dados:
+
+    1. a tabela atual é renomeada para `<tabela>_legado` (com seus índices);
+    2. é criada a tabela particionada com o nome original, as mesmas colunas,
+    os mesmos índices e chaves estrangeiras, e chave primária (id, data),
+    pois no PostgreSQL a chave primária precisa conter a chave de partição;
+    3. a tabela legada é anexada como a partição dos eventos anteriores ao
+    próximo mês, e são criadas as partições dos meses seguintes e a partição
+    padrão (para eventos fora das partições existentes).
+
+Os IDs continuam vindo de uma sequência, iniciada após o maior ID legado. As
+partições futuras são criadas pelo comando `manter_particoes_eventos`.
+
+Em outros bancos de dados a migração não tem efeito.
+"""
+from datetime import datetime, timezone
+from django.db import migrations
+
+TABELAS = {
+    'infrastructure_visualizacao_post': 'data_visualizacao',
+    'infrastructure_post_reacao': 'data_reacao',
+    'infrastructure_votacao_post': 'data_votacao',
+    'infrastructure_compartilhamento_post': 'data_compartilhamento',
+    'infrastructure_reacao_comentario': 'data_reacao',
+}
+
+MESES_FUTUROS = 3
+
+
+def _proximo_mes(data: datetime) -> datetime:
+    if data.month == 12:
+        return data.replace(year=data.year + 1, month=1)
+    return data.replace(month=data.month + 1)
+
+
+def _particionar(cursor, quote, tabela: str, coluna: str) -> None:
+    legado = f'{tabela}_legado'
+
+    cursor.execute(
+        "SELECT indexname, indexdef FROM pg_indexes "
+        "WHERE schemaname = current_schema() AND tablename = %s",
+        [tabela],
+    )
+    indices = cursor.fetchall()
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype = 'f'",
+        [tabela],
+    )
+    chaves_estrangeiras = cursor.fetchall()
+    cursor.execute(f'SELECT MAX(id), MAX({quote(coluna)}) FROM {quote(tabela)}')
+    maior_id, maior_data = cursor.fetchone()
+
+    # 1. Tabela e índices legados liberam os nomes originais
+    cursor.execute(f'ALTER TABLE {quote(tabela)} RENAME TO {quote(legado)}')
+    for nome, _ in indices:
+        cursor.execute(f'ALTER INDEX {quote(nome)} RENAME TO {quote(nome[:55] + "_legado")}')
+    cursor.execute(f'ALTER TABLE {quote(legado)} ALTER COLUMN id DROP IDENTITY IF EXISTS')
+    cursor.execute(f'ALTER TABLE {quote(legado)} ALTER COLUMN id DROP DEFAULT')
+
+    # 2. Tabela particionada
+    cursor.execute(
+        f'CREATE TABLE {quote(tabela)} (LIKE {quote(legado)} '
+        f'INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE) '
+        f'PARTITION BY RANGE ({quote(coluna)})'
+    )
+    cursor.execute(
+        f'ALTER TABLE {quote(tabela)} ADD CONSTRAINT {quote(tabela + "_pkey")} '
+        f'PRIMARY KEY (id, {quote(coluna)})'
+    )
+    sequencia = f'{tabela}_part_id_seq'
+    cursor.execute(f'CREATE SEQUENCE {quote(sequencia)} OWNED BY {quote(tabela)}.id')
+    cursor.execute('SELECT setval(%s, %s, false)', [sequencia, (maior_id or 0) + 1])
+    cursor.execute(
+        f"ALTER TABLE {quote(tabela)} ALTER COLUMN id SET DEFAULT nextval('{sequencia}')"
+    )
+    for nome, definicao in indices:
+        if nome != f'{tabela}_pkey':
+            cursor.execute(definicao)
+    for nome, definicao in chaves_estrangeiras:
+        cursor.execute(f'ALTER TABLE {quote(tabela)} ADD CONSTRAINT {quote(nome)} {definicao}')
+
+    # 3. Partições: legada, meses seguintes e padrão
+    inicio = _proximo_mes(
+        datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    )
+    if maior_data is not None:
+        while maior_data >= inicio:
+            inicio = _proximo_mes(inicio)
+    cursor.execute(
+        f'ALTER TABLE {quote(tabela)} ATTACH PARTITION {quote(legado)} '
+        f'FOR VALUES FROM (MINVALUE) TO (%s)',
+        [inicio],
+    )
+    for _ in range(MESES_FUTUROS):
+        fim = _proximo_mes(inicio)
+        cursor.execute(
+            f'CREATE TABLE {quote(f"{tabela}_p{inicio:%Y%m}")} PARTITION OF {quote(tabela)} '
+            f'FOR VALUES FROM (%s) TO (%s)',
+            [inicio, fim],
+        )
+        inicio = fim
+    cursor.execute(
+        f'CREATE TABLE {quote(tabela + "_padrao")} PARTITION OF {quote(tabela)} DEFAULT'
+    )
+
+
+def particionar(apps, schema_editor):  # pylint: disable=unused-argument
+    """Particiona as tabelas de eventos (somente PostgreSQL)."""
+    conexao = schema_editor.connection
+    if conexao.vendor != 'postgresql':
+        return
+    with conexao.cursor() as cursor:
+        for tabela, coluna in TABELAS.items():
+            _particionar(cursor, conexao.ops.quote_name, tabela, coluna)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0020_pontuacaotendenciapost'),
+    ]
+
+    operations = [
+        migrations.RunPython(particionar, elidable=False),
+    ]
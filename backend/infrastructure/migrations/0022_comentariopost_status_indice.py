@@ -0,0 +1,22 @@
+# Generated by Django 5.0.9 on 2026-10-17 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0021_particionar_eventos_blog'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comentariopost',
+            name='status',
+            field=models.CharField(choices=[('aguardando', 'Aguardando Aprovação'), ('aprovado', 'Aprovado'), ('rejeitado', 'Rejeitado')], default='aguardando', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='comentariopost',
+            index=models.Index(fields=['status', 'data_comentario', 'id'], name='comentario_status_data_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.9 on 2026-10-17 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0022_comentariopost_status_indice'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='localizacao',
+            name='latitude',
+            field=models.DecimalField(blank=True, decimal_places=6, max_digits=9, null=True),
+        ),
+        migrations.AlterField(
+            model_name='localizacao',
+            name='longitude',
+            field=models.DecimalField(blank=True, decimal_places=6, max_digits=9, null=True),
+        ),
+    ]
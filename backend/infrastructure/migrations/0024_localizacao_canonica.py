@@ -0,0 +1,26 @@
+# Generated by Django 5.0.9 on 2026-10-17 17:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0023_localizacao_coordenadas_opcionais'),
+    ]
+
+    operations = [
+        migrations.RenameModel(
+            old_name='Localizacao',
+            new_name='LocalizacaoModel',
+        ),
+        migrations.AddField(
+            model_name='localizacaomodel',
+            name='dia',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='localizacaomodel',
+            constraint=models.UniqueConstraint(condition=models.Q(('dia__isnull', False)), fields=('ip_address', 'dia'), name='localizacao_canonica_ip_dia'),
+        ),
+    ]
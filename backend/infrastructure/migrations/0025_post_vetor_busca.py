@@ -0,0 +1,103 @@
+"""
+Busca textual de posts: cria a configuração textual `ritmo_pt` (português,
+sem acentos), o campo `vetor_busca` de Post com o seu índice GIN e preenche o
+vetor dos posts existentes.
+
+A configuração copia a `portuguese` e passa as palavras pelo dicionário
+`unaccent` antes do stemming, de modo que "informação" e "informacao"
+produzam o mesmo lexema.
+
+Em outros bancos de dados, apenas o campo é criado.
+"""
+import html
+from collections import defaultdict
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import UnaccentExtension
+from django.db import migrations
+from django.utils.html import strip_tags
+
+CONFIGURACAO_BUSCA = 'ritmo_pt'
+
+TAMANHO_LOTE = 500
+
+
+def criar_configuracao(apps, schema_editor):  # pylint: disable=unused-argument
+    """Cria a configuração textual (somente PostgreSQL)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE TEXT SEARCH CONFIGURATION {CONFIGURACAO_BUSCA} (COPY = portuguese)'
+    )
+    schema_editor.execute(
+        f'ALTER TEXT SEARCH CONFIGURATION {CONFIGURACAO_BUSCA} '
+        f'ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem'
+    )
+
+
+def remover_configuracao(apps, schema_editor):  # pylint: disable=unused-argument
+    """Remove a configuração textual (somente PostgreSQL)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP TEXT SEARCH CONFIGURATION IF EXISTS {CONFIGURACAO_BUSCA}')
+
+
+def preencher_vetores(apps, schema_editor):
+    """Preenche o vetor de busca dos posts existentes (somente PostgreSQL)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    # pylint: disable=import-outside-toplevel
+    from django.contrib.postgres.search import SearchVector, SearchVectorField
+    from django.db.models import Case, TextField, Value, When
+
+    post_model = apps.get_model('infrastructure', 'Post')
+    posts = post_model._base_manager.using(schema_editor.connection.alias)
+    ids = list(posts.order_by('id').values_list('id', flat=True))
+    for inicio in range(0, len(ids), TAMANHO_LOTE):
+        lote = ids[inicio:inicio + TAMANHO_LOTE]
+        tags = defaultdict(list)
+        for post_id, nome in post_model.tags.through.objects.using(
+            schema_editor.connection.alias
+        ).filter(post_id__in=lote).values_list('post_id', 'tagpost__name'):
+            tags[post_id].append(nome)
+
+        casos = []
+        for post_id, titulo, conteudo in posts.filter(id__in=lote).values_list(
+            'id', 'title', 'content'
+        ):
+            texto = ' '.join(html.unescape(strip_tags((conteudo or '').replace('<', ' <'))).split())
+            vetor = None
+            for parte, peso in ((titulo or '', 'A'), (' '.join(tags[post_id]), 'B'), (texto, 'C')):
+                expressao = SearchVector(
+                    Value(parte, output_field=TextField()), config=CONFIGURACAO_BUSCA, weight=peso
+                )
+                vetor = expressao if vetor is None else vetor + expressao
+            casos.append(When(id=post_id, then=vetor))
+        if casos:
+            posts.filter(id__in=lote).update(
+                vetor_busca=Case(*casos, output_field=SearchVectorField())
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0024_localizacao_canonica'),
+    ]
+
+    operations = [
+        UnaccentExtension(),
+        migrations.RunPython(criar_configuracao, remover_configuracao, elidable=False),
+        migrations.AddField(
+            model_name='post',
+            name='vetor_busca',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['vetor_busca'], name='post_vetor_busca_gin'
+            ),
+        ),
+        migrations.RunPython(preencher_vetores, migrations.RunPython.noop, elidable=False),
+    ]
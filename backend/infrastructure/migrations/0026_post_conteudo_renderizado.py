@@ -0,0 +1,103 @@
+"""
+Conteúdo pré-renderizado dos posts: adiciona os campos derivados do conteúdo
+e renderiza o conteúdo dos posts existentes.
+
+A renderização é copiada aqui (versão 1 de
+infrastructure.repositories.blog.renderizacao_conteudo), e não importada,
+para que a migração não mude junto com o código da aplicação. Posts
+renderizados por uma versão anterior são atualizados pelo comando
+`renderizar_posts`.
+"""
+import hashlib
+import html
+import math
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+from djangocms_text_ckeditor.html import clean_html
+
+TAMANHO_LOTE = 200
+
+VERSAO_RENDERIZACAO = 1
+
+CAMPOS = (
+    'conteudo_renderizado', 'resumo', 'texto_simples', 'numero_palavras',
+    'tempo_leitura', 'hash_conteudo',
+)
+
+
+def renderizar_conteudo(conteudo):
+    """Retorna os campos derivados do conteúdo HTML de um post."""
+    renderizado = clean_html(conteudo, full=False) if conteudo else ''
+    texto = ' '.join(html.unescape(strip_tags(renderizado.replace('<', ' <'))).split())
+    numero_palavras = len(texto.split())
+    palavras_por_minuto = getattr(settings, 'POST_PALAVRAS_POR_MINUTO', 200)
+    return {
+        'conteudo_renderizado': renderizado,
+        'resumo': Truncator(texto).words(
+            getattr(settings, 'POST_RESUMO_PALAVRAS', 55), truncate='…'
+        ),
+        'texto_simples': texto,
+        'numero_palavras': numero_palavras,
+        'tempo_leitura': math.ceil(numero_palavras / palavras_por_minuto),
+        'hash_conteudo': hashlib.sha256(
+            f'{VERSAO_RENDERIZACAO}:{conteudo or ""}'.encode('utf-8')
+        ).hexdigest(),
+    }
+
+
+def renderizar(apps, schema_editor):
+    """Renderiza o conteúdo dos posts existentes."""
+    post_model = apps.get_model('infrastructure', 'Post')
+    posts = post_model._base_manager.using(schema_editor.connection.alias)
+    lote = []
+    for post in posts.only('id', 'content').iterator(chunk_size=TAMANHO_LOTE):
+        for campo, valor in renderizar_conteudo(post.content).items():
+            setattr(post, campo, valor)
+        lote.append(post)
+        if len(lote) == TAMANHO_LOTE:
+            posts.bulk_update(lote, CAMPOS)
+            lote = []
+    posts.bulk_update(lote, CAMPOS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0025_post_vetor_busca'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='conteudo_renderizado',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='resumo',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='texto_simples',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='numero_palavras',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='tempo_leitura',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='hash_conteudo',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.RunPython(renderizar, migrations.RunPython.noop, elidable=False),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.9 on 2026-10-17 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0026_post_conteudo_renderizado'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(
+                fields=['blog', 'status', 'is_deleted', '-published_date', '-id'],
+                name='post_listagem_blog_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.9 on 2026-10-17 20:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0027_post_listagem_indice'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedGerado',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('escopo', models.CharField(choices=[('blog', 'Blog'), ('tag', 'Tag'), ('categoria', 'Categoria')], max_length=20)),
+                ('escopo_id', models.PositiveBigIntegerField()),
+                ('formato', models.CharField(choices=[('rss', 'RSS 2.0'), ('atom', 'Atom'), ('json', 'JSON Feed')], max_length=10)),
+                ('conteudo', models.BinaryField()),
+                ('etag', models.CharField(max_length=64)),
+                ('ultima_modificacao', models.DateTimeField()),
+                ('gerado_em', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Feed Gerado',
+                'verbose_name_plural': 'Feeds Gerados',
+                'db_table': 'infrastructure_feed_gerado',
+                'constraints': [models.UniqueConstraint(fields=('escopo', 'escopo_id', 'formato'), name='feed_gerado_escopo_formato')],
+            },
+        ),
+    ]
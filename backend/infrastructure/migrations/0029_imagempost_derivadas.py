@@ -0,0 +1,48 @@
+# Generated by Django 5.0.9 on 2026-10-17 21:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0028_feedgerado'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imagempost',
+            name='largura',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='imagempost',
+            name='altura',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='imagempost',
+            name='origem_derivadas',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.CreateModel(
+            name='DerivadaImagemPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('largura', models.PositiveIntegerField()),
+                ('altura', models.PositiveIntegerField()),
+                ('formato', models.CharField(choices=[('avif', 'AVIF'), ('webp', 'WebP'), ('jpeg', 'JPEG')], max_length=10)),
+                ('arquivo', models.FileField(max_length=255, upload_to='uploads/posts/derivadas/')),
+                ('tamanho_bytes', models.PositiveIntegerField()),
+                ('data_geracao', models.DateTimeField(auto_now_add=True)),
+                ('imagem', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='derivadas', to='infrastructure.imagempost')),
+            ],
+            options={
+                'verbose_name': 'Derivada da Imagem do Post',
+                'verbose_name_plural': 'Derivadas das Imagens do Post',
+                'db_table': 'infrastructure_derivada_imagem_post',
+                'constraints': [models.UniqueConstraint(fields=('imagem', 'formato', 'largura'), name='derivada_imagem_formato_largura')],
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+"""
+Normaliza os CNPJs já cadastrados para o formato armazenado
+(00.000.000/0000-00), o mesmo gravado pelo cadastro e pela importação em lote,
+para que o conflito de unicidade em `cnpj` reconheça a mesma empresa.
+
+A regra de formatação é copiada aqui, e não importada, para que a migração não
+mude junto com o código da aplicação. CNPJs que colidirem com um já formatado
+(a mesma empresa cadastrada nos dois formatos) são mantidos como estão e
+registrados no log, para a unificação manual dos cadastros.
+"""
+import logging
+from django.db import migrations
+
+logger = logging.getLogger('ocorrencias')
+
+
+def _formatar(cnpj):
+    digitos = ''.join(filter(str.isdigit, cnpj or ''))
+    if len(digitos) != 14:
+        return cnpj
+    return f"{digitos[:2]}.{digitos[2:5]}.{digitos[5:8]}/{digitos[8:12]}-{digitos[12:]}"
+
+
+def formatar_cnpjs(apps, schema_editor):
+    """Reescreve os CNPJs fora do formato armazenado."""
+    pessoa_juridica_model = apps.get_model('infrastructure', 'PessoaJuridicaModel')
+    pessoas_juridicas = pessoa_juridica_model._base_manager.using(schema_editor.connection.alias)
+    ids_por_cnpj = dict(pessoas_juridicas.values_list('cnpj', 'id'))
+    for cnpj, pessoa_juridica_id in list(ids_por_cnpj.items()):
+        formatado = _formatar(cnpj)
+        if formatado == cnpj:
+            continue
+        if formatado in ids_por_cnpj:
+            logger.warning(
+                "CNPJ %s duplicado nas pessoas jurídicas %s e %s; unifique os cadastros.",
+                formatado, ids_por_cnpj[formatado], pessoa_juridica_id,
+            )
+            continue
+        pessoas_juridicas.filter(id=pessoa_juridica_id).update(cnpj=formatado)
+        ids_por_cnpj[formatado] = pessoa_juridica_id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0029_imagempost_derivadas'),
+    ]
+
+    operations = [
+        migrations.RunPython(formatar_cnpjs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.9 on 2026-10-17 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0030_pessoa_juridica_cnpj_formatado'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enderecomodel',
+            index=models.Index(fields=['cidade', 'id'], name='endereco_cidade_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enderecomodel',
+            index=models.Index(fields=['cep', 'id'], name='endereco_cep_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enderecomodel',
+            index=models.Index(fields=['data_inicio', 'id'], name='endereco_inicio_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pessoafisicamodel',
+            index=models.Index(fields=['date_joined', 'pessoa_fisica_id'], name='pessoa_fisica_joined_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pessoajuridicamodel',
+            index=models.Index(fields=['razao_social', 'id'], name='pessoa_juridica_razao_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profissaomodel',
+            index=models.Index(fields=['descricao', 'id'], name='profissao_descricao_id_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.9 on 2026-10-18 10:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0031_indices_ordenacao_marketing'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='compartilhamentopost',
+            name='total_compartilhamentos',
+        ),
+    ]
@@ -0,0 +1,107 @@
+"""
+Módulo que implementa as models dos agregados temporais de engajamento de
+posts.
+
+Os agregados (rollups) guardam, por post, intervalo de tempo (hora ou dia) e
+dimensão (cidade, tipo de reação, voto), a quantidade de eventos de cada
+métrica. Consultas analíticas leem os agregados em vez de varrer as tabelas de
+eventos, de modo que seu custo depende do período consultado, não do volume
+de eventos.
+
+Classes:
+    AgregadoEngajamentoPost: Total de eventos de um post em um intervalo.
+    MarcaAgregacaoEngajamento: Último evento já agregado de cada fonte.
+"""
+from django.db import models
+from infrastructure.models.blog.post import Post
+
+GRANULARIDADE_HORA = 'hora'
+GRANULARIDADE_DIA = 'dia'
+
+GRANULARIDADES = [
+    (GRANULARIDADE_HORA, 'Hora'),
+    (GRANULARIDADE_DIA, 'Dia'),
+]
+
+METRICA_AGREGADA_VISUALIZACOES = 'visualizacoes'
+METRICA_AGREGADA_REACOES = 'reacoes'
+METRICA_AGREGADA_VOTOS = 'votos'
+METRICA_AGREGADA_COMPARTILHAMENTOS = 'compartilhamentos'
+
+
+class AgregadoEngajamentoPost(models.Model):
+    """
+    Model que armazena a quantidade de eventos de uma métrica de um post em
+    um intervalo de tempo, por dimensão.
+
+    Atributos:
+        post: Post ao qual os eventos se referem.
+        granularidade: Tamanho do intervalo ('hora' ou 'dia').
+        inicio: Início do intervalo, no fuso horário do projeto.
+        metrica: Métrica agregada (ex.: 'visualizacoes', 'reacoes').
+        dimensao: Valor da dimensão da métrica (cidade, tipo de reação ou
+        voto); vazio quando desconhecido.
+        total: Quantidade de eventos.
+    """
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='agregados_engajamento')
+    granularidade = models.CharField(max_length=4, choices=GRANULARIDADES)
+    inicio = models.DateTimeField()
+    metrica = models.CharField(max_length=30)
+    dimensao = models.CharField(max_length=100, blank=True, default='')
+    total = models.BigIntegerField(default=0)
+
+    class Meta:
+        """
+        Metadados para a model AgregadoEngajamentoPost.
+        """
+        app_label = 'infrastructure'
+        db_table = 'infrastructure_agregado_engajamento_post'
+        verbose_name = 'Agregado de Engajamento de Post'
+        verbose_name_plural = 'Agregados de Engajamento de Posts'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['post', 'granularidade', 'inicio', 'metrica', 'dimensao'],
+                name='agregado_engajamento_post_unico'
+            ),
+        ]
+        indexes = [
+            # Consultas de painel: uma métrica em um período, de todos os posts
+            models.Index(
+                fields=['granularidade', 'metrica', 'inicio'],
+                name='agregado_engaj_periodo_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.metrica}[{self.dimensao}] do post {self.post_id} "
+            f"em {self.inicio:%Y-%m-%d %H:%M} ({self.granularidade}): {self.total}"
+        )
+
+
+class MarcaAgregacaoEngajamento(models.Model):
+    """
+    Model que registra até qual evento de cada fonte os agregados já foram
+    calculados (marca d'água), permitindo que a agregação processe apenas os
+    eventos novos.
+
+    Atributos:
+        fonte: Nome da fonte de eventos (igual à métrica agregada).
+        ultimo_id: Maior ID de evento da fonte já agregado.
+        atualizado_em: Data e hora da última agregação.
+    """
+    fonte = models.CharField(max_length=30, unique=True)
+    ultimo_id = models.BigIntegerField(default=0)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Metadados para a model MarcaAgregacaoEngajamento.
+        """
+        app_label = 'infrastructure'
+        db_table = 'infrastructure_marca_agregacao_engajamento'
+        verbose_name = 'Marca de Agregação de Engajamento'
+        verbose_name_plural = 'Marcas de Agregação de Engajamento'
+
+    def __str__(self):
+        return f"{self.fonte}: até o evento {self.ultimo_id}"
@@ -9,7 +9,9 @@
 """
 
 from django.db import models
-from infrastructure.models.shared.resources.localizacao import Localizacao  
+from domain.blog.value_objects.comentario_moderacao import (
+    STATUS_AGUARDANDO, STATUS_APROVADO, STATUS_REJEITADO)
+from infrastructure.models.shared.resources.localizacao import LocalizacaoModel
 
 
 class ComentarioPost(models.Model):
@@ -17,12 +19,18 @@ class ComentarioPost(models.Model):
     Model que representa um comentário em uma postagem de blog.
     """
 
+    STATUS_CHOICES = [
+        (STATUS_AGUARDANDO, 'Aguardando Aprovação'),
+        (STATUS_APROVADO, 'Aprovado'),
+        (STATUS_REJEITADO, 'Rejeitado'),
+    ]
+
     post = models.ForeignKey('Post', on_delete=models.CASCADE, related_name='comentarios')
     comentario = models.TextField()
     data_comentario = models.DateTimeField(auto_now_add=True)
     ip_origem = models.GenericIPAddressField(null=True, blank=True)  # Armazena o IP de origem do comentário
-    localizacao = models.ForeignKey(Localizacao, on_delete=models.SET_NULL, null=True, blank=True, related_name='comentarios')
-    status = models.CharField(max_length=20, default='aguardando')
+    localizacao = models.ForeignKey(LocalizacaoModel, on_delete=models.SET_NULL, null=True, blank=True, related_name='comentarios')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_AGUARDANDO)
 
     class Meta:
         app_label = 'infrastructure'
@@ -30,6 +38,11 @@ class ComentarioPost(models.Model):
         verbose_name = 'Comentário do Post'
         verbose_name_plural = 'Comentários dos Posts'
         ordering = ['-data_comentario']
+        indexes = [
+            # Fila de moderação e listagem do admin: filtro por status,
+            # ordenação e paginação por chave (data, id)
+            models.Index(fields=['status', 'data_comentario', 'id'], name='comentario_status_data_idx'),
+        ]
 
     def __str__(self):
         return f"Comentário {str(self.comentario)[:50]} no post {getattr(self.post, 'title', 'Título não disponível')}"
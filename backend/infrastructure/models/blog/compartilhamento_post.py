@@ -3,7 +3,7 @@
 
 from django.db import models
 from infrastructure.models.blog.post import Post
-from infrastructure.models.shared.resources.localizacao import Localizacao
+from infrastructure.models.shared.resources.localizacao import LocalizacaoModel
 from infrastructure.models.marketing.pessoa_fisica import PessoaFisicaModel
 
 
@@ -16,17 +16,16 @@ class CompartilhamentoPost(models.Model):
         localizacao: Localização de onde o compartilhamento foi feito.
         pessoa_fisica: Referência ao usuário que compartilhou o post.
         data_compartilhamento: Data e hora em que o compartilhamento foi feito.
+
+    O total de compartilhamentos de um post é mantido pelos contadores de
+    engajamento (EngajamentoPostRepository) e copiado para
+    Post.numero_compartilhamentos.
     """
     post = models.ForeignKey(Post, on_delete=models.CASCADE)
-    localizacao = models.ForeignKey(Localizacao, on_delete=models.SET_NULL, null=True)
+    localizacao = models.ForeignKey(LocalizacaoModel, on_delete=models.SET_NULL, null=True)
     pessoa_fisica = models.ForeignKey(PessoaFisicaModel, on_delete=models.SET_NULL, null=True, blank=True)
     data_compartilhamento = models.DateTimeField(auto_now_add=True)
-    total_compartilhamentos = models.IntegerField(default=0)
 
-    def incrementar_compartilhamentos(self):
-        """ atualiza o total de compartilhamentos"""
-        self.total_compartilhamentos += 1
-        self.save()
     class Meta:
         app_label = 'infrastructure'
         db_table = 'infrastructure_compartilhamento_post'
@@ -0,0 +1,59 @@
+"""
+Módulo que implementa a model de contadores de engajamento de posts.
+
+Os contadores são pré-agregados: cada evento (visualização, reação, voto,
+compartilhamento ou aprovação de comentário) incrementa atomicamente uma
+linha, em vez de as contagens serem calculadas sobre as tabelas de eventos a
+cada leitura. Cada métrica é dividida em `NUMERO_SHARDS` linhas (shards)
+escolhidas aleatoriamente nas escritas, para que posts muito acessados não
+disputem o bloqueio de uma única linha; a leitura soma os shards.
+
+Classes:
+    ContadorEngajamentoPost: Shard de um contador de engajamento de um post.
+"""
+from django.db import models
+from infrastructure.models.blog.post import Post
+
+# Quantidade de linhas por contador.
+NUMERO_SHARDS = 8
+
+METRICA_VISUALIZACOES = 'visualizacoes'
+METRICA_VOTOS_POSITIVOS = 'votos_positivos'
+METRICA_VOTOS_NEGATIVOS = 'votos_negativos'
+METRICA_COMPARTILHAMENTOS = 'compartilhamentos'
+METRICA_COMENTARIOS_APROVADOS = 'comentarios_aprovados'
+PREFIXO_METRICA_REACAO = 'reacao:'
+
+
+class ContadorEngajamentoPost(models.Model):
+    """
+    Model que armazena um shard de um contador de engajamento de um post.
+
+    Atributos:
+        post: Post ao qual o contador pertence.
+        metrica: Nome da métrica (ex.: 'visualizacoes', 'reacao:curtida').
+        shard: Número do shard, de 0 a NUMERO_SHARDS - 1.
+        valor: Valor parcial do contador neste shard.
+    """
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='contadores_engajamento')
+    metrica = models.CharField(max_length=60)
+    shard = models.PositiveSmallIntegerField(default=0)
+    valor = models.BigIntegerField(default=0)
+
+    class Meta:
+        """
+        Metadados para a model ContadorEngajamentoPost.
+        """
+        app_label = 'infrastructure'
+        db_table = 'infrastructure_contador_engajamento_post'
+        verbose_name = 'Contador de Engajamento de Post'
+        verbose_name_plural = 'Contadores de Engajamento de Posts'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['post', 'metrica', 'shard'],
+                name='contador_engajamento_post_unico'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.metrica}[{self.shard}] do post {self.post_id}: {self.valor}"
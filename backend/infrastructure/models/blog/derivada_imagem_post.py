@@ -0,0 +1,60 @@
+"""
+Módulo que implementa a model das versões redimensionadas (derivadas) das
+imagens dos posts.
+
+Após o upload de uma imagem, as derivadas são geradas em cada largura e
+formato configurados (IMAGENS_POST_LARGURAS e IMAGENS_POST_FORMATOS) e
+registradas aqui, de modo que o `srcset` da imagem seja montado com uma
+consulta, sem verificar a existência de arquivos no storage.
+
+Classes:
+    DerivadaImagemPost: Versão redimensionada de uma imagem de post.
+"""
+from django.db import models
+
+FORMATO_AVIF = 'avif'
+FORMATO_WEBP = 'webp'
+FORMATO_JPEG = 'jpeg'
+
+
+class DerivadaImagemPost(models.Model):
+    """
+    Model que armazena uma versão redimensionada de uma imagem de post.
+
+    Atributos:
+        imagem: Imagem original.
+        largura: Largura da derivada, em pixels.
+        altura: Altura da derivada, em pixels.
+        formato: Formato do arquivo (avif, webp ou jpeg).
+        arquivo: Arquivo da derivada.
+        tamanho_bytes: Tamanho do arquivo, em bytes.
+        data_geracao: Data e hora da geração.
+    """
+
+    FORMATO_CHOICES = [
+        (FORMATO_AVIF, 'AVIF'),
+        (FORMATO_WEBP, 'WebP'),
+        (FORMATO_JPEG, 'JPEG'),
+    ]
+
+    imagem = models.ForeignKey('ImagemPost', on_delete=models.CASCADE, related_name='derivadas')
+    largura = models.PositiveIntegerField()
+    altura = models.PositiveIntegerField()
+    formato = models.CharField(max_length=10, choices=FORMATO_CHOICES)
+    arquivo = models.FileField(upload_to='uploads/posts/derivadas/', max_length=255)
+    tamanho_bytes = models.PositiveIntegerField()
+    data_geracao = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = 'infrastructure'
+        db_table = 'infrastructure_derivada_imagem_post'
+        verbose_name = 'Derivada da Imagem do Post'
+        verbose_name_plural = 'Derivadas das Imagens do Post'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['imagem', 'formato', 'largura'], name='derivada_imagem_formato_largura'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.imagem_id} {self.largura}w {self.formato}"
@@ -0,0 +1,69 @@
+"""
+Módulo que implementa a model dos feeds (RSS, Atom e JSON Feed) gerados.
+
+Cada feed de um escopo (blog, tag ou categoria) em cada formato é gerado
+somente quando um post do escopo é publicado ou alterado, e o conteúdo
+serializado é guardado aqui, com o ETag e a data da última modificação
+usados nas requisições condicionais.
+
+Classes:
+    FeedGerado: Conteúdo serializado de um feed.
+"""
+from django.db import models
+
+ESCOPO_BLOG = 'blog'
+ESCOPO_TAG = 'tag'
+ESCOPO_CATEGORIA = 'categoria'
+
+FORMATO_RSS = 'rss'
+FORMATO_ATOM = 'atom'
+FORMATO_JSON = 'json'
+
+
+class FeedGerado(models.Model):
+    """
+    Model que armazena o conteúdo serializado de um feed.
+
+    Atributos:
+        escopo: Tipo do escopo do feed (blog, tag ou categoria).
+        escopo_id: ID do blog, da tag ou da categoria.
+        formato: Formato do feed (rss, atom ou json).
+        conteudo: Conteúdo serializado do feed.
+        etag: Hash do conteúdo, usado como ETag.
+        ultima_modificacao: Data e hora da última alteração do conteúdo.
+        gerado_em: Data e hora da última geração, alterando ou não o conteúdo.
+    """
+
+    ESCOPO_CHOICES = [
+        (ESCOPO_BLOG, 'Blog'),
+        (ESCOPO_TAG, 'Tag'),
+        (ESCOPO_CATEGORIA, 'Categoria'),
+    ]
+
+    FORMATO_CHOICES = [
+        (FORMATO_RSS, 'RSS 2.0'),
+        (FORMATO_ATOM, 'Atom'),
+        (FORMATO_JSON, 'JSON Feed'),
+    ]
+
+    escopo = models.CharField(max_length=20, choices=ESCOPO_CHOICES)
+    escopo_id = models.PositiveBigIntegerField()
+    formato = models.CharField(max_length=10, choices=FORMATO_CHOICES)
+    conteudo = models.BinaryField()
+    etag = models.CharField(max_length=64)
+    ultima_modificacao = models.DateTimeField()
+    gerado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'infrastructure'
+        db_table = 'infrastructure_feed_gerado'
+        verbose_name = 'Feed Gerado'
+        verbose_name_plural = 'Feeds Gerados'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['escopo', 'escopo_id', 'formato'], name='feed_gerado_escopo_formato'
+            ),
+        ]
+
+    def __str__(self):
+        return f"Feed {self.formato} de {self.escopo} {self.escopo_id}"
@@ -8,6 +8,11 @@ class ImagemPost(models.Model):
     imagem = models.ImageField(upload_to='uploads/posts/')
     legenda = models.CharField(max_length=255, null=True, blank=True)
     data_upload = models.DateTimeField(auto_now_add=True)
+    # Dimensões da imagem (já orientada pelo EXIF) e nome do arquivo a partir
+    # do qual as derivadas atuais foram geradas (veja DerivadaImagemPost)
+    largura = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    altura = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    origem_derivadas = models.CharField(max_length=255, blank=True, default='', editable=False)
 
     class Meta:
         """
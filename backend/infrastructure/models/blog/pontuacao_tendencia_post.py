@@ -0,0 +1,58 @@
+"""
+Módulo que implementa a model das pontuações de tendência (posts "em alta").
+
+A pontuação de um post é a soma dos pesos dos seus eventos de engajamento,
+cada um decaindo exponencialmente com o tempo. Para que as pontuações não
+precisem ser recalculadas à medida que o tempo passa, cada evento é
+registrado com peso ampliado por exp((t - EPOCA) / tau) ("forward decay") e
+guardado em escala logarítmica:
+
+    pontuacao = ln(soma(peso * exp((t_evento - EPOCA) / tau)))
+
+Como todas as pontuações decaem no mesmo ritmo, a ordem entre os posts é a
+ordem de `pontuacao`, e o ranking é uma consulta ordenada por um índice. O
+valor decaído no instante t é exp(pontuacao - (t - EPOCA) / tau).
+
+Classes:
+    PontuacaoTendenciaPost: Pontuação de tendência de um post.
+"""
+from datetime import datetime, timezone as dt_timezone
+from django.db import models
+from infrastructure.models.blog.post import Post
+
+# Referência fixa dos instantes dos eventos; nunca deve ser alterada.
+EPOCA_TENDENCIA = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class PontuacaoTendenciaPost(models.Model):
+    """
+    Model que armazena o snapshot da pontuação de tendência de um post.
+
+    Atributos:
+        post: Post pontuado.
+        blog: Blog do post (escopo do ranking por blog).
+        site: Site do blog (escopo do ranking por site).
+        pontuacao: Pontuação em escala logarítmica relativa a EPOCA_TENDENCIA.
+        atualizado_em: Data e hora do último snapshot.
+    """
+    post = models.OneToOneField(Post, on_delete=models.CASCADE, related_name='pontuacao_tendencia')
+    blog = models.ForeignKey('Blog', on_delete=models.CASCADE, related_name='+')
+    site = models.ForeignKey('CustomSite', on_delete=models.CASCADE, related_name='+')
+    pontuacao = models.FloatField()
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Metadados para a model PontuacaoTendenciaPost.
+        """
+        app_label = 'infrastructure'
+        db_table = 'infrastructure_pontuacao_tendencia_post'
+        verbose_name = 'Pontuação de Tendência de Post'
+        verbose_name_plural = 'Pontuações de Tendência de Posts'
+        indexes = [
+            models.Index(fields=['blog', '-pontuacao'], name='tendencia_blog_idx'),
+            models.Index(fields=['site', '-pontuacao'], name='tendencia_site_idx'),
+        ]
+
+    def __str__(self):
+        return f"Tendência do post {self.post_id}: {self.pontuacao:.3f}"
@@ -4,12 +4,17 @@ Módulo responsável pela definição da model Post.
 Este módulo define a model Post, que representa uma postagem de blog.
 Cada postagem pertence a um blog e inclui funcionalidades de auditoria,
 inativação, exclusão lógica e gerenciamento de status através dos mixins.
-A model Post também gerencia o título, slug, conteúdo e data de publicação.
+A model Post também gerencia o título, slug, conteúdo e data de publicação,
+o conteúdo pré-renderizado (HTML sanitizado, resumo, texto simples, número
+de palavras e tempo de leitura) e o vetor da busca textual (título, tags e
+conteúdo), indexado por GIN.
 
 Classes:
     Post: Model que representa uma postagem de blog.
 """
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from djangocms_text_ckeditor.fields import HTMLField
 from infrastructure.mixins.audit import AuditMixin
@@ -44,6 +49,15 @@ class Post(
     compartilhado = models.BooleanField(default=False)
     tags = models.ManyToManyField(TagPost, related_name='posts', blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='rascunho')
+    # Campos derivados do conteúdo, mantidos por infrastructure.signals.conteudo_post
+    conteudo_renderizado = models.TextField(blank=True, default='', editable=False)
+    resumo = models.TextField(blank=True, default='', editable=False)
+    texto_simples = models.TextField(blank=True, default='', editable=False)
+    numero_palavras = models.PositiveIntegerField(default=0, editable=False)
+    tempo_leitura = models.PositiveSmallIntegerField(default=0, editable=False)
+    hash_conteudo = models.CharField(max_length=64, blank=True, default='', editable=False)
+    # Título, tags e conteúdo sem HTML, mantido por infrastructure.signals.busca_posts
+    vetor_busca = SearchVectorField(null=True, editable=False)
 
     class Meta:
         app_label = 'infrastructure'
@@ -51,6 +65,14 @@ class Post(
         verbose_name = 'Postagem de Blog'
         verbose_name_plural = 'Postagens de Blog'
         ordering = ['-published_date']
+        indexes = [
+            # Listagem dos posts de um blog (DjangoListagemPostsRepository)
+            models.Index(
+                fields=['blog', 'status', 'is_deleted', '-published_date', '-id'],
+                name='post_listagem_blog_idx',
+            ),
+            GinIndex(fields=['vetor_busca'], name='post_vetor_busca_gin'),
+        ]
 
     def __str__(self):
         return str(self.title)
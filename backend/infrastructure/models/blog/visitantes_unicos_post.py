@@ -0,0 +1,45 @@
+"""
+Módulo que implementa a model dos sketches de visitantes únicos de posts.
+
+Cada linha guarda o HyperLogLog (serializado e compactado) dos visitantes de
+um post em um dia. Visitantes de semanas, meses ou conjuntos de posts são
+estimados unindo os sketches diários, sem consultar as visualizações.
+
+Classes:
+    VisitantesUnicosPost: Sketch dos visitantes de um post em um dia.
+"""
+from django.db import models
+from infrastructure.models.blog.post import Post
+
+
+class VisitantesUnicosPost(models.Model):
+    """
+    Model que armazena o sketch HyperLogLog dos visitantes de um post em um
+    dia.
+
+    Atributos:
+        post: Post visualizado.
+        dia: Dia das visualizações, no fuso horário do projeto.
+        sketch: Registradores do HyperLogLog (HyperLogLog.serializar).
+    """
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='visitantes_unicos')
+    dia = models.DateField()
+    sketch = models.BinaryField()
+
+    class Meta:
+        """
+        Metadados para a model VisitantesUnicosPost.
+        """
+        app_label = 'infrastructure'
+        db_table = 'infrastructure_visitantes_unicos_post'
+        verbose_name = 'Visitantes Únicos de Post'
+        verbose_name_plural = 'Visitantes Únicos de Posts'
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'dia'], name='visitantes_unicos_post_unico'),
+        ]
+        indexes = [
+            models.Index(fields=['dia'], name='visitantes_unicos_dia_idx'),
+        ]
+
+    def __str__(self):
+        return f"Visitantes do post {self.post_id} em {self.dia}"
@@ -2,7 +2,8 @@
     Módulo que implementa a model de visualização de post com geolocalização. 
 """
 from django.db import models
-from infrastructure.models.shared.resources.localizacao import Localizacao
+from django.utils import timezone
+from infrastructure.models.shared.resources.localizacao import LocalizacaoModel
 from infrastructure.models.marketing.pessoa_fisica import PessoaFisicaModel
 from infrastructure.models.blog.post import Post
 
@@ -18,9 +19,11 @@ class VisualizacaoPost(models.Model):
         data_visualizacao: Data e hora em que a visualização foi feita.
     """
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='visualizacoes')
-    localizacao = models.ForeignKey(Localizacao, on_delete=models.SET_NULL, null=True)
+    localizacao = models.ForeignKey(LocalizacaoModel, on_delete=models.SET_NULL, null=True)
     pessoa_fisica = models.ForeignKey(PessoaFisicaModel, on_delete=models.SET_NULL, null=True, blank=True)  # Campo pode ficar vazio
-    data_visualizacao = models.DateTimeField(auto_now_add=True)
+    # default em vez de auto_now_add para preservar o instante do evento nas
+    # gravações em lote da ingestão bufferizada
+    data_visualizacao = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         """
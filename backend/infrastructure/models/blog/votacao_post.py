@@ -3,7 +3,7 @@
 
 from django.db import models
 from infrastructure.models.blog.post import Post
-from infrastructure.models.shared.resources.localizacao import Localizacao
+from infrastructure.models.shared.resources.localizacao import LocalizacaoModel
 from infrastructure.models.marketing.pessoa_fisica import PessoaFisicaModel
 
 
@@ -24,7 +24,7 @@ class VotacaoPost(models.Model):
     ]
     
     post = models.ForeignKey(Post, on_delete=models.CASCADE)
-    localizacao = models.ForeignKey(Localizacao, on_delete=models.SET_NULL, null=True)
+    localizacao = models.ForeignKey(LocalizacaoModel, on_delete=models.SET_NULL, null=True)
     pessoa_fisica = models.ForeignKey(PessoaFisicaModel, on_delete=models.SET_NULL, null=True, blank=True)
     voto = models.CharField(max_length=10, choices=VOTE_CHOICES, default='positivo')
     data_votacao = models.DateTimeField(auto_now_add=True)
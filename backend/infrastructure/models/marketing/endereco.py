@@ -49,6 +49,12 @@ class EnderecoModel(models.Model):
         db_table = 'infrastructure_endereco'
         verbose_name = 'Endereço'
         verbose_name_plural = 'Endereços'
+        indexes = [
+            # Paginação por chave das listagens: (chave de ordenação, pk)
+            models.Index(fields=['cidade', 'id'], name='endereco_cidade_id_idx'),
+            models.Index(fields=['cep', 'id'], name='endereco_cep_id_idx'),
+            models.Index(fields=['data_inicio', 'id'], name='endereco_inicio_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.rua}, {self.numero} - {self.cidade}, {self.estado}, {self.pais}"
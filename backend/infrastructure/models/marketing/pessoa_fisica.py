@@ -182,4 +182,8 @@ class PessoaFisicaModel(
         db_table = 'infrastructure_pessoa_fisica'
         verbose_name = 'Pessoa Física'
         verbose_name_plural = 'Pessoas Físicas'
+        indexes = [
+            # Paginação por chave das listagens: (chave de ordenação, pk)
+            models.Index(fields=['date_joined', 'pessoa_fisica_id'], name='pessoa_fisica_joined_id_idx'),
+        ]
 
@@ -18,9 +18,8 @@ class PessoaFisicaTipoModel(SoftDeleteMixin, models.Model):
         usuario_tipo (ForeignKey): Referência ao tipo de usuário.
     """
     
-    pessoa_fisica_tipo_id = models.AutoField(primary_key=True) 
-    pessoa_fisica_tipo_id = models.ForeignKey(PessoaFisicaModel, on_delete=models.CASCADE)
-    usuario_tipo_tipo = models.ForeignKey(UsuarioTipoModel, on_delete=models.CASCADE)
+    pessoa_fisica = models.ForeignKey(PessoaFisicaModel, on_delete=models.CASCADE)
+    usuario_tipo = models.ForeignKey(UsuarioTipoModel, on_delete=models.CASCADE)
 
     class Meta:
         """
@@ -37,4 +36,4 @@ class PessoaFisicaTipoModel(SoftDeleteMixin, models.Model):
         # Garante que a mesma pessoa não tenha o mesmo tipo mais de uma vez.
 
     def __str__(self):
-        return f"PessoaFisicaTipo(pessoa_fisica_tipo_id={self.pessoa_fisica_tipo_id}, pessoa_fisica_id={self.pessoa_fisica}, usuario_tipo_id={self.usuario_tipo})"
+        return f"PessoaFisicaTipo(pessoa_fisica_tipo_id={self.pk}, pessoa_fisica_id={self.pessoa_fisica_id}, usuario_tipo_id={self.usuario_tipo_id})"
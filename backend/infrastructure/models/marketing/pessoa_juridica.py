@@ -13,7 +13,7 @@ Classes:
     suas informações associadas.
 """
 from django.db import models
-from domain.shared.validations.valida_cnpj import validar_cnpj
+from domain.shared.validations.valida_cnpj import formatar_cnpj, validar_cnpj
 from domain.shared.exceptions.validation_exception import ValidationException
 from infrastructure.mixins.audit import AuditMixin
 from infrastructure.mixins.softdelete import SoftDeleteMixin
@@ -103,6 +103,16 @@ class PessoaJuridicaModel(
         # Valida o CNPJ
         if not validar_cnpj(self.cnpj):
             raise ValidationException({'cnpj': 'CNPJ inválido.'})
+        self.cnpj = formatar_cnpj(self.cnpj)
+
+    def save(self, *args, **kwargs):
+        """
+        Salva a Pessoa Jurídica com o CNPJ no formato armazenado
+        (00.000.000/0000-00), para que a unicidade não dependa da formatação
+        recebida.
+        """
+        self.cnpj = formatar_cnpj(self.cnpj)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         """
@@ -124,4 +134,8 @@ class PessoaJuridicaModel(
         db_table = 'infrastructure_pessoa_juridica'
         verbose_name = 'Pessoa Jurídica'
         verbose_name_plural = 'Pessoas Jurídicas'
+        indexes = [
+            # Paginação por chave das listagens: (chave de ordenação, pk)
+            models.Index(fields=['razao_social', 'id'], name='pessoa_juridica_razao_id_idx'),
+        ]
 
@@ -21,5 +21,16 @@ class ProdutoModel(AuditMixin, models.Model):
     descricao = models.TextField(null=True, blank=True)
     tipo_produto = models.ForeignKey(TipoProdutoModel, on_delete=models.PROTECT, related_name='produtos')
 
+    class Meta:
+        """
+        Metadados da model ProdutoModel.
+        """
+        app_label = 'infrastructure'
+        indexes = [
+            # Paginação por chave das listagens: (chave de ordenação, pk)
+            models.Index(fields=['nome', 'id'], name='produto_nome_id_idx'),
+            models.Index(fields=['created_at', 'id'], name='produto_criacao_id_idx'),
+        ]
+
     def __str__(self):
         return str(self.nome)
@@ -51,6 +51,10 @@ class TipoProdutoModel(SoftDeleteMixin, StatusMixin, models.Model):
         db_table = 'infrastructure_tipo_produto'
         verbose_name = 'Tipo de Produto'
         verbose_name_plural = 'Tipos de Produtos'
+        indexes = [
+            # Paginação por chave das listagens: (chave de ordenação, pk)
+            models.Index(fields=['nome', 'id'], name='tipo_produto_nome_id_idx'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -32,6 +32,10 @@ class ProfissaoModel(AuditMixin, OrderingMixin, InactivateMixin, SoftDeleteMixin
         verbose_name = 'Profissão'
         verbose_name_plural = 'Profissões'
         ordering = ['order']
+        indexes = [
+            # Paginação por chave das listagens: (chave de ordenação, pk)
+            models.Index(fields=['descricao', 'id'], name='profissao_descricao_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.codigo} - {self.descricao}"
@@ -22,6 +22,10 @@ pessoas físicas.
 - **ComentarioPost**: Captura a localização de onde um comentário foi feito.
 - **ReacaoPost**: Captura a localização de onde uma reação foi registrada.
 
+Localizações capturadas na ingestão de eventos são canônicas: uma única
+linha por (IP, dia), identificada pelo campo `dia`, reaproveitada por todos
+os eventos do IP no dia (veja LocalizacaoCanonicaRepository).
+
 Classes:
     - Localizacao: Model que representa os dados de geolocalização 
       capturados durante interações de usuários.
@@ -36,13 +40,15 @@ class LocalizacaoModel(models.Model):
     Model para armazenar informações de geolocalização e visitas.
     """
     ip_address = models.GenericIPAddressField()
-    latitude = models.DecimalField(max_digits=9, decimal_places=6)
-    longitude = models.DecimalField(max_digits=9, decimal_places=6)
+    latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
     precisao = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
     cidade = models.CharField(max_length=100, null=True, blank=True)
     estado = models.CharField(max_length=100, null=True, blank=True)
     pais = models.CharField(max_length=100, null=True, blank=True)
     data_hora_captura = models.DateTimeField(auto_now_add=True)
+    # Dia das localizações canônicas (uma por IP e dia); nulo nas demais
+    dia = models.DateField(null=True, blank=True, editable=False)
 
     class Meta:
         """
@@ -52,6 +58,13 @@ class LocalizacaoModel(models.Model):
         db_table = 'infrastructure_localizacao'
         verbose_name = 'Localização'
         verbose_name_plural = 'Localizações'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['ip_address', 'dia'],
+                condition=models.Q(dia__isnull=False),
+                name='localizacao_canonica_ip_dia',
+            ),
+        ]
 
     def __str__(self):
         return f"IP: {self.ip_address} - Coordenadas: ({self.latitude}, {self.longitude})"
@@ -1,9 +1,10 @@
 # pylint: disable=no-member:
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
+from django.db.models import QuerySet
 from domain.blog.repositories.blog import BlogRepository
 from domain.blog.entities.blog import BlogDomain
-from infrastructure.models.blog import Blog 
+from infrastructure.models.blog.blog import Blog
 from infrastructure.models.blog.categoria_post import CategoriaPost
 from infrastructure.models.blog.tag_post import TagPost
 
@@ -40,27 +41,8 @@ class DjangoBlogRepository(BlogRepository):
 
     def get_by_id(self, blog_id: int) -> Optional[BlogDomain]:
         try:
-            blog_model = Blog.objects.get(id=blog_id)
-
-            categorias = [
-                CategoriaPost(id=categoria.id, nome=categoria.nome, descricao=categoria.descricao)
-                for categoria in blog_model.categorias.all()
-            ]
-
-            tags = [
-                Tag(id=tag.id, nome=tag.nome)
-                for tag in blog_model.tags.all()
-            ]
-
-            return BlogDomain(
-                id=blog_model.id,
-                title=blog_model.title,
-                description=blog_model.description,
-                proprietario=blog_model.proprietario,
-                site=blog_model.site,
-                categorias=categorias,
-                tags=tags
-            )
+            blog_model = self._queryset().get(id=blog_id)
+            return self._to_domain(blog_model)
         except Blog.DoesNotExist:
             return None
 
@@ -68,22 +50,34 @@ class DjangoBlogRepository(BlogRepository):
         Blog.objects.filter(id=blog.id).delete()
 
     def list_all(self) -> List[BlogDomain]:
-        blogs = Blog.objects.all()
-        return [
-            BlogDomain(
-                id=blog.id,
-                title=blog.title,
-                description=blog.description,
-                proprietario=blog.proprietario,
-                site=blog.site,
-                categorias=[
-                    CategoriaPost(id=categoria.id, nome=categoria.nome, descricao=categoria.descricao)
-                    for categoria in blog.categorias.all()
-                ],
-                tags=[
-                    TagPost(id=tag.id, nome=tag.nome)
-                    for tag in blog.tags.all()
-                ]
-            )
-            for blog in blogs
-        ]
+        return [self._to_domain(blog) for blog in self._queryset()]
+
+    def iter_all(self, chunk_size: int = 500) -> Iterator[BlogDomain]:
+        """
+        Percorre todos os blogs em lotes de `chunk_size`, sem carregar a
+        tabela inteira em memória. Cada lote é buscado com um cursor no
+        servidor e tem suas categorias e tags pré-carregadas em conjunto.
+        """
+        for blog in self._queryset().order_by('id').iterator(chunk_size=chunk_size):
+            yield self._to_domain(blog)
+
+    def _queryset(self) -> QuerySet:
+        """
+        Queryset base das leituras: proprietário e site vêm no mesmo SELECT
+        (JOIN) e categorias/tags são pré-carregadas com uma consulta cada,
+        independente da quantidade de blogs.
+        """
+        return Blog.objects.select_related(
+            'proprietario', 'site'
+        ).prefetch_related('categorias', 'tags')
+
+    def _to_domain(self, blog_model: Blog) -> BlogDomain:
+        return BlogDomain(
+            id=blog_model.id,
+            title=blog_model.title,
+            description=blog_model.description,
+            proprietario=blog_model.proprietario,
+            site=blog_model.site,
+            categorias=list(blog_model.categorias.all()),
+            tags=list(blog_model.tags.all())
+        )
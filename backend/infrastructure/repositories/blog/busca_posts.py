@@ -0,0 +1,184 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pela busca textual de posts (full-text search do
+PostgreSQL).
+
+Cada post guarda em `vetor_busca` o tsvector do seu título (peso A), das suas
+tags (peso B) e do seu conteúdo sem HTML (peso C), na configuração textual
+CONFIGURACAO_BUSCA (português, com stemming e sem acentos; criada pela
+migração 0025). O vetor é indexado por um índice GIN, de modo que a busca
+consulta apenas os posts que contêm os termos, em vez de varrer o conteúdo
+de todos os posts com ILIKE.
+
+O vetor é recalculado pelos sinais de Post, das tags do post e de TagPost
+(veja infrastructure.signals.busca_posts) e, para todo o acervo, pelo
+comando `reindexar_busca_posts`. O HTML do conteúdo é removido em Python,
+com as entidades (ex.: &ccedil;) convertidas em caracteres.
+
+Classes:
+    DjangoBuscaPostsRepository: Busca textual e manutenção dos vetores de busca.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector, SearchVectorField)
+from django.db import models
+from django.db.models import F, FloatField, Q, QuerySet, TextField, Value
+from django.db.models.functions import Coalesce
+from domain.blog.repositories.busca_posts import BuscaPostsRepository
+from domain.blog.value_objects.resultado_busca_post import ResultadoBuscaPostDomain
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.models.blog.post import Post
+from infrastructure.repositories.blog.renderizacao_conteudo import texto_sem_html
+
+CONFIGURACAO_BUSCA = 'ritmo_pt'
+
+# Posts recalculados por instrução UPDATE na reindexação.
+TAMANHO_LOTE_REINDEXACAO = 500
+
+
+def vetor_busca(titulo: str, tags: Iterable[str], conteudo: str) -> SearchVector:
+    """
+    Retorna a expressão do tsvector de um post a partir do título, dos nomes
+    das tags e do conteúdo HTML.
+    """
+    partes = (
+        (titulo or '', 'A'),
+        (' '.join(tags), 'B'),
+        (texto_sem_html(conteudo), 'C'),
+    )
+    vetor = None
+    for texto, peso in partes:
+        parte = SearchVector(
+            Value(texto, output_field=TextField()), config=CONFIGURACAO_BUSCA, weight=peso
+        )
+        vetor = parte if vetor is None else vetor + parte
+    return vetor
+
+
+def consulta_busca(termos: str) -> SearchQuery:
+    """
+    Retorna a consulta dos termos na sintaxe de busca web ("frase exata", OR
+    e -exclusão), que aceita qualquer entrada sem erro de sintaxe.
+    """
+    return SearchQuery(termos, search_type='websearch', config=CONFIGURACAO_BUSCA)
+
+
+class DjangoBuscaPostsRepository(BuscaPostsRepository):
+    """
+    Implementação do repositório de busca textual de posts com o full-text
+    search do PostgreSQL.
+    """
+
+    def buscar(
+        self,
+        termos: str,
+        limite: int = 20,
+        deslocamento: int = 0,
+        blog_id: Optional[int] = None
+    ) -> List[ResultadoBuscaPostDomain]:
+        try:
+            posts = Post.objects.filter(status='publicado')
+            if blog_id is not None:
+                posts = posts.filter(blog_id=blog_id)
+            posts = self.filtrar(posts, termos).order_by('-relevancia', '-published_date', '-id')
+            return [
+                ResultadoBuscaPostDomain(
+                    post_id=post['id'],
+                    titulo=post['title'],
+                    slug=post['slug'],
+                    published_date=post['published_date'],
+                    relevancia=post['relevancia'],
+                )
+                for post in posts.values(
+                    'id', 'title', 'slug', 'published_date', 'relevancia'
+                )[deslocamento:deslocamento + limite]
+            ]
+        except Exception as e:
+            raise OperationFailedException(f"Erro ao buscar os posts: {str(e)}") from e
+
+    @staticmethod
+    def filtrar(queryset: QuerySet, termos: str, alternativa: Optional[Q] = None) -> QuerySet:
+        """
+        Restringe os posts do queryset aos que contêm os termos e anota a
+        relevância de cada um em `relevancia`.
+
+        Args:
+            queryset (QuerySet): Posts a filtrar.
+            termos (str): Termos buscados.
+            alternativa (Optional[Q]): Condição que também seleciona o post
+            quando ele não contém os termos (com relevância 0).
+
+        Returns:
+            QuerySet: Posts filtrados, sem ordenação imposta.
+        """
+        consulta = consulta_busca(termos)
+        condicao = Q(vetor_busca=consulta)
+        if alternativa is not None:
+            condicao |= alternativa
+        return queryset.filter(condicao).annotate(
+            relevancia=Coalesce(
+                SearchRank(F('vetor_busca'), consulta), Value(0.0), output_field=FloatField()
+            )
+        )
+
+    def atualizar_vetores(self, post_ids: Iterable[int]) -> int:
+        """
+        Recalcula o vetor de busca dos posts com uma instrução UPDATE por
+        lote, sem disparar os sinais de Post.
+
+        Args:
+            post_ids (Iterable[int]): IDs dos posts, inclusive excluídos.
+
+        Returns:
+            int: Quantidade de posts atualizados.
+
+        Raises:
+            OperationFailedException: Se a atualização falhar.
+        """
+        post_ids = list(dict.fromkeys(post_ids))
+        try:
+            atualizados = 0
+            for inicio in range(0, len(post_ids), TAMANHO_LOTE_REINDEXACAO):
+                atualizados += self._atualizar_lote(
+                    post_ids[inicio:inicio + TAMANHO_LOTE_REINDEXACAO]
+                )
+            return atualizados
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao atualizar os vetores de busca dos posts: {str(e)}"
+            ) from e
+
+    def reindexar(self) -> int:
+        """
+        Recalcula o vetor de busca de todos os posts, inclusive os excluídos.
+
+        Returns:
+            int: Quantidade de posts atualizados.
+        """
+        return self.atualizar_vetores(
+            Post.objects.all_with_deleted().order_by('id').values_list('id', flat=True).iterator()
+        )
+
+    @staticmethod
+    def _atualizar_lote(post_ids: List[int]) -> int:
+        tags: Dict[int, List[str]] = defaultdict(list)
+        for post_id, nome in Post.tags.through.objects.filter(
+            post_id__in=post_ids
+        ).order_by('tagpost__name').values_list('post_id', 'tagpost__name'):
+            tags[post_id].append(nome)
+
+        posts = Post.objects.all_with_deleted().filter(id__in=post_ids).only('title', 'content')
+        vetores = {
+            post.id: vetor_busca(post.title, tags[post.id], post.content)
+            for post in posts
+        }
+        if not vetores:
+            return 0
+        return Post.objects.all_with_deleted().filter(id__in=vetores).update(
+            vetor_busca=models.Case(
+                *(models.When(id=post_id, then=vetor) for post_id, vetor in vetores.items()),
+                output_field=SearchVectorField(),
+            )
+        )
@@ -0,0 +1,127 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pelo conteúdo pré-renderizado dos posts.
+
+O HTML do post é sanitizado e os campos derivados (resumo, texto simples,
+número de palavras e tempo de leitura) são calculados quando o post é salvo
+(veja renderizacao_conteudo) e gravados no próprio post. A leitura consulta
+apenas esses campos, sem carregar nem reprocessar o conteúdo original.
+
+Classes:
+    DjangoConteudoPostRepository: Leitura e atualização do conteúdo
+    renderizado dos posts.
+"""
+from typing import Dict, Iterable, Optional
+from domain.blog.repositories.conteudo_post import ConteudoPostRepository
+from domain.blog.value_objects.conteudo_renderizado_post import (
+    ConteudoRenderizadoPostDomain)
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.models.blog.post import Post
+from infrastructure.repositories.blog.renderizacao_conteudo import (
+    hash_conteudo, renderizar_conteudo)
+
+CAMPOS_RENDERIZADOS = (
+    'conteudo_renderizado', 'resumo', 'texto_simples', 'numero_palavras',
+    'tempo_leitura', 'hash_conteudo',
+)
+
+# Posts lidos e gravados por lote na renderização de todo o acervo.
+TAMANHO_LOTE_RENDERIZACAO = 200
+
+
+class DjangoConteudoPostRepository(ConteudoPostRepository):
+    """
+    Implementação do repositório do conteúdo renderizado de posts.
+    """
+
+    def obter(self, post_id: int) -> Optional[ConteudoRenderizadoPostDomain]:
+        return self.obter_varios([post_id]).get(post_id)
+
+    def obter_varios(self, post_ids: Iterable[int]) -> Dict[int, ConteudoRenderizadoPostDomain]:
+        try:
+            return {
+                linha['id']: ConteudoRenderizadoPostDomain(
+                    post_id=linha['id'],
+                    html=linha['conteudo_renderizado'],
+                    resumo=linha['resumo'],
+                    texto=linha['texto_simples'],
+                    numero_palavras=linha['numero_palavras'],
+                    tempo_leitura=linha['tempo_leitura'],
+                )
+                for linha in Post.objects.filter(id__in=list(post_ids)).values(
+                    'id', 'conteudo_renderizado', 'resumo', 'texto_simples',
+                    'numero_palavras', 'tempo_leitura',
+                )
+            }
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao obter o conteúdo renderizado dos posts: {str(e)}"
+            ) from e
+
+    def atualizar(self, post: Post) -> bool:
+        """
+        Renderiza o conteúdo do post, se ele mudou desde a última
+        renderização, e grava os campos derivados com uma instrução UPDATE,
+        sem disparar os sinais de Post. Os campos da instância também são
+        atualizados.
+
+        Args:
+            post (Post): Post já salvo.
+
+        Returns:
+            bool: True se o conteúdo foi renderizado.
+
+        Raises:
+            OperationFailedException: Se a renderização ou a gravação falhar.
+        """
+        if hash_conteudo(post.content) == post.hash_conteudo:
+            return False
+        try:
+            campos = renderizar_conteudo(post.content)
+            Post.objects.all_with_deleted().filter(pk=post.pk).update(**campos)
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao renderizar o conteúdo do post {post.pk}: {str(e)}"
+            ) from e
+        for campo, valor in campos.items():
+            setattr(post, campo, valor)
+        return True
+
+    def renderizar_todos(self, forcar: bool = False) -> int:
+        """
+        Renderiza o conteúdo de todos os posts, inclusive os excluídos, cujo
+        conteúdo mudou desde a última renderização (ou de todos, com
+        `forcar`), gravando-os em lotes.
+
+        Returns:
+            int: Quantidade de posts renderizados.
+
+        Raises:
+            OperationFailedException: Se a renderização ou a gravação falhar.
+        """
+        try:
+            renderizados = 0
+            ultimo_id = 0
+            while True:
+                lote = list(
+                    Post.objects.all_with_deleted()
+                    .filter(id__gt=ultimo_id)
+                    .order_by('id')
+                    .only('id', 'content', 'hash_conteudo')[:TAMANHO_LOTE_RENDERIZACAO]
+                )
+                if not lote:
+                    return renderizados
+                ultimo_id = lote[-1].id
+                alterados = []
+                for post in lote:
+                    if forcar or hash_conteudo(post.content) != post.hash_conteudo:
+                        for campo, valor in renderizar_conteudo(post.content).items():
+                            setattr(post, campo, valor)
+                        alterados.append(post)
+                Post.objects.all_with_deleted().bulk_update(alterados, CAMPOS_RENDERIZADOS)
+                renderizados += len(alterados)
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao renderizar o conteúdo dos posts: {str(e)}"
+            ) from e
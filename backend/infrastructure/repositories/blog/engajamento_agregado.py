@@ -0,0 +1,405 @@
+# pylint: disable=no-member
+"""
+Módulo implementa o repositório concreto de engajamento agregado.
+
+Além das consultas do contrato EngajamentoAgregadoRepository, o repositório
+mantém os agregados:
+
+    - `agregar` processa, em lotes de IDs, apenas os eventos posteriores à
+    marca d'água de cada fonte e soma suas contagens aos agregados por hora e
+    por dia. Cada lote é gravado na mesma transação que avança a marca, de
+    modo que um evento nunca é contado duas vezes nem esquecido. Deve ser
+    executado periodicamente (comando `agregar_engajamento`).
+    - `reconstruir` recalcula os agregados de um período (ou de todo o
+    histórico) a partir das tabelas de eventos (comando
+    `reconstruir_agregados_engajamento`). Necessário após a remoção de
+    eventos, que a agregação incremental não desconta.
+
+Classes:
+    DjangoEngajamentoAgregadoRepository: Consulta e manutenção dos agregados.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, Min, Sum, Value
+from django.db.models.functions import Coalesce, Trunc
+from django.utils import timezone
+from domain.blog.repositories.engajamento_agregado import (
+    EngajamentoAgregadoRepository)
+from domain.blog.value_objects.engajamento_agregado import EngajamentoAgregadoDomain
+from domain.shared.exceptions.invalid_input_exception import InvalidInputException
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.models.blog.agregado_engajamento_post import (
+    GRANULARIDADE_DIA, GRANULARIDADE_HORA, METRICA_AGREGADA_COMPARTILHAMENTOS,
+    METRICA_AGREGADA_REACOES, METRICA_AGREGADA_VISUALIZACOES,
+    METRICA_AGREGADA_VOTOS, AgregadoEngajamentoPost, MarcaAgregacaoEngajamento)
+from infrastructure.models.blog.compartilhamento_post import CompartilhamentoPost
+from infrastructure.models.blog.post_reacao import PostReacao
+from infrastructure.models.blog.visualizacao_post import VisualizacaoPost
+from infrastructure.models.blog.votacao_post import VotacaoPost
+
+# Fonte de eventos de cada métrica: (model, campo de data, campo da dimensão).
+FONTES = {
+    METRICA_AGREGADA_VISUALIZACOES: (VisualizacaoPost, 'data_visualizacao', 'localizacao__cidade'),
+    METRICA_AGREGADA_REACOES: (PostReacao, 'data_reacao', 'reacao_tipo'),
+    METRICA_AGREGADA_VOTOS: (VotacaoPost, 'data_votacao', 'voto'),
+    METRICA_AGREGADA_COMPARTILHAMENTOS: (
+        CompartilhamentoPost, 'data_compartilhamento', 'localizacao__cidade'
+    ),
+}
+
+# Unidade de truncamento (Trunc) de cada granularidade.
+TRUNCAMENTOS = {
+    GRANULARIDADE_HORA: 'hour',
+    GRANULARIDADE_DIA: 'day',
+}
+
+# Quantidade máxima de IDs de eventos processados por transação.
+TAMANHO_LOTE_AGREGACAO = 50000
+
+ChaveAgregado = Tuple[int, str, datetime, str]
+
+
+class DjangoEngajamentoAgregadoRepository(EngajamentoAgregadoRepository):
+    """
+    Repositório concreto dos agregados de engajamento de posts, usando
+    Django ORM.
+    """
+
+    # Consultas
+
+    def serie(
+        self,
+        metrica: str,
+        granularidade: str,
+        inicio: datetime,
+        fim: datetime,
+        post_id: Optional[int] = None,
+        por_dimensao: bool = False
+    ) -> List[EngajamentoAgregadoDomain]:
+        """
+        Retorna a série temporal de uma métrica no período [inicio, fim).
+
+        Raises:
+            InvalidInputException: Se a métrica ou a granularidade forem
+            desconhecidas.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        self._validar(metrica, granularidade)
+        try:
+            campos = ['inicio', 'dimensao'] if por_dimensao else ['inicio']
+            linhas = (
+                self._periodo(metrica, granularidade, inicio, fim, post_id)
+                .values(*campos)
+                .annotate(soma=Sum('total'))
+                .order_by(*campos)
+            )
+            return [
+                EngajamentoAgregadoDomain(
+                    inicio=linha['inicio'],
+                    total=linha['soma'],
+                    dimensao=linha.get('dimensao'),
+                    post_id=post_id,
+                )
+                for linha in linhas
+            ]
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao consultar a série de engajamento: {str(e)}"
+            ) from e
+
+    def totais_por_dimensao(
+        self,
+        metrica: str,
+        inicio: datetime,
+        fim: datetime,
+        post_id: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Retorna o total de uma métrica no período por dimensão, com precisão
+        de uma hora (de um dia, se o período começar e terminar à meia-noite).
+
+        Raises:
+            InvalidInputException: Se a métrica for desconhecida.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        self._validar(metrica)
+        try:
+            linhas = (
+                self._periodo(metrica, self._granularidade(inicio, fim), inicio, fim, post_id)
+                .values('dimensao')
+                .annotate(soma=Sum('total'))
+                .order_by('-soma')
+            )
+            return {linha['dimensao']: linha['soma'] for linha in linhas}
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao consultar o engajamento por dimensão: {str(e)}"
+            ) from e
+
+    def totais_por_post(
+        self,
+        metrica: str,
+        inicio: datetime,
+        fim: datetime,
+        dimensao: Optional[str] = None,
+        limite: Optional[int] = None
+    ) -> Dict[int, int]:
+        """
+        Retorna o total de uma métrica no período por post, do maior para o
+        menor, com a mesma precisão de `totais_por_dimensao`.
+
+        Raises:
+            InvalidInputException: Se a métrica for desconhecida.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        self._validar(metrica)
+        try:
+            agregados = self._periodo(metrica, self._granularidade(inicio, fim), inicio, fim)
+            if dimensao is not None:
+                agregados = agregados.filter(dimensao=dimensao)
+            linhas = (
+                agregados.values('post_id')
+                .annotate(soma=Sum('total'))
+                .order_by('-soma', 'post_id')
+            )
+            if limite is not None:
+                linhas = linhas[:limite]
+            return {linha['post_id']: linha['soma'] for linha in linhas}
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao consultar o engajamento por post: {str(e)}"
+            ) from e
+
+    # Manutenção
+
+    def agregar(self, tamanho_lote: int = TAMANHO_LOTE_AGREGACAO) -> Dict[str, int]:
+        """
+        Agrega os eventos posteriores à marca d'água de cada fonte.
+
+        Args:
+            tamanho_lote (int): Quantidade máxima de IDs por transação.
+
+        Returns:
+            Dict[str, int]: Quantidade de eventos agregados por métrica.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado; os lotes
+            já gravados são mantidos.
+        """
+        try:
+            return {
+                metrica: self._agregar_fonte(metrica, tamanho_lote)
+                for metrica in FONTES
+            }
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao agregar o engajamento dos posts: {str(e)}"
+            ) from e
+
+    def reconstruir(
+        self,
+        desde: Optional[date] = None,
+        ate: Optional[date] = None
+    ) -> Dict[str, int]:
+        """
+        Recalcula os agregados dos dias de `desde` a `ate` (inclusive), um
+        dia por transação, a partir das tabelas de eventos.
+
+        Sem período, reconstrói todo o histórico: os agregados são apagados
+        e a marca d'água é levada ao último evento existente, de modo que a
+        agregação incremental executada durante a reconstrução processe
+        apenas os eventos novos.
+
+        Args:
+            desde (Optional[date]): Primeiro dia; por padrão, o do evento mais
+            antigo.
+            ate (Optional[date]): Último dia; por padrão, hoje.
+
+        Returns:
+            Dict[str, int]: Quantidade de eventos agregados por métrica.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            return {
+                metrica: self._reconstruir_fonte(metrica, desde, ate)
+                for metrica in FONTES
+            }
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao reconstruir os agregados de engajamento: {str(e)}"
+            ) from e
+
+    def _agregar_fonte(self, metrica: str, tamanho_lote: int) -> int:
+        model = FONTES[metrica][0]
+        MarcaAgregacaoEngajamento.objects.get_or_create(fonte=metrica)
+        limite = self._maior_id_confirmado(model)
+        agregados = 0
+        while True:
+            with transaction.atomic():
+                # O bloqueio da marca serializa execuções concorrentes
+                marca = MarcaAgregacaoEngajamento.objects.select_for_update().get(fonte=metrica)
+                ate = min(marca.ultimo_id + tamanho_lote, limite)
+                if ate <= marca.ultimo_id:
+                    return agregados
+                agregados += self._somar(
+                    metrica, {'id__gt': marca.ultimo_id, 'id__lte': ate}
+                )
+                marca.ultimo_id = ate
+                marca.save(update_fields=['ultimo_id', 'atualizado_em'])
+
+    def _reconstruir_fonte(
+        self, metrica: str, desde: Optional[date], ate: Optional[date]
+    ) -> int:
+        model, campo_data, _ = FONTES[metrica]
+        MarcaAgregacaoEngajamento.objects.get_or_create(fonte=metrica)
+
+        if desde is None and ate is None:
+            with transaction.atomic():
+                marca = MarcaAgregacaoEngajamento.objects.select_for_update().get(fonte=metrica)
+                AgregadoEngajamentoPost.objects.filter(metrica=metrica).delete()
+                marca.ultimo_id = self._maior_id_confirmado(model)
+                marca.save(update_fields=['ultimo_id', 'atualizado_em'])
+
+        if desde is None:
+            primeiro = model.objects.aggregate(primeiro=Min(campo_data))['primeiro']
+            if primeiro is None:
+                return 0
+            desde = timezone.localdate(primeiro)
+        ate = ate or timezone.localdate()
+
+        agregados = 0
+        dia = desde
+        while dia <= ate:
+            inicio, fim = self._meia_noite(dia), self._meia_noite(dia + timedelta(days=1))
+            with transaction.atomic():
+                marca = MarcaAgregacaoEngajamento.objects.select_for_update().get(fonte=metrica)
+                AgregadoEngajamentoPost.objects.filter(
+                    metrica=metrica, inicio__gte=inicio, inicio__lt=fim
+                ).delete()
+                # Eventos após a marca serão somados pela agregação incremental
+                agregados += self._somar(metrica, {
+                    'id__lte': marca.ultimo_id,
+                    f'{campo_data}__gte': inicio,
+                    f'{campo_data}__lt': fim,
+                })
+            dia += timedelta(days=1)
+        return agregados
+
+    def _somar(self, metrica: str, filtro: Dict[str, object]) -> int:
+        """
+        Soma aos agregados, nas duas granularidades, os eventos da fonte
+        selecionados por `filtro`. Deve ser chamado com a marca da fonte
+        bloqueada.
+
+        Returns:
+            int: Quantidade de eventos somados.
+        """
+        model, campo_data, campo_dimensao = FONTES[metrica]
+        incrementos: Dict[ChaveAgregado, int] = {}
+        for granularidade, truncamento in TRUNCAMENTOS.items():
+            linhas = (
+                model.objects.filter(**filtro)
+                .order_by()  # remove a ordenação padrão do GROUP BY
+                .values(
+                    'post_id',
+                    bucket=Trunc(campo_data, truncamento),
+                    valor_dimensao=Coalesce(F(campo_dimensao), Value('')),
+                )
+                .annotate(total=Count('id'))
+            )
+            for linha in linhas:
+                chave = (
+                    linha['post_id'], granularidade, linha['bucket'],
+                    linha['valor_dimensao'],
+                )
+                incrementos[chave] = incrementos.get(chave, 0) + linha['total']
+        if not incrementos:
+            return 0
+
+        existentes = {
+            (agregado.post_id, agregado.granularidade, agregado.inicio, agregado.dimensao): agregado
+            for agregado in AgregadoEngajamentoPost.objects.filter(
+                metrica=metrica,
+                post_id__in={chave[0] for chave in incrementos},
+                inicio__in={chave[2] for chave in incrementos},
+            )
+        }
+        alterados, novos = [], []
+        for chave, total in incrementos.items():
+            agregado = existentes.get(chave)
+            if agregado is not None:
+                agregado.total += total
+                alterados.append(agregado)
+            else:
+                post_id, granularidade, inicio, dimensao = chave
+                novos.append(AgregadoEngajamentoPost(
+                    post_id=post_id, granularidade=granularidade, inicio=inicio,
+                    metrica=metrica, dimensao=dimensao, total=total,
+                ))
+        AgregadoEngajamentoPost.objects.bulk_update(alterados, ['total'], batch_size=1000)
+        AgregadoEngajamentoPost.objects.bulk_create(novos, batch_size=1000)
+
+        return sum(
+            total for (_, granularidade, _, _), total in incrementos.items()
+            if granularidade == GRANULARIDADE_DIA
+        )
+
+    @staticmethod
+    def _maior_id_confirmado(model) -> int:
+        """
+        Retorna o maior ID da tabela de eventos tal que nenhum ID menor ainda
+        possa ser confirmado por uma transação em andamento. No PostgreSQL,
+        um bloqueio SHARE breve aguarda as inserções em andamento; sem ele, um
+        evento com ID menor confirmado depois da leitura ficaria abaixo da
+        marca e nunca seria agregado.
+        """
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f'LOCK TABLE {connection.ops.quote_name(model._meta.db_table)} '
+                        'IN SHARE MODE'
+                    )
+            return model.objects.aggregate(maior=Max('id'))['maior'] or 0
+
+    def _periodo(
+        self,
+        metrica: str,
+        granularidade: str,
+        inicio: datetime,
+        fim: datetime,
+        post_id: Optional[int] = None
+    ):
+        agregados = AgregadoEngajamentoPost.objects.filter(
+            metrica=metrica, granularidade=granularidade,
+            inicio__gte=inicio, inicio__lt=fim,
+        )
+        if post_id is not None:
+            agregados = agregados.filter(post_id=post_id)
+        return agregados
+
+    @staticmethod
+    def _granularidade(inicio: datetime, fim: datetime) -> str:
+        """Usa os agregados diários se o período for formado por dias inteiros."""
+        meia_noite = time(0, 0)
+        if (
+            timezone.localtime(inicio).time() == meia_noite
+            and timezone.localtime(fim).time() == meia_noite
+        ):
+            return GRANULARIDADE_DIA
+        return GRANULARIDADE_HORA
+
+    @staticmethod
+    def _meia_noite(dia: date) -> datetime:
+        return timezone.make_aware(datetime.combine(dia, time(0, 0)))
+
+    @staticmethod
+    def _validar(metrica: str, granularidade: str = GRANULARIDADE_DIA) -> None:
+        if metrica not in FONTES:
+            raise InvalidInputException(f"Métrica de engajamento desconhecida: {metrica}")
+        if granularidade not in TRUNCAMENTOS:
+            raise InvalidInputException(f"Granularidade desconhecida: {granularidade}")
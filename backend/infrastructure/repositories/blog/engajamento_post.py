@@ -0,0 +1,301 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pelo repositório dos contadores de engajamento de posts.
+
+As escritas de eventos (visualizações, reações, votos, compartilhamentos e
+aprovações de comentários) incrementam os contadores com
+`UPDATE ... SET valor = valor + n` em um shard aleatório, sem ler a linha e
+sem disputar uma única linha por post. As leituras somam os shards de cada métrica. `reconciliar` reconstrói os
+contadores a partir das tabelas de eventos.
+
+No PostgreSQL, a reconciliação e os incrementos se coordenam por bloqueios
+consultivos (advisory locks) de transação, um por post: os incrementos
+tomam o bloqueio compartilhado (e não disputam entre si) e a reconciliação
+toma o exclusivo dos posts do lote. Assim, a reconciliação aguarda apenas as
+transações de eventos em andamento nos posts do lote e bloqueia apenas os
+novos eventos desses posts, sem perder nem contar duas vezes um incremento
+confirmado durante a recontagem.
+
+O campo desnormalizado `Post.numero_compartilhamentos` não é atualizado a
+cada compartilhamento, o que voltaria a concentrar as escritas na linha do
+post (a mesma usada pelo admin e pela edição do conteúdo): ele é derivado
+dos contadores por `sincronizar_compartilhamentos` e por `reconciliar`.
+
+Classes:
+    EngajamentoPostRepository: Incremento, leitura e reconciliação dos
+    contadores de engajamento.
+"""
+import random
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.db import connection, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from domain.blog.value_objects.comentario_moderacao import STATUS_APROVADO
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.models.blog.comentario_post import ComentarioPost
+from infrastructure.models.blog.compartilhamento_post import CompartilhamentoPost
+from infrastructure.models.blog.contador_engajamento_post import (
+    METRICA_COMENTARIOS_APROVADOS, METRICA_COMPARTILHAMENTOS,
+    METRICA_VISUALIZACOES, METRICA_VOTOS_NEGATIVOS, METRICA_VOTOS_POSITIVOS,
+    NUMERO_SHARDS, PREFIXO_METRICA_REACAO, ContadorEngajamentoPost)
+from infrastructure.models.blog.post import Post
+from infrastructure.models.blog.post_reacao import PostReacao
+from infrastructure.models.blog.visualizacao_post import VisualizacaoPost
+from infrastructure.models.blog.votacao_post import VotacaoPost
+
+# Quantidade de posts reconciliados por transação (e de bloqueios
+# consultivos mantidos pela transação, limitados por max_locks_per_transaction).
+TAMANHO_LOTE_RECONCILIACAO = 200
+
+# Espaço de chaves dos bloqueios consultivos (post) dos contadores.
+CLASSE_BLOQUEIO_ENGAJAMENTO = 7301
+
+METRICA_POR_VOTO = {
+    'positivo': METRICA_VOTOS_POSITIVOS,
+    'negativo': METRICA_VOTOS_NEGATIVOS,
+}
+
+
+def metrica_reacao(reacao_tipo: str) -> str:
+    """Retorna o nome da métrica de um tipo de reação."""
+    return f'{PREFIXO_METRICA_REACAO}{reacao_tipo}'
+
+
+class EngajamentoPostRepository:
+    """
+    Repositório dos contadores pré-agregados de engajamento de posts.
+    """
+
+    def incrementar(self, post_id: int, metrica: str, quantidade: int = 1) -> None:
+        """
+        Soma `quantidade` (que pode ser negativa) ao contador do post.
+
+        Args:
+            post_id (int): ID do post.
+            metrica (str): Nome da métrica.
+            quantidade (int): Valor a somar.
+        """
+        self.incrementar_varios({(post_id, metrica): quantidade})
+
+    def incrementar_varios(self, incrementos: Dict[Tuple[int, str], int]) -> None:
+        """
+        Aplica vários incrementos, um UPDATE atômico por par (post, métrica),
+        em ordem de (post, métrica) para que transações concorrentes tomem os
+        shards na mesma ordem. Os shards inexistentes são criados na primeira
+        escrita. Deve ser chamado na transação que grava os eventos.
+
+        Args:
+            incrementos (Dict[Tuple[int, str], int]): Quantidade a somar por
+            (ID do post, métrica).
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            with transaction.atomic():
+                self._bloquear_posts(
+                    {post_id for (post_id, _), quantidade in incrementos.items() if quantidade},
+                    exclusivo=False,
+                )
+                for (post_id, metrica), quantidade in sorted(incrementos.items()):
+                    if not quantidade:
+                        continue
+                    filtro = {
+                        'post_id': post_id,
+                        'metrica': metrica,
+                        'shard': random.randrange(NUMERO_SHARDS),
+                    }
+                    atualizados = ContadorEngajamentoPost.objects.filter(**filtro).update(
+                        valor=F('valor') + quantidade
+                    )
+                    if not atualizados:
+                        # Cria o shard zerado (ignorando uma criação concorrente)
+                        # e repete o incremento atômico
+                        ContadorEngajamentoPost.objects.bulk_create(
+                            [ContadorEngajamentoPost(**filtro)], ignore_conflicts=True
+                        )
+                        ContadorEngajamentoPost.objects.filter(**filtro).update(
+                            valor=F('valor') + quantidade
+                        )
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao incrementar os contadores de engajamento: {str(e)}"
+            ) from e
+
+    def obter(self, post_id: int) -> Dict[str, int]:
+        """
+        Retorna os contadores de um post.
+
+        Args:
+            post_id (int): ID do post.
+
+        Returns:
+            Dict[str, int]: Valor de cada métrica; métricas sem eventos não
+            aparecem.
+        """
+        return self.obter_varios([post_id]).get(post_id, {})
+
+    def obter_varios(self, post_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+        """
+        Retorna os contadores de vários posts em uma única consulta.
+
+        Args:
+            post_ids (Iterable[int]): IDs dos posts.
+
+        Returns:
+            Dict[int, Dict[str, int]]: Contadores por ID do post.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            contadores: Dict[int, Dict[str, int]] = defaultdict(dict)
+            linhas = (
+                ContadorEngajamentoPost.objects
+                .filter(post_id__in=list(post_ids))
+                .values('post_id', 'metrica')
+                .annotate(total=Sum('valor'))
+            )
+            for linha in linhas:
+                contadores[linha['post_id']][linha['metrica']] = linha['total']
+            return dict(contadores)
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao obter os contadores de engajamento: {str(e)}"
+            ) from e
+
+    def sincronizar_compartilhamentos(self) -> int:
+        """
+        Copia o total do contador de compartilhamentos para
+        `Post.numero_compartilhamentos`, com uma única instrução UPDATE que
+        altera apenas os posts cujo valor mudou.
+
+        Returns:
+            int: Quantidade de posts atualizados.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            total = Coalesce(
+                Subquery(
+                    ContadorEngajamentoPost.objects
+                    .filter(post_id=OuterRef('pk'), metrica=METRICA_COMPARTILHAMENTOS)
+                    .values('post_id')
+                    .annotate(total=Sum('valor'))
+                    .values('total')
+                ),
+                Value(0),
+            )
+            return (
+                Post.objects.all_with_deleted()
+                .annotate(total_compartilhamentos=total)
+                .exclude(numero_compartilhamentos=F('total_compartilhamentos'))
+                .update(numero_compartilhamentos=total)
+            )
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao sincronizar o número de compartilhamentos dos posts: {str(e)}"
+            ) from e
+
+    def reconciliar(self, post_ids: Optional[List[int]] = None) -> int:
+        """
+        Reconstrói os contadores a partir das tabelas de eventos, em lotes de
+        TAMANHO_LOTE_RECONCILIACAO posts por transação. Também corrige
+        `Post.numero_compartilhamentos`.
+
+        Args:
+            post_ids (Optional[List[int]]): Posts a reconciliar; por padrão,
+            todos.
+
+        Returns:
+            int: Quantidade de posts reconciliados.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            if post_ids is None:
+                post_ids = list(
+                    Post.objects.all_with_deleted().order_by('pk').values_list('pk', flat=True)
+                )
+            for inicio in range(0, len(post_ids), TAMANHO_LOTE_RECONCILIACAO):
+                self._reconciliar_lote(post_ids[inicio:inicio + TAMANHO_LOTE_RECONCILIACAO])
+            return len(post_ids)
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao reconciliar os contadores de engajamento: {str(e)}"
+            ) from e
+
+    @staticmethod
+    def _bloquear_posts(post_ids: Iterable[int], exclusivo: bool) -> None:
+        """
+        Toma, em ordem de ID, os bloqueios consultivos de transação dos posts
+        (somente PostgreSQL).
+        """
+        post_ids = sorted(post_ids)
+        if not post_ids or connection.vendor != 'postgresql':
+            return
+        funcao = 'pg_advisory_xact_lock' if exclusivo else 'pg_advisory_xact_lock_shared'
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT {funcao}(%s, post_id) '
+                f'FROM (SELECT unnest(%s::integer[]) AS post_id ORDER BY 1) AS posts',
+                [CLASSE_BLOQUEIO_ENGAJAMENTO, post_ids],
+            )
+
+    @transaction.atomic
+    def _reconciliar_lote(self, post_ids: List[int]) -> None:
+        # O bloqueio exclusivo dos posts aguarda as transações de eventos em
+        # andamento nesses posts (que incrementam os contadores na própria
+        # transação) e bloqueia os novos incrementos até o fim do lote; sem
+        # ele, um incremento confirmado entre a contagem e a regravação dos
+        # contadores seria perdido, ou contado duas vezes ao recriar um shard.
+        self._bloquear_posts(post_ids, exclusivo=True)
+
+        totais: Dict[Tuple[int, str], int] = {}
+
+        for linha in (
+            VisualizacaoPost.objects.filter(post_id__in=post_ids)
+            .values('post_id').annotate(total=Count('id'))
+        ):
+            totais[(linha['post_id'], METRICA_VISUALIZACOES)] = linha['total']
+
+        for linha in (
+            PostReacao.objects.filter(post_id__in=post_ids)
+            .values('post_id', 'reacao_tipo').annotate(total=Count('id'))
+        ):
+            totais[(linha['post_id'], metrica_reacao(linha['reacao_tipo']))] = linha['total']
+
+        for linha in (
+            VotacaoPost.objects.filter(post_id__in=post_ids)
+            .values('post_id', 'voto').annotate(total=Count('id'))
+        ):
+            metrica = METRICA_POR_VOTO.get(linha['voto'])
+            if metrica:
+                totais[(linha['post_id'], metrica)] = linha['total']
+
+        for linha in (
+            CompartilhamentoPost.objects.filter(post_id__in=post_ids)
+            .values('post_id').annotate(total=Count('id'))
+        ):
+            totais[(linha['post_id'], METRICA_COMPARTILHAMENTOS)] = linha['total']
+
+        for linha in (
+            ComentarioPost.objects.filter(post_id__in=post_ids, status=STATUS_APROVADO)
+            .values('post_id').annotate(total=Count('id'))
+        ):
+            totais[(linha['post_id'], METRICA_COMENTARIOS_APROVADOS)] = linha['total']
+
+        ContadorEngajamentoPost.objects.filter(post_id__in=post_ids).delete()
+        ContadorEngajamentoPost.objects.bulk_create([
+            ContadorEngajamentoPost(post_id=post_id, metrica=metrica, shard=0, valor=total)
+            for (post_id, metrica), total in totais.items()
+        ])
+
+        posts = list(Post.objects.all_with_deleted().filter(pk__in=post_ids).only('pk'))
+        for post in posts:
+            post.numero_compartilhamentos = totais.get((post.pk, METRICA_COMPARTILHAMENTOS), 0)
+        Post.objects.all_with_deleted().bulk_update(posts, ['numero_compartilhamentos'])
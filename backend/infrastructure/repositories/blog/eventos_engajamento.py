@@ -0,0 +1,298 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pela ingestão bufferizada das reações, votos e
+compartilhamentos de posts.
+
+Assim como as visualizações (veja VisualizacaoPostRepository), esses eventos
+não precisam ser gravados durante a requisição: `registrar_*` apenas
+enfileira o evento no IngestorBufferizado do seu tipo, e a thread de gravação
+grava os eventos de todas as requisições concorrentes em lotes, com um
+`bulk_create` por lote, reaproveitando as localizações canônicas de cada IP
+no dia. Os contadores de engajamento são incrementados uma
+única vez por (post, métrica) e por lote, e os eventos alimentam o motor de
+tendências após o commit.
+
+A validação (post publicado, tipo de reação, deduplicação e limitação de
+taxa) é responsabilidade de quem registra o evento e deve ocorrer antes de
+`registrar_*`: um evento de um post apagado depois da validação faz o lote
+falhar, e o IngestorBufferizado o divide para gravar os demais eventos,
+mantendo no spool apenas o evento com erro.
+
+As datas de reações, votos e compartilhamentos são atribuídas na gravação do
+lote (auto_now_add), alguns segundos após o evento.
+
+Classes:
+    EventosEngajamentoRepository: Registro e gravação em lote de reações,
+    votos e compartilhamentos.
+"""
+import threading
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.models.blog.compartilhamento_post import CompartilhamentoPost
+from infrastructure.models.blog.contador_engajamento_post import (
+    METRICA_COMPARTILHAMENTOS)
+from infrastructure.models.blog.post_reacao import PostReacao
+from infrastructure.models.blog.votacao_post import VotacaoPost
+from infrastructure.repositories.blog.engajamento_post import (
+    METRICA_POR_VOTO, EngajamentoPostRepository, metrica_reacao)
+from infrastructure.repositories.blog.tendencias import (
+    EVENTO_COMPARTILHAMENTO, EVENTO_REACAO, EVENTO_VOTO, MotorTendencias)
+from infrastructure.repositories.blog.visualizacao_post import (
+    CAMPOS_LOCALIZACAO, diretorio_spool)
+from infrastructure.repositories.shared.ingestao_bufferizada import (
+    IngestorBufferizado, reprocessar_spool)
+from infrastructure.repositories.shared.resources.localizacao_canonica import (
+    LocalizacaoCanonicaRepository)
+
+NOME_INGESTAO_REACOES = 'reacoes'
+NOME_INGESTAO_VOTOS = 'votos'
+NOME_INGESTAO_COMPARTILHAMENTOS = 'compartilhamentos'
+
+Evento = Dict[str, object]
+
+
+def _localizacao(localizacao: Optional[Dict[str, object]]) -> Optional[Dict[str, object]]:
+    if not localizacao:
+        return None
+    return {campo: localizacao.get(campo) for campo in CAMPOS_LOCALIZACAO}
+
+
+class EventosEngajamentoRepository:
+    """
+    Repositório de PostReacao, VotacaoPost e CompartilhamentoPost com
+    ingestão bufferizada.
+    """
+
+    _ingestores: Dict[str, IngestorBufferizado] = {}
+    _lock_ingestores = threading.Lock()
+
+    def registrar_reacao(
+        self,
+        post_id: int,
+        reacao_tipo: str,
+        ip_origem: Optional[str] = None
+    ) -> bool:
+        """
+        Registra uma reação já validada para gravação em lote posterior.
+
+        Args:
+            post_id (int): ID do post.
+            reacao_tipo (str): Nome do tipo de reação.
+            ip_origem (Optional[str]): IP de origem da reação.
+
+        Returns:
+            bool: False se o evento foi descartado por contrapressão.
+        """
+        return self.ingestor(NOME_INGESTAO_REACOES).enfileirar({
+            'post_id': post_id,
+            'reacao_tipo': reacao_tipo,
+            'ip_origem': ip_origem,
+        })
+
+    def registrar_voto(
+        self,
+        post_id: int,
+        voto: str,
+        pessoa_fisica_id: Optional[int] = None,
+        localizacao: Optional[Dict[str, object]] = None
+    ) -> bool:
+        """
+        Registra um voto ('positivo' ou 'negativo') para gravação em lote
+        posterior.
+
+        Args:
+            post_id (int): ID do post.
+            voto (str): Valor do voto.
+            pessoa_fisica_id (Optional[int]): ID da pessoa física, se autenticada.
+            localizacao (Optional[Dict[str, object]]): Campos de
+            CAMPOS_LOCALIZACAO da origem do voto.
+
+        Returns:
+            bool: False se o evento foi descartado por contrapressão.
+        """
+        return self.ingestor(NOME_INGESTAO_VOTOS).enfileirar({
+            'post_id': post_id,
+            'voto': voto,
+            'pessoa_fisica_id': pessoa_fisica_id,
+            'localizacao': _localizacao(localizacao),
+        })
+
+    def registrar_compartilhamento(
+        self,
+        post_id: int,
+        pessoa_fisica_id: Optional[int] = None,
+        localizacao: Optional[Dict[str, object]] = None
+    ) -> bool:
+        """
+        Registra um compartilhamento para gravação em lote posterior.
+
+        Args:
+            post_id (int): ID do post.
+            pessoa_fisica_id (Optional[int]): ID da pessoa física, se autenticada.
+            localizacao (Optional[Dict[str, object]]): Campos de
+            CAMPOS_LOCALIZACAO da origem do compartilhamento.
+
+        Returns:
+            bool: False se o evento foi descartado por contrapressão.
+        """
+        return self.ingestor(NOME_INGESTAO_COMPARTILHAMENTOS).enfileirar({
+            'post_id': post_id,
+            'pessoa_fisica_id': pessoa_fisica_id,
+            'localizacao': _localizacao(localizacao),
+        })
+
+    @transaction.atomic
+    def gravar_reacoes(self, eventos: List[Evento]) -> None:
+        """
+        Grava um lote de reações com um único `bulk_create`.
+
+        Raises:
+            OperationFailedException: Se a gravação falhar; nada é gravado.
+        """
+        try:
+            PostReacao.objects.bulk_create([
+                PostReacao(
+                    post_id=evento['post_id'],
+                    reacao_tipo=evento['reacao_tipo'],
+                    ip_origem=evento.get('ip_origem'),
+                )
+                for evento in eventos
+            ])
+            self._contabilizar(
+                eventos,
+                lambda evento: metrica_reacao(evento['reacao_tipo']),
+                EVENTO_REACAO,
+            )
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao gravar o lote de reações: {str(e)}"
+            ) from e
+
+    @transaction.atomic
+    def gravar_votos(self, eventos: List[Evento]) -> None:
+        """
+        Grava um lote de votos com um único `bulk_create`.
+
+        Raises:
+            OperationFailedException: Se a gravação falhar; nada é gravado.
+        """
+        try:
+            localizacoes = self._localizacoes(eventos)
+            VotacaoPost.objects.bulk_create([
+                VotacaoPost(
+                    post_id=evento['post_id'],
+                    voto=evento['voto'],
+                    pessoa_fisica_id=evento.get('pessoa_fisica_id'),
+                    localizacao_id=localizacao_id,
+                )
+                for evento, localizacao_id in zip(eventos, localizacoes)
+            ])
+            self._contabilizar(
+                eventos, lambda evento: METRICA_POR_VOTO.get(evento['voto']), EVENTO_VOTO
+            )
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao gravar o lote de votos: {str(e)}"
+            ) from e
+
+    @transaction.atomic
+    def gravar_compartilhamentos(self, eventos: List[Evento]) -> None:
+        """
+        Grava um lote de compartilhamentos com um único `bulk_create`.
+
+        Raises:
+            OperationFailedException: Se a gravação falhar; nada é gravado.
+        """
+        try:
+            localizacoes = self._localizacoes(eventos)
+            CompartilhamentoPost.objects.bulk_create([
+                CompartilhamentoPost(
+                    post_id=evento['post_id'],
+                    pessoa_fisica_id=evento.get('pessoa_fisica_id'),
+                    localizacao_id=localizacao_id,
+                )
+                for evento, localizacao_id in zip(eventos, localizacoes)
+            ])
+            self._contabilizar(
+                eventos, lambda evento: METRICA_COMPARTILHAMENTOS, EVENTO_COMPARTILHAMENTO
+            )
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao gravar o lote de compartilhamentos: {str(e)}"
+            ) from e
+
+    def reprocessar_spool(self, idade_minima: float = 300.0, incluir_mortos: bool = False) -> int:
+        """
+        Regrava as reações, votos e compartilhamentos deixados no spool por
+        processos encerrados antes de gravá-los (e, com `incluir_mortos`, os
+        que esgotaram as tentativas de gravação).
+
+        Returns:
+            int: Quantidade de eventos regravados.
+        """
+        return sum(
+            reprocessar_spool(
+                nome, gravar, diretorio_spool(), idade_minima,
+                max_tentativas=getattr(settings, 'INGESTAO_MAX_TENTATIVAS', 10),
+                incluir_mortos=incluir_mortos,
+            )
+            for nome, gravar in self._gravadores().items()
+        )
+
+    @classmethod
+    def ingestor(cls, nome: str) -> IngestorBufferizado:
+        """Retorna o ingestor do processo para o tipo de evento `nome`."""
+        with cls._lock_ingestores:
+            if nome not in cls._ingestores:
+                cls._ingestores[nome] = IngestorBufferizado(
+                    nome,
+                    cls()._gravadores()[nome],
+                    diretorio_spool(),
+                    tamanho_lote=getattr(settings, 'INGESTAO_TAMANHO_LOTE', 500),
+                    intervalo=getattr(settings, 'INGESTAO_INTERVALO', 2.0),
+                    max_tentativas=getattr(settings, 'INGESTAO_MAX_TENTATIVAS', 10),
+                )
+        return cls._ingestores[nome]
+
+    def _gravadores(self) -> Dict[str, Callable[[List[Evento]], None]]:
+        return {
+            NOME_INGESTAO_REACOES: self.gravar_reacoes,
+            NOME_INGESTAO_VOTOS: self.gravar_votos,
+            NOME_INGESTAO_COMPARTILHAMENTOS: self.gravar_compartilhamentos,
+        }
+
+    @staticmethod
+    def _localizacoes(eventos: List[Evento]) -> List[Optional[int]]:
+        """Retorna os IDs das localizações canônicas do lote, na ordem dos eventos."""
+        hoje = timezone.localdate()
+        return LocalizacaoCanonicaRepository.padrao().obter_ids(
+            [evento.get('localizacao') for evento in eventos], [hoje] * len(eventos)
+        )
+
+    @staticmethod
+    def _contabilizar(
+        eventos: List[Evento],
+        metrica: Callable[[Evento], Optional[str]],
+        tipo_evento: str
+    ) -> None:
+        """
+        Incrementa os contadores de engajamento do lote e, após o commit,
+        registra os eventos no motor de tendências.
+        """
+        incrementos = Counter(
+            (evento['post_id'], metrica(evento)) for evento in eventos if metrica(evento)
+        )
+        EngajamentoPostRepository().incrementar_varios(dict(incrementos))
+
+        tendencias = Counter(evento['post_id'] for evento in eventos)
+        transaction.on_commit(
+            lambda: MotorTendencias.padrao().registrar_varios(
+                (post_id, tipo_evento, None, quantidade)
+                for post_id, quantidade in tendencias.items()
+            )
+        )
@@ -0,0 +1,452 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pelos feeds (RSS 2.0, Atom e JSON Feed 1.1) dos posts de
+um blog, de uma tag ou de uma categoria.
+
+Leitores de feeds consultam os feeds com frequência, e quase sempre nada
+mudou. Por isso, os feeds não são gerados a cada requisição: cada feed é
+gerado somente quando um post do seu escopo é salvo (o que inclui a
+publicação, a alteração e a exclusão lógica), quando as tags do post mudam ou
+quando o blog, a tag ou a categoria é alterado (veja
+infrastructure.signals.feeds). A geração acontece após o commit, uma única
+vez por escopo e por transação, e o conteúdo serializado, o ETag (hash do
+conteúdo) e a data da última modificação são gravados em FeedGerado. Um feed
+gerado novamente com o mesmo conteúdo mantém o ETag e a data.
+
+A leitura (`obter`) consulta primeiro um LRU em memória por processo, válido
+por FEEDS_TTL_LOCAL segundos. Expirada a entrada, o feed do LRU ou do cache
+do Django é revalidado pelo ETag gravado em FeedGerado (uma consulta de uma
+coluna) e só é recarregado se tiver mudado; assim, uma regeneração feita por
+outro processo é percebida em até FEEDS_TTL_LOCAL segundos, mesmo que o cache
+do Django não seja compartilhado. Um feed ainda não gerado é gerado na
+primeira leitura, e um escopo inexistente fica registrado como ausente por
+FEEDS_TIMEOUT_AUSENTE segundos, para que leituras repetidas não consultem o
+banco de dados.
+
+A categoria não se relaciona diretamente com os posts: o feed de uma
+categoria contém os posts dos blogs da categoria.
+
+Classes:
+    DjangoFeedsRepository: Geração e leitura dos feeds serializados.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone as dt_timezone
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import feedgenerator, timezone
+from domain.blog.repositories.feeds import FeedsRepository
+from domain.blog.value_objects.feed_serializado import FeedSerializadoDomain
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.models.blog.blog import Blog
+from infrastructure.models.blog.categoria_post import CategoriaPost
+from infrastructure.models.blog.feed_gerado import (
+    ESCOPO_BLOG, ESCOPO_CATEGORIA, ESCOPO_TAG, FORMATO_ATOM, FORMATO_JSON,
+    FORMATO_RSS, FeedGerado)
+from infrastructure.models.blog.post import Post
+from infrastructure.models.blog.tag_post import TagPost
+
+logger = logging.getLogger('ocorrencias')
+
+PREFIXO_CHAVE = 'feed'
+
+# (tipo do escopo, ID do blog, da tag ou da categoria)
+Escopo = Tuple[str, int]
+
+TIPOS_CONTEUDO = {
+    FORMATO_RSS: 'application/rss+xml; charset=utf-8',
+    FORMATO_ATOM: 'application/atom+xml; charset=utf-8',
+    FORMATO_JSON: 'application/feed+json; charset=utf-8',
+}
+
+# Filtro dos posts de cada tipo de escopo.
+FILTRO_ESCOPO = {
+    ESCOPO_BLOG: 'blog_id',
+    ESCOPO_TAG: 'tags',
+    ESCOPO_CATEGORIA: 'blog__categorias',
+}
+
+# Data de atualização dos feeds sem posts.
+DATA_FEED_VAZIO = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+
+# Marcador dos escopos inexistentes no LRU local e no cache do Django.
+AUSENTE = 'ausente'
+
+
+class _DataEstavel:
+    """
+    Sem posts, o feedgenerator usa o instante atual como data de atualização
+    do feed; a data fixa mantém o conteúdo (e o ETag) entre as gerações.
+    """
+
+    def latest_post_date(self):
+        if not self.items:
+            return DATA_FEED_VAZIO
+        return super().latest_post_date()
+
+
+class _FeedRss(_DataEstavel, feedgenerator.Rss201rev2Feed):
+    pass
+
+
+class _FeedAtom(_DataEstavel, feedgenerator.Atom1Feed):
+    pass
+
+
+def _serializar_xml(classe, cabecalho: Dict[str, str], itens: List[Dict[str, object]]) -> bytes:
+    feed = classe(
+        title=cabecalho['titulo'],
+        link=cabecalho['link'],
+        description=cabecalho['descricao'],
+        language='pt-br',
+        feed_url=cabecalho['url_feed'],
+    )
+    for item in itens:
+        feed.add_item(
+            title=item['title'],
+            link=item['link'],
+            description=item['resumo'],
+            unique_id=item['link'],
+            pubdate=item['published_date'],
+            author_name=item['autor'] or None,
+        )
+    return feed.writeString('utf-8').encode('utf-8')
+
+
+def _serializar_json(cabecalho: Dict[str, str], itens: List[Dict[str, object]]) -> bytes:
+    feed = {
+        'version': 'https://jsonfeed.org/version/1.1',
+        'title': cabecalho['titulo'],
+        'home_page_url': cabecalho['link'],
+        'feed_url': cabecalho['url_feed'],
+        'description': cabecalho['descricao'],
+        'language': 'pt-BR',
+        'items': [
+            {
+                'id': item['link'],
+                'url': item['link'],
+                'title': item['title'],
+                'summary': item['resumo'],
+                'content_html': item['conteudo_renderizado'],
+                'date_published': item['published_date'].isoformat(),
+                **({'authors': [{'name': item['autor']}]} if item['autor'] else {}),
+            }
+            for item in itens
+        ],
+    }
+    return json.dumps(feed, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+SERIALIZADORES = {
+    FORMATO_RSS: partial(_serializar_xml, _FeedRss),
+    FORMATO_ATOM: partial(_serializar_xml, _FeedAtom),
+    FORMATO_JSON: _serializar_json,
+}
+
+
+class DjangoFeedsRepository(FeedsRepository):
+    """
+    Implementação do repositório dos feeds de posts, com o conteúdo
+    serializado gravado em FeedGerado.
+    """
+
+    _local: OrderedDict = OrderedDict()
+    _lock = threading.Lock()
+    _pendentes = threading.local()
+
+    def obter_local(self, escopo: str, escopo_id: int, formato: str) -> Optional[FeedSerializadoDomain]:
+        """
+        Retorna o feed do LRU do processo, sem acessar o cache do Django nem o
+        banco de dados, ou None em falta.
+        """
+        feed, valido = self._ler_local(escopo, escopo_id, formato)
+        return feed if valido and feed != AUSENTE else None
+
+    def obter(self, escopo: str, escopo_id: int, formato: str) -> Optional[FeedSerializadoDomain]:
+        """
+        Retorna o feed serializado, gerando-o se ainda não tiver sido gerado.
+
+        Raises:
+            OperationFailedException: Se a leitura ou a geração falhar.
+        """
+        feed, valido = self._ler_local(escopo, escopo_id, formato)
+        if valido:
+            return None if feed == AUSENTE else feed
+        chave = self._chave(escopo, escopo_id, formato)
+        try:
+            if feed is None:
+                feed = cache.get(chave)
+            if feed == AUSENTE:
+                self._guardar_local(escopo, escopo_id, formato, feed)
+                return None
+            etag = FeedGerado.objects.filter(
+                escopo=escopo, escopo_id=escopo_id, formato=formato
+            ).values_list('etag', flat=True).first()
+            if etag is None or feed is None or feed.etag != etag:
+                feed = self._carregar(escopo, escopo_id, formato)
+                if feed is None and self.regenerar(escopo, escopo_id):
+                    feed = self._carregar(escopo, escopo_id, formato)
+                if feed is None:
+                    cache.set(chave, AUSENTE, self._timeout_ausente())
+                    self._guardar_local(escopo, escopo_id, formato, AUSENTE)
+                    return None
+                cache.set(chave, feed, self._timeout())
+        except OperationFailedException:
+            raise
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao obter o feed {formato} de {escopo} {escopo_id}: {str(e)}"
+            ) from e
+        self._guardar_local(escopo, escopo_id, formato, feed)
+        return feed
+
+    def regenerar(self, escopo: str, escopo_id: int) -> int:
+        """
+        Gera novamente os feeds do escopo em todos os formatos, gravando
+        apenas os que mudaram. Se o escopo não existir mais, os seus feeds
+        são removidos. O cache é atualizado após o commit.
+
+        Returns:
+            int: Quantidade de feeds cujo conteúdo mudou.
+
+        Raises:
+            OperationFailedException: Se a geração ou a gravação falhar.
+        """
+        try:
+            cabecalho = self._cabecalho(escopo, escopo_id)
+            if cabecalho is None:
+                FeedGerado.objects.filter(escopo=escopo, escopo_id=escopo_id).delete()
+                transaction.on_commit(partial(self._publicar, escopo, escopo_id, {}))
+                return 0
+
+            itens = self._itens(escopo, escopo_id)
+            etags = dict(
+                FeedGerado.objects.filter(escopo=escopo, escopo_id=escopo_id)
+                .values_list('formato', 'etag')
+            )
+            agora = timezone.now()
+            alterados = []
+            for formato, serializar in SERIALIZADORES.items():
+                conteudo = serializar(
+                    {**cabecalho, 'url_feed': self._url_feed(cabecalho, escopo, escopo_id, formato)},
+                    itens,
+                )
+                etag = hashlib.sha256(conteudo).hexdigest()
+                if etags.get(formato) != etag:
+                    alterados.append(FeedGerado(
+                        escopo=escopo, escopo_id=escopo_id, formato=formato,
+                        conteudo=conteudo, etag=etag, ultima_modificacao=agora,
+                    ))
+            if alterados:
+                FeedGerado.objects.bulk_create(
+                    alterados,
+                    update_conflicts=True,
+                    unique_fields=['escopo', 'escopo_id', 'formato'],
+                    update_fields=['conteudo', 'etag', 'ultima_modificacao', 'gerado_em'],
+                )
+                transaction.on_commit(partial(self._publicar, escopo, escopo_id, {
+                    feed.formato: FeedSerializadoDomain(
+                        formato=feed.formato,
+                        conteudo=feed.conteudo,
+                        etag=feed.etag,
+                        ultima_modificacao=feed.ultima_modificacao,
+                    )
+                    for feed in alterados
+                }))
+            return len(alterados)
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao gerar os feeds de {escopo} {escopo_id}: {str(e)}"
+            ) from e
+
+    def marcar_alterados(
+        self,
+        escopos: Iterable[Escopo] = (),
+        post_ids: Iterable[int] = ()
+    ) -> None:
+        """
+        Agenda a regeneração, após o commit da transação atual, dos feeds dos
+        escopos e dos escopos dos posts (resolvidos no commit). Cada escopo é
+        gerado uma única vez, mesmo que marcado várias vezes na transação.
+        """
+        pendentes = self._pendentes.__dict__
+        pendentes.setdefault('escopos', set()).update(escopos)
+        pendentes.setdefault('posts', set()).update(post_ids)
+        # Registrado a cada chamada: o primeiro callback executado processa
+        # todas as pendências, e os demais não encontram nenhuma
+        transaction.on_commit(self._regenerar_pendentes)
+
+    def regenerar_todos(self) -> int:
+        """
+        Gera novamente os feeds de todos os blogs, tags e categorias.
+
+        Returns:
+            int: Quantidade de feeds cujo conteúdo mudou.
+        """
+        escopos = (
+            [(ESCOPO_BLOG, pk) for pk in Blog.objects.values_list('id', flat=True)]
+            + [(ESCOPO_TAG, pk) for pk in TagPost.objects.values_list('id', flat=True)]
+            + [(ESCOPO_CATEGORIA, pk) for pk in CategoriaPost.objects.values_list('id', flat=True)]
+        )
+        return sum(self.regenerar(escopo, escopo_id) for escopo, escopo_id in escopos)
+
+    def _regenerar_pendentes(self) -> None:
+        escopos: Set[Escopo] = self._pendentes.__dict__.pop('escopos', set())
+        post_ids = self._pendentes.__dict__.pop('posts', set())
+        if post_ids:
+            escopos |= self.escopos_posts(post_ids)
+        for escopo, escopo_id in sorted(escopos):
+            try:
+                self.regenerar(escopo, escopo_id)
+            except OperationFailedException:
+                logger.exception("Falha ao gerar os feeds de %s %s.", escopo, escopo_id)
+
+    @classmethod
+    def escopos_posts(cls, post_ids: Set[int]) -> Set[Escopo]:
+        """Retorna os escopos (blogs, tags e categorias dos blogs) dos posts."""
+        blog_ids = set(
+            Post.objects.all_with_deleted().filter(id__in=post_ids)
+            .values_list('blog_id', flat=True)
+        )
+        tag_ids = set(
+            Post.tags.through.objects.filter(post_id__in=post_ids)
+            .values_list('tagpost_id', flat=True)
+        )
+        return cls.escopos_blogs(blog_ids) | {(ESCOPO_TAG, pk) for pk in tag_ids}
+
+    @staticmethod
+    def escopos_blogs(blog_ids: Set[int]) -> Set[Escopo]:
+        """Retorna os escopos dos blogs e das categorias dos blogs."""
+        categoria_ids = set(
+            Blog.categorias.through.objects.filter(blog_id__in=blog_ids)
+            .values_list('categoriapost_id', flat=True)
+        )
+        return (
+            {(ESCOPO_BLOG, pk) for pk in blog_ids}
+            | {(ESCOPO_CATEGORIA, pk) for pk in categoria_ids}
+        )
+
+    @staticmethod
+    def _cabecalho(escopo: str, escopo_id: int) -> Optional[Dict[str, str]]:
+        """Retorna o título, a descrição e o link do escopo, ou None se ele não existir."""
+        if escopo == ESCOPO_BLOG:
+            blog = Blog.objects.filter(pk=escopo_id).values(
+                'title', 'description', dominio=F('site__domain')
+            ).first()
+            if blog is None:
+                return None
+            titulo, descricao, dominio = blog['title'], blog['description'], blog['dominio']
+        else:
+            model, campo_nome = (
+                (TagPost, 'name') if escopo == ESCOPO_TAG else (CategoriaPost, 'nome')
+            )
+            registro = model.objects.filter(pk=escopo_id).values(campo_nome, 'descricao').first()
+            if registro is None:
+                return None
+            titulo, descricao = registro[campo_nome], registro['descricao']
+            dominio = Site.objects.get_current().domain
+        return {
+            'titulo': titulo,
+            'descricao': descricao or titulo,
+            'link': getattr(settings, 'FEEDS_URL_SITE', 'https://{dominio}').format(dominio=dominio),
+        }
+
+    @staticmethod
+    def _itens(escopo: str, escopo_id: int) -> List[Dict[str, object]]:
+        """Retorna os posts publicados mais recentes do escopo, sem o conteúdo original."""
+        url_post = getattr(settings, 'FEEDS_URL_POST', 'https://{dominio}/blog/{slug}/')
+        posts = (
+            Post.objects.filter(status='publicado', **{FILTRO_ESCOPO[escopo]: escopo_id})
+            .order_by('-published_date', '-id')
+            .values(
+                'title', 'slug', 'published_date', 'resumo', 'conteudo_renderizado',
+                autor_primeiro_nome=F('autor__pessoa_fisica__first_name'),
+                autor_sobrenome=F('autor__pessoa_fisica__last_name'),
+                dominio=F('blog__site__domain'),
+            )[:getattr(settings, 'FEEDS_QUANTIDADE_POSTS', 20)]
+        )
+        return [
+            {
+                **post,
+                'link': url_post.format(dominio=post['dominio'], slug=post['slug']),
+                'autor': ' '.join(
+                    nome for nome in (post['autor_primeiro_nome'], post['autor_sobrenome']) if nome
+                ),
+            }
+            for post in posts
+        ]
+
+    @staticmethod
+    def _url_feed(cabecalho: Dict[str, str], escopo: str, escopo_id: int, formato: str) -> str:
+        prefixo = getattr(settings, 'FEEDS_ASGI_PREFIXO', '/feeds/')
+        return f"{cabecalho['link'].rstrip('/')}{prefixo}{escopo}/{escopo_id}.{formato}"
+
+    @staticmethod
+    def _carregar(escopo: str, escopo_id: int, formato: str) -> Optional[FeedSerializadoDomain]:
+        feed = FeedGerado.objects.filter(
+            escopo=escopo, escopo_id=escopo_id, formato=formato
+        ).values('conteudo', 'etag', 'ultima_modificacao').first()
+        if feed is None:
+            return None
+        return FeedSerializadoDomain(
+            formato=formato,
+            conteudo=bytes(feed['conteudo']),
+            etag=feed['etag'],
+            ultima_modificacao=feed['ultima_modificacao'],
+        )
+
+    def _publicar(self, escopo: str, escopo_id: int, feeds: Dict[str, FeedSerializadoDomain]) -> None:
+        """Atualiza o cache do Django e o LRU local com os feeds regenerados."""
+        with self._lock:
+            for formato in TIPOS_CONTEUDO:
+                self._local.pop((escopo, escopo_id, formato), None)
+        if feeds:
+            cache.set_many(
+                {self._chave(escopo, escopo_id, formato): feed for formato, feed in feeds.items()},
+                self._timeout(),
+            )
+        else:
+            cache.delete_many([self._chave(escopo, escopo_id, formato) for formato in TIPOS_CONTEUDO])
+
+    def _ler_local(self, escopo: str, escopo_id: int, formato: str) -> Tuple[object, bool]:
+        """
+        Retorna o feed do LRU do processo (ou AUSENTE) e se ele ainda está
+        dentro da validade; o feed expirado é revalidado por `obter`.
+        """
+        chave = (escopo, escopo_id, formato)
+        with self._lock:
+            entrada = self._local.get(chave)
+            if entrada is None:
+                return None, False
+            self._local.move_to_end(chave)
+            return entrada[1], entrada[0] > time.monotonic()
+
+    def _guardar_local(self, escopo: str, escopo_id: int, formato: str, feed: object) -> None:
+        chave = (escopo, escopo_id, formato)
+        with self._lock:
+            self._local[chave] = (time.monotonic() + getattr(settings, 'FEEDS_TTL_LOCAL', 5.0), feed)
+            self._local.move_to_end(chave)
+            while len(self._local) > getattr(settings, 'FEEDS_TAMANHO_CACHE', 1024):
+                self._local.popitem(last=False)
+
+    @staticmethod
+    def _chave(escopo: str, escopo_id: int, formato: str) -> str:
+        return f'{PREFIXO_CHAVE}:{escopo}:{escopo_id}:{formato}'
+
+    @staticmethod
+    def _timeout() -> int:
+        return getattr(settings, 'FEEDS_TIMEOUT', 86400)
+
+    @staticmethod
+    def _timeout_ausente() -> int:
+        return getattr(settings, 'FEEDS_TIMEOUT_AUSENTE', 60)
@@ -0,0 +1,296 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pelas versões redimensionadas (derivadas) das imagens dos
+posts.
+
+Quando uma imagem é enviada (ou o seu arquivo é substituído), o arquivo é
+lido após o commit e as derivadas são geradas em um pool de processos, em
+cada largura de IMAGENS_POST_LARGURAS e em cada formato de
+IMAGENS_POST_FORMATOS suportado pelo Pillow instalado (o JPEG é sempre
+gerado, como alternativa para navegadores sem AVIF/WebP). O redimensionamento
+não ocupa a thread da requisição nem disputa o GIL com ela, e os resultados
+são gravados no storage e registrados em DerivadaImagemPost por uma thread de
+gravação dedicada, substituindo as derivadas anteriores (a thread de
+gerenciamento do pool, que executa os callbacks dos futuros, fica livre para
+receber os demais resultados).
+
+Com as derivadas registradas, o `srcset` de cada formato é montado com uma
+consulta, sem verificar a existência de arquivos no storage. As imagens
+enviadas antes das derivadas, ou que falharam, são processadas pelo comando
+`gerar_derivadas_imagens`.
+
+Classes:
+    DjangoImagensPostRepository: Geração e leitura das derivadas das imagens.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait)
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from domain.blog.repositories.imagens_post import ImagensPostRepository
+from domain.blog.value_objects.imagem_responsiva import ImagemResponsivaDomain
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.models.blog.derivada_imagem_post import (
+    FORMATO_JPEG, DerivadaImagemPost)
+from infrastructure.models.blog.imagem_post import ImagemPost
+from infrastructure.repositories.shared.resources.redimensionamento_imagem import (
+    EXTENSOES, Derivada, formatos_suportados, gerar_derivadas)
+
+logger = logging.getLogger('ocorrencias')
+
+DIRETORIO_DERIVADAS = 'uploads/posts/derivadas'
+
+
+class DjangoImagensPostRepository(ImagensPostRepository):
+    """
+    Implementação do repositório das derivadas das imagens de posts, com o
+    redimensionamento em um ProcessPoolExecutor e a gravação das derivadas
+    agendadas em um ThreadPoolExecutor de uma thread, compartilhados pelo
+    processo.
+    """
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _gravador: Optional[ThreadPoolExecutor] = None
+    _pid: Optional[int] = None
+    _trava = threading.Lock()
+
+    def __init__(self):
+        self.larguras = tuple(getattr(settings, 'IMAGENS_POST_LARGURAS', (320, 640, 960, 1280, 1920)))
+        self.qualidade = dict(getattr(
+            settings, 'IMAGENS_POST_QUALIDADE', {'avif': 55, 'webp': 75, 'jpeg': 82}
+        ))
+        formatos = formatos_suportados(getattr(settings, 'IMAGENS_POST_FORMATOS', ('avif', 'webp', 'jpeg')))
+        self.formatos = tuple(formatos if FORMATO_JPEG in formatos else formatos + [FORMATO_JPEG])
+        self.processos = max(1, int(getattr(settings, 'IMAGENS_POST_PROCESSOS', 2)))
+        self.storage = DerivadaImagemPost._meta.get_field('arquivo').storage
+
+    # Leitura
+
+    def obter_responsivas(self, imagem_ids: Iterable[int]) -> Dict[int, ImagemResponsivaDomain]:
+        try:
+            imagem_ids = list(dict.fromkeys(imagem_ids))
+            fontes: Dict[int, Dict[str, List[Tuple[int, str]]]] = defaultdict(lambda: defaultdict(list))
+            for imagem_id, formato, largura, arquivo in DerivadaImagemPost.objects.filter(
+                imagem_id__in=imagem_ids
+            ).order_by('imagem_id', 'formato', 'largura').values_list(
+                'imagem_id', 'formato', 'largura', 'arquivo'
+            ):
+                fontes[imagem_id][formato].append((largura, self.storage.url(arquivo)))
+
+            responsivas = {}
+            for imagem in ImagemPost.objects.filter(id__in=imagem_ids).values(
+                'id', 'imagem', 'largura', 'altura'
+            ):
+                url = self.storage.url(imagem['imagem']) if imagem['imagem'] else ''
+                por_formato = fontes.get(imagem['id'], {})
+                responsivas[imagem['id']] = ImagemResponsivaDomain(
+                    imagem_id=imagem['id'],
+                    url=url,
+                    largura=imagem['largura'],
+                    altura=imagem['altura'],
+                    srcsets={
+                        formato: ', '.join(f"{url_derivada} {largura}w" for largura, url_derivada in lista)
+                        for formato, lista in por_formato.items()
+                    },
+                    fallback=por_formato[FORMATO_JPEG][-1][1] if FORMATO_JPEG in por_formato else url,
+                )
+            return responsivas
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao obter as imagens responsivas: {str(e)}"
+            ) from e
+
+    # Geração
+
+    def agendar(self, imagem_id: int) -> bool:
+        """
+        Envia a imagem ao pool de processos, se o seu arquivo mudou desde a
+        última geração, sem aguardar; quando ficarem prontas, as derivadas
+        são gravadas pela thread de gravação dedicada.
+
+        Args:
+            imagem_id (int): ID da imagem já salva (após o commit).
+
+        Returns:
+            bool: True se a imagem foi enviada ao pool.
+
+        Raises:
+            OperationFailedException: Se a leitura do arquivo falhar.
+        """
+        envio = self._enviar(imagem_id, forcar=False)
+        if envio is None:
+            return False
+        origem, futuro = envio
+
+        def concluir(futuro: Future) -> None:
+            try:
+                self._concluir(imagem_id, origem, futuro)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Falha ao gerar as derivadas da imagem %s.", imagem_id)
+            finally:
+                close_old_connections()
+
+        # O callback roda na thread de gerenciamento do pool de processos,
+        # que não deve ficar bloqueada pela gravação no storage e no banco
+        gravador = self._gravacao()
+        futuro.add_done_callback(lambda futuro: gravador.submit(concluir, futuro))
+        return True
+
+    def gerar_derivadas(self, imagem_ids: Iterable[int], forcar: bool = False) -> int:
+        """
+        Gera as derivadas das imagens no pool de processos, mantendo no
+        máximo dois arquivos por processo em memória, e grava os resultados
+        nesta thread. As imagens que falharem são registradas no log.
+
+        Args:
+            imagem_ids (Iterable[int]): IDs das imagens.
+            forcar (bool): Gera também as imagens cujas derivadas estão em dia.
+
+        Returns:
+            int: Quantidade de imagens com derivadas geradas.
+        """
+        limite = 2 * self.processos
+        pendentes: Dict[Future, Tuple[int, str]] = {}
+        geradas = 0
+
+        def concluir(prontos: Iterable[Future]) -> int:
+            sucesso = 0
+            for futuro in prontos:
+                imagem_id, origem = pendentes.pop(futuro)
+                try:
+                    sucesso += self._concluir(imagem_id, origem, futuro)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Falha ao gerar as derivadas da imagem %s.", imagem_id)
+            return sucesso
+
+        for imagem_id in imagem_ids:
+            try:
+                envio = self._enviar(imagem_id, forcar)
+            except OperationFailedException:
+                logger.exception("Falha ao ler a imagem %s.", imagem_id)
+                continue
+            if envio is None:
+                continue
+            pendentes[envio[1]] = (imagem_id, envio[0])
+            if len(pendentes) >= limite:
+                prontos, _ = wait(list(pendentes), return_when=FIRST_COMPLETED)
+                geradas += concluir(prontos)
+        geradas += concluir(wait(list(pendentes)).done)
+        return geradas
+
+    def pendentes(self, forcar: bool = False) -> List[int]:
+        """
+        Retorna os IDs das imagens com arquivo cujas derivadas não foram
+        geradas a partir do arquivo atual (ou de todas, com `forcar`).
+        """
+        imagens = ImagemPost.objects.exclude(imagem='')
+        if not forcar:
+            imagens = imagens.exclude(origem_derivadas=F('imagem'))
+        return list(imagens.order_by('id').values_list('id', flat=True))
+
+    def excluir_arquivos(self, nomes: Iterable[str]) -> None:
+        """Remove do storage os arquivos de derivadas, ignorando os inexistentes."""
+        for nome in nomes:
+            try:
+                self.storage.delete(nome)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Falha ao remover a derivada '%s'.", nome)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        # Processos iniciados com spawn: o fork de um processo com threads e
+        # conexões abertas (servidor ou ingestão bufferizada) não é seguro
+        cls = type(self)
+        with cls._trava:
+            if cls._executor is None or cls._pid != os.getpid():
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=self.processos, mp_context=multiprocessing.get_context('spawn')
+                )
+                cls._gravador = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='derivadas-imagens'
+                )
+                cls._pid = os.getpid()
+            return cls._executor
+
+    def _gravacao(self) -> ThreadPoolExecutor:
+        """Retorna o executor da gravação das derivadas agendadas."""
+        self._pool()
+        return type(self)._gravador
+
+    def _enviar(self, imagem_id: int, forcar: bool) -> Optional[Tuple[str, Future]]:
+        """Lê o arquivo da imagem e o envia ao pool; retorna (origem, futuro)."""
+        imagem = ImagemPost.objects.filter(pk=imagem_id).only('id', 'imagem', 'origem_derivadas').first()
+        if imagem is None or not imagem.imagem:
+            return None
+        if not forcar and imagem.imagem.name == imagem.origem_derivadas:
+            return None
+        try:
+            with imagem.imagem.open('rb') as arquivo:
+                conteudo = arquivo.read()
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao ler o arquivo da imagem {imagem_id}: {str(e)}"
+            ) from e
+        futuro = self._pool().submit(
+            gerar_derivadas, conteudo, self.larguras, self.formatos, self.qualidade
+        )
+        return imagem.imagem.name, futuro
+
+    def _concluir(self, imagem_id: int, origem: str, futuro: Future) -> bool:
+        """
+        Grava as derivadas geradas a partir de `origem` e substitui as
+        anteriores, se a imagem ainda usa o mesmo arquivo.
+        """
+        dimensoes, derivadas = futuro.result()
+        if not ImagemPost.objects.filter(pk=imagem_id, imagem=origem).exists():
+            return False
+        novas = self._gravar_arquivos(imagem_id, origem, derivadas)
+        try:
+            with transaction.atomic():
+                antigas = list(
+                    DerivadaImagemPost.objects.select_for_update()
+                    .filter(imagem_id=imagem_id).values_list('arquivo', flat=True)
+                )
+                atualizada = ImagemPost.objects.filter(pk=imagem_id, imagem=origem).update(
+                    largura=dimensoes[0], altura=dimensoes[1], origem_derivadas=origem
+                )
+                if atualizada:
+                    DerivadaImagemPost.objects.filter(imagem_id=imagem_id).delete()
+                    DerivadaImagemPost.objects.bulk_create(novas)
+        except Exception as e:
+            self.excluir_arquivos(derivada.arquivo.name for derivada in novas)
+            raise OperationFailedException(
+                f"Erro ao registrar as derivadas da imagem {imagem_id}: {str(e)}"
+            ) from e
+        # A imagem foi substituída ou excluída durante a geração
+        self.excluir_arquivos(antigas if atualizada else [derivada.arquivo.name for derivada in novas])
+        return bool(atualizada)
+
+    def _gravar_arquivos(
+        self, imagem_id: int, origem: str, derivadas: List[Derivada]
+    ) -> List[DerivadaImagemPost]:
+        base = os.path.splitext(os.path.basename(origem))[0]
+        novas: List[DerivadaImagemPost] = []
+        try:
+            for largura, altura, formato, conteudo in derivadas:
+                nome = self.storage.save(
+                    f"{DIRETORIO_DERIVADAS}/{imagem_id}/{base}-{largura}w.{EXTENSOES[formato]}",
+                    ContentFile(conteudo),
+                )
+                novas.append(DerivadaImagemPost(
+                    imagem_id=imagem_id, largura=largura, altura=altura, formato=formato,
+                    arquivo=nome, tamanho_bytes=len(conteudo),
+                ))
+        except Exception as e:
+            self.excluir_arquivos(derivada.arquivo.name for derivada in novas)
+            raise OperationFailedException(
+                f"Erro ao gravar as derivadas da imagem {imagem_id}: {str(e)}"
+            ) from e
+        return novas
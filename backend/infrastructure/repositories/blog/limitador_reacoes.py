@@ -0,0 +1,90 @@
+"""
+Módulo implementa o serviço concreto de limitação de reações.
+
+Duas janelas deslizantes são aplicadas antes de qualquer gravação:
+
+    - deduplicação: uma reação por (post, origem, tipo de reação) a cada
+    `REACOES_JANELA_DEDUPLICACAO` segundos;
+    - limitação de taxa: no máximo `REACOES_LIMITE_POR_JANELA` reações por
+    origem a cada `REACOES_JANELA_LIMITE` segundos, em quaisquer posts.
+
+Com `REACOES_LIMITADOR_COMPARTILHADO` ativo, as janelas ficam no cache do
+Django e valem para todos os processos; caso contrário, ficam em memória, por
+processo.
+
+Classes:
+    LimitadorReacoesJanelaDeslizante: Deduplicação e limitação de taxa.
+"""
+from typing import Optional
+from django.conf import settings
+from domain.blog.services.limitador_reacoes import LimitadorReacoes
+from infrastructure.repositories.shared.limitador_taxa import (
+    LimitadorJanelaDeslizante)
+
+
+class LimitadorReacoesJanelaDeslizante(LimitadorReacoes):
+    """
+    Implementação de LimitadorReacoes com janelas deslizantes.
+
+    Atributos:
+        deduplicacao (LimitadorJanelaDeslizante): Janela de reações repetidas.
+        taxa (LimitadorJanelaDeslizante): Janela de reações por origem.
+    """
+
+    _padrao: Optional['LimitadorReacoesJanelaDeslizante'] = None
+
+    def __init__(
+        self,
+        janela_deduplicacao: Optional[float] = None,
+        limite_por_janela: Optional[int] = None,
+        janela_limite: Optional[float] = None,
+        compartilhado: Optional[bool] = None
+    ):
+        """
+        Args:
+            janela_deduplicacao (Optional[float]): Por padrão,
+            REACOES_JANELA_DEDUPLICACAO (86400 segundos).
+            limite_por_janela (Optional[int]): Por padrão,
+            REACOES_LIMITE_POR_JANELA (30).
+            janela_limite (Optional[float]): Por padrão,
+            REACOES_JANELA_LIMITE (60 segundos).
+            compartilhado (Optional[bool]): Por padrão,
+            REACOES_LIMITADOR_COMPARTILHADO (False).
+        """
+        if compartilhado is None:
+            compartilhado = getattr(settings, 'REACOES_LIMITADOR_COMPARTILHADO', False)
+        self.deduplicacao = LimitadorJanelaDeslizante(
+            'reacoes:deduplicacao',
+            limite=1,
+            janela=janela_deduplicacao or getattr(settings, 'REACOES_JANELA_DEDUPLICACAO', 86400),
+            compartilhado=compartilhado,
+        )
+        self.taxa = LimitadorJanelaDeslizante(
+            'reacoes:taxa',
+            limite=limite_por_janela or getattr(settings, 'REACOES_LIMITE_POR_JANELA', 30),
+            janela=janela_limite or getattr(settings, 'REACOES_JANELA_LIMITE', 60),
+            compartilhado=compartilhado,
+        )
+
+    @classmethod
+    def padrao(cls) -> 'LimitadorReacoesJanelaDeslizante':
+        """
+        Retorna o limitador do processo, configurado pelas settings. As
+        janelas em memória só são efetivas se a mesma instância for usada em
+        todas as requisições.
+        """
+        if cls._padrao is None:
+            cls._padrao = cls()
+        return cls._padrao
+
+    def duplicada(self, post_id: int, origem: str, reacao_tipo: str) -> bool:
+        """Indica se a reação repete uma reação recente da mesma origem."""
+        return not self.deduplicacao.permitir(f'{post_id}|{origem}|{reacao_tipo}')
+
+    def excede_limite(self, origem: str) -> bool:
+        """Indica se a origem excedeu a taxa de reações."""
+        return not self.taxa.permitir(origem)
+
+    def liberar(self, post_id: int, origem: str, reacao_tipo: str) -> None:
+        """Remove a reação da janela de deduplicação."""
+        self.deduplicacao.liberar(f'{post_id}|{origem}|{reacao_tipo}')
@@ -0,0 +1,89 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pela listagem dos posts de um blog.
+
+A listagem é uma projeção dos campos exibidos nos cards (título, slug, data
+de publicação, resumo e tempo de leitura pré-renderizados e o nome do
+autor): o conteúdo do post não é carregado, e o nome do autor vem da mesma
+consulta, por junção. Cada página é uma única consulta, qualquer que seja o
+tamanho da página, apoiada no índice `post_listagem_blog_idx` (blog, status,
+is_deleted, published_date DESC, id DESC), que atende o filtro, a ordenação
+e o cursor da paginação por chave.
+
+Classes:
+    DjangoListagemPostsRepository: Listagem paginada dos posts de um blog.
+"""
+from typing import Optional
+from django.db.models import F
+from domain.blog.repositories.listagem_posts import ListagemPostsRepository
+from domain.blog.value_objects.post_listagem import PostListagemDomain
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from domain.shared.value_objects.pagina import Pagina
+from infrastructure.models.blog.post import Post
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+
+
+def _para_dominio(post: Post) -> PostListagemDomain:
+    return PostListagemDomain(
+        post_id=post.id,
+        titulo=post.title,
+        slug=post.slug,
+        published_date=post.published_date,
+        resumo=post.resumo,
+        tempo_leitura=post.tempo_leitura,
+        autor_id=post.autor_id,
+        autor_nome=' '.join(
+            nome for nome in (post.autor_primeiro_nome, post.autor_sobrenome) if nome
+        ),
+    )
+
+
+class DjangoListagemPostsRepository(ListagemPostsRepository):
+    """
+    Implementação do repositório da listagem de posts dos blogs.
+    """
+
+    def listar(
+        self,
+        blog_id: int,
+        status: str = 'publicado',
+        after: Optional[str] = None,
+        limit: int = 20
+    ) -> Pagina[PostListagemDomain]:
+        """
+        Retorna uma página dos posts do blog com o status, dos mais recentes
+        para os mais antigos.
+
+        Raises:
+            InvalidInputException: Se o cursor ou o limite forem inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            posts = (
+                Post.objects.filter(blog_id=blog_id, status=status)
+                .only(
+                    'id', 'title', 'slug', 'published_date', 'resumo',
+                    'tempo_leitura', 'autor',
+                )
+                .annotate(
+                    autor_primeiro_nome=F('autor__pessoa_fisica__first_name'),
+                    autor_sobrenome=F('autor__pessoa_fisica__last_name'),
+                )
+            )
+            return paginar_por_chave(
+                posts,
+                _para_dominio,
+                after=after,
+                limit=limit,
+                order_by='-published_date',
+                campos_ordenacao=('published_date',)
+            )
+        except InvalidInputException:
+            raise
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao listar os posts do blog {blog_id}: {str(e)}"
+            ) from e
@@ -0,0 +1,172 @@
+# pylint: disable=no-member
+"""
+Módulo implementa o repositório concreto de moderação de comentários.
+
+As transições de status são aplicadas com um UPDATE por lote de até
+TAMANHO_LOTE_MODERACAO comentários, sem carregar nem salvar cada model. Os
+comentários são antes bloqueados (SELECT ... FOR UPDATE, em ordem de id),
+para que o ajuste dos contadores de comentários aprovados considere o status
+efetivamente substituído mesmo com moderadores concorrentes. Os comentários
+aprovados alimentam o motor de tendências após o commit.
+
+A fila é lida com paginação por chave sobre o índice (status,
+data_comentario, id).
+
+Classes:
+    DjangoModeracaoComentariosRepository: Fila e transições de status dos
+    comentários.
+"""
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.db import transaction
+from domain.blog.repositories.moderacao_comentarios import ModeracaoComentariosRepository
+from domain.blog.value_objects.comentario_moderacao import (
+    STATUS_APROVADO, ComentarioModeracaoDomain)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from domain.shared.value_objects.pagina import Pagina
+from infrastructure.models.blog.comentario_post import ComentarioPost
+from infrastructure.models.blog.contador_engajamento_post import (
+    METRICA_COMENTARIOS_APROVADOS)
+from infrastructure.repositories.blog.engajamento_post import EngajamentoPostRepository
+from infrastructure.repositories.blog.tendencias import EVENTO_COMENTARIO, MotorTendencias
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+
+# Quantidade máxima de comentários alterados por instrução UPDATE.
+TAMANHO_LOTE_MODERACAO = 5000
+
+
+def _para_dominio(comentario: ComentarioPost) -> ComentarioModeracaoDomain:
+    return ComentarioModeracaoDomain(
+        id=comentario.pk,
+        post_id=comentario.post_id,
+        comentario=comentario.comentario,
+        data_comentario=comentario.data_comentario,
+        status=comentario.status,
+        ip_origem=comentario.ip_origem,
+    )
+
+
+class DjangoModeracaoComentariosRepository(ModeracaoComentariosRepository):
+    """
+    Repositório concreto da moderação de comentários, usando Django ORM.
+    """
+
+    def __init__(self, engajamento_repository: Optional[EngajamentoPostRepository] = None):
+        self.engajamento_repository = engajamento_repository or EngajamentoPostRepository()
+
+    def fila(
+        self,
+        status: str,
+        after: Optional[str] = None,
+        limit: int = 50,
+        post_id: Optional[int] = None
+    ) -> Pagina[ComentarioModeracaoDomain]:
+        """
+        Retorna uma página dos comentários com o status, dos mais antigos
+        para os mais recentes.
+
+        Raises:
+            InvalidInputException: Se o cursor ou o limite forem inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            comentarios = ComentarioPost.objects.filter(status=status).only(
+                'id', 'post', 'comentario', 'data_comentario', 'status', 'ip_origem'
+            )
+            if post_id is not None:
+                comentarios = comentarios.filter(post_id=post_id)
+            return paginar_por_chave(
+                comentarios,
+                _para_dominio,
+                after=after,
+                limit=limit,
+                order_by='data_comentario',
+                campos_ordenacao=('data_comentario',)
+            )
+        except InvalidInputException:
+            raise
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao consultar a fila de moderação: {str(e)}"
+            ) from e
+
+    def alterar_status(
+        self,
+        ids: Iterable[int],
+        status_origem: Iterable[str],
+        status_destino: str
+    ) -> int:
+        """
+        Altera o status dos comentários em massa e ajusta os contadores de
+        comentários aprovados dos posts na mesma transação. Após o commit, os
+        comentários aprovados são registrados no motor de tendências.
+
+        Args:
+            ids (Iterable[int]): IDs dos comentários.
+            status_origem (Iterable[str]): Status a partir dos quais a
+            transição é permitida; os demais comentários são ignorados.
+            status_destino (str): Novo status.
+
+        Returns:
+            int: Quantidade de comentários alterados.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            ids = sorted(set(ids))
+            status_origem = list(status_origem)
+            alterados = 0
+            with transaction.atomic():
+                incrementos: Dict[Tuple[int, str], int] = Counter()
+                for inicio in range(0, len(ids), TAMANHO_LOTE_MODERACAO):
+                    alterados += self._alterar_lote(
+                        ids[inicio:inicio + TAMANHO_LOTE_MODERACAO],
+                        status_origem,
+                        status_destino,
+                        incrementos,
+                    )
+                self.engajamento_repository.incrementar_varios(incrementos)
+                if status_destino == STATUS_APROVADO:
+                    # Nenhum dos comentários alterados estava aprovado
+                    tendencias = [
+                        (post_id, EVENTO_COMENTARIO, None, quantidade)
+                        for (post_id, _), quantidade in incrementos.items()
+                    ]
+                    transaction.on_commit(
+                        lambda: MotorTendencias.padrao().registrar_varios(tendencias)
+                    )
+            return alterados
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao alterar o status dos comentários: {str(e)}"
+            ) from e
+
+    @staticmethod
+    def _alterar_lote(
+        ids: List[int],
+        status_origem: List[str],
+        status_destino: str,
+        incrementos: Dict[Tuple[int, str], int]
+    ) -> int:
+        bloqueados = list(
+            ComentarioPost.objects.select_for_update()
+            .filter(pk__in=ids, status__in=status_origem)
+            .exclude(status=status_destino)
+            .order_by('pk')
+            .values_list('pk', 'post_id', 'status')
+        )
+        if not bloqueados:
+            return 0
+        ComentarioPost.objects.filter(pk__in=[pk for pk, _, _ in bloqueados]).update(
+            status=status_destino
+        )
+        for _, post_id, status in bloqueados:
+            if status == STATUS_APROVADO:
+                incrementos[(post_id, METRICA_COMENTARIOS_APROVADOS)] -= 1
+            if status_destino == STATUS_APROVADO:
+                incrementos[(post_id, METRICA_COMENTARIOS_APROVADOS)] += 1
+        return len(bloqueados)
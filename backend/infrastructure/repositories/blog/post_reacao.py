@@ -0,0 +1,75 @@
+# pylint: disable=no-member
+"""
+Módulo implementa o repositório concreto de post_reacao.
+
+A validação do post de uma reação consulta um conjunto cacheado com os IDs de
+todos os posts publicados, invalidado a cada gravação de Post, em vez de
+buscar o post no banco a cada clique.
+
+Classes:
+    DjangoPostReacaoRepository: Registro de reações a posts.
+"""
+from datetime import datetime
+from typing import FrozenSet, Optional
+from domain.blog.repositories.post_reacao import PostReacaoRepository
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.models.blog.post import Post
+from infrastructure.models.blog.post_reacao import PostReacao
+from infrastructure.repositories.shared.cache_referencia import CacheReferencia
+
+# Cache dos IDs dos posts publicados, invalidado a cada gravação de Post.
+CACHE_POSTS_PUBLICADOS = CacheReferencia('posts_publicados', Post)
+
+
+class DjangoPostReacaoRepository(PostReacaoRepository):
+    """
+    Repositório concreto das reações a posts, usando Django ORM.
+    """
+
+    def post_publicado(self, post_id: int) -> bool:
+        """
+        Indica se o post existe, não foi excluído e está publicado, sem
+        consultar o banco enquanto o conjunto cacheado for válido.
+        """
+        return post_id in self.ids_posts_publicados()
+
+    def ids_posts_publicados(self) -> FrozenSet[int]:
+        """Retorna o conjunto cacheado dos IDs dos posts publicados."""
+        return CACHE_POSTS_PUBLICADOS.obter('ids', self._carregar_ids)
+
+    def save(
+        self,
+        post_id: int,
+        reacao_tipo: str,
+        ip_origem: Optional[str] = None,
+        data_reacao: Optional[datetime] = None
+    ) -> None:
+        """
+        Registra uma reação a um post. Os contadores de engajamento são
+        atualizados pelos sinais de PostReacao.
+
+        Args:
+            post_id (int): ID do post.
+            reacao_tipo (str): Nome do tipo de reação.
+            ip_origem (Optional[str]): IP de origem da reação.
+            data_reacao (Optional[datetime]): Ignorada; a data é atribuída na
+            gravação (auto_now_add).
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            PostReacao.objects.create(
+                post_id=post_id, reacao_tipo=reacao_tipo, ip_origem=ip_origem
+            )
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao registrar a reação ao post: {str(e)}"
+            ) from e
+
+    @staticmethod
+    def _carregar_ids() -> FrozenSet[int]:
+        return frozenset(
+            Post.objects.filter(status='publicado').values_list('id', flat=True)
+        )
@@ -1,15 +1,22 @@
 # pylint: disable=no-member
 """Módulo implementa o repositório concreto de reacao_tipo"""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from domain.blog.repositories.reacao_tipo import ReacaoTipoRepository
 from domain.blog.value_objects.reacao_tipo import ReacaoTipoDomain
 from infrastructure.models.blog.reacao_tipo import ReacaoTipo
+from infrastructure.repositories.shared.cache_referencia import CacheReferencia
+
+# Cache de leitura, invalidado a cada gravação de ReacaoTipo.
+CACHE_TIPOS_REACAO = CacheReferencia('reacao_tipo', ReacaoTipo)
 
 
 class DjangoReacaoTipoRepository(ReacaoTipoRepository):
     """
     Repositório concreto para manipulação dos dados do tipo de reação (ReacaoTipo), usando Django ORM.
+
+    Todos os tipos são mantidos em cache em um único dicionário por ID, de
+    modo que as buscas, inclusive por IDs inexistentes, não consultam o banco.
     """
 
     def list_all(self) -> List[ReacaoTipoDomain]:
@@ -19,15 +26,7 @@ class DjangoReacaoTipoRepository(ReacaoTipoRepository):
         Retorno:
             List[ReacaoTipoDomain]: Uma lista contendo todas as instâncias de ReacaoTipoDomain.
         """
-        reacoes = ReacaoTipo.objects.all()
-        return [
-            ReacaoTipoDomain(
-                repositorio_tipo_id=reacao.id,  
-                nome=reacao.nome,
-                descricao=reacao.descricao,
-                icone=reacao.icone
-            ) for reacao in reacoes
-        ]
+        return list(self._por_id().values())
 
     def get_by_id(self, reacao_tipo_id: int) -> Optional[ReacaoTipoDomain]:
         """
@@ -39,14 +38,18 @@ class DjangoReacaoTipoRepository(ReacaoTipoRepository):
         Retorno:
             Optional[ReacaoTipoDomain]: O tipo de reação correspondente ou None, se não for encontrado.
         """
-        try:
-            reacao = ReacaoTipo.objects.get(id=reacao_tipo_id)
-            return ReacaoTipoDomain(
+        return self._por_id().get(reacao_tipo_id)
+
+    def _por_id(self) -> Dict[int, ReacaoTipoDomain]:
+        return CACHE_TIPOS_REACAO.obter('por_id', self._carregar)
+
+    @staticmethod
+    def _carregar() -> Dict[int, ReacaoTipoDomain]:
+        return {
+            reacao.id: ReacaoTipoDomain(
                 repositorio_tipo_id=reacao.id,
                 nome=reacao.nome,
                 descricao=reacao.descricao,
-                icone=reacao.icone
-            )
-        except ReacaoTipo.DoesNotExist:
-            return None
-
+                icone=reacao.icone.name if reacao.icone else None
+            ) for reacao in ReacaoTipo.objects.order_by('id')
+        }
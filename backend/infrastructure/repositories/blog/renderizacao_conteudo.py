@@ -0,0 +1,69 @@
+"""
+Módulo responsável pela renderização do conteúdo HTML dos posts.
+
+O conteúdo de um post (HTMLField do djangocms_text_ckeditor) é sanitizado
+com o mesmo filtro do editor (`clean_html`) e dele são extraídos o texto
+simples, o resumo, a quantidade de palavras e o tempo de leitura. A
+renderização é feita uma única vez, quando o post é salvo (veja
+infrastructure.signals.conteudo_post), e o resultado é gravado no próprio
+post; o hash do conteúdo original evita renderizar de novo um conteúdo
+inalterado.
+
+Funções:
+    hash_conteudo: Hash do conteúdo original, pela versão da renderização.
+    texto_sem_html: Texto simples de um conteúdo HTML.
+    renderizar_conteudo: HTML final e campos derivados de um conteúdo.
+"""
+import hashlib
+import html
+import math
+from typing import Dict, Optional
+from django.conf import settings
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+from djangocms_text_ckeditor.html import clean_html
+
+# Alterar a versão faz o comando `renderizar_posts` renderizar todos os posts
+# novamente, mesmo com o conteúdo inalterado.
+VERSAO_RENDERIZACAO = 1
+
+
+def hash_conteudo(conteudo: Optional[str]) -> str:
+    """Retorna o hash SHA-256 do conteúdo original, prefixado pela versão da renderização."""
+    return hashlib.sha256(
+        f'{VERSAO_RENDERIZACAO}:{conteudo or ""}'.encode('utf-8')
+    ).hexdigest()
+
+
+def texto_sem_html(conteudo: Optional[str]) -> str:
+    """Retorna o texto do conteúdo HTML, sem marcações e com as entidades convertidas."""
+    # O espaço antes de cada marcação separa as palavras de blocos adjacentes
+    return ' '.join(html.unescape(strip_tags((conteudo or '').replace('<', ' <'))).split())
+
+
+def renderizar_conteudo(conteudo: Optional[str]) -> Dict[str, object]:
+    """
+    Renderiza o conteúdo HTML de um post.
+
+    Args:
+        conteudo (Optional[str]): HTML do post, como gravado pelo editor.
+
+    Returns:
+        Dict[str, object]: Valores dos campos derivados de Post
+        (conteudo_renderizado, resumo, texto_simples, numero_palavras,
+        tempo_leitura e hash_conteudo).
+    """
+    renderizado = clean_html(conteudo, full=False) if conteudo else ''
+    texto = texto_sem_html(renderizado)
+    numero_palavras = len(texto.split())
+    palavras_por_minuto = getattr(settings, 'POST_PALAVRAS_POR_MINUTO', 200)
+    return {
+        'conteudo_renderizado': renderizado,
+        'resumo': Truncator(texto).words(
+            getattr(settings, 'POST_RESUMO_PALAVRAS', 55), truncate='…'
+        ),
+        'texto_simples': texto,
+        'numero_palavras': numero_palavras,
+        'tempo_leitura': math.ceil(numero_palavras / palavras_por_minuto),
+        'hash_conteudo': hash_conteudo(conteudo),
+    }
@@ -0,0 +1,390 @@
+# pylint: disable=no-member
+"""
+Módulo implementa o motor de tendências (posts "em alta") e o repositório
+concreto de tendências.
+
+Cada evento de engajamento confirmado (visualização, reação, voto,
+compartilhamento ou aprovação de comentário) soma seu peso à pontuação do post com
+decaimento exponencial (meia-vida `TENDENCIAS_MEIA_VIDA`), em escala
+logarítmica relativa a EPOCA_TENDENCIA (veja PontuacaoTendenciaPost). O
+MotorTendencias do processo:
+
+    1. acumula em memória as contribuições dos eventos, por post, e as soma
+    imediatamente aos rankings carregados em que o post já figura;
+    2. a cada `TENDENCIAS_INTERVALO` segundos (verificado a cada evento ou
+    consulta) e no encerramento do processo, grava as contribuições
+    acumuladas nos snapshots PontuacaoTendenciaPost com um UPDATE atômico,
+    de modo que os processos combinam seus eventos e as pontuações
+    sobrevivem a reinícios;
+    3. mantém, por Blog e por CustomSite, um TopK com os
+    `TENDENCIAS_TAMANHO_TOPK` posts de maior pontuação, recarregado dos
+    snapshots (por um índice, via cache do Django compartilhado entre os
+    processos) quando mais antigo que o intervalo.
+
+Servir um ranking custa O(K), sem consultas enquanto o TopK for recente. Um
+post que ainda não está no TopK de um escopo entra nele na recarga seguinte.
+Um post movido para outro blog tem o seu snapshot transferido para os
+escopos do novo blog (veja `mover_post`).
+
+Classes:
+    TopK: Os K posts de maior pontuação de um escopo.
+    MotorTendencias: Pontuações e rankings de tendência do processo.
+    DjangoTendenciasRepository: Implementação de TendenciasRepository.
+"""
+import atexit
+import logging
+import math
+import os
+import threading
+import time
+from datetime import datetime
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Abs, Exp, Greatest, Ln
+from django.utils import timezone
+from domain.blog.repositories.tendencias import TendenciasRepository
+from domain.blog.value_objects.post_tendencia import PostTendenciaDomain
+from infrastructure.models.blog.blog import Blog
+from infrastructure.models.blog.pontuacao_tendencia_post import (
+    EPOCA_TENDENCIA, PontuacaoTendenciaPost)
+from infrastructure.models.blog.post import Post
+from infrastructure.repositories.blog.post_reacao import DjangoPostReacaoRepository
+
+logger = logging.getLogger('ocorrencias')
+
+ESCOPO_BLOG = 'blog'
+ESCOPO_SITE = 'site'
+
+EVENTO_VISUALIZACAO = 'visualizacao'
+EVENTO_REACAO = 'reacao'
+EVENTO_VOTO = 'voto'
+EVENTO_COMPARTILHAMENTO = 'compartilhamento'
+EVENTO_COMENTARIO = 'comentario'
+
+PESOS_PADRAO = {
+    EVENTO_VISUALIZACAO: 1.0,
+    EVENTO_REACAO: 3.0,
+    EVENTO_VOTO: 2.0,
+    EVENTO_COMPARTILHAMENTO: 5.0,
+    EVENTO_COMENTARIO: 4.0,
+}
+
+# Pontuação inicial dos snapshots criados, equivalente a zero na escala
+# logarítmica: ln(exp(-1e9) + exp(x)) == x.
+PONTUACAO_NULA = -1e9
+
+# Limite inferior do expoente no UPDATE: exp(-700) já é desprezível, e o
+# PostgreSQL pode rejeitar um exp() que resulte em underflow.
+EXPOENTE_MINIMO = -700.0
+
+Escopo = Tuple[str, int]
+
+
+def _somar_log(a: float, b: float) -> float:
+    """Retorna ln(exp(a) + exp(b)) sem overflow."""
+    return max(a, b) + math.log1p(math.exp(-abs(a - b)))
+
+
+class TopK:
+    """
+    Os `capacidade` posts de maior pontuação de um escopo.
+
+    As pontuações só aumentam (novos eventos), então basta comparar um post
+    que cresce com o menor do conjunto.
+    """
+
+    def __init__(self, capacidade: int, itens: Iterable[Tuple[int, float]] = ()):
+        self.capacidade = capacidade
+        self._itens: Dict[int, float] = {}
+        for post_id, pontuacao in itens:
+            self.atualizar(post_id, pontuacao)
+
+    def __contains__(self, post_id: int) -> bool:
+        return post_id in self._itens
+
+    def pontuacao(self, post_id: int) -> Optional[float]:
+        """Retorna a pontuação do post, se estiver no conjunto."""
+        return self._itens.get(post_id)
+
+    def atualizar(self, post_id: int, pontuacao: float) -> None:
+        """Registra a nova pontuação do post, substituindo o menor se preciso."""
+        if post_id in self._itens or len(self._itens) < self.capacidade:
+            self._itens[post_id] = pontuacao
+            return
+        menor = min(self._itens, key=self._itens.get)
+        if pontuacao > self._itens[menor]:
+            del self._itens[menor]
+            self._itens[post_id] = pontuacao
+
+    def ordenados(self) -> List[Tuple[int, float]]:
+        """Retorna (post, pontuação) do maior para o menor."""
+        return sorted(self._itens.items(), key=lambda item: item[1], reverse=True)
+
+
+class MotorTendencias:
+    """
+    Pontuações e rankings de tendência do processo.
+
+    Atributos:
+        tau (float): Constante de tempo do decaimento, em segundos
+        (meia-vida / ln 2).
+        pesos (Dict[str, float]): Peso de cada tipo de evento.
+        tamanho_topk (int): Quantidade de posts mantida por escopo.
+        intervalo (float): Intervalo, em segundos, entre snapshots e entre
+        recargas dos rankings.
+    """
+
+    _padrao: Optional['MotorTendencias'] = None
+    _lock_padrao = threading.Lock()
+
+    def __init__(
+        self,
+        meia_vida: float = 21600.0,
+        pesos: Optional[Dict[str, float]] = None,
+        tamanho_topk: int = 50,
+        intervalo: float = 30.0
+    ):
+        self.tau = meia_vida / math.log(2)
+        self.pesos = pesos or PESOS_PADRAO
+        self.tamanho_topk = tamanho_topk
+        self.intervalo = intervalo
+        self._pendentes: Dict[int, float] = {}
+        self._rankings: Dict[Escopo, Tuple[float, TopK]] = {}
+        self._escopos_post: Dict[int, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._ultimo_snapshot = time.monotonic()
+        self._pid = os.getpid()
+        atexit.register(self._encerrar)
+
+    @classmethod
+    def padrao(cls) -> 'MotorTendencias':
+        """Retorna o motor do processo, configurado pelas settings."""
+        with cls._lock_padrao:
+            if cls._padrao is None:
+                cls._padrao = cls(
+                    meia_vida=getattr(settings, 'TENDENCIAS_MEIA_VIDA', 21600.0),
+                    pesos=getattr(settings, 'TENDENCIAS_PESOS', None),
+                    tamanho_topk=getattr(settings, 'TENDENCIAS_TAMANHO_TOPK', 50),
+                    intervalo=getattr(settings, 'TENDENCIAS_INTERVALO', 30.0),
+                )
+        return cls._padrao
+
+    def registrar(
+        self,
+        post_id: int,
+        evento: str,
+        instante: Optional[datetime] = None,
+        quantidade: int = 1
+    ) -> None:
+        """
+        Soma à pontuação do post o peso de `quantidade` eventos. Deve ser
+        chamado após a confirmação da transação do evento.
+
+        Args:
+            post_id (int): ID do post.
+            evento (str): Tipo do evento (EVENTO_*); tipos sem peso são ignorados.
+            instante (Optional[datetime]): Instante do evento; por padrão, o atual.
+            quantidade (int): Quantidade de eventos.
+        """
+        self.registrar_varios([(post_id, evento, instante, quantidade)])
+
+    def registrar_varios(
+        self,
+        eventos: Iterable[Tuple[int, str, Optional[datetime], int]]
+    ) -> None:
+        """Registra vários eventos (post, tipo, instante, quantidade)."""
+        agora = timezone.now()
+        with self._lock:
+            self._verificar_fork()
+            for post_id, evento, instante, quantidade in eventos:
+                peso = self.pesos.get(evento, 0) * quantidade
+                if peso <= 0:
+                    continue
+                contribuicao = math.log(peso) + self._tempo(instante or agora)
+                pendente = self._pendentes.get(post_id)
+                self._pendentes[post_id] = (
+                    contribuicao if pendente is None else _somar_log(pendente, contribuicao)
+                )
+                self._somar_aos_rankings(post_id, contribuicao)
+            vencido = time.monotonic() - self._ultimo_snapshot >= self.intervalo
+        if vencido:
+            self.gravar_snapshot()
+
+    def ranking(self, escopo: str, escopo_id: int, limite: int = 10) -> List[PostTendenciaDomain]:
+        """
+        Retorna os posts publicados em alta do escopo, do maior para o menor.
+
+        Args:
+            escopo (str): ESCOPO_BLOG ou ESCOPO_SITE.
+            escopo_id (int): ID do blog ou do site.
+            limite (int): Quantidade máxima de posts (até o tamanho do TopK).
+        """
+        chave = (escopo, escopo_id)
+        with self._lock:
+            self._verificar_fork()
+            carregado = self._rankings.get(chave)
+        if carregado is None or time.monotonic() - carregado[0] >= self.intervalo:
+            self.gravar_snapshot()
+            topk = self._carregar(escopo, escopo_id)
+        else:
+            topk = carregado[1]
+
+        publicados = DjangoPostReacaoRepository().ids_posts_publicados()
+        agora = self._tempo(timezone.now())
+        with self._lock:
+            ordenados = topk.ordenados()
+        return [
+            PostTendenciaDomain(post_id=post_id, pontuacao=math.exp(pontuacao - agora))
+            for post_id, pontuacao in ordenados
+            if post_id in publicados
+        ][:limite]
+
+    def gravar_snapshot(self) -> None:
+        """
+        Grava nos snapshots as contribuições acumuladas desde o último. Em
+        caso de falha, as contribuições são mantidas para a próxima tentativa.
+        """
+        with self._lock:
+            pendentes, self._pendentes = self._pendentes, {}
+            self._ultimo_snapshot = time.monotonic()
+        if not pendentes:
+            return
+        try:
+            with transaction.atomic():
+                self._criar_snapshots_ausentes(pendentes)
+                for post_id, contribuicao in sorted(pendentes.items()):
+                    valor = Value(contribuicao)
+                    PontuacaoTendenciaPost.objects.filter(post_id=post_id).update(
+                        pontuacao=Greatest(F('pontuacao'), valor)
+                        + Ln(Value(1.0) + Exp(Greatest(
+                            -Abs(F('pontuacao') - valor), Value(EXPOENTE_MINIMO)
+                        )))
+                    )
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Falha ao gravar o snapshot de tendências.")
+            with self._lock:
+                for post_id, contribuicao in pendentes.items():
+                    pendente = self._pendentes.get(post_id)
+                    self._pendentes[post_id] = (
+                        contribuicao if pendente is None else _somar_log(pendente, contribuicao)
+                    )
+
+    def mover_post(self, post_id: int, blog_id: int) -> None:
+        """
+        Transfere o snapshot do post para os escopos do blog (e do site do
+        blog), se o post mudou de blog. Após o commit, os rankings dos escopos
+        anterior e novo são descartados, para serem recarregados na próxima
+        consulta.
+
+        Args:
+            post_id (int): ID do post.
+            blog_id (int): ID do blog atual do post.
+        """
+        anterior = (
+            PontuacaoTendenciaPost.objects.filter(post_id=post_id)
+            .exclude(blog_id=blog_id)
+            .values_list('blog_id', 'site_id')
+            .first()
+        )
+        if anterior is None:
+            return
+        site_id = Blog.objects.filter(pk=blog_id).values_list('site_id', flat=True).get()
+        PontuacaoTendenciaPost.objects.filter(post_id=post_id).update(
+            blog_id=blog_id, site_id=site_id
+        )
+        escopos = [
+            (ESCOPO_BLOG, anterior[0]), (ESCOPO_SITE, anterior[1]),
+            (ESCOPO_BLOG, blog_id), (ESCOPO_SITE, site_id),
+        ]
+        transaction.on_commit(partial(self._descartar_rankings, post_id, escopos))
+
+    def _descartar_rankings(self, post_id: int, escopos: List[Escopo]) -> None:
+        cache.delete_many([f'tendencias:{escopo}:{escopo_id}' for escopo, escopo_id in escopos])
+        with self._lock:
+            self._escopos_post.pop(post_id, None)
+            for chave in escopos:
+                self._rankings.pop(chave, None)
+
+    def _criar_snapshots_ausentes(self, pendentes: Dict[int, float]) -> None:
+        existentes = set(
+            PontuacaoTendenciaPost.objects.filter(post_id__in=pendentes)
+            .values_list('post_id', flat=True)
+        )
+        ausentes = [post_id for post_id in pendentes if post_id not in existentes]
+        if not ausentes:
+            return
+        PontuacaoTendenciaPost.objects.bulk_create(
+            [
+                PontuacaoTendenciaPost(
+                    post_id=post_id, blog_id=blog_id, site_id=site_id,
+                    pontuacao=PONTUACAO_NULA,
+                )
+                for post_id, blog_id, site_id in Post.objects.all_with_deleted()
+                .filter(pk__in=ausentes)
+                .values_list('id', 'blog_id', 'blog__site_id')
+            ],
+            ignore_conflicts=True,
+        )
+
+    def _carregar(self, escopo: str, escopo_id: int) -> TopK:
+        chave_cache = f'tendencias:{escopo}:{escopo_id}'
+        itens = cache.get(chave_cache)
+        if itens is None:
+            itens = list(
+                PontuacaoTendenciaPost.objects.filter(**{f'{escopo}_id': escopo_id})
+                .order_by('-pontuacao')
+                .values_list('post_id', 'blog_id', 'site_id', 'pontuacao')[:self.tamanho_topk]
+            )
+            cache.set(chave_cache, itens, self.intervalo)
+        topk = TopK(self.tamanho_topk, ((post_id, pontuacao) for post_id, _, _, pontuacao in itens))
+        with self._lock:
+            for post_id, blog_id, site_id, _ in itens:
+                self._escopos_post[post_id] = (blog_id, site_id)
+            self._rankings[(escopo, escopo_id)] = (time.monotonic(), topk)
+        return topk
+
+    def _somar_aos_rankings(self, post_id: int, contribuicao: float) -> None:
+        """Atualiza os rankings carregados em que o post já figura."""
+        escopos = self._escopos_post.get(post_id)
+        if escopos is None:
+            return
+        for chave in ((ESCOPO_BLOG, escopos[0]), (ESCOPO_SITE, escopos[1])):
+            carregado = self._rankings.get(chave)
+            if carregado is None:
+                continue
+            atual = carregado[1].pontuacao(post_id)
+            if atual is not None:
+                carregado[1].atualizar(post_id, _somar_log(atual, contribuicao))
+
+    def _verificar_fork(self) -> None:
+        # Um processo filho (fork) não regrava as contribuições do pai
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._pendentes = {}
+            self._rankings = {}
+
+    def _tempo(self, instante: datetime) -> float:
+        return (instante - EPOCA_TENDENCIA).total_seconds() / self.tau
+
+    def _encerrar(self) -> None:
+        if self._pid == os.getpid():
+            self.gravar_snapshot()
+
+
+class DjangoTendenciasRepository(TendenciasRepository):
+    """
+    Repositório concreto de tendências, servido pelo MotorTendencias do
+    processo.
+    """
+
+    def ranking_blog(self, blog_id: int, limite: int = 10) -> List[PostTendenciaDomain]:
+        """Retorna os posts publicados em alta do blog."""
+        return MotorTendencias.padrao().ranking(ESCOPO_BLOG, blog_id, limite)
+
+    def ranking_site(self, site_id: int, limite: int = 10) -> List[PostTendenciaDomain]:
+        """Retorna os posts publicados em alta do site."""
+        return MotorTendencias.padrao().ranking(ESCOPO_SITE, site_id, limite)
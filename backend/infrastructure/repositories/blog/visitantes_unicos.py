@@ -0,0 +1,182 @@
+# pylint: disable=no-member
+"""
+Módulo implementa o repositório concreto de visitantes únicos.
+
+Os sketches diários são atualizados na ingestão das visualizações
+(`registrar_lote`, chamado por VisualizacaoPostRepository.gravar_lote) e
+podem ser recalculados a partir das visualizações com `reconstruir` (comando
+`reconstruir_visitantes_unicos`).
+
+Classes:
+    DjangoVisitantesUnicosRepository: Atualização e leitura dos sketches.
+"""
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from django.db import transaction
+from django.utils import timezone
+from domain.blog.repositories.visitantes_unicos import VisitantesUnicosRepository
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from domain.shared.utils.hyperloglog import HyperLogLog
+from infrastructure.models.blog.visitantes_unicos_post import VisitantesUnicosPost
+from infrastructure.models.blog.visualizacao_post import VisualizacaoPost
+
+# (ID do post, dia, identificador do visitante)
+Visita = Tuple[int, date, str]
+
+
+def identificar_visitante(
+    pessoa_fisica_id: Optional[int] = None,
+    ip_address: Optional[str] = None
+) -> Optional[str]:
+    """
+    Retorna o identificador do visitante: a pessoa física, se autenticada,
+    ou o IP. None se nenhum dos dois for conhecido.
+    """
+    if pessoa_fisica_id is not None:
+        return f'pf:{pessoa_fisica_id}'
+    if ip_address:
+        return f'ip:{ip_address}'
+    return None
+
+
+class DjangoVisitantesUnicosRepository(VisitantesUnicosRepository):
+    """
+    Repositório concreto dos sketches de visitantes únicos, usando Django
+    ORM.
+    """
+
+    def sketch(
+        self,
+        desde: date,
+        ate: date,
+        post_ids: Optional[List[int]] = None
+    ) -> HyperLogLog:
+        """
+        Retorna a união dos sketches diários do período e dos posts.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            resultado = HyperLogLog()
+            for dados in self._sketches(desde, ate, post_ids).values_list('sketch', flat=True):
+                resultado.unir(HyperLogLog.desserializar(dados))
+            return resultado
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao consultar os visitantes únicos: {str(e)}"
+            ) from e
+
+    def sketches_por_post(
+        self,
+        desde: date,
+        ate: date,
+        post_ids: List[int]
+    ) -> Dict[int, HyperLogLog]:
+        """
+        Retorna, por post, a união dos seus sketches diários no período.
+        Posts sem visualizações recebem um sketch vazio.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            resultado = {post_id: HyperLogLog() for post_id in post_ids}
+            for post_id, dados in self._sketches(desde, ate, post_ids).values_list('post_id', 'sketch'):
+                resultado[post_id].unir(HyperLogLog.desserializar(dados))
+            return resultado
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao consultar os visitantes únicos por post: {str(e)}"
+            ) from e
+
+    @transaction.atomic
+    def registrar_lote(self, visitas: Iterable[Visita]) -> None:
+        """
+        Adiciona as visitas aos sketches diários, lendo e gravando cada
+        sketch (post, dia) uma única vez por lote.
+
+        Args:
+            visitas (Iterable[Visita]): (ID do post, dia, visitante).
+        """
+        visitantes: Dict[Tuple[int, date], Set[str]] = defaultdict(set)
+        for post_id, dia, visitante in visitas:
+            visitantes[(post_id, dia)].add(visitante)
+        if not visitantes:
+            return
+
+        # Cria os sketches ausentes (ignorando criações concorrentes) para
+        # que todos possam ser bloqueados e atualizados
+        vazio = HyperLogLog().serializar()
+        VisitantesUnicosPost.objects.bulk_create(
+            [
+                VisitantesUnicosPost(post_id=post_id, dia=dia, sketch=vazio)
+                for post_id, dia in visitantes
+            ],
+            ignore_conflicts=True,
+        )
+        registros = VisitantesUnicosPost.objects.select_for_update().filter(
+            post_id__in={post_id for post_id, _ in visitantes},
+            dia__in={dia for _, dia in visitantes},
+        ).order_by('pk')
+        alterados = []
+        for registro in registros:
+            novos = visitantes.get((registro.post_id, registro.dia))
+            if not novos:
+                continue
+            sketch = HyperLogLog.desserializar(registro.sketch)
+            sketch.adicionar_varios(novos)
+            registro.sketch = sketch.serializar()
+            alterados.append(registro)
+        VisitantesUnicosPost.objects.bulk_update(alterados, ['sketch'], batch_size=500)
+
+    def reconstruir(self, desde: date, ate: date) -> int:
+        """
+        Recalcula a partir das visualizações os sketches dos dias de `desde`
+        a `ate` (inclusive), um dia por transação.
+
+        Returns:
+            int: Quantidade de visualizações processadas.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            processadas = 0
+            dia = desde
+            while dia <= ate:
+                processadas += self._reconstruir_dia(dia)
+                dia += timedelta(days=1)
+            return processadas
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao reconstruir os visitantes únicos: {str(e)}"
+            ) from e
+
+    @transaction.atomic
+    def _reconstruir_dia(self, dia: date) -> int:
+        inicio = timezone.make_aware(datetime.combine(dia, time(0, 0)))
+        visualizacoes = VisualizacaoPost.objects.filter(
+            data_visualizacao__gte=inicio,
+            data_visualizacao__lt=inicio + timedelta(days=1),
+        ).values_list('post_id', 'pessoa_fisica_id', 'localizacao__ip_address')
+
+        VisitantesUnicosPost.objects.filter(dia=dia).delete()
+        processadas = 0
+        visitas = []
+        for post_id, pessoa_fisica_id, ip_address in visualizacoes.iterator(chunk_size=5000):
+            processadas += 1
+            visitante = identificar_visitante(pessoa_fisica_id, ip_address)
+            if visitante:
+                visitas.append((post_id, dia, visitante))
+        self.registrar_lote(visitas)
+        return processadas
+
+    @staticmethod
+    def _sketches(desde: date, ate: date, post_ids: Optional[List[int]]):
+        sketches = VisitantesUnicosPost.objects.filter(dia__gte=desde, dia__lte=ate)
+        if post_ids is not None:
+            sketches = sketches.filter(post_id__in=post_ids)
+        return sketches
@@ -0,0 +1,191 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pelo repositório de visualizações de posts.
+
+As visualizações são o evento de maior volume do blog. Em vez de gravar uma
+Localizacao e uma VisualizacaoPost por requisição, `registrar` apenas
+enfileira o evento no IngestorBufferizado do processo; a gravação acontece em
+segundo plano, em lotes, com um `bulk_create` de visualizações por lote. As
+visualizações de um mesmo IP em um mesmo dia referenciam uma única
+localização canônica (LocalizacaoCanonicaRepository).
+
+Classes:
+    VisualizacaoPostRepository: Registro e gravação em lote de visualizações.
+"""
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.models.blog.visualizacao_post import VisualizacaoPost
+from infrastructure.models.blog.contador_engajamento_post import (
+    METRICA_VISUALIZACOES)
+from infrastructure.repositories.blog.engajamento_post import (
+    EngajamentoPostRepository)
+from infrastructure.repositories.blog.tendencias import (
+    EVENTO_VISUALIZACAO, MotorTendencias)
+from infrastructure.repositories.blog.visitantes_unicos import (
+    DjangoVisitantesUnicosRepository, identificar_visitante)
+from infrastructure.repositories.shared.ingestao_bufferizada import (
+    IngestorBufferizado, reprocessar_spool)
+from infrastructure.repositories.shared.resources.localizacao_canonica import (
+    LocalizacaoCanonicaRepository)
+
+NOME_INGESTAO = 'visualizacoes'
+
+# Campos de LocalizacaoModel aceitos no evento de visualização.
+CAMPOS_LOCALIZACAO = (
+    'ip_address', 'latitude', 'longitude', 'precisao', 'cidade', 'estado', 'pais'
+)
+
+
+def diretorio_spool() -> str:
+    """Retorna o diretório do spool da ingestão bufferizada (INGESTAO_SPOOL_DIR)."""
+    return getattr(
+        settings, 'INGESTAO_SPOOL_DIR', os.path.join(settings.BASE_DIR, 'spool')
+    )
+
+
+class VisualizacaoPostRepository:
+    """
+    Repositório de VisualizacaoPost com ingestão bufferizada.
+    """
+
+    _ingestor: Optional[IngestorBufferizado] = None
+    _lock_ingestor = threading.Lock()
+
+    def registrar(
+        self,
+        post_id: int,
+        pessoa_fisica_id: Optional[int] = None,
+        localizacao: Optional[Dict[str, object]] = None,
+        data_visualizacao: Optional[datetime] = None
+    ) -> bool:
+        """
+        Registra uma visualização para gravação em lote posterior. O custo na
+        requisição é apenas o de enfileirar o evento.
+
+        Args:
+            post_id (int): ID do post visualizado.
+            pessoa_fisica_id (Optional[int]): ID da pessoa física, se autenticada.
+            localizacao (Optional[Dict[str, object]]): Campos de
+            CAMPOS_LOCALIZACAO da origem da visualização.
+            data_visualizacao (Optional[datetime]): Instante da visualização;
+            por padrão, o atual.
+
+        Returns:
+            bool: False se o evento foi descartado por contrapressão.
+        """
+        evento = {
+            'post_id': post_id,
+            'pessoa_fisica_id': pessoa_fisica_id,
+            'data_visualizacao': data_visualizacao or timezone.now(),
+        }
+        if localizacao:
+            evento['localizacao'] = {
+                campo: localizacao.get(campo) for campo in CAMPOS_LOCALIZACAO
+            }
+        return self.ingestor().enfileirar(evento)
+
+    @transaction.atomic
+    def gravar_lote(self, eventos: List[Dict[str, object]]) -> None:
+        """
+        Grava um lote de eventos de visualização com um `bulk_create` de
+        visualizações, reaproveitando as localizações canônicas de cada IP no
+        dia, e incrementa os contadores de
+        visualizações e os sketches de visitantes únicos de cada post uma
+        única vez por lote. Após o commit, as visualizações alimentam o motor
+        de tendências.
+
+        Args:
+            eventos (List[Dict[str, object]]): Eventos gerados por `registrar`.
+
+        Raises:
+            OperationFailedException: Se a gravação falhar; nada é gravado.
+        """
+        try:
+            datas = [self._data_evento(evento) for evento in eventos]
+            localizacoes = LocalizacaoCanonicaRepository.padrao().obter_ids(
+                [evento.get('localizacao') for evento in eventos],
+                [timezone.localdate(data) for data in datas],
+            )
+
+            VisualizacaoPost.objects.bulk_create([
+                VisualizacaoPost(
+                    post_id=evento['post_id'],
+                    pessoa_fisica_id=evento.get('pessoa_fisica_id'),
+                    localizacao_id=localizacao_id,
+                    data_visualizacao=data,
+                )
+                for evento, data, localizacao_id in zip(eventos, datas, localizacoes)
+            ])
+
+            incrementos = Counter(
+                (evento['post_id'], METRICA_VISUALIZACOES) for evento in eventos
+            )
+            EngajamentoPostRepository().incrementar_varios(dict(incrementos))
+
+            visitas = []
+            for evento, data in zip(eventos, datas):
+                visitante = identificar_visitante(
+                    evento.get('pessoa_fisica_id'),
+                    (evento.get('localizacao') or {}).get('ip_address'),
+                )
+                if visitante:
+                    visitas.append((evento['post_id'], timezone.localdate(data), visitante))
+            DjangoVisitantesUnicosRepository().registrar_lote(visitas)
+
+            tendencias = [
+                (evento['post_id'], EVENTO_VISUALIZACAO, data, 1)
+                for evento, data in zip(eventos, datas)
+            ]
+            transaction.on_commit(
+                lambda: MotorTendencias.padrao().registrar_varios(tendencias)
+            )
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao gravar o lote de visualizações: {str(e)}"
+            ) from e
+
+    def reprocessar_spool(self, idade_minima: float = 300.0, incluir_mortos: bool = False) -> int:
+        """
+        Regrava as visualizações deixadas no spool por processos encerrados
+        antes de gravá-las (e, com `incluir_mortos`, as que esgotaram as
+        tentativas de gravação).
+
+        Returns:
+            int: Quantidade de visualizações regravadas.
+        """
+        return reprocessar_spool(
+            NOME_INGESTAO, self.gravar_lote, diretorio_spool(), idade_minima,
+            max_tentativas=getattr(settings, 'INGESTAO_MAX_TENTATIVAS', 10),
+            incluir_mortos=incluir_mortos,
+        )
+
+    @classmethod
+    def ingestor(cls) -> IngestorBufferizado:
+        """Retorna o ingestor do processo, criando-o no primeiro uso."""
+        with cls._lock_ingestor:
+            if cls._ingestor is None:
+                cls._ingestor = IngestorBufferizado(
+                    NOME_INGESTAO,
+                    cls().gravar_lote,
+                    diretorio_spool(),
+                    tamanho_lote=getattr(settings, 'INGESTAO_TAMANHO_LOTE', 500),
+                    intervalo=getattr(settings, 'INGESTAO_INTERVALO', 2.0),
+                    max_tentativas=getattr(settings, 'INGESTAO_MAX_TENTATIVAS', 10),
+                )
+        return cls._ingestor
+
+    @staticmethod
+    def _data_evento(evento: Dict[str, object]) -> datetime:
+        data = evento.get('data_visualizacao')
+        if isinstance(data, str):
+            data = parse_datetime(data)
+        return data or timezone.now()
@@ -0,0 +1,95 @@
+"""
+Módulo responsável pelo contêiner de repositórios.
+
+O contêiner instancia cada repositório uma única vez por unidade de trabalho
+(normalmente, uma por requisição) e injeta nos repositórios compostos as
+mesmas instâncias dos repositórios de que dependem. Assim, todos compartilham
+o mesmo mapa de identidade e uma linha carregada por um deles não é
+recarregada pelos demais.
+
+Exemplo:
+    repositorios = ContainerRepositorios(UnidadeDeTrabalho())
+    pessoa_juridica = repositorios.pessoa_juridica.get_by_id(1)
+
+Classes:
+    ContainerRepositorios: Fornece os repositórios de uma unidade de trabalho.
+"""
+from functools import cached_property
+from typing import Optional
+from infrastructure.repositories.marketing.atividade_economica import (
+                                                AtividadeEconomicaRepository)
+from infrastructure.repositories.marketing.endereco import EnderecoRepository
+from infrastructure.repositories.marketing.pessoa_fisica import (
+                                            PessoaFisicaRepository)
+from infrastructure.repositories.marketing.pessoa_juridica import (
+                                            PessoaJuridicaRepository)
+from infrastructure.repositories.shared.resources.localizacao import (
+                                                    LocalizacaoRepository)
+from infrastructure.repositories.shared.resources.rede_social import (
+                                                    RedeSocialRepository)
+from infrastructure.repositories.shared.unidade_trabalho import (
+    UnidadeDeTrabalho, unidade_trabalho_atual)
+
+
+class ContainerRepositorios:
+    """
+    Contêiner de repositórios de uma unidade de trabalho.
+
+    Cada propriedade cria o repositório no primeiro acesso e devolve a mesma
+    instância nos acessos seguintes.
+
+    Atributos:
+        unidade_trabalho (UnidadeDeTrabalho): Unidade compartilhada pelos
+        repositórios do contêiner.
+    """
+
+    def __init__(self, unidade_trabalho: Optional[UnidadeDeTrabalho] = None):
+        """
+        Args:
+            unidade_trabalho (Optional[UnidadeDeTrabalho]): Unidade a usar;
+            por padrão, a ativa no contexto atual ou uma nova.
+        """
+        self.unidade_trabalho = (
+            unidade_trabalho or unidade_trabalho_atual() or UnidadeDeTrabalho()
+        )
+
+    @cached_property
+    def endereco(self) -> EnderecoRepository:
+        """Repositório de endereços."""
+        return EnderecoRepository()
+
+    @cached_property
+    def localizacao(self) -> LocalizacaoRepository:
+        """Repositório de localizações."""
+        return LocalizacaoRepository()
+
+    @cached_property
+    def rede_social(self) -> RedeSocialRepository:
+        """Repositório de redes sociais."""
+        return RedeSocialRepository()
+
+    @cached_property
+    def atividade_economica(self) -> AtividadeEconomicaRepository:
+        """Repositório de atividades econômicas."""
+        return AtividadeEconomicaRepository(unidade_trabalho=self.unidade_trabalho)
+
+    @cached_property
+    def pessoa_fisica(self) -> PessoaFisicaRepository:
+        """Repositório de pessoas físicas."""
+        return PessoaFisicaRepository(
+            endereco_repository=self.endereco,
+            localizacao_repository=self.localizacao,
+            rede_social_repository=self.rede_social,
+            unidade_trabalho=self.unidade_trabalho,
+        )
+
+    @cached_property
+    def pessoa_juridica(self) -> PessoaJuridicaRepository:
+        """Repositório de pessoas jurídicas."""
+        return PessoaJuridicaRepository(
+            self.pessoa_fisica,
+            self.atividade_economica,
+            self.endereco,
+            self.rede_social,
+            unidade_trabalho=self.unidade_trabalho,
+        )
@@ -14,6 +14,8 @@ Exceções lançadas:
     - OperationFailedException: Lançada quando ocorre um erro inesperado ao
     realizar uma operação no banco de dados.
 """
+import re
+from typing import Dict, Iterable, List, Optional
 from django.core.exceptions import ObjectDoesNotExist
 from domain.marketing.repositories.atividade_economica import (
     AtividadeEconomicaContract)
@@ -21,8 +23,22 @@ from domain.shared.exceptions.entity_not_found_exception import (
     EntityNotFoundException)
 from domain.shared.exceptions.operation_failed_exception import (
     OperationFailedException)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.value_objects.pagina import Pagina
 from infrastructure.models.marketing.atividade_economica import (
     AtividadeEconomicaModel)
+from infrastructure.repositories.shared.cache_referencia import CacheReferencia
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+from infrastructure.repositories.shared.unidade_trabalho import (
+                                                    UnidadeDeTrabalho)
+
+
+# Campos aceitos como chave de ordenação na paginação por chave.
+CAMPOS_ORDENACAO = ('id', 'atividade_econ_codigo')
+
+# Cache de leitura, invalidado a cada gravação de AtividadeEconomicaModel.
+CACHE_ATIVIDADES = CacheReferencia('atividade_economica', AtividadeEconomicaModel)
 
 
 class AtividadeEconomicaRepository(AtividadeEconomicaContract):
@@ -33,6 +49,14 @@ class AtividadeEconomicaRepository(AtividadeEconomicaContract):
     da entidade AtividadeEconomicaDomain no banco de dados utilizando o Django ORM.
     """
 
+    def __init__(self, unidade_trabalho: Optional[UnidadeDeTrabalho] = None):
+        """
+        Args:
+            unidade_trabalho (Optional[UnidadeDeTrabalho]): Unidade de trabalho
+            cujo mapa de identidade recebe as atividades buscadas por ID.
+        """
+        self.unidade_trabalho = unidade_trabalho
+
     def get_by_id(self, atividade_econ_id: int) -> AtividadeEconomicaModel:
         """
         Recupera uma entidade AtividadeEconomicaModel pelo seu ID.
@@ -52,8 +76,15 @@ class AtividadeEconomicaRepository(AtividadeEconomicaContract):
             na operação.
         """
         try:
-            # Busca a atividade econômica no banco de dados
-            atividade = AtividadeEconomicaModel.objects.get(id=atividade_econ_id)
+            # Busca a atividade econômica no cache ou no banco de dados
+            atividade = CACHE_ATIVIDADES.obter(
+                atividade_econ_id,
+                lambda: AtividadeEconomicaModel.objects.get(id=atividade_econ_id)
+            )
+            if self.unidade_trabalho:
+                # O cache devolve uma cópia, que pode ser alterada e gravada
+                # na conclusão da unidade
+                return self.unidade_trabalho.registrar(atividade)
             return atividade
 
         except ObjectDoesNotExist as e: 
@@ -66,6 +97,33 @@ class AtividadeEconomicaRepository(AtividadeEconomicaContract):
                 f"Erro ao buscar a atividade econômica: {str(e)}"
             ) from e
 
+    def get_by_ids(self, atividade_econ_ids: Iterable[int]) -> List[AtividadeEconomicaModel]:
+        """
+        Recupera várias atividades econômicas pelos IDs em uma única consulta.
+        IDs inexistentes são ignorados.
+
+        Args:
+            atividade_econ_ids (Iterable[int]): Os identificadores das atividades.
+
+        Returns:
+            List[AtividadeEconomicaModel]: As atividades econômicas encontradas.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado na operação.
+        """
+        try:
+            if self.unidade_trabalho:
+                return self.unidade_trabalho.obter_varios(
+                    AtividadeEconomicaModel, atividade_econ_ids
+                )
+            return list(
+                AtividadeEconomicaModel.objects.filter(id__in=list(atividade_econ_ids))
+            )
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao buscar as atividades econômicas: {str(e)}"
+            ) from e
+
     def list_all(self) -> list[AtividadeEconomicaModel]:
         """
         Retorna todas as atividades econômicas cadastradas no banco de dados.
@@ -77,8 +135,10 @@ class AtividadeEconomicaRepository(AtividadeEconomicaContract):
             OperationFailedException: Se ocorrer um erro inesperado na operação.
         """
         try:
-            # Lista todas as atividades econômicas do banco de dados
-            atividades = AtividadeEconomicaModel.objects.all()
+            # Lista todas as atividades econômicas do cache ou do banco de dados
+            atividades = CACHE_ATIVIDADES.obter(
+                'todas', lambda: list(AtividadeEconomicaModel.objects.all())
+            )
             return list(atividades)
 
         except Exception as e:
@@ -86,6 +146,66 @@ class AtividadeEconomicaRepository(AtividadeEconomicaContract):
                 f"Erro ao listar as atividades econômicas: {str(e)}"
             ) from e
 
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[AtividadeEconomicaModel]:
+        """
+        Retorna uma página de atividades econômicas usando paginação por chave (keyset).
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Um dos campos de CAMPOS_ORDENACAO, prefixado com
+            '-' para ordem decrescente.
+
+        Returns:
+            Pagina[AtividadeEconomicaModel]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            return paginar_por_chave(
+                AtividadeEconomicaModel.objects.all(),
+                lambda atividade: atividade,
+                after=after,
+                limit=limit,
+                order_by=order_by,
+                campos_ordenacao=CAMPOS_ORDENACAO
+            )
+        except InvalidInputException:
+            raise
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao paginar as atividades econômicas: {str(e)}"
+            ) from e
+
+    def mapa_por_codigo(self) -> Dict[str, int]:
+        """
+        Retorna o ID de cada atividade econômica indexado pelo código CNAE
+        sem formatação (apenas dígitos), em uma única consulta.
+
+        Returns:
+            Dict[str, int]: Dicionário de código CNAE para ID da atividade.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado na operação.
+        """
+        try:
+            atividades = AtividadeEconomicaModel.objects.values_list(
+                'atividade_econ_codigo', 'id'
+            )
+            return {
+                re.sub(r'\D', '', codigo): atividade_id
+                for codigo, atividade_id in atividades
+            }
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao mapear as atividades econômicas: {str(e)}"
+            ) from e
+
     def save(self, atividade_economica: AtividadeEconomicaModel, user) -> str:
         """
         Salva ou atualiza uma entidade AtividadeEconomicaModel no banco de dados.
@@ -13,14 +13,23 @@ Classes:
     EnderecoRepository: Implementação concreta do contrato EnderecoContract.
 """
 
+from typing import Dict, Iterable, List, Optional
 from django.core.exceptions import ObjectDoesNotExist
 from domain.shared.exceptions.entity_not_found_exception import (
     EntityNotFoundException)
 from domain.shared.exceptions.operation_failed_exception import (
     OperationFailedException)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.value_objects.pagina import Pagina
 from domain.marketing.entities.endereco import EnderecoDomain
 from domain.marketing.repositories.endereco import EnderecoContract
 from infrastructure.models.marketing.endereco import EnderecoModel
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+
+
+# Campos aceitos como chave de ordenação na paginação por chave.
+CAMPOS_ORDENACAO = ('id', 'cidade', 'cep', 'data_inicio')
 
 
 class EnderecoRepository(EnderecoContract):
@@ -184,6 +193,152 @@ class EnderecoRepository(EnderecoContract):
                 f"Erro ao listar endereços para pessoa jurídica: {str(e)}"
             ) from e
 
+    def get_by_ids(self, endereco_ids: Iterable[int]) -> List[EnderecoDomain]:
+        """
+        Recupera, em uma única consulta, os endereços cujos IDs foram
+        informados.
+
+        Args:
+            endereco_ids (Iterable[int]): Os identificadores dos endereços.
+
+        Returns:
+            List[EnderecoDomain]: Lista de endereços encontrados. IDs
+            inexistentes são ignorados.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado ao buscar
+            os endereços.
+        """
+        ids = set(endereco_ids or [])
+        if not ids:
+            return []
+
+        try:
+            enderecos = EnderecoModel.objects.filter(id__in=ids)
+            return [self._from_model_to_domain(endereco) for endereco in enderecos]
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao buscar os endereços: {str(e)}"
+            ) from e
+
+    def list_by_pessoas_fisicas(
+        self, pessoa_fisica_ids: Iterable[int]
+    ) -> Dict[int, List[EnderecoDomain]]:
+        """
+        Retorna, em uma única consulta, os endereços de várias pessoas físicas.
+
+        Args:
+            pessoa_fisica_ids (Iterable[int]): Os identificadores das pessoas
+            físicas.
+
+        Returns:
+            Dict[int, List[EnderecoDomain]]: Endereços agrupados pelo ID da
+            pessoa física. Pessoas sem endereço recebem uma lista vazia.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado ao listar os
+            endereços.
+        """
+        try:
+            return self._agrupar_por_proprietario('pessoa_fisica_id', pessoa_fisica_ids)
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao listar endereços para pessoas físicas: {str(e)}"
+            ) from e
+
+    def list_by_pessoas_juridicas(
+        self, pessoa_juridica_ids: Iterable[int]
+    ) -> Dict[int, List[EnderecoDomain]]:
+        """
+        Retorna, em uma única consulta, os endereços de várias pessoas jurídicas.
+
+        Args:
+            pessoa_juridica_ids (Iterable[int]): Os identificadores das pessoas
+            jurídicas.
+
+        Returns:
+            Dict[int, List[EnderecoDomain]]: Endereços agrupados pelo ID da
+            pessoa jurídica. Pessoas sem endereço recebem uma lista vazia.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado ao listar os
+            endereços.
+        """
+        try:
+            return self._agrupar_por_proprietario('pessoa_juridica_id', pessoa_juridica_ids)
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao listar endereços para pessoas jurídicas: {str(e)}"
+            ) from e
+
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[EnderecoDomain]:
+        """
+        Retorna uma página de endereços usando paginação por chave (keyset).
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Um dos campos de CAMPOS_ORDENACAO, prefixado com
+            '-' para ordem decrescente.
+
+        Returns:
+            Pagina[EnderecoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            return paginar_por_chave(
+                EnderecoModel.objects.all(),
+                self._from_model_to_domain,
+                after=after,
+                limit=limit,
+                order_by=order_by,
+                campos_ordenacao=CAMPOS_ORDENACAO
+            )
+        except InvalidInputException:
+            raise
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao paginar os endereços: {str(e)}"
+            ) from e
+
+    # Métodos privados auxiliares
+
+    def _agrupar_por_proprietario(
+        self, campo: str, proprietario_ids: Iterable[int]
+    ) -> Dict[int, List[EnderecoDomain]]:
+        """
+        Busca os endereços de vários proprietários com um único filtro
+        `IN` e os agrupa pelo valor da chave estrangeira informada.
+
+        Args:
+            campo (str): Nome da coluna da chave estrangeira
+            ('pessoa_fisica_id' ou 'pessoa_juridica_id').
+            proprietario_ids (Iterable[int]): IDs dos proprietários.
+
+        Returns:
+            Dict[int, List[EnderecoDomain]]: Endereços agrupados por proprietário.
+        """
+        agrupados: Dict[int, List[EnderecoDomain]] = {
+            proprietario_id: [] for proprietario_id in proprietario_ids or []
+        }
+        if not agrupados:
+            return agrupados
+
+        enderecos = EnderecoModel.objects.filter(
+            **{f'{campo}__in': list(agrupados)}
+        ).order_by(campo, 'id')
+        for endereco in enderecos:
+            agrupados[getattr(endereco, campo)].append(
+                self._from_model_to_domain(endereco)
+            )
+        return agrupados
+
     # Métodos privados auxiliares de conversão
 
     def _from_model_to_domain(self, endereco_model: EnderecoModel) -> EnderecoDomain:
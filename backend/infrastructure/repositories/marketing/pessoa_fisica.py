@@ -12,12 +12,15 @@ Classes:
     PessoaFisicaRepository: Repositório concreto que implementa o contrato
     PessoaFisicaContract para gerenciar PessoaFisica no banco de dados.
 """
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
 from django.db import transaction
 from domain.shared.exceptions.entity_not_found_exception import (
                                             EntityNotFoundException)
 from domain.shared.exceptions.operation_failed_exception import (
                                             OperationFailedException)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.value_objects.pagina import Pagina
 from infrastructure.models.marketing.pessoa_fisica import PessoaFisicaModel
 from infrastructure.models.marketing.pessoa_fisica_rede_social import (
     PessoaFisicaRedeSocialModel
@@ -27,6 +30,15 @@ from infrastructure.repositories.shared.resources.localizacao import (
                                                     LocalizacaoRepository)
 from infrastructure.repositories.shared.resources.rede_social import (
                                                     RedeSocialRepository)
+from infrastructure.repositories.shared.resources.sincronizador_redes_sociais import (
+                                                    SincronizadorRedesSociais)
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+from infrastructure.repositories.shared.unidade_trabalho import (
+                                                    UnidadeDeTrabalho)
+
+
+# Campos aceitos como chave de ordenação na paginação por chave.
+CAMPOS_ORDENACAO = ('id', 'cpf', 'email', 'date_joined')
 
 
 class PessoaFisicaRepository:
@@ -38,10 +50,33 @@ class PessoaFisicaRepository:
     com endereços, localização e redes sociais.
     """
 
-    def __init__(self):
-        self.endereco_repository = EnderecoRepository()
-        self.localizacao_repository = LocalizacaoRepository()
-        self.rede_social_repository = RedeSocialRepository()
+    def __init__(
+        self,
+        endereco_repository: Optional[EnderecoRepository] = None,
+        localizacao_repository: Optional[LocalizacaoRepository] = None,
+        rede_social_repository: Optional[RedeSocialRepository] = None,
+        unidade_trabalho: Optional[UnidadeDeTrabalho] = None
+    ):
+        """
+        Args:
+            endereco_repository (Optional[EnderecoRepository]): Repositório de
+            endereços compartilhado; criado se não informado.
+            localizacao_repository (Optional[LocalizacaoRepository]):
+            Repositório de localizações compartilhado; criado se não informado.
+            rede_social_repository (Optional[RedeSocialRepository]):
+            Repositório de redes sociais compartilhado; criado se não informado.
+            unidade_trabalho (Optional[UnidadeDeTrabalho]): Unidade de trabalho
+            cujo mapa de identidade é usado nas buscas por ID.
+        """
+        self.endereco_repository = endereco_repository or EnderecoRepository()
+        self.localizacao_repository = localizacao_repository or LocalizacaoRepository()
+        self.rede_social_repository = rede_social_repository or RedeSocialRepository()
+        self.unidade_trabalho = unidade_trabalho
+        self.redes_sociais_sincronizador = SincronizadorRedesSociais(
+            PessoaFisicaRedeSocialModel,
+            campo_proprietario='pessoa_fisica',
+            campo_usuario='endereco'
+        )
 
     @transaction.atomic
     def get_by_id(self, pessoa_fisica_id: int) -> PessoaFisicaModel:
@@ -58,13 +93,36 @@ class PessoaFisicaRepository:
             EntityNotFoundException: Se a pessoa física não for encontrada.
         """
         try:
+            if self.unidade_trabalho:
+                return self.unidade_trabalho.obter(PessoaFisicaModel, pessoa_fisica_id)
             pessoa_model = PessoaFisicaModel.objects.get(pessoa_fisica_id=pessoa_fisica_id)
             return pessoa_model
-        except PessoaFisicaModel.DoesNotExist as e:
+        except (PessoaFisicaModel.DoesNotExist, EntityNotFoundException) as e:
             raise EntityNotFoundException(f"Pessoa Física com ID {pessoa_fisica_id} não encontrada.") from e
         except Exception as e:
             raise OperationFailedException(f"Erro ao buscar pessoa física: {str(e)}") from e
 
+    def get_by_ids(self, pessoa_fisica_ids: Iterable[int]) -> List[PessoaFisicaModel]:
+        """
+        Recupera várias pessoas físicas pelos IDs em uma única consulta.
+        IDs inexistentes são ignorados.
+
+        Args:
+            pessoa_fisica_ids (Iterable[int]): Os identificadores das pessoas físicas.
+
+        Returns:
+            List[PessoaFisicaModel]: As pessoas físicas encontradas.
+
+        Raises:
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            if self.unidade_trabalho:
+                return self.unidade_trabalho.obter_varios(PessoaFisicaModel, pessoa_fisica_ids)
+            return list(PessoaFisicaModel.objects.filter(pk__in=list(pessoa_fisica_ids)))
+        except Exception as e:
+            raise OperationFailedException(f"Erro ao buscar pessoas físicas: {str(e)}") from e
+
     @transaction.atomic
     def save(self, pessoa_model: PessoaFisicaModel, redes_sociais: Dict[int, str], user) -> str:
         """
@@ -132,6 +190,42 @@ class PessoaFisicaRepository:
         except Exception as e:
             raise OperationFailedException(f"Erro ao listar pessoas físicas: {str(e)}") from e
 
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[PessoaFisicaModel]:
+        """
+        Retorna uma página de pessoas físicas usando paginação por chave (keyset).
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Um dos campos de CAMPOS_ORDENACAO, prefixado com
+            '-' para ordem decrescente.
+
+        Returns:
+            Pagina[PessoaFisicaModel]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            return paginar_por_chave(
+                PessoaFisicaModel.objects.all(),
+                lambda pessoa_model: pessoa_model,
+                after=after,
+                limit=limit,
+                order_by=order_by,
+                campos_ordenacao=CAMPOS_ORDENACAO
+            )
+        except InvalidInputException:
+            raise
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao paginar pessoas físicas: {str(e)}"
+            ) from e
+
     @transaction.atomic
     def alterar_status(self, pessoa_fisica_id: int, status: str) -> str:
         """
@@ -160,49 +254,15 @@ class PessoaFisicaRepository:
         """
         Salva ou atualiza as redes sociais associadas à pessoa física.
 
+        A diferença entre as redes informadas e as já associadas é aplicada
+        pelo SincronizadorRedesSociais, com número constante de consultas.
+
         Args:
             pessoa_model (PessoaFisicaModel): O modelo da pessoa física.
             redes_sociais (Dict[int, str]): Dicionário de ID da rede social e nome de usuário.
         """
         try:
-            # Redes sociais já associadas a esta pessoa
-            redes_existentes = PessoaFisicaRedeSocialModel.objects.filter(
-                pessoa_fisica=pessoa_model
-            )
-
-            # Redes sociais que precisam ser atualizadas
-            redes_a_atualizar = {}
-
-            # Itera sobre as redes sociais fornecidas
-            for rede_social_id, usuario in redes_sociais.items():
-                rede_social_model = self.rede_social_repository.get_by_id(rede_social_id)
-
-                # Verifica se já existe uma associação com essa rede social
-                rede_existente = redes_existentes.filter(rede_social=rede_social_model).first()
-
-                if rede_existente:
-                    # Atualiza o usuário se houver alteração
-                    if rede_existente.endereco != usuario:
-                        rede_existente.endereco = usuario
-                        redes_a_atualizar[rede_existente.id] = rede_existente
-                else:
-                    # Cria uma nova associação se não existir
-                    PessoaFisicaRedeSocialModel.objects.create(
-                        pessoa_fisica=pessoa_model,
-                        rede_social=rede_social_model,
-                        endereco=usuario
-                    )
-
-            # Atualiza as redes sociais modificadas
-            if redes_a_atualizar:
-                PessoaFisicaRedeSocialModel.objects.bulk_update(
-                    list(redes_a_atualizar.values()), ['endereco']
-                )
-
-            # Remove redes sociais que não estão na lista fornecida
-            ids_informados = list(redes_sociais.keys())
-            redes_existentes.exclude(rede_social_id__in=ids_informados).delete()
-
+            self.redes_sociais_sincronizador.sincronizar(pessoa_model, redes_sociais)
         except Exception as e:
             raise OperationFailedException(
                 f"Erro ao salvar redes sociais: {str(e)}") from e
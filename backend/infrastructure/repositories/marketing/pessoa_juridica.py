@@ -30,11 +30,16 @@ from domain.shared.exceptions.entity_not_found_exception import (
                                             EntityNotFoundException)
 from domain.shared.exceptions.operation_failed_exception import (
                                             OperationFailedException)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.value_objects.pagina import Pagina
 from domain.marketing.entities.pessoa_juridica import PessoaJuridicaDomain
 from domain.marketing.repositories.pessoa_juridica import (
                                         PessoaJuridicaContract)
 from domain.marketing.domain_service.ativar_pessoa_juridica import (
                                                         AtivarPessoaJuridica)
+from domain.marketing.domain_service.importar_pessoas_juridicas import (
+                                                    RegistroImportacaoCNPJ)
 from infrastructure.models.marketing.pessoa_juridica import PessoaJuridicaModel
 from infrastructure.repositories.marketing.pessoa_fisica import (
                                             PessoaFisicaRepository)
@@ -43,6 +48,15 @@ from infrastructure.repositories.marketing.atividade_economica import (
                                                 AtividadeEconomicaRepository)
 from infrastructure.repositories.shared.resources.rede_social import (
                                                         RedeSocialRepository)
+from infrastructure.repositories.shared.resources.sincronizador_redes_sociais import (
+                                                    SincronizadorRedesSociais)
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+from infrastructure.repositories.shared.unidade_trabalho import (
+                                                    UnidadeDeTrabalho)
+
+
+# Campos aceitos como chave de ordenação na paginação por chave.
+CAMPOS_ORDENACAO = ('id', 'razao_social', 'cnpj')
 
 
 class PessoaJuridicaRepository(PessoaJuridicaContract):
@@ -57,12 +71,19 @@ class PessoaJuridicaRepository(PessoaJuridicaContract):
         pessoa_fisica_repo: PessoaFisicaRepository,
         atividade_economica_repo: AtividadeEconomicaRepository,
         endereco_repo: EnderecoRepository,
-        rede_social_repo: RedeSocialRepository
+        rede_social_repo: RedeSocialRepository,
+        unidade_trabalho: Optional[UnidadeDeTrabalho] = None
     ):
+        self.unidade_trabalho = unidade_trabalho
         self.pessoa_fisica_repo = pessoa_fisica_repo
         self.atividade_economica_repo = atividade_economica_repo
         self.endereco_repo = endereco_repo
         self.rede_social_repo = rede_social_repo
+        self.redes_sociais_sincronizador = SincronizadorRedesSociais(
+            PessoaJuridicaModel.redes_sociais.through,
+            campo_proprietario='pessoajuridicamodel',
+            campo_rede_social='redesocialmodel'
+        )
 
     @transaction.atomic
     def save(self, pessoa_juridica: PessoaJuridicaDomain, user) -> dict:
@@ -104,7 +125,7 @@ class PessoaJuridicaRepository(PessoaJuridicaContract):
                 
             }
         except Exception as e:
-            raise OperationFailedException(f"Erro ao salvar a pessoa jurídica: {str(exc)}") from e
+            raise OperationFailedException(f"Erro ao salvar a pessoa jurídica: {str(e)}") from e
 
     @transaction.atomic
     def delete(self, pessoa_juridica_id: int, user) -> str:
@@ -122,7 +143,7 @@ class PessoaJuridicaRepository(PessoaJuridicaContract):
             pessoa_juridica = PessoaJuridicaModel.objects.get(id=pessoa_juridica_id)
             pessoa_juridica.delete(user=user)     
             return "Pessoa Jurídica excluída com sucesso."
-        except PessoaJuridicaModel.DoesNotExist:
+        except PessoaJuridicaModel.DoesNotExist as e:
             raise EntityNotFoundException(f"Pessoa Jurídica com ID {pessoa_juridica_id} não encontrada.") from e
         except Exception as e:
             raise OperationFailedException(f"Erro ao excluir a pessoa jurídica: {str(e)}") from e
@@ -139,9 +160,14 @@ class PessoaJuridicaRepository(PessoaJuridicaContract):
             Optional[PessoaJuridicaDomain]: A entidade de domínio correspondente ou None.
         """
         try:
-            pessoa_juridica_model = PessoaJuridicaModel.objects.get(id=pessoa_juridica_id)
+            if self.unidade_trabalho:
+                pessoa_juridica_model = self.unidade_trabalho.obter(
+                    PessoaJuridicaModel, pessoa_juridica_id
+                )
+            else:
+                pessoa_juridica_model = PessoaJuridicaModel.objects.get(id=pessoa_juridica_id)
             return self._model_to_domain(pessoa_juridica_model)
-        except PessoaJuridicaModel.DoesNotExist as exc:
+        except (PessoaJuridicaModel.DoesNotExist, EntityNotFoundException) as exc:
             raise EntityNotFoundException(f"Pessoa Jurídica com ID {pessoa_juridica_id} não encontrada.") from exc
 
     @transaction.atomic
@@ -158,6 +184,111 @@ class PessoaJuridicaRepository(PessoaJuridicaContract):
         except Exception as exc:
             raise OperationFailedException(f"Erro ao listar todas as pessoas jurídicas: {str(exc)}") from exc
 
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[PessoaJuridicaDomain]:
+        """
+        Retorna uma página de pessoas jurídicas usando paginação por chave (keyset).
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Um dos campos de CAMPOS_ORDENACAO, prefixado com
+            '-' para ordem decrescente.
+
+        Returns:
+            Pagina[PessoaJuridicaDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            return paginar_por_chave(
+                PessoaJuridicaModel.objects.prefetch_related(
+                    'administradores', 'enderecos',
+                    'atividades_economicas', 'redes_sociais'
+                ),
+                self._model_to_domain,
+                after=after,
+                limit=limit,
+                order_by=order_by,
+                campos_ordenacao=CAMPOS_ORDENACAO
+            )
+        except InvalidInputException:
+            raise
+        except Exception as exc:
+            raise OperationFailedException(
+                f"Erro ao paginar as pessoas jurídicas: {str(exc)}"
+            ) from exc
+
+    @transaction.atomic
+    def importar_lote(self, registros: List[RegistroImportacaoCNPJ], iniciador_id: int) -> int:
+        """
+        Grava um lote de pessoas jurídicas importadas com um único
+        INSERT ... ON CONFLICT (cnpj) DO UPDATE, seguido da associação em
+        massa de administradores e atividades econômicas.
+
+        CNPJs já cadastrados têm razão social, nome fantasia e inscrição
+        estadual atualizados; associações existentes são preservadas.
+
+        Args:
+            registros (List[RegistroImportacaoCNPJ]): Linhas já validadas.
+            iniciador_id (int): Pessoa física iniciadora e administradora.
+
+        Returns:
+            int: Quantidade de pessoas jurídicas criadas ou atualizadas.
+        """
+        PessoaJuridicaModel.objects.bulk_create(
+            [
+                PessoaJuridicaModel(
+                    razao_social=registro.razao_social,
+                    nome_fantasia=registro.nome_fantasia,
+                    cnpj=registro.cnpj,
+                    inscricao_estadual=registro.inscricao_estadual,
+                    iniciador_id=iniciador_id,
+                )
+                for registro in registros
+            ],
+            update_conflicts=True,
+            unique_fields=['cnpj'],
+            update_fields=['razao_social', 'nome_fantasia', 'inscricao_estadual'],
+        )
+
+        ids_por_cnpj = dict(
+            PessoaJuridicaModel.objects.all_with_deleted()
+            .filter(cnpj__in=[registro.cnpj for registro in registros])
+            .values_list('cnpj', 'id')
+        )
+
+        administradores = PessoaJuridicaModel.administradores.through
+        administradores.objects.bulk_create(
+            [
+                administradores(
+                    pessoajuridicamodel_id=pessoa_juridica_id,
+                    pessoafisicamodel_id=iniciador_id,
+                )
+                for pessoa_juridica_id in ids_por_cnpj.values()
+            ],
+            ignore_conflicts=True,
+        )
+
+        atividades = PessoaJuridicaModel.atividades_economicas.through
+        atividades.objects.bulk_create(
+            [
+                atividades(
+                    pessoajuridicamodel_id=ids_por_cnpj[registro.cnpj],
+                    atividadeeconomicamodel_id=atividade_id,
+                )
+                for registro in registros
+                for atividade_id in registro.atividades_ids
+            ],
+            ignore_conflicts=True,
+        )
+
+        return len(registros)
+
     def ativar_pessoa_juridica(self, pessoa_juridica_id: int) -> dict:
         """
         Ativa a pessoa jurídica se as condições forem atendidas.
@@ -196,11 +327,14 @@ class PessoaJuridicaRepository(PessoaJuridicaContract):
 
         # Atualizar endereços usando o repositório de Endereços
         enderecos = self.endereco_repo.get_by_ids(pessoa_juridica.enderecos)
-        pessoa_juridica_model.enderecos.set(enderecos)
+        pessoa_juridica_model.enderecos.set(
+            [endereco.endereco_id for endereco in enderecos]
+        )
 
-        # Atualizar redes sociais usando o repositório de Redes Sociais
-        redes_sociais = self.rede_social_repo.get_by_ids(pessoa_juridica.redes_sociais)
-        pessoa_juridica_model.redes_sociais.set(redes_sociais)
+        # Atualizar redes sociais aplicando apenas a diferença em lote
+        self.redes_sociais_sincronizador.sincronizar(
+            pessoa_juridica_model, dict.fromkeys(pessoa_juridica.redes_sociais or [])
+        )
 
         pessoa_juridica_model.save()
 
@@ -220,10 +354,11 @@ class PessoaJuridicaRepository(PessoaJuridicaContract):
             nome_fantasia=pessoa_juridica_model.nome_fantasia,
             cnpj=pessoa_juridica_model.cnpj,
             inscricao_estadual=pessoa_juridica_model.inscricao_estadual,
-            administradores=list(pessoa_juridica_model.administradores.values_list('id', flat=True)),
-            iniciador_id=pessoa_juridica_model.iniciador_id.id,
-            enderecos=list(pessoa_juridica_model.enderecos.values_list('id', flat=True)),
-            atividades_economicas=list(pessoa_juridica_model.atividades_economicas.values_list('id', flat=True)),
+            # .all() reaproveita as relações pré-carregadas com prefetch_related
+            administradores=[adm.pk for adm in pessoa_juridica_model.administradores.all()],
+            iniciador_id=pessoa_juridica_model.iniciador_id,
+            enderecos=[endereco.id for endereco in pessoa_juridica_model.enderecos.all()],
+            atividades_economicas=[atividade.id for atividade in pessoa_juridica_model.atividades_economicas.all()],
             website=pessoa_juridica_model.website,
-            redes_sociais=list(pessoa_juridica_model.redes_sociais.values_list('id', flat=True))
+            redes_sociais=[rede.id for rede in pessoa_juridica_model.redes_sociais.all()]
         )
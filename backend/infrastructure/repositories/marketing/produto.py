@@ -8,11 +8,19 @@ from domain.shared.exceptions.entity_not_found_exception import (
                                             EntityNotFoundException)
 from domain.shared.exceptions.operation_failed_exception import (
                                             OperationFailedException)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.value_objects.pagina import Pagina
 from domain.marketing.entities.produto import ProdutoDomain
 from domain.marketing.repositories.produto import ProdutoContract
 from infrastructure.models.marketing.produto import ProdutoModel
 from infrastructure.repositories.marketing.produto_tipo import (
                                             TipoProdutoRepository)
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+
+
+# Campos aceitos como chave de ordenação na paginação por chave.
+CAMPOS_ORDENACAO = ('id', 'nome', 'created_at')
 
 
 class ProdutoRepository(ProdutoContract):
@@ -138,6 +146,42 @@ class ProdutoRepository(ProdutoContract):
         except Exception as e:
             raise OperationFailedException(f"Erro ao listar produtos: {str(e)}") from e
 
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[ProdutoDomain]:
+        """
+        Retorna uma página de produtos usando paginação por chave (keyset).
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Um dos campos de CAMPOS_ORDENACAO, prefixado com
+            '-' para ordem decrescente.
+
+        Returns:
+            Pagina[ProdutoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            return paginar_por_chave(
+                ProdutoModel.objects.all(),
+                self._model_to_domain,
+                after=after,
+                limit=limit,
+                order_by=order_by,
+                campos_ordenacao=CAMPOS_ORDENACAO
+            )
+        except InvalidInputException:
+            raise
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao paginar produtos: {str(e)}"
+            ) from e
+
     # Métodos auxiliares privados
 
     def _model_to_domain(self, produto_model: ProdutoModel) -> ProdutoDomain:
@@ -154,5 +198,5 @@ class ProdutoRepository(ProdutoContract):
             produto_id=produto_model.id,
             nome=produto_model.nome,
             descricao=produto_model.descricao,
-            tipo_produto_id=produto_model.tipo_produto.id
+            tipo_produto_id=produto_model.tipo_produto_id
         )
@@ -8,9 +8,21 @@ from domain.shared.exceptions.entity_not_found_exception import (
                                             EntityNotFoundException)
 from domain.shared.exceptions.operation_failed_exception import (
                                             OperationFailedException)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.value_objects.pagina import Pagina
 from domain.marketing.entities.produto_tipo import TipoProdutoDomain
 from domain.marketing.repositories.produto_tipo import TipoProdutoContract
 from infrastructure.models.marketing.produto_tipo import TipoProdutoModel
+from infrastructure.repositories.shared.cache_referencia import CacheReferencia
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+
+
+# Campos aceitos como chave de ordenação na paginação por chave.
+CAMPOS_ORDENACAO = ('id', 'nome')
+
+# Cache de leitura, invalidado a cada gravação de TipoProdutoModel.
+CACHE_TIPOS_PRODUTO = CacheReferencia('tipo_produto', TipoProdutoModel)
 
 
 class TipoProdutoRepository(TipoProdutoContract):
@@ -21,7 +33,6 @@ class TipoProdutoRepository(TipoProdutoContract):
     as operações de CRUD para a entidade de domínio TipoProduto.
     """
 
-    @transaction.atomic
     def get_by_id(self, tipo_produto_id: int) -> Optional[TipoProdutoDomain]:
         """
         Recupera um tipo de produto pelo ID.
@@ -37,8 +48,12 @@ class TipoProdutoRepository(TipoProdutoContract):
             OperationFailedException: Se ocorrer um erro inesperado.
         """
         try:
-            tipo_produto_model = TipoProdutoModel.objects.get(id=tipo_produto_id)
-            return self._model_to_domain(tipo_produto_model)
+            return CACHE_TIPOS_PRODUTO.obter(
+                tipo_produto_id,
+                lambda: self._model_to_domain(
+                    TipoProdutoModel.objects.get(id=tipo_produto_id)
+                )
+            )
         except TipoProdutoModel.DoesNotExist as e:
             raise EntityNotFoundException(
                 f"Tipo de produto com ID {tipo_produto_id} não encontrado."
@@ -116,6 +131,42 @@ class TipoProdutoRepository(TipoProdutoContract):
                 f"Erro ao listar os tipos de produtos: {str(e)}"
             ) from e
 
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[TipoProdutoDomain]:
+        """
+        Retorna uma página de tipos de produtos usando paginação por chave (keyset).
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Um dos campos de CAMPOS_ORDENACAO, prefixado com
+            '-' para ordem decrescente.
+
+        Returns:
+            Pagina[TipoProdutoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            return paginar_por_chave(
+                TipoProdutoModel.objects.all(),
+                self._model_to_domain,
+                after=after,
+                limit=limit,
+                order_by=order_by,
+                campos_ordenacao=CAMPOS_ORDENACAO
+            )
+        except InvalidInputException:
+            raise
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao paginar os tipos de produtos: {str(e)}"
+            ) from e
+
     def _model_to_domain(self, tipo_produto_model: TipoProdutoModel) -> TipoProdutoDomain:
         """
         Converte uma instância de TipoProdutoModel para TipoProdutoDomain.
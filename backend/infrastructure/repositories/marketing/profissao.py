@@ -15,9 +15,21 @@ from domain.shared.exceptions.entity_not_found_exception import (
                                             EntityNotFoundException)
 from domain.shared.exceptions.operation_failed_exception import (
                                             OperationFailedException)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.value_objects.pagina import Pagina
 from domain.marketing.entities.profissao import ProfissaoDomain
 from domain.marketing.repositories.profissao import ProfissaoContract
 from infrastructure.models.marketing.profissao import ProfissaoModel
+from infrastructure.repositories.shared.cache_referencia import CacheReferencia
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+
+
+# Campos aceitos como chave de ordenação na paginação por chave.
+CAMPOS_ORDENACAO = ('id', 'codigo', 'descricao')
+
+# Cache de leitura, invalidado a cada gravação de ProfissaoModel.
+CACHE_PROFISSOES = CacheReferencia('profissao', ProfissaoModel)
 
 
 class ProfissaoRepository(ProfissaoContract):
@@ -66,7 +78,6 @@ class ProfissaoRepository(ProfissaoContract):
         except Exception as exc:
             raise OperationFailedException(f"Erro ao salvar a profissão: {str(exc)}") from exc
 
-    @transaction.atomic
     def buscar_por_id(self, profissao_id: int) -> Optional[ProfissaoDomain]:
         """
         Busca uma instância de Profissao por seu ID no banco de dados.
@@ -82,17 +93,51 @@ class ProfissaoRepository(ProfissaoContract):
             OperationFailedException: Se ocorrer algum erro ao buscar a profissão.
         """
         try:
-            profissao_model = ProfissaoModel.objects.get(id=profissao_id)
-            return ProfissaoDomain(
-                profissao_id=profissao_model.id,
-                codigo=profissao_model.codigo,
-                descricao=profissao_model.descricao
+            return CACHE_PROFISSOES.obter(
+                profissao_id,
+                lambda: self._model_to_domain(ProfissaoModel.objects.get(id=profissao_id))
             )
         except ProfissaoModel.DoesNotExist as exc:
             raise EntityNotFoundException(f"Profissão com ID {profissao_id} não encontrada.") from exc
         except Exception as exc:
             raise OperationFailedException(f"Erro ao buscar a profissão: {str(exc)}") from exc
 
+    def listar_pagina(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[ProfissaoDomain]:
+        """
+        Retorna uma página de profissões usando paginação por chave (keyset).
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Um dos campos de CAMPOS_ORDENACAO, prefixado com
+            '-' para ordem decrescente.
+
+        Returns:
+            Pagina[ProfissaoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            return paginar_por_chave(
+                ProfissaoModel.objects.all(),
+                self._model_to_domain,
+                after=after,
+                limit=limit,
+                order_by=order_by,
+                campos_ordenacao=CAMPOS_ORDENACAO
+            )
+        except InvalidInputException:
+            raise
+        except Exception as exc:
+            raise OperationFailedException(
+                f"Erro ao paginar as profissões: {str(exc)}"
+            ) from exc
+
     def listar_todas(self) -> List[ProfissaoDomain]:
         """
         Lista todas as instâncias de Profissao no banco de dados.
@@ -114,3 +159,19 @@ class ProfissaoRepository(ProfissaoContract):
             ]
         except Exception as exc:
             raise OperationFailedException(f"Erro ao listar as profissões: {str(exc)}") from exc
+
+    def _model_to_domain(self, profissao_model: ProfissaoModel) -> ProfissaoDomain:
+        """
+        Converte uma instância de ProfissaoModel para ProfissaoDomain.
+
+        Args:
+            profissao_model (ProfissaoModel): A instância da model de banco de dados.
+
+        Returns:
+            ProfissaoDomain: A entidade de domínio convertida.
+        """
+        return ProfissaoDomain(
+            profissao_id=profissao_model.id,
+            codigo=profissao_model.codigo,
+            descricao=profissao_model.descricao
+        )
@@ -15,9 +15,21 @@ from domain.shared.exceptions.entity_not_found_exception import (
                                             EntityNotFoundException)
 from domain.shared.exceptions.operation_failed_exception import (
                                             OperationFailedException)
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.value_objects.pagina import Pagina
 from domain.marketing.entities.usuario_tipo import UsuarioTipoDomain
 from domain.marketing.repositories.usuario_tipo import UsuarioTipoContract
 from infrastructure.models.marketing.usuario_tipo import UsuarioTipoModel
+from infrastructure.repositories.shared.cache_referencia import CacheReferencia
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+
+
+# Campos aceitos como chave de ordenação na paginação por chave.
+CAMPOS_ORDENACAO = ('id', 'nome')
+
+# Cache de leitura, invalidado a cada gravação de UsuarioTipoModel.
+CACHE_TIPOS_USUARIO = CacheReferencia('usuario_tipo', UsuarioTipoModel)
 
 
 class UsuarioTipoRepository(UsuarioTipoContract):
@@ -62,17 +74,53 @@ class UsuarioTipoRepository(UsuarioTipoContract):
             Optional[UsuarioTipoDomain]: A instância de UsuarioTipo, ou None se não encontrada.
         """
         try:
-            usuario_tipo_model = UsuarioTipoModel.objects.get(id=usuario_tipo_id)
-            return UsuarioTipoDomain(
-                usuario_tipo_id=usuario_tipo_model.id,
-                nome=usuario_tipo_model.nome,
-                descricao=usuario_tipo_model.descricao
+            return CACHE_TIPOS_USUARIO.obter(
+                usuario_tipo_id,
+                lambda: self._model_to_domain(
+                    UsuarioTipoModel.objects.get(id=usuario_tipo_id)
+                )
             )
         except UsuarioTipoModel.DoesNotExist as exc:
             raise EntityNotFoundException(f"Tipo de usuário com ID {usuario_tipo_id} não encontrado.") from exc
         except Exception as exc:
             raise OperationFailedException(f"Erro ao buscar o tipo de usuário: {str(exc)}") from exc
 
+    def listar_pagina(
+        self, after: Optional[str] = None, limit: int = 50, order_by: str = 'id'
+    ) -> Pagina[UsuarioTipoDomain]:
+        """
+        Retorna uma página de tipos de usuário usando paginação por chave (keyset).
+
+        Args:
+            after (Optional[str]): Cursor retornado pela página anterior.
+            limit (int): Quantidade máxima de itens da página.
+            order_by (str): Um dos campos de CAMPOS_ORDENACAO, prefixado com
+            '-' para ordem decrescente.
+
+        Returns:
+            Pagina[UsuarioTipoDomain]: Itens da página e o cursor da próxima.
+
+        Raises:
+            InvalidInputException: Se o cursor, o limite ou a ordenação forem
+            inválidos.
+            OperationFailedException: Se ocorrer um erro inesperado.
+        """
+        try:
+            return paginar_por_chave(
+                UsuarioTipoModel.objects.all(),
+                self._model_to_domain,
+                after=after,
+                limit=limit,
+                order_by=order_by,
+                campos_ordenacao=CAMPOS_ORDENACAO
+            )
+        except InvalidInputException:
+            raise
+        except Exception as exc:
+            raise OperationFailedException(
+                f"Erro ao paginar os tipos de usuário: {str(exc)}"
+            ) from exc
+
     def listar_todos(self) -> List[UsuarioTipoDomain]:
         """
         Lista todas as instâncias de UsuarioTipo no banco de dados.
@@ -91,3 +139,19 @@ class UsuarioTipoRepository(UsuarioTipoContract):
             ]
         except Exception as exc:
             raise OperationFailedException(f"Erro ao listar os tipos de usuário: {str(exc)}") from exc
+
+    def _model_to_domain(self, usuario_tipo_model: UsuarioTipoModel) -> UsuarioTipoDomain:
+        """
+        Converte uma instância de UsuarioTipoModel para UsuarioTipoDomain.
+
+        Args:
+            usuario_tipo_model (UsuarioTipoModel): A instância da model de banco de dados.
+
+        Returns:
+            UsuarioTipoDomain: A entidade de domínio convertida.
+        """
+        return UsuarioTipoDomain(
+            usuario_tipo_id=usuario_tipo_model.id,
+            nome=usuario_tipo_model.nome,
+            descricao=usuario_tipo_model.descricao
+        )
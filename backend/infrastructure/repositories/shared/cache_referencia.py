@@ -0,0 +1,180 @@
+"""
+Módulo responsável pelo cache de leitura (read-through) das tabelas de
+referência, como atividades econômicas, profissões, redes sociais, tipos de
+produto e tipos de usuário.
+
+O cache tem duas camadas:
+
+    - um LRU em memória, por processo, consultado primeiro e sem custo de
+    rede; suas entradas expiram após `ttl_local` segundos para que os demais
+    processos percebam as invalidações;
+    - o framework de cache do Django (`django.core.cache`), compartilhado
+    entre os processos (Redis, veja CACHES em settings).
+
+As chaves do cache do Django são versionadas por tabela
+(`referencia:<tabela>:v<versao>:<chave>`). Invalidar uma tabela apenas
+incrementa a versão, tornando inacessíveis todas as chaves anteriores sem
+precisar enumerá-las. A invalidação é disparada pelos sinais `post_save` e
+`post_delete` da model, cobrindo as gravações feitas pelos repositórios, pelo
+admin e por `update_or_create`.
+
+A invalidação só alcança os demais processos por meio de um cache
+compartilhado. Com um backend local ao processo (LocMemCache ou DummyCache), a
+segunda camada não é usada e as gravações feitas em outros processos são
+percebidas quando as entradas do LRU expiram.
+
+Cada chamada recebe uma cópia do valor cacheado, que pode ser alterada sem
+afetar as demais.
+
+Classes:
+    CacheReferencia: Cache de leitura de uma tabela de referência.
+"""
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Union
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+
+logger = logging.getLogger('ocorrencias')
+
+PREFIXO_CHAVE = 'referencia'
+
+
+def cache_compartilhado() -> bool:
+    """Indica se o cache padrão do Django é compartilhado entre os processos."""
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+
+class CacheReferencia:
+    """
+    Cache de leitura de uma tabela de referência.
+
+    Atributos:
+        tabela (str): Nome do espaço de chaves da tabela.
+        tamanho_maximo (int): Quantidade máxima de entradas no LRU local.
+        ttl_local (float): Validade, em segundos, das entradas do LRU local.
+        timeout (int): Validade, em segundos, das entradas no cache do Django.
+    """
+
+    def __init__(
+        self,
+        tabela: str,
+        model: type[models.Model],
+        tamanho_maximo: int = 1024,
+        ttl_local: float = 30.0,
+        timeout: int = 3600
+    ):
+        """
+        Inicializa o cache e conecta a invalidação aos sinais da model.
+
+        Args:
+            tabela (str): Nome do espaço de chaves da tabela.
+            model (type[models.Model]): Model cujas gravações invalidam o cache.
+            tamanho_maximo (int): Quantidade máxima de entradas no LRU local.
+            ttl_local (float): Validade das entradas do LRU local.
+            timeout (int): Validade das entradas no cache do Django.
+        """
+        self.tabela = tabela
+        self.tamanho_maximo = tamanho_maximo
+        self.ttl_local = ttl_local
+        self.timeout = timeout
+        self._local: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        for sinal in (post_save, post_delete):
+            sinal.connect(
+                self._ao_gravar,
+                sender=model,
+                weak=False,
+                dispatch_uid=f'{PREFIXO_CHAVE}:{tabela}:{sinal is post_save}',
+            )
+
+    def obter(self, chave: Union[int, str], carregar: Callable[[], Any]) -> Any:
+        """
+        Retorna o valor da chave, carregando-o com `carregar` em caso de falta.
+
+        Valores None e exceções levantadas por `carregar` não são cacheados.
+        O valor devolvido é uma cópia, que pode ser alterada livremente.
+
+        Args:
+            chave (Union[int, str]): Chave do valor dentro da tabela.
+            carregar (Callable[[], Any]): Função que busca o valor no banco.
+
+        Returns:
+            Any: O valor cacheado ou recém-carregado.
+        """
+        agora = time.monotonic()
+        with self._lock:
+            entrada = self._local.get(chave)
+            if entrada is not None and entrada[0] > agora:
+                self._local.move_to_end(chave)
+                return copy.deepcopy(entrada[1])
+
+        if self._compartilhado():
+            chave_compartilhada = f'{self._prefixo_versionado()}:{chave}'
+            valor = cache.get(chave_compartilhada)
+            if valor is None:
+                valor = carregar()
+                if valor is None:
+                    return None
+                cache.set(chave_compartilhada, valor, self.timeout)
+        else:
+            valor = carregar()
+            if valor is None:
+                return None
+
+        with self._lock:
+            self._local[chave] = (agora + self.ttl_local, valor)
+            self._local.move_to_end(chave)
+            while len(self._local) > self.tamanho_maximo:
+                self._local.popitem(last=False)
+        return copy.deepcopy(valor)
+
+    def invalidar(self) -> None:
+        """
+        Invalida todas as entradas da tabela, no processo atual e no cache
+        compartilhado.
+        """
+        with self._lock:
+            self._local.clear()
+        if not self._compartilhado():
+            return
+        chave_versao = self._chave_versao()
+        try:
+            cache.incr(chave_versao)
+        except ValueError:
+            # Versão ausente (expirada ou cache reiniciado)
+            cache.set(chave_versao, int(time.time()), None)
+
+    def _ao_gravar(self, **kwargs) -> None:
+        # Invalida já, para a própria transação, e após o commit, para que
+        # leituras concorrentes não recoloquem no cache o valor antigo.
+        self.invalidar()
+        transaction.on_commit(self.invalidar, using=kwargs.get('using'))
+
+    def _compartilhado(self) -> bool:
+        compartilhado = cache_compartilhado()
+        if not compartilhado and not getattr(self, '_avisado', False):
+            self._avisado = True
+            logger.warning(
+                "Cache '%s' sem backend compartilhado: usando apenas o LRU local, "
+                "com validade de %s segundos.", self.tabela, self.ttl_local
+            )
+        return compartilhado
+
+    def _chave_versao(self) -> str:
+        return f'{PREFIXO_CHAVE}:{self.tabela}:versao'
+
+    def _prefixo_versionado(self) -> str:
+        chave_versao = self._chave_versao()
+        versao = cache.get(chave_versao)
+        if versao is None:
+            cache.add(chave_versao, int(time.time()), None)
+            versao = cache.get(chave_versao)
+        return f'{PREFIXO_CHAVE}:{self.tabela}:v{versao}'
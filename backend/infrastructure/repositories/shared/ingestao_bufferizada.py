@@ -0,0 +1,457 @@
+"""
+Módulo responsável pela ingestão bufferizada de eventos de alto volume.
+
+Em vez de gravar cada evento no banco durante a requisição, o
+IngestorBufferizado:
+
+    1. acrescenta o evento, em JSON, ao segmento ativo de um spool local
+    (arquivo somente de acréscimo) e o coloca em um buffer em memória — é
+    apenas isso que a requisição paga;
+    2. em uma thread em segundo plano, quando o buffer atinge `tamanho_lote`
+    eventos ou a cada `intervalo` segundos, fecha o segmento ativo
+    (renomeando-o para `.pronto`) e grava o lote com uma única chamada a
+    `gravar_lote`;
+    3. apaga o segmento somente após a gravação bem-sucedida. Se o lote
+    falhar, ele é dividido ao meio e cada metade é gravada separadamente,
+    até isolar os eventos com erro (ex.: um post apagado entre a validação e
+    a gravação); somente esses permanecem no segmento. Segmentos com eventos
+    não gravados são tentados novamente nos ciclos seguintes, com espera
+    crescente entre as tentativas; após `max_tentativas` falhas, o segmento é
+    renomeado para `.morto` (fila de mensagens mortas) e não é mais tentado.
+    Falhas de conexão com o banco não dividem o lote: o segmento inteiro é
+    tentado novamente.
+
+Os segmentos são nomeados `<nome>-<pid>-<id>[-<falhas>].<extensão>` e
+pertencem ao processo do PID: somente ele os grava. Se o processo terminar
+abruptamente, os eventos ainda não gravados permanecem nos segmentos do spool
+e são regravados por `reprocessar_spool` (veja o comando
+`reprocessar_spool_visualizacoes`), que só considera segmentos de processos
+encerrados e toma posse de cada um renomeando-o, de forma atômica, para o seu
+próprio PID — dois reprocessamentos concorrentes nunca gravam o mesmo
+segmento. O spool deve ser local ao host, pois a verificação de PIDs não vale
+entre hosts.
+
+A entrega é "pelo menos uma vez": um lote pode ser regravado se o processo
+cair entre a gravação e a remoção do segmento.
+
+Contrapressão: o buffer em memória comporta no máximo `capacidade` eventos.
+Quando cheio, `enfileirar` espera até `espera_maxima` segundos por espaço e,
+se não houver, descarta o evento, contabilizando-o em `descartados`.
+
+Classes:
+    IngestorBufferizado: Buffer com spool e gravação em lote.
+
+Funções:
+    reprocessar_spool: Regrava os segmentos abandonados de um spool.
+"""
+import atexit
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import InterfaceError, OperationalError, close_old_connections
+
+logger = logging.getLogger('ocorrencias')
+
+EXTENSAO_ATIVO = '.jsonl'
+EXTENSAO_PRONTO = '.pronto'
+EXTENSAO_MORTO = '.morto'
+
+# Espera máxima, em segundos, entre as novas tentativas de um segmento.
+ESPERA_MAXIMA_NOVA_TENTATIVA = 300.0
+
+Evento = Dict[str, object]
+GravadorLote = Callable[[List[Evento]], None]
+
+
+class IngestorBufferizado:
+    """
+    Buffer de eventos com spool local e gravação em lote em segundo plano.
+
+    Atributos:
+        nome (str): Nome do fluxo, usado no nome dos arquivos de spool.
+        diretorio_spool (str): Diretório dos segmentos do spool.
+        tamanho_lote (int): Quantidade de eventos que dispara a gravação.
+        intervalo (float): Tempo máximo, em segundos, entre gravações.
+        capacidade (int): Quantidade máxima de eventos no buffer em memória.
+        espera_maxima (float): Espera máxima por espaço no buffer, em segundos.
+        max_tentativas (int): Falhas de gravação após as quais o segmento é
+        movido para a fila de mensagens mortas.
+        descartados (int): Eventos descartados por falta de espaço.
+    """
+
+    def __init__(
+        self,
+        nome: str,
+        gravar_lote: GravadorLote,
+        diretorio_spool: str,
+        tamanho_lote: int = 500,
+        intervalo: float = 2.0,
+        capacidade: int = 50000,
+        espera_maxima: float = 0.05,
+        max_tentativas: int = 10
+    ):
+        self.nome = nome
+        self.gravar_lote = gravar_lote
+        self.diretorio_spool = diretorio_spool
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self.capacidade = capacidade
+        self.espera_maxima = espera_maxima
+        self.max_tentativas = max_tentativas
+        self.descartados = 0
+
+        self._buffer: List[Evento] = []
+        self._segmento = None
+        self._caminho_segmento: Optional[str] = None
+        lock = threading.Lock()
+        self._condicao = threading.Condition(lock)
+        self._espaco = threading.Condition(lock)
+        self._gravacao = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._encerrando = False
+
+    def enfileirar(self, evento: Evento) -> bool:
+        """
+        Registra um evento para gravação posterior.
+
+        Args:
+            evento (Evento): Dicionário serializável em JSON.
+
+        Returns:
+            bool: False se o evento foi descartado por contrapressão.
+        """
+        linha = json.dumps(evento, cls=DjangoJSONEncoder) + '\n'
+        with self._condicao:
+            self._garantir_thread()
+            if len(self._buffer) >= self.capacidade:
+                self._espaco.wait_for(
+                    lambda: len(self._buffer) < self.capacidade, self.espera_maxima
+                )
+                if len(self._buffer) >= self.capacidade:
+                    self.descartados += 1
+                    if self.descartados % 1000 == 1:
+                        logger.warning(
+                            "Ingestão '%s' saturada: %s eventos descartados.",
+                            self.nome, self.descartados
+                        )
+                    return False
+            self._segmento_ativo().write(linha)
+            self._buffer.append(evento)
+            if len(self._buffer) >= self.tamanho_lote:
+                self._condicao.notify_all()
+        return True
+
+    def descarregar(self) -> None:
+        """Grava imediatamente os eventos pendentes (usado no encerramento)."""
+        with self._gravacao:
+            lote, caminho = self._rotacionar()
+            if lote:
+                self._gravar_segmento(lote, caminho)
+            self._regravar_pendentes()
+
+    # Thread de gravação
+
+    def _garantir_thread(self) -> None:
+        # Recria a thread após um fork (ex.: workers do gunicorn com preload)
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        os.makedirs(self.diretorio_spool, exist_ok=True)
+        self._buffer = []
+        self._segmento = None
+        self._pid = os.getpid()
+        self._thread = threading.Thread(
+            target=self._executar, name=f'ingestao-{self.nome}', daemon=True
+        )
+        self._thread.start()
+        atexit.register(self._encerrar)
+
+    def _executar(self) -> None:
+        while not self._encerrando:
+            with self._condicao:
+                self._condicao.wait_for(
+                    lambda: len(self._buffer) >= self.tamanho_lote or self._encerrando,
+                    self.intervalo
+                )
+            try:
+                self.descarregar()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Falha na ingestão '%s'.", self.nome)
+            finally:
+                close_old_connections()
+
+    def _encerrar(self) -> None:
+        self._encerrando = True
+        with self._condicao:
+            self._condicao.notify_all()
+        try:
+            self.descarregar()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Eventos da ingestão '%s' mantidos no spool.", self.nome)
+
+    # Spool
+
+    def _segmento_ativo(self):
+        if self._segmento is None:
+            self._caminho_segmento = os.path.join(
+                self.diretorio_spool,
+                _nome_segmento(self.nome, os.getpid(), uuid.uuid4().hex, 0, EXTENSAO_ATIVO)
+            )
+            # buffering=1: cada linha chega ao sistema operacional no enqueue
+            self._segmento = open(  # pylint: disable=consider-using-with
+                self._caminho_segmento, 'a', buffering=1, encoding='utf-8'
+            )
+        return self._segmento
+
+    def _rotacionar(self):
+        """Fecha o segmento ativo e retorna o lote correspondente."""
+        with self._condicao:
+            if not self._buffer:
+                return [], None
+            lote, self._buffer = self._buffer, []
+            self._segmento.close()
+            pronto = self._caminho_segmento[:-len(EXTENSAO_ATIVO)] + EXTENSAO_PRONTO
+            os.replace(self._caminho_segmento, pronto)
+            self._segmento = None
+            self._espaco.notify_all()
+        return lote, pronto
+
+    def _gravar_segmento(self, lote: List[Evento], caminho: str) -> None:
+        rejeitados, erro = _gravar_isolando(self.gravar_lote, lote)
+        if not rejeitados:
+            os.remove(caminho)
+            return
+        logger.error(
+            "Falha ao gravar %s de %s eventos de '%s' (segmento %s).",
+            len(rejeitados), len(lote), self.nome, os.path.basename(caminho),
+            exc_info=erro
+        )
+        _registrar_falha(self.nome, caminho, self.max_tentativas, rejeitados, len(lote))
+
+    def _regravar_pendentes(self) -> None:
+        """
+        Tenta novamente os segmentos prontos deste processo que falharam,
+        esperando entre as tentativas de cada segmento o dobro da espera
+        anterior (a partir de `intervalo`).
+        """
+        agora = time.time()
+        for arquivo in sorted(os.listdir(self.diretorio_spool)):
+            segmento = _segmento(self.nome, arquivo)
+            if segmento is None or segmento[0] != os.getpid() or segmento[3] != EXTENSAO_PRONTO:
+                continue
+            caminho = os.path.join(self.diretorio_spool, arquivo)
+            falhas = segmento[2]
+            espera = min(self.intervalo * 2 ** (falhas - 1), ESPERA_MAXIMA_NOVA_TENTATIVA)
+            if falhas and agora - os.path.getmtime(caminho) < espera:
+                continue
+            self._gravar_segmento(_ler_segmento(caminho), caminho)
+
+
+def _nome_segmento(nome: str, pid: int, identificador: str, falhas: int, extensao: str) -> str:
+    sufixo = f'-{falhas}' if falhas else ''
+    return f'{nome}-{pid}-{identificador}{sufixo}{extensao}'
+
+
+def _segmento(nome: str, arquivo: str) -> Optional[Tuple[int, str, int, str]]:
+    """Retorna (pid, identificador, falhas, extensão) de um segmento de `nome`."""
+    encontrado = re.fullmatch(
+        rf'{re.escape(nome)}-(\d+)-([0-9a-f]+)(?:-(\d+))?'
+        rf'({re.escape(EXTENSAO_ATIVO)}|{re.escape(EXTENSAO_PRONTO)}|{re.escape(EXTENSAO_MORTO)})',
+        arquivo
+    )
+    if encontrado is None:
+        return None
+    pid, identificador, falhas, extensao = encontrado.groups()
+    return int(pid), identificador, int(falhas or 0), extensao
+
+
+def _falha_transitoria(erro: BaseException) -> bool:
+    """Indica se o erro (ou sua causa) é uma falha de conexão com o banco."""
+    while erro is not None:
+        if isinstance(erro, (OperationalError, InterfaceError)):
+            return True
+        erro = erro.__cause__ or erro.__context__
+    return False
+
+
+def _gravar_isolando(
+    gravar_lote: GravadorLote, eventos: List[Evento]
+) -> Tuple[List[Evento], Optional[Exception]]:
+    """
+    Grava `eventos` com `gravar_lote`, dividindo ao meio os lotes que falharem
+    até isolar os eventos com erro. Cada chamada a `gravar_lote` é uma
+    transação própria, de modo que os demais eventos são efetivados.
+
+    Returns:
+        Tuple[List[Evento], Optional[Exception]]: Eventos não gravados e o
+        último erro de gravação.
+    """
+    try:
+        gravar_lote(eventos)
+        return [], None
+    except Exception as erro:  # pylint: disable=broad-except
+        if len(eventos) == 1 or _falha_transitoria(erro):
+            return list(eventos), erro
+    meio = len(eventos) // 2
+    rejeitados, erro = _gravar_isolando(gravar_lote, eventos[:meio])
+    rejeitados_fim, erro_fim = _gravar_isolando(gravar_lote, eventos[meio:])
+    return rejeitados + rejeitados_fim, erro_fim or erro
+
+
+def _registrar_falha(
+    nome: str,
+    caminho: str,
+    max_tentativas: int,
+    rejeitados: Optional[List[Evento]] = None,
+    total: int = 0
+) -> None:
+    """
+    Conta uma falha de gravação no nome do segmento (que volta a ter a data
+    de modificação atual, base da espera até a próxima tentativa) ou, na
+    última tentativa, move-o para a fila de mensagens mortas. Se parte dos
+    `total` eventos do segmento foi gravada, ele é reescrito somente com os
+    `rejeitados`.
+    """
+    if rejeitados is not None and len(rejeitados) < total:
+        _reescrever_segmento(caminho, rejeitados)
+    diretorio, arquivo = os.path.split(caminho)
+    pid, identificador, falhas, _ = _segmento(nome, arquivo)
+    falhas += 1
+    if falhas >= max_tentativas:
+        destino = os.path.join(
+            diretorio, _nome_segmento(nome, pid, identificador, falhas, EXTENSAO_MORTO)
+        )
+        os.replace(caminho, destino)
+        logger.error(
+            "Segmento %s de '%s' movido para %s após %s falhas.",
+            arquivo, nome, os.path.basename(destino), falhas
+        )
+        return
+    destino = os.path.join(
+        diretorio, _nome_segmento(nome, pid, identificador, falhas, EXTENSAO_PRONTO)
+    )
+    os.replace(caminho, destino)
+    os.utime(destino)
+
+
+def _reescrever_segmento(caminho: str, eventos: List[Evento]) -> None:
+    """Substitui, de forma atômica, o conteúdo do segmento por `eventos`."""
+    temporario = caminho + '.tmp'
+    with open(temporario, 'w', encoding='utf-8') as arquivo:
+        for evento in eventos:
+            arquivo.write(json.dumps(evento, cls=DjangoJSONEncoder) + '\n')
+    os.replace(temporario, caminho)
+
+
+def _processo_ativo(pid: int) -> bool:
+    """Indica se o processo do PID (neste host) ainda está em execução."""
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # O processo existe, mas pertence a outro usuário
+        return True
+    return True
+
+
+def _ler_segmento(caminho: str) -> List[Evento]:
+    eventos = []
+    with open(caminho, encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            try:
+                eventos.append(json.loads(linha))
+            except ValueError:
+                # Última linha truncada por uma queda durante a escrita
+                logger.warning("Linha inválida ignorada no spool %s.", caminho)
+    return eventos
+
+
+def reprocessar_spool(
+    nome: str,
+    gravar_lote: GravadorLote,
+    diretorio_spool: str,
+    idade_minima: float = 300.0,
+    tamanho_lote: int = 500,
+    max_tentativas: int = 10,
+    incluir_mortos: bool = False
+) -> int:
+    """
+    Regrava os segmentos abandonados do spool de `nome`, isto é, segmentos
+    de processos encerrados e não modificados há pelo menos `idade_minima`
+    segundos.
+
+    Cada segmento é tomado renomeando-o para o PID deste processo (um
+    reprocessamento concorrente que o tome antes faz a renomeação falhar) e
+    gravado em chamadas de até `tamanho_lote` eventos, isolando os eventos
+    com erro como na gravação em segundo plano: somente eles permanecem no
+    segmento, que é tentado novamente na próxima execução. Após
+    `max_tentativas` falhas, o segmento vai para a fila de mensagens mortas.
+
+    Args:
+        nome (str): Nome do fluxo de ingestão.
+        gravar_lote (GravadorLote): Função que grava um lote de eventos.
+        diretorio_spool (str): Diretório dos segmentos.
+        idade_minima (float): Idade mínima dos segmentos, em segundos; deve
+        ser bem maior que o intervalo de gravação dos processos ativos.
+        tamanho_lote (int): Quantidade de eventos por chamada a `gravar_lote`.
+        max_tentativas (int): Falhas após as quais o segmento é movido para
+        a fila de mensagens mortas.
+        incluir_mortos (bool): Também regrava os segmentos da fila de
+        mensagens mortas (ex.: após corrigir a causa das falhas), com a
+        contagem de falhas zerada.
+
+    Returns:
+        int: Quantidade de eventos regravados.
+    """
+    if not os.path.isdir(diretorio_spool):
+        return 0
+    limite = time.time() - idade_minima
+    regravados = 0
+    for arquivo in sorted(os.listdir(diretorio_spool)):
+        segmento = _segmento(nome, arquivo)
+        if segmento is None:
+            continue
+        pid, identificador, falhas, extensao = segmento
+        if extensao == EXTENSAO_MORTO:
+            if not incluir_mortos:
+                continue
+            falhas = 0
+        caminho = os.path.join(diretorio_spool, arquivo)
+        try:
+            if _processo_ativo(pid) or os.path.getmtime(caminho) > limite:
+                continue
+            proprio = os.path.join(
+                diretorio_spool,
+                _nome_segmento(nome, os.getpid(), identificador, falhas, EXTENSAO_PRONTO)
+            )
+            os.replace(caminho, proprio)
+        except FileNotFoundError:
+            # Tomado por outro reprocessamento
+            continue
+        eventos = _ler_segmento(proprio)
+        rejeitados, erro = [], None
+        for inicio in range(0, len(eventos), tamanho_lote):
+            rejeitados_lote, erro_lote = _gravar_isolando(
+                gravar_lote, eventos[inicio:inicio + tamanho_lote]
+            )
+            rejeitados += rejeitados_lote
+            erro = erro_lote or erro
+        regravados += len(eventos) - len(rejeitados)
+        if not rejeitados:
+            os.remove(proprio)
+            continue
+        logger.error(
+            "Falha ao regravar %s de %s eventos de '%s' (segmento %s).",
+            len(rejeitados), len(eventos), nome, arquivo, exc_info=erro
+        )
+        _registrar_falha(nome, proprio, max_tentativas, rejeitados, len(eventos))
+    return regravados
@@ -0,0 +1,270 @@
+"""
+Módulo responsável pela instrumentação dos métodos dos repositórios.
+
+Quando `INSTRUMENTAR_REPOSITORIOS` está ativo, os métodos públicos de todos os
+repositórios concretos de `infrastructure.repositories` são envolvidos em
+`instrumentar_repositorios` (chamada em `InfrastructureConfig.ready`) e cada
+chamada registra:
+
+    - quantidade de chamadas;
+    - quantidade de consultas SQL executadas (inclusive as dos repositórios
+    chamados internamente);
+    - linhas devolvidas (tamanho da lista, página ou dicionário retornado, ou 1
+    para uma única entidade);
+    - tempo total e tempo gasto no banco de dados.
+
+Os totais são acumulados em `REGISTRO`, agregado por processo, e na coleta da
+requisição atual, exposta pelo InstrumentacaoRepositoriosMiddleware. Com a
+instrumentação desativada nenhum método é envolvido e o custo é nulo.
+
+Classes:
+    EstatisticaMetodo: Totais de um método (ou de uma requisição).
+    RegistroInstrumentacao: Agregado, por processo, das estatísticas.
+    ColetaRequisicao: Estatísticas das chamadas de uma requisição.
+
+Funções:
+    instrumentar_repositorios: Instrumenta os repositórios concretos.
+    instrumentar_classe: Instrumenta os métodos públicos de uma classe.
+    iniciar_coleta / encerrar_coleta: Delimitam a coleta de uma requisição.
+"""
+import functools
+import importlib
+import inspect
+import logging
+import pkgutil
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from django.db import connection
+from domain.shared.value_objects.pagina import Pagina
+
+logger = logging.getLogger('ocorrencias')
+
+PACOTE_REPOSITORIOS = 'infrastructure.repositories'
+SUFIXO_REPOSITORIO = 'Repository'
+
+
+@dataclass
+class EstatisticaMetodo:
+    """
+    Totais acumulados de chamadas.
+
+    Atributos:
+        chamadas (int): Quantidade de chamadas.
+        consultas (int): Consultas SQL executadas.
+        linhas (int): Linhas devolvidas.
+        tempo_total (float): Tempo total, em segundos.
+        tempo_db (float): Tempo gasto no banco de dados, em segundos.
+    """
+    chamadas: int = 0
+    consultas: int = 0
+    linhas: int = 0
+    tempo_total: float = 0.0
+    tempo_db: float = 0.0
+
+    def acumular(self, consultas: int, linhas: int, tempo_total: float, tempo_db: float) -> None:
+        """Soma uma chamada aos totais."""
+        self.chamadas += 1
+        self.consultas += consultas
+        self.linhas += linhas
+        self.tempo_total += tempo_total
+        self.tempo_db += tempo_db
+
+    def como_dict(self) -> Dict[str, float]:
+        """Retorna os totais com os tempos em milissegundos."""
+        return {
+            'chamadas': self.chamadas,
+            'consultas': self.consultas,
+            'linhas': self.linhas,
+            'tempo_ms': round(self.tempo_total * 1000, 2),
+            'tempo_db_ms': round(self.tempo_db * 1000, 2),
+        }
+
+
+class RegistroInstrumentacao:
+    """
+    Agregado, por processo, das estatísticas de cada método instrumentado,
+    identificado por 'Classe.metodo'.
+    """
+
+    def __init__(self):
+        self._estatisticas: Dict[str, EstatisticaMetodo] = {}
+        self._lock = threading.Lock()
+
+    def registrar(
+        self, metodo: str, consultas: int, linhas: int, tempo_total: float, tempo_db: float
+    ) -> None:
+        """Soma uma chamada de `metodo` ao agregado."""
+        with self._lock:
+            estatistica = self._estatisticas.setdefault(metodo, EstatisticaMetodo())
+            estatistica.acumular(consultas, linhas, tempo_total, tempo_db)
+
+    def resumo(self, ordenar_por: str = 'tempo_total') -> List[Dict[str, float]]:
+        """
+        Retorna as estatísticas de cada método, da mais custosa para a menos.
+
+        Args:
+            ordenar_por (str): Atributo de EstatisticaMetodo usado na ordenação.
+        """
+        with self._lock:
+            itens = sorted(
+                self._estatisticas.items(),
+                key=lambda item: getattr(item[1], ordenar_por),
+                reverse=True,
+            )
+            return [{'metodo': metodo, **estatistica.como_dict()} for metodo, estatistica in itens]
+
+    def limpar(self) -> None:
+        """Zera o agregado."""
+        with self._lock:
+            self._estatisticas.clear()
+
+
+REGISTRO = RegistroInstrumentacao()
+
+
+@dataclass
+class ColetaRequisicao:
+    """
+    Estatísticas das chamadas de repositório de uma requisição.
+
+    Atributos:
+        total (EstatisticaMetodo): Totais das chamadas de nível mais externo,
+        sem contar duas vezes as chamadas feitas entre repositórios.
+        por_metodo (Dict[str, EstatisticaMetodo]): Totais por método.
+    """
+    total: EstatisticaMetodo = field(default_factory=EstatisticaMetodo)
+    por_metodo: Dict[str, EstatisticaMetodo] = field(default_factory=dict)
+    profundidade: int = 0
+
+
+_coleta_atual: ContextVar[Optional[ColetaRequisicao]] = ContextVar(
+    'coleta_repositorios', default=None
+)
+
+
+def iniciar_coleta():
+    """
+    Inicia a coleta das chamadas de repositório do contexto atual.
+
+    Returns:
+        Token: Token a ser passado para `encerrar_coleta`.
+    """
+    return _coleta_atual.set(ColetaRequisicao())
+
+
+def encerrar_coleta(token) -> ColetaRequisicao:
+    """Encerra a coleta iniciada com `token` e retorna suas estatísticas."""
+    coleta = _coleta_atual.get()
+    _coleta_atual.reset(token)
+    return coleta
+
+
+class _MedidorConsultas:
+    """execute_wrapper que conta as consultas e mede o tempo no banco."""
+
+    __slots__ = ('consultas', 'tempo')
+
+    def __init__(self):
+        self.consultas = 0
+        self.tempo = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.tempo += time.perf_counter() - inicio
+            self.consultas += 1
+
+
+def _contar_linhas(resultado) -> int:
+    if resultado is None or isinstance(resultado, (str, bytes, bool, int, float)):
+        return 0
+    if isinstance(resultado, Pagina):
+        return len(resultado.itens)
+    if isinstance(resultado, (list, tuple, set, frozenset, dict)):
+        return len(resultado)
+    # QuerySets só são contados se já avaliados, para não disparar consultas
+    cache = getattr(resultado, '_result_cache', False)
+    if cache is not False:
+        return len(cache) if cache is not None else 0
+    return 1
+
+
+def _instrumentar_metodo(nome: str, metodo):
+    @functools.wraps(metodo)
+    def instrumentado(*args, **kwargs):
+        coleta = _coleta_atual.get()
+        if coleta is not None:
+            coleta.profundidade += 1
+        medidor = _MedidorConsultas()
+        inicio = time.perf_counter()
+        linhas = 0
+        try:
+            with connection.execute_wrapper(medidor):
+                resultado = metodo(*args, **kwargs)
+            linhas = _contar_linhas(resultado)
+            return resultado
+        finally:
+            tempo_total = time.perf_counter() - inicio
+            REGISTRO.registrar(nome, medidor.consultas, linhas, tempo_total, medidor.tempo)
+            if coleta is not None:
+                coleta.profundidade -= 1
+                coleta.por_metodo.setdefault(nome, EstatisticaMetodo()).acumular(
+                    medidor.consultas, linhas, tempo_total, medidor.tempo
+                )
+                if coleta.profundidade == 0:
+                    coleta.total.acumular(
+                        medidor.consultas, linhas, tempo_total, medidor.tempo
+                    )
+
+    instrumentado.__instrumentado__ = True
+    return instrumentado
+
+
+def instrumentar_classe(classe: type) -> type:
+    """
+    Envolve os métodos públicos de instância da classe (inclusive os
+    herdados) com a instrumentação. Chamadas repetidas não têm efeito.
+
+    Returns:
+        type: A própria classe, para uso como decorador.
+    """
+    for nome, _ in inspect.getmembers(classe, inspect.isfunction):
+        if nome.startswith('_'):
+            continue
+        metodo = inspect.getattr_static(classe, nome)
+        if not inspect.isfunction(metodo) or getattr(metodo, '__instrumentado__', False):
+            continue  # staticmethod, classmethod ou já instrumentado
+        setattr(classe, nome, _instrumentar_metodo(f'{classe.__name__}.{nome}', metodo))
+    return classe
+
+
+def instrumentar_repositorios(pacote: str = PACOTE_REPOSITORIOS) -> List[type]:
+    """
+    Importa os módulos de `pacote` e instrumenta as classes concretas cujo
+    nome termina em 'Repository'. Módulos que não puderem ser importados são
+    ignorados, com um aviso no log.
+
+    Returns:
+        List[type]: As classes instrumentadas.
+    """
+    instrumentadas = []
+    raiz = importlib.import_module(pacote)
+    for modulo_info in pkgutil.walk_packages(raiz.__path__, prefix=f'{pacote}.'):
+        try:
+            modulo = importlib.import_module(modulo_info.name)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Repositório não instrumentado (%s): %s", modulo_info.name, exc)
+            continue
+        for _, classe in inspect.getmembers(modulo, inspect.isclass):
+            if (
+                classe.__module__ == modulo.__name__
+                and classe.__name__.endswith(SUFIXO_REPOSITORIO)
+                and not inspect.isabstract(classe)
+            ):
+                instrumentadas.append(instrumentar_classe(classe))
+    return instrumentadas
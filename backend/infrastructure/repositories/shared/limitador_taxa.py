@@ -0,0 +1,146 @@
+"""
+Módulo responsável pela limitação de taxa em janela deslizante.
+
+O LimitadorJanelaDeslizante aceita no máximo `limite` eventos por chave a cada
+`janela` segundos. Há dois modos:
+
+    - local (padrão): um registro exato dos instantes dos eventos de cada
+    chave, em memória, por processo. Sem custo de rede, mas cada processo
+    aplica o limite separadamente. A quantidade de chaves é limitada por um
+    LRU; chaves descartadas voltam a ser aceitas.
+    - compartilhado: contadores no framework de cache do Django, comuns a
+    todos os processos. Com `limite` igual a 1 (deduplicação), a janela é
+    exata (`cache.add` com expiração); com limites maiores, é aproximada pela
+    média ponderada da janela fixa atual e da anterior.
+
+Classes:
+    LimitadorJanelaDeslizante: Limite de eventos por chave em uma janela.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from django.core.cache import cache
+
+PREFIXO_CHAVE = 'limite'
+
+
+class LimitadorJanelaDeslizante:
+    """
+    Limite de `limite` eventos por chave a cada `janela` segundos.
+
+    Atributos:
+        nome (str): Nome do limitador, usado no espaço de chaves do cache.
+        limite (int): Quantidade máxima de eventos por chave na janela.
+        janela (float): Duração da janela, em segundos.
+        compartilhado (bool): Usa o cache do Django em vez da memória local.
+        tamanho_maximo (int): Quantidade máxima de chaves em memória.
+    """
+
+    def __init__(
+        self,
+        nome: str,
+        limite: int,
+        janela: float,
+        compartilhado: bool = False,
+        tamanho_maximo: int = 100000
+    ):
+        self.nome = nome
+        self.limite = limite
+        self.janela = janela
+        self.compartilhado = compartilhado
+        self.tamanho_maximo = tamanho_maximo
+        self._eventos: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def permitir(self, chave: str) -> bool:
+        """
+        Registra um evento da chave se ele estiver dentro do limite.
+
+        Args:
+            chave (str): Chave limitada (ex.: origem, ou post e origem).
+
+        Returns:
+            bool: False se o limite da chave na janela já foi atingido; nesse
+            caso o evento não é registrado.
+        """
+        if self.compartilhado:
+            return self._permitir_compartilhado(chave)
+        return self._permitir_local(chave)
+
+    def liberar(self, chave: str) -> None:
+        """
+        Desfaz o último evento registrado da chave, quando a operação que ele
+        representa não chegou a ser realizada.
+
+        Args:
+            chave (str): Chave informada a `permitir`.
+        """
+        if self.compartilhado:
+            resumo = self._resumo(chave)
+            if self.limite == 1:
+                cache.delete(f'{PREFIXO_CHAVE}:{self.nome}:{resumo}')
+                return
+            indice = int(time.time() // self.janela)
+            try:
+                cache.decr(f'{PREFIXO_CHAVE}:{self.nome}:{indice}:{resumo}')
+            except ValueError:
+                pass  # Contador já expirado
+            return
+        with self._lock:
+            instantes = self._eventos.get(chave)
+            if instantes:
+                instantes.pop()
+
+    def limpar(self) -> None:
+        """Descarta os eventos registrados em memória."""
+        with self._lock:
+            self._eventos.clear()
+
+    def _permitir_local(self, chave: str) -> bool:
+        agora = time.monotonic()
+        with self._lock:
+            instantes = self._eventos.get(chave)
+            if instantes is None:
+                instantes = self._eventos[chave] = deque()
+            else:
+                self._eventos.move_to_end(chave)
+                while instantes and instantes[0] <= agora - self.janela:
+                    instantes.popleft()
+            if len(instantes) >= self.limite:
+                return False
+            instantes.append(agora)
+            while len(self._eventos) > self.tamanho_maximo:
+                self._eventos.popitem(last=False)
+            return True
+
+    def _permitir_compartilhado(self, chave: str) -> bool:
+        resumo = self._resumo(chave)
+        if self.limite == 1:
+            return cache.add(
+                f'{PREFIXO_CHAVE}:{self.nome}:{resumo}', 1, timeout=int(self.janela) or 1
+            )
+
+        agora = time.time()
+        indice, resto = divmod(agora, self.janela)
+        atual = f'{PREFIXO_CHAVE}:{self.nome}:{int(indice)}:{resumo}'
+        anterior = f'{PREFIXO_CHAVE}:{self.nome}:{int(indice) - 1}:{resumo}'
+        contagens = cache.get_many([atual, anterior])
+        estimativa = (
+            contagens.get(anterior, 0) * (1 - resto / self.janela)
+            + contagens.get(atual, 0)
+        )
+        if estimativa >= self.limite:
+            return False
+        if not cache.add(atual, 1, timeout=int(2 * self.janela) + 1):
+            try:
+                cache.incr(atual)
+            except ValueError:
+                # Contador expirou entre o add e o incr
+                cache.set(atual, 1, timeout=int(2 * self.janela) + 1)
+        return True
+
+    @staticmethod
+    def _resumo(chave: str) -> str:
+        # Resumo da chave: mantém as chaves do cache curtas e sem espaços
+        return hashlib.blake2b(chave.encode('utf-8'), digest_size=12).hexdigest()
@@ -0,0 +1,130 @@
+"""
+Módulo responsável pela paginação por chave (keyset/seek pagination) das
+listagens dos repositórios.
+
+Em vez de OFFSET, cada página é buscada a partir do último registro da página
+anterior (`WHERE (chave, id) > (ultima_chave, ultimo_id)`), de modo que o
+custo de uma página profunda é o mesmo da primeira quando a chave de
+ordenação possui índice, e apenas `limit + 1` linhas são carregadas em memória.
+
+O cursor é opaco para quem chama: é o par (valor da chave, id) do último item
+da página codificado em base64. Datas e horas são codificadas com os
+microssegundos, para que a comparação use exatamente a chave do último item.
+
+Funções:
+    paginar_por_chave: Retorna uma página de um queryset ordenado por chave.
+"""
+import base64
+import binascii
+import datetime
+import json
+from typing import Callable, Iterable, Optional
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+from domain.shared.exceptions.invalid_input_exception import (
+                                            InvalidInputException)
+from domain.shared.value_objects.pagina import Pagina
+
+# Tamanho máximo de página aceito, para manter a memória limitada.
+LIMITE_MAXIMO = 500
+
+
+class _CodificadorCursor(DjangoJSONEncoder):
+    """
+    Codificador JSON do cursor. O DjangoJSONEncoder trunca datas e horas em
+    milissegundos, o que repetiria ou pularia itens na fronteira das páginas.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def paginar_por_chave(
+    queryset: QuerySet,
+    conversor: Callable,
+    after: Optional[str] = None,
+    limit: int = 50,
+    order_by: str = 'id',
+    campos_ordenacao: Iterable[str] = ('id',),
+) -> Pagina:
+    """
+    Retorna uma página do queryset ordenada pela chave informada.
+
+    Args:
+        queryset (QuerySet): Queryset base, já filtrado.
+        conversor (Callable): Função que converte cada model no item da página.
+        after (Optional[str]): Cursor retornado pela página anterior.
+        limit (int): Quantidade máxima de itens (1 a LIMITE_MAXIMO).
+        order_by (str): Campo de ordenação; prefixado com '-' para ordem
+        decrescente. A chave primária é usada como desempate.
+        campos_ordenacao (Iterable[str]): Campos aceitos como chave de
+        ordenação. Devem ser não nulos e, de preferência, indexados.
+
+    Returns:
+        Pagina: Itens da página e o cursor da próxima página.
+
+    Raises:
+        InvalidInputException: Se o limite, a chave de ordenação ou o cursor
+        forem inválidos.
+    """
+    if not 1 <= limit <= LIMITE_MAXIMO:
+        raise InvalidInputException(
+            f"O limite da página deve estar entre 1 e {LIMITE_MAXIMO}."
+        )
+
+    decrescente = order_by.startswith('-')
+    campo = order_by.lstrip('-')
+    if campo not in campos_ordenacao:
+        raise InvalidInputException(
+            f"Ordenação por '{campo}' não suportada. "
+            f"Use um dos campos: {', '.join(campos_ordenacao)}."
+        )
+
+    # 'id' sempre se refere à chave primária, mesmo quando ela tem outro nome
+    pk = queryset.model._meta.pk.name  # pylint: disable=protected-access
+    if campo == 'id':
+        campo = pk
+    sentido = '-' if decrescente else ''
+    ordenacao = [f'{sentido}{campo}'] if campo == pk else [f'{sentido}{campo}', f'{sentido}{pk}']
+    queryset = queryset.order_by(*ordenacao)
+
+    if after:
+        valor, ultimo_pk = _decodificar_cursor(after)
+        operador = 'lt' if decrescente else 'gt'
+        if campo == pk:
+            queryset = queryset.filter(**{f'{pk}__{operador}': ultimo_pk})
+        else:
+            queryset = queryset.filter(
+                Q(**{f'{campo}__{operador}': valor})
+                | Q(**{campo: valor, f'{pk}__{operador}': ultimo_pk})
+            )
+
+    # Busca um registro a mais apenas para saber se há próxima página
+    models = list(queryset[:limit + 1])
+    proximo_cursor = None
+    if len(models) > limit:
+        models = models[:limit]
+        ultimo = models[-1]
+        proximo_cursor = _codificar_cursor(getattr(ultimo, campo), ultimo.pk)
+
+    return Pagina(
+        itens=[conversor(model) for model in models],
+        proximo_cursor=proximo_cursor
+    )
+
+
+def _codificar_cursor(valor, pk) -> str:
+    """Codifica o par (valor da chave, pk) em um cursor opaco."""
+    conteudo = json.dumps([valor, pk], cls=_CodificadorCursor)
+    return base64.urlsafe_b64encode(conteudo.encode()).decode()
+
+
+def _decodificar_cursor(cursor: str) -> tuple:
+    """Decodifica um cursor gerado por `_codificar_cursor`."""
+    try:
+        valor, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return valor, pk
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise InvalidInputException("Cursor de paginação inválido.") from exc
@@ -0,0 +1,231 @@
+"""
+Módulo responsável pela manutenção das partições mensais das tabelas de
+eventos do blog (veja a migração 0021_particionar_eventos_blog).
+
+    - `criar_particoes_futuras` cria as partições dos próximos meses antes
+    que os eventos cheguem. Se a partição padrão já tiver recebido eventos
+    de um mês, eles são movidos para a nova partição na mesma transação.
+    - `aplicar_retencao` desanexa as partições cujo mês inteiro é anterior ao
+    período de retenção e as arquiva (movendo-as para o esquema de arquivo)
+    ou as apaga. As duas operações alteram apenas o catálogo, em tempo
+    constante, sem o DELETE de milhões de linhas nem o vacuum posterior.
+
+Os contadores, agregados e sketches de engajamento não dependem dos eventos
+já processados e são preservados pela retenção; os comandos que os
+reconstroem a partir dos eventos (reconciliar_engajamento,
+reconstruir_agregados_engajamento) passam a considerar apenas os eventos
+retidos.
+
+Os limites das partições são meses em UTC.
+
+Classes:
+    Particao: Uma partição de uma tabela de eventos.
+    GerenciadorParticoes: Criação e retenção das partições.
+"""
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+from django.db import connections, transaction
+from infrastructure.models.blog.comentario_reacao import ComentarioReacaoModel
+from infrastructure.models.blog.compartilhamento_post import CompartilhamentoPost
+from infrastructure.models.blog.post_reacao import PostReacao
+from infrastructure.models.blog.visualizacao_post import VisualizacaoPost
+from infrastructure.models.blog.votacao_post import VotacaoPost
+
+logger = logging.getLogger('ocorrencias')
+
+# Tabela particionada -> coluna da data do evento (chave de partição).
+TABELAS_PARTICIONADAS = {
+    VisualizacaoPost._meta.db_table: 'data_visualizacao',
+    PostReacao._meta.db_table: 'data_reacao',
+    VotacaoPost._meta.db_table: 'data_votacao',
+    CompartilhamentoPost._meta.db_table: 'data_compartilhamento',
+    ComentarioReacaoModel._meta.db_table: 'data_reacao',
+}
+
+ESQUEMA_ARQUIVO_PADRAO = 'arquivo_eventos'
+
+_LIMITES = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def _inicio_do_mes(data: datetime) -> datetime:
+    return data.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _somar_meses(data: datetime, meses: int) -> datetime:
+    indice = data.year * 12 + data.month - 1 + meses
+    return data.replace(year=indice // 12, month=indice % 12 + 1)
+
+
+def _limite(texto: str) -> Optional[datetime]:
+    if texto in ('MINVALUE', 'MAXVALUE'):
+        return None
+    return datetime.fromisoformat(texto.strip("'"))
+
+
+@dataclass(frozen=True)
+class Particao:
+    """
+    Uma partição de uma tabela de eventos.
+
+    Atributos:
+        nome (str): Nome da tabela da partição.
+        inicio (Optional[datetime]): Limite inferior (inclusivo); None se
+        ilimitado (MINVALUE) ou se for a partição padrão.
+        fim (Optional[datetime]): Limite superior (exclusivo); None se
+        ilimitado ou se for a partição padrão.
+        padrao (bool): Indica a partição padrão (DEFAULT).
+    """
+    nome: str
+    inicio: Optional[datetime]
+    fim: Optional[datetime]
+    padrao: bool = False
+
+    def sobrepoe(self, inicio: datetime, fim: datetime) -> bool:
+        """Indica se a partição cobre parte do intervalo [inicio, fim)."""
+        if self.padrao:
+            return False
+        return (self.inicio is None or self.inicio < fim) and (self.fim is None or self.fim > inicio)
+
+
+class GerenciadorParticoes:
+    """
+    Criação e retenção das partições mensais das tabelas de eventos.
+
+    Atributos:
+        using (str): Alias do banco de dados.
+    """
+
+    def __init__(self, using: str = 'default'):
+        self.using = using
+        self.conexao = connections[using]
+
+    @property
+    def suportado(self) -> bool:
+        """Indica se o banco de dados suporta particionamento (PostgreSQL)."""
+        return self.conexao.vendor == 'postgresql'
+
+    def particionada(self, tabela: str) -> bool:
+        """Indica se a tabela já foi convertida em tabela particionada."""
+        with self.conexao.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+                [tabela],
+            )
+            return cursor.fetchone() is not None
+
+    def particoes(self, tabela: str) -> List[Particao]:
+        """Retorna as partições da tabela, ordenadas pelo limite inferior."""
+        with self.conexao.cursor() as cursor:
+            cursor.execute(
+                "SELECT filha.relname, pg_get_expr(filha.relpartbound, filha.oid) "
+                "FROM pg_inherits JOIN pg_class filha ON filha.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = to_regclass(%s)",
+                [tabela],
+            )
+            linhas = cursor.fetchall()
+        particoes = []
+        for nome, limites in linhas:
+            if limites == 'DEFAULT':
+                particoes.append(Particao(nome, None, None, padrao=True))
+                continue
+            inicio, fim = _LIMITES.search(limites).groups()
+            particoes.append(Particao(nome, _limite(inicio), _limite(fim)))
+        return sorted(
+            particoes,
+            key=lambda particao: (particao.padrao, particao.inicio or datetime.min.replace(tzinfo=timezone.utc)),
+        )
+
+    def criar_particoes_futuras(self, tabela: str, meses: int = 3) -> List[str]:
+        """
+        Cria as partições do mês atual e dos `meses` seguintes que ainda não
+        existirem.
+
+        Returns:
+            List[str]: Nomes das partições criadas.
+        """
+        criadas = []
+        quote = self.conexao.ops.quote_name
+        coluna = TABELAS_PARTICIONADAS[tabela]
+        atual = _inicio_do_mes(datetime.now(timezone.utc))
+        for deslocamento in range(meses + 1):
+            inicio = _somar_meses(atual, deslocamento)
+            fim = _somar_meses(inicio, 1)
+            particoes = self.particoes(tabela)
+            if any(particao.sobrepoe(inicio, fim) for particao in particoes):
+                continue
+            nome = f'{tabela}_p{inicio:%Y%m}'
+            padrao = next((particao.nome for particao in particoes if particao.padrao), None)
+            with transaction.atomic(using=self.using), self.conexao.cursor() as cursor:
+                if padrao is not None:
+                    cursor.execute(
+                        f'SELECT EXISTS (SELECT 1 FROM {quote(padrao)} '
+                        f'WHERE {quote(coluna)} >= %s AND {quote(coluna)} < %s)',
+                        [inicio, fim],
+                    )
+                    if not cursor.fetchone()[0]:
+                        padrao = None
+                if padrao is not None:
+                    # Eventos do mês já gravados na partição padrão impedem a
+                    # criação da partição; são movidos para ela
+                    cursor.execute(f'ALTER TABLE {quote(tabela)} DETACH PARTITION {quote(padrao)}')
+                cursor.execute(
+                    f'CREATE TABLE {quote(nome)} PARTITION OF {quote(tabela)} '
+                    f'FOR VALUES FROM (%s) TO (%s)',
+                    [inicio, fim],
+                )
+                if padrao is not None:
+                    cursor.execute(
+                        f'WITH movidos AS (DELETE FROM {quote(padrao)} '
+                        f'WHERE {quote(coluna)} >= %s AND {quote(coluna)} < %s RETURNING *) '
+                        f'INSERT INTO {quote(tabela)} SELECT * FROM movidos',
+                        [inicio, fim],
+                    )
+                    cursor.execute(f'ALTER TABLE {quote(tabela)} ATTACH PARTITION {quote(padrao)} DEFAULT')
+            criadas.append(nome)
+        return criadas
+
+    def aplicar_retencao(
+        self,
+        tabela: str,
+        meses: int,
+        arquivar: bool = False,
+        esquema_arquivo: str = ESQUEMA_ARQUIVO_PADRAO
+    ) -> List[str]:
+        """
+        Desanexa as partições cujos eventos são todos anteriores ao início do
+        mês de `meses` meses atrás, arquivando-as ou apagando-as.
+
+        Args:
+            tabela (str): Tabela particionada.
+            meses (int): Quantidade de meses completos retidos, além do atual.
+            arquivar (bool): Move as partições para `esquema_arquivo` em vez
+            de apagá-las.
+            esquema_arquivo (str): Esquema que recebe as partições arquivadas.
+
+        Returns:
+            List[str]: Nomes das partições removidas da tabela.
+        """
+        quote = self.conexao.ops.quote_name
+        corte = _somar_meses(_inicio_do_mes(datetime.now(timezone.utc)), -meses)
+        removidas = []
+        for particao in self.particoes(tabela):
+            if particao.padrao or particao.fim is None or particao.fim > corte:
+                continue
+            with transaction.atomic(using=self.using), self.conexao.cursor() as cursor:
+                cursor.execute(f'ALTER TABLE {quote(tabela)} DETACH PARTITION {quote(particao.nome)}')
+                if arquivar:
+                    cursor.execute(f'CREATE SCHEMA IF NOT EXISTS {quote(esquema_arquivo)}')
+                    cursor.execute(
+                        f'ALTER TABLE {quote(particao.nome)} SET SCHEMA {quote(esquema_arquivo)}'
+                    )
+                else:
+                    cursor.execute(f'DROP TABLE {quote(particao.nome)}')
+            logger.info(
+                "Partição %s de %s %s.", particao.nome, tabela,
+                f'arquivada em {esquema_arquivo}' if arquivar else 'apagada'
+            )
+            removidas.append(particao.nome)
+        return removidas
@@ -9,12 +9,22 @@ utilizando o ORM do Django para interagir com o banco de dados.
 """
 # backend/infrastructure/repositories/plugin_repository.py
 
+from collections import defaultdict
 from uuid import UUID
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from domain.shared.plugins.aggregates.plugin import Plugin
 from domain.shared.plugins.repositories.plugin import PluginRepository
 from infrastructure.models.shared.plugins.plugin import PluginModel
 
+# Relações ManyToMany do agregado, representadas como listas de IDs.
+RELACOES_PLUGIN = (
+    'permissoes',
+    'historico_modificacoes',
+    'tags',
+    'dependencias',
+    'templates',
+)
+
 
 class DjangoPluginRepository(PluginRepository):
     """
@@ -41,22 +51,7 @@ class DjangoPluginRepository(PluginRepository):
     def get(self, plugin_id: UUID) -> Optional[Plugin]:
         try:
             plugin_model = PluginModel.objects.get(pk=plugin_id)  # pylint: disable=no-member
-            return Plugin(
-                id=plugin_model.id,
-                nome=plugin_model.nome,
-                categoria_id=plugin_model.categoria_id,
-                tipo_plugin_id=plugin_model.tipo_plugin_id,
-                versao=plugin_model.versao,
-                descricao=plugin_model.descricao,
-                artefato_plugin_id=plugin_model.artefato_plugin_id,
-                documentacao=plugin_model.documentacao,
-                caminho_arquivo=plugin_model.caminho_arquivo,
-                permissoes=list(plugin_model.permissoes.all()),
-                historico_modificacoes=list(plugin_model.historico_modificacoes.all()),
-                tags=list(plugin_model.tags.all()),
-                dependencias=list(plugin_model.dependencias.all()),
-                templates=list(plugin_model.templates.all())
-            )
+            return self._materializar([plugin_model])[0]
         except PluginModel.DoesNotExist:
             return None
         except Exception as e:
@@ -95,74 +90,92 @@ class DjangoPluginRepository(PluginRepository):
     def list(self) -> List[Plugin]:
         try:
             plugin_models = PluginModel.objects.all()  # pylint: disable=no-member
-            return [
-                Plugin(
-                    id=plugin_model.id,
-                    nome=plugin_model.nome,
-                    categoria_id=plugin_model.categoria_id,
-                    tipo_plugin_id=plugin_model.tipo_plugin_id,
-                    versao=plugin_model.versao,
-                    descricao=plugin_model.descricao,
-                    artefato_plugin_id=plugin_model.artefato_plugin_id,
-                    documentacao=plugin_model.documentacao,
-                    caminho_arquivo=plugin_model.caminho_arquivo,
-                    permissoes=list(plugin_model.permissoes.all()),
-                    historico_modificacoes=list(plugin_model.historico_modificacoes.all()),
-                    tags=list(plugin_model.tags.all()),
-                    dependencias=list(plugin_model.dependencias.all()),
-                    templates=list(plugin_model.templates.all())
-                )
-                for plugin_model in plugin_models
-            ]
+            return self._materializar(plugin_models)
         except Exception as e:
             raise ValueError(f"Erro ao listar os plugins: {str(e)}") from e
 
     def list_by_categoria(self, categoria_id: UUID) -> List[Plugin]:
         try:
             plugin_models = PluginModel.objects.filter(categoria_id=categoria_id)  # pylint: disable=no-member
-            return [
-                Plugin(
-                    id=plugin_model.id,
-                    nome=plugin_model.nome,
-                    categoria_id=plugin_model.categoria_id,
-                    tipo_plugin_id=plugin_model.tipo_plugin_id,
-                    versao=plugin_model.versao,
-                    descricao=plugin_model.descricao,
-                    artefato_plugin_id=plugin_model.artefato_plugin_id,
-                    documentacao=plugin_model.documentacao,
-                    caminho_arquivo=plugin_model.caminho_arquivo,
-                    permissoes=list(plugin_model.permissoes.all()),
-                    historico_modificacoes=list(plugin_model.historico_modificacoes.all()),
-                    tags=list(plugin_model.tags.all()),
-                    dependencias=list(plugin_model.dependencias.all()),
-                    templates=list(plugin_model.templates.all())
-                )
-                for plugin_model in plugin_models
-            ]
+            return self._materializar(plugin_models)
         except Exception as e:
             raise ValueError(f"Erro ao listar os plugins por categoria: {str(e)}") from e
 
     def list_by_tipo(self, tipo_plugin_id: UUID) -> List[Plugin]:
         try:
             plugin_models = PluginModel.objects.filter(tipo_plugin_id=tipo_plugin_id)  # pylint: disable=no-member
-            return [
-                Plugin(
-                    id=plugin_model.id,
-                    nome=plugin_model.nome,
-                    categoria_id=plugin_model.categoria_id,
-                    tipo_plugin_id=plugin_model.tipo_plugin_id,
-                    versao=plugin_model.versao,
-                    descricao=plugin_model.descricao,
-                    artefato_plugin_id=plugin_model.artefato_plugin_id,
-                    documentacao=plugin_model.documentacao,
-                    caminho_arquivo=plugin_model.caminho_arquivo,
-                    permissoes=list(plugin_model.permissoes.all()),
-                    historico_modificacoes=list(plugin_model.historico_modificacoes.all()),
-                    tags=list(plugin_model.tags.all()),
-                    dependencias=list(plugin_model.dependencias.all()),
-                    templates=list(plugin_model.templates.all())
-                )
-                for plugin_model in plugin_models
-            ]
+            return self._materializar(plugin_models)
         except Exception as e:
             raise ValueError(f"Erro ao listar os plugins por tipo: {str(e)}") from e
+
+    def _materializar(self, plugin_models: Iterable[PluginModel]) -> List[Plugin]:
+        """
+        Constrói os agregados Plugin a partir das models informadas,
+        carregando as cinco relações ManyToMany com um número fixo de
+        consultas (uma por relação), independente da quantidade de plugins.
+
+        As relações são representadas por listas de identificadores, conforme
+        definido no agregado, sem instanciar as models relacionadas.
+
+        Args:
+            plugin_models (Iterable[PluginModel]): Models já filtradas.
+
+        Returns:
+            List[Plugin]: Agregados na mesma ordem das models recebidas.
+        """
+        plugin_models = list(plugin_models)
+        if not plugin_models:
+            return []
+
+        plugin_ids = [plugin_model.id for plugin_model in plugin_models]
+        relacoes = {
+            relacao: self._carregar_ids_relacionados(relacao, plugin_ids)
+            for relacao in RELACOES_PLUGIN
+        }
+
+        return [
+            Plugin(
+                id=plugin_model.id,
+                nome=plugin_model.nome,
+                categoria_id=plugin_model.categoria_id,
+                tipo_plugin_id=plugin_model.tipo_plugin_id,
+                versao=plugin_model.versao,
+                descricao=plugin_model.descricao,
+                artefato_plugin_id=plugin_model.artefato_plugin_id,
+                documentacao=plugin_model.documentacao,
+                caminho_arquivo=plugin_model.caminho_arquivo,
+                **{
+                    relacao: ids_por_plugin.get(plugin_model.id, [])
+                    for relacao, ids_por_plugin in relacoes.items()
+                }
+            )
+            for plugin_model in plugin_models
+        ]
+
+    def _carregar_ids_relacionados(
+        self, relacao: str, plugin_ids: List[UUID]
+    ) -> Dict[UUID, List]:
+        """
+        Busca, em uma única consulta, os IDs da relação ManyToMany informada
+        para todos os plugins, agrupados pelo ID do plugin.
+
+        A consulta parte do manager padrão da model relacionada, preservando
+        o filtro de exclusão lógica aplicado por `plugin_model.<relacao>.all()`.
+
+        Args:
+            relacao (str): Nome do campo ManyToMany em PluginModel.
+            plugin_ids (List[UUID]): IDs dos plugins.
+
+        Returns:
+            Dict[UUID, List]: IDs relacionados agrupados por plugin.
+        """
+        campo = PluginModel._meta.get_field(relacao)  # pylint: disable=protected-access
+        reverso = campo.related_query_name()
+        pares = campo.related_model._default_manager.filter(  # pylint: disable=protected-access
+            **{f'{reverso}__in': plugin_ids}
+        ).values_list(reverso, 'pk')
+
+        agrupados: Dict[UUID, List] = defaultdict(list)
+        for plugin_id, relacionado_id in pares:
+            agrupados[plugin_id].append(relacionado_id)
+        return agrupados
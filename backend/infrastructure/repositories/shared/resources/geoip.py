@@ -0,0 +1,177 @@
+"""
+Módulo responsável pela geolocalização de endereços IP sem serviços externos.
+
+A base de geolocalização é um arquivo CSV (opcionalmente compactado com gzip)
+de faixas de IP, uma faixa por linha:
+
+    ip_inicio,ip_fim,latitude,longitude,precisao,cidade,estado,pais
+    177.0.0.0,177.0.255.255,-23.550520,-46.633308,50,São Paulo,SP,BR
+
+Os limites podem ser endereços (IPv4 ou IPv6) ou inteiros; as colunas após
+`ip_fim` são opcionais. O arquivo é carregado em arrays NumPy ordenados pelo
+início da faixa (um par de arrays por versão de IP) e cada consulta é uma
+busca binária (`searchsorted`), precedida por um LRU dos IPs consultados. As
+localizações repetidas entre faixas são armazenadas uma única vez.
+
+Classes:
+    ResolvedorGeoIP: Consulta da localização de um IP na base local.
+"""
+import csv
+import gzip
+import ipaddress
+import logging
+import os
+import threading
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from django.conf import settings
+from domain.shared.value_objects.geolocalizacao_ip import GeolocalizacaoIP
+
+logger = logging.getLogger('ocorrencias')
+
+# Inícios, fins e índices das localizações das faixas, ordenados pelo início.
+_Faixas = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _inteiro_ip(valor: str) -> Tuple[int, int]:
+    """Retorna (versão, valor inteiro) de um endereço ou inteiro."""
+    valor = valor.strip()
+    if valor.isdigit():
+        numero = int(valor)
+        return (4 if numero < 2 ** 32 else 6), numero
+    endereco = ipaddress.ip_address(valor)
+    return endereco.version, int(endereco)
+
+
+def _decimal(valor: Optional[str]) -> Optional[Decimal]:
+    try:
+        return Decimal(valor) if valor else None
+    except InvalidOperation:
+        return None
+
+
+def _faixas_vazias() -> _Faixas:
+    return np.empty(0, dtype=np.uint32), np.empty(0, dtype=np.uint32), np.empty(0, dtype=np.int32)
+
+
+class ResolvedorGeoIP:
+    """
+    Geolocalização de endereços IP a partir de uma base local de faixas.
+
+    Atributos:
+        arquivo (Optional[str]): Caminho da base carregada.
+        quantidade_faixas (int): Quantidade de faixas carregadas.
+    """
+
+    _padrao: Optional['ResolvedorGeoIP'] = None
+    _lock_padrao = threading.Lock()
+
+    def __init__(self, arquivo: Optional[str] = None, tamanho_cache: int = 65536):
+        """
+        Args:
+            arquivo (Optional[str]): Base de faixas a carregar; sem base, nenhum
+            IP é resolvido.
+            tamanho_cache (int): Quantidade máxima de IPs no LRU.
+        """
+        self.arquivo = arquivo
+        self.quantidade_faixas = 0
+        self._faixas: Dict[int, _Faixas] = {4: _faixas_vazias(), 6: _faixas_vazias()}
+        self._localizacoes: List[GeolocalizacaoIP] = []
+        self.resolver = lru_cache(maxsize=tamanho_cache)(self._resolver)
+        if arquivo:
+            self.carregar(arquivo)
+
+    @classmethod
+    def padrao(cls) -> 'ResolvedorGeoIP':
+        """
+        Retorna o resolvedor do processo, com a base GEOIP_ARQUIVO. Se o
+        arquivo não existir, nenhum IP é resolvido.
+        """
+        with cls._lock_padrao:
+            if cls._padrao is None:
+                arquivo = getattr(settings, 'GEOIP_ARQUIVO', None)
+                if arquivo and not os.path.exists(arquivo):
+                    logger.warning("Base de geolocalização %s não encontrada.", arquivo)
+                    arquivo = None
+                cls._padrao = cls(arquivo, getattr(settings, 'GEOIP_TAMANHO_CACHE', 65536))
+        return cls._padrao
+
+    def carregar(self, arquivo: str) -> None:
+        """
+        Carrega (ou recarrega) a base de faixas, substituindo a atual e
+        limpando o LRU.
+
+        Args:
+            arquivo (str): Caminho do CSV, compactado se terminar em '.gz'.
+        """
+        inicios: Dict[int, List[int]] = {4: [], 6: []}
+        fins: Dict[int, List[int]] = {4: [], 6: []}
+        indices: Dict[int, List[int]] = {4: [], 6: []}
+        localizacoes: List[GeolocalizacaoIP] = []
+        indice_localizacao: Dict[GeolocalizacaoIP, int] = {}
+
+        abrir = gzip.open if arquivo.endswith('.gz') else open
+        with abrir(arquivo, 'rt', encoding='utf-8', newline='') as conteudo:
+            for linha in csv.DictReader(conteudo):
+                try:
+                    versao, inicio = _inteiro_ip(linha['ip_inicio'])
+                    _, fim = _inteiro_ip(linha['ip_fim'])
+                except (KeyError, ValueError, AttributeError):
+                    continue
+                localizacao = GeolocalizacaoIP(
+                    latitude=_decimal(linha.get('latitude')),
+                    longitude=_decimal(linha.get('longitude')),
+                    precisao=_decimal(linha.get('precisao')),
+                    cidade=linha.get('cidade') or None,
+                    estado=linha.get('estado') or None,
+                    pais=linha.get('pais') or None,
+                )
+                if localizacao not in indice_localizacao:
+                    indice_localizacao[localizacao] = len(localizacoes)
+                    localizacoes.append(localizacao)
+                inicios[versao].append(inicio)
+                fins[versao].append(fim)
+                indices[versao].append(indice_localizacao[localizacao])
+
+        faixas = {}
+        for versao in (4, 6):
+            # Endereços IPv6 não cabem em inteiros de 64 bits
+            tipo = np.uint32 if versao == 4 else object
+            array_inicios = np.array(inicios[versao], dtype=tipo)
+            ordem = np.argsort(array_inicios, kind='stable')
+            faixas[versao] = (
+                array_inicios[ordem],
+                np.array(fins[versao], dtype=tipo)[ordem],
+                np.array(indices[versao], dtype=np.int32)[ordem],
+            )
+
+        self._faixas, self._localizacoes = faixas, localizacoes
+        self.arquivo = arquivo
+        self.quantidade_faixas = sum(len(faixa[0]) for faixa in faixas.values())
+        self.resolver.cache_clear()
+        logger.info(
+            "Base de geolocalização %s carregada: %s faixas, %s localizações.",
+            arquivo, self.quantidade_faixas, len(localizacoes)
+        )
+
+    def _resolver(self, ip: str) -> Optional[GeolocalizacaoIP]:
+        """
+        Retorna a localização do IP, ou None se o IP for inválido ou não
+        pertencer a nenhuma faixa. Exposto, com o LRU, como `resolver`.
+        """
+        try:
+            endereco = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        if endereco.version == 6 and endereco.ipv4_mapped:
+            endereco = endereco.ipv4_mapped
+        inicios, fins, indices = self._faixas[endereco.version]
+        numero = int(endereco)
+        # A chave no mesmo tipo do array evita a conversão do array inteiro
+        chave = np.uint32(numero) if endereco.version == 4 else numero
+        posicao = int(np.searchsorted(inicios, chave, side='right')) - 1
+        if posicao < 0 or numero > int(fins[posicao]):
+            return None
+        return self._localizacoes[indices[posicao]]
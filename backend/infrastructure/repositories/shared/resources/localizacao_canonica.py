@@ -0,0 +1,161 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pelas localizações canônicas dos eventos de engajamento.
+
+Em vez de uma LocalizacaoModel por evento, todos os eventos de um mesmo IP em
+um mesmo dia referenciam uma única linha canônica, identificada por
+(ip_address, dia). A cidade, o estado, o país e as coordenadas da linha vêm
+da base local de geolocalização (ResolvedorGeoIP) e, na falta dela, dos
+campos informados pelo primeiro evento do IP no dia.
+
+Os IDs das linhas canônicas ficam em um LRU por processo; em falta, um lote
+de eventos custa uma consulta das linhas existentes e, para as ausentes, um
+`bulk_create` (ignorando criações concorrentes) e uma nova consulta. IDs de
+linhas criadas entram no LRU somente após o commit da transação.
+
+Classes:
+    LocalizacaoCanonicaRepository: Obtenção ou criação das localizações
+    canônicas de um lote de eventos.
+"""
+import ipaddress
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import date
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
+from django.conf import settings
+from django.db import transaction
+from infrastructure.models.shared.resources.localizacao import LocalizacaoModel
+from infrastructure.repositories.shared.resources.geoip import ResolvedorGeoIP
+
+# (IP normalizado, dia)
+Chave = Tuple[str, date]
+
+
+def _normalizar_ip(ip: Optional[str]) -> Optional[str]:
+    try:
+        endereco = ipaddress.ip_address(ip) if ip else None
+    except ValueError:
+        return None
+    if endereco is not None and endereco.version == 6 and endereco.ipv4_mapped:
+        endereco = endereco.ipv4_mapped
+    return str(endereco) if endereco is not None else None
+
+
+class LocalizacaoCanonicaRepository:
+    """
+    Repositório das localizações canônicas por IP e dia.
+
+    Atributos:
+        resolvedor (ResolvedorGeoIP): Base local de geolocalização.
+        tamanho_cache (int): Quantidade máxima de IDs no LRU.
+    """
+
+    _padrao: Optional['LocalizacaoCanonicaRepository'] = None
+    _lock_padrao = threading.Lock()
+
+    def __init__(self, resolvedor: Optional[ResolvedorGeoIP] = None, tamanho_cache: int = 100000):
+        self.resolvedor = resolvedor or ResolvedorGeoIP.padrao()
+        self.tamanho_cache = tamanho_cache
+        self._ids: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def padrao(cls) -> 'LocalizacaoCanonicaRepository':
+        """Retorna o repositório do processo, cujo LRU é compartilhado entre os lotes."""
+        with cls._lock_padrao:
+            if cls._padrao is None:
+                cls._padrao = cls(
+                    tamanho_cache=getattr(settings, 'LOCALIZACAO_TAMANHO_CACHE', 100000)
+                )
+        return cls._padrao
+
+    def obter_ids(
+        self,
+        localizacoes: Sequence[Optional[Dict[str, object]]],
+        dias: Sequence[date]
+    ) -> List[Optional[int]]:
+        """
+        Retorna, para cada evento, o ID da localização canônica do seu IP no
+        seu dia, criando as ausentes. Deve ser chamado dentro da transação
+        que grava os eventos.
+
+        Args:
+            localizacoes (Sequence[Optional[Dict[str, object]]]): Campos de
+            localização de cada evento (ao menos `ip_address`).
+            dias (Sequence[date]): Dia de cada evento.
+
+        Returns:
+            List[Optional[int]]: ID da localização de cada evento, ou None se
+            o evento não tiver um IP válido.
+        """
+        chaves: List[Optional[Chave]] = [
+            (ip, dia) if ip else None
+            for ip, dia in (
+                (_normalizar_ip((localizacao or {}).get('ip_address')), dia)
+                for localizacao, dia in zip(localizacoes, dias)
+            )
+        ]
+        ids = self._do_cache({chave for chave in chaves if chave})
+
+        ausentes: Dict[Chave, Dict[str, object]] = {}
+        for chave, localizacao in zip(chaves, localizacoes):
+            if chave and chave not in ids and chave not in ausentes:
+                ausentes[chave] = localizacao
+        if ausentes:
+            encontrados = self._buscar(ausentes)
+            ids.update(encontrados)
+            self._guardar(encontrados)
+
+            novos = {chave: campos for chave, campos in ausentes.items() if chave not in encontrados}
+            if novos:
+                LocalizacaoModel.objects.bulk_create(
+                    [self._nova(chave, campos) for chave, campos in novos.items()],
+                    ignore_conflicts=True,
+                )
+                criados = self._buscar(novos)
+                ids.update(criados)
+                transaction.on_commit(partial(self._guardar, criados))
+
+        return [ids.get(chave) if chave else None for chave in chaves]
+
+    def _nova(self, chave: Chave, campos: Dict[str, object]) -> LocalizacaoModel:
+        ip, dia = chave
+        valores = {
+            campo: valor for campo, valor in campos.items()
+            if campo != 'ip_address' and valor not in (None, '')
+        }
+        geolocalizacao = self.resolvedor.resolver(ip)
+        if geolocalizacao is not None:
+            valores.update({
+                campo: valor for campo, valor in asdict(geolocalizacao).items()
+                if valor is not None
+            })
+        return LocalizacaoModel(ip_address=ip, dia=dia, **valores)
+
+    @staticmethod
+    def _buscar(chaves: Dict[Chave, object]) -> Dict[Chave, int]:
+        linhas = LocalizacaoModel.objects.filter(
+            ip_address__in={ip for ip, _ in chaves},
+            dia__in={dia for _, dia in chaves},
+        ).values_list('ip_address', 'dia', 'id')
+        return {(ip, dia): pk for ip, dia, pk in linhas if (ip, dia) in chaves}
+
+    def _do_cache(self, chaves) -> Dict[Chave, int]:
+        with self._lock:
+            ids = {}
+            for chave in chaves:
+                pk = self._ids.get(chave)
+                if pk is not None:
+                    self._ids.move_to_end(chave)
+                    ids[chave] = pk
+            return ids
+
+    def _guardar(self, ids: Dict[Chave, int]) -> None:
+        with self._lock:
+            self._ids.update(ids)
+            for chave in ids:
+                self._ids.move_to_end(chave)
+            while len(self._ids) > self.tamanho_cache:
+                self._ids.popitem(last=False)
@@ -9,8 +9,12 @@ from typing import List, Optional
 from domain.shared.resources.entities.rede_social import RedeSocialDomain
 from domain.shared.resources.repositories.rede_social import RedeSocialContract
 from infrastructure.models.shared.resources.rede_social import RedeSocialModel
+from infrastructure.repositories.shared.cache_referencia import CacheReferencia
 from django.core.exceptions import ObjectDoesNotExist
 
+# Cache de leitura, invalidado a cada gravação de RedeSocialModel.
+CACHE_REDES_SOCIAIS = CacheReferencia('rede_social', RedeSocialModel)
+
 
 class RedeSocialRepository(RedeSocialContract):
     """
@@ -47,15 +51,24 @@ class RedeSocialRepository(RedeSocialContract):
             Optional[RedeSocialDomain]: A instância de RedeSocial, ou None se não encontrada.
         """
         try:
-            rede_social_model = RedeSocialModel.objects.get(id=rede_social_id)
-            return RedeSocialDomain(
-                rede_social_id=rede_social_model.id,
-                nome=rede_social_model.nome,
-                icone=rede_social_model.icone
-            )
+            return CACHE_REDES_SOCIAIS.obter(rede_social_id, lambda: self._carregar(rede_social_id))
         except ObjectDoesNotExist:
             return None
 
+    def _carregar(self, rede_social_id: int) -> RedeSocialDomain:
+        """
+        Busca a rede social no banco de dados, sem passar pelo cache.
+
+        Raises:
+            ObjectDoesNotExist: Se a rede social não existir.
+        """
+        rede_social_model = RedeSocialModel.objects.get(id=rede_social_id)
+        return RedeSocialDomain(
+            rede_social_id=rede_social_model.id,
+            nome=rede_social_model.nome,
+            icone=rede_social_model.icone
+        )
+
     def listar_todas(self) -> List[RedeSocialDomain]:
         """
         Lista todas as instâncias de RedeSocial no banco de dados.
@@ -0,0 +1,107 @@
+"""
+Módulo responsável pela geração das versões redimensionadas (derivadas) de
+uma imagem, em várias larguras e formatos.
+
+As funções deste módulo usam apenas o Pillow, sem importar o Django, e
+recebem e retornam bytes, para que possam ser executadas em processos
+separados (iniciados com `spawn`) sem configurar o Django nem acessar o
+storage ou o banco de dados.
+
+A imagem é orientada pelo EXIF, convertida para RGB (ou RGBA, quando tem
+transparência e o formato a suporta) e reduzida com o filtro LANCZOS, sem
+nunca ser ampliada: larguras maiores que a original são substituídas pela
+própria largura original.
+
+Funções:
+    formatos_suportados: Formatos que o Pillow instalado consegue gravar.
+    gerar_derivadas: Gera as derivadas de uma imagem.
+"""
+import io
+from typing import Dict, Iterable, List, Tuple
+from PIL import Image, ImageOps
+
+FORMATO_AVIF = 'avif'
+FORMATO_WEBP = 'webp'
+FORMATO_JPEG = 'jpeg'
+
+# Nome do formato no Pillow, extensão do arquivo e tipo MIME de cada formato.
+FORMATOS_PIL = {FORMATO_AVIF: 'AVIF', FORMATO_WEBP: 'WEBP', FORMATO_JPEG: 'JPEG'}
+EXTENSOES = {FORMATO_AVIF: 'avif', FORMATO_WEBP: 'webp', FORMATO_JPEG: 'jpg'}
+TIPOS_MIME = {FORMATO_AVIF: 'image/avif', FORMATO_WEBP: 'image/webp', FORMATO_JPEG: 'image/jpeg'}
+
+# (largura, altura, formato, conteúdo) de uma derivada.
+Derivada = Tuple[int, int, str, bytes]
+
+
+def formatos_suportados(formatos: Iterable[str]) -> List[str]:
+    """
+    Retorna, na ordem recebida, os formatos que o Pillow instalado consegue
+    gravar. O AVIF depende do Pillow 11.2+ (ou do plugin pillow-avif-plugin).
+    """
+    Image.init()
+    return [formato for formato in formatos if FORMATOS_PIL.get(formato) in Image.SAVE]
+
+
+def _converter(imagem: Image.Image, formato: str) -> Image.Image:
+    """Converte a imagem para um modo que o formato consegue gravar."""
+    transparente = imagem.mode in ('RGBA', 'LA', 'PA') or (
+        imagem.mode == 'P' and 'transparency' in imagem.info
+    )
+    if not transparente:
+        return imagem if imagem.mode == 'RGB' else imagem.convert('RGB')
+    imagem = imagem if imagem.mode == 'RGBA' else imagem.convert('RGBA')
+    if formato != FORMATO_JPEG:
+        return imagem
+    fundo = Image.new('RGB', imagem.size, (255, 255, 255))
+    fundo.paste(imagem, mask=imagem.getchannel('A'))
+    return fundo
+
+
+def _gravar(imagem: Image.Image, formato: str, qualidade: int) -> bytes:
+    saida = io.BytesIO()
+    opcoes = {'quality': qualidade}
+    if formato == FORMATO_JPEG:
+        opcoes.update(optimize=True, progressive=True)
+    elif formato == FORMATO_WEBP:
+        opcoes.update(method=4)
+    elif formato == FORMATO_AVIF:
+        opcoes.update(speed=6)
+    _converter(imagem, formato).save(saida, FORMATOS_PIL[formato], **opcoes)
+    return saida.getvalue()
+
+
+def gerar_derivadas(
+    conteudo: bytes,
+    larguras: Iterable[int],
+    formatos: Iterable[str],
+    qualidade: Dict[str, int]
+) -> Tuple[Tuple[int, int], List[Derivada]]:
+    """
+    Gera as derivadas de uma imagem em cada largura e formato.
+
+    Args:
+        conteudo (bytes): Conteúdo do arquivo da imagem original.
+        larguras (Iterable[int]): Larguras desejadas, em pixels.
+        formatos (Iterable[str]): Formatos desejados ('avif', 'webp' ou
+        'jpeg'), já restritos aos suportados.
+        qualidade (Dict[str, int]): Qualidade de compressão por formato.
+
+    Returns:
+        Tuple[Tuple[int, int], List[Derivada]]: Dimensões da imagem original
+        (já orientada) e as derivadas, em ordem crescente de largura.
+    """
+    with Image.open(io.BytesIO(conteudo)) as original:
+        imagem = ImageOps.exif_transpose(original)
+        imagem.load()
+    largura_original, altura_original = imagem.size
+    derivadas: List[Derivada] = []
+    for largura in sorted({min(int(largura), largura_original) for largura in larguras}):
+        altura = max(1, round(altura_original * largura / largura_original))
+        redimensionada = imagem if largura == largura_original else imagem.resize(
+            (largura, altura), Image.Resampling.LANCZOS, reducing_gap=3.0
+        )
+        for formato in formatos:
+            derivadas.append((
+                largura, altura, formato, _gravar(redimensionada, formato, qualidade.get(formato, 80))
+            ))
+    return (largura_original, altura_original), derivadas
@@ -0,0 +1,124 @@
+# pylint: disable=no-member
+"""
+Módulo responsável pela sincronização em lote das redes sociais associadas
+a uma pessoa física ou jurídica.
+
+A sincronização compara as associações existentes com as redes sociais
+informadas e aplica a diferença com um número constante de consultas,
+independente da quantidade de redes sociais:
+
+    - uma consulta para carregar as associações existentes;
+    - uma consulta para validar as redes sociais informadas;
+    - um `bulk_create` para as novas associações;
+    - um `bulk_update` para as associações com usuário alterado;
+    - um `delete` para as associações que deixaram de ser informadas.
+
+Classes:
+    SincronizadorRedesSociais: Aplica a diferença entre as redes sociais
+    informadas e as associações persistidas de um proprietário.
+"""
+from typing import Dict, Optional
+from django.db import models
+from domain.shared.exceptions.entity_not_found_exception import (
+                                            EntityNotFoundException)
+from infrastructure.models.shared.resources.rede_social import RedeSocialModel
+
+
+class SincronizadorRedesSociais:
+    """
+    Sincroniza a tabela associativa entre um proprietário (pessoa física ou
+    jurídica) e RedeSocialModel.
+
+    Atributos:
+        associacao_model (type[models.Model]): Model associativa.
+        campo_proprietario (str): Nome da chave estrangeira para o proprietário.
+        campo_rede_social (str): Nome da chave estrangeira para a rede social.
+        campo_usuario (Optional[str]): Nome do campo que guarda o usuário na
+        rede social, ou None quando a associação não armazena usuário.
+    """
+
+    def __init__(
+        self,
+        associacao_model: type[models.Model],
+        campo_proprietario: str,
+        campo_rede_social: str = 'rede_social',
+        campo_usuario: Optional[str] = None
+    ):
+        self.associacao_model = associacao_model
+        self.campo_proprietario = campo_proprietario
+        self.campo_rede_social = campo_rede_social
+        self.campo_usuario = campo_usuario
+
+    def sincronizar(
+        self, proprietario: models.Model, redes_sociais: Dict[int, Optional[str]]
+    ) -> Dict[str, int]:
+        """
+        Aplica as redes sociais informadas ao proprietário.
+
+        Args:
+            proprietario (models.Model): Instância da pessoa física ou jurídica.
+            redes_sociais (Dict[int, Optional[str]]): Dicionário de ID da rede
+            social e nome de usuário. Redes existentes que não estiverem no
+            dicionário são removidas.
+
+        Returns:
+            Dict[str, int]: Quantidade de associações criadas, atualizadas e
+            removidas.
+
+        Raises:
+            EntityNotFoundException: Se alguma rede social informada não existir.
+        """
+        coluna_rede_social = f'{self.campo_rede_social}_id'
+
+        existentes = {
+            getattr(associacao, coluna_rede_social): associacao
+            for associacao in self.associacao_model.objects.filter(
+                **{self.campo_proprietario: proprietario}
+            )
+        }
+
+        novas_ids = set(redes_sociais) - set(existentes)
+        if novas_ids:
+            encontradas = set(
+                RedeSocialModel.objects.filter(id__in=novas_ids)
+                .values_list('id', flat=True)
+            )
+            inexistentes = novas_ids - encontradas
+            if inexistentes:
+                raise EntityNotFoundException(
+                    f"Redes sociais não encontradas: {sorted(inexistentes)}."
+                )
+
+        a_criar = []
+        a_atualizar = []
+        for rede_social_id, usuario in redes_sociais.items():
+            associacao = existentes.get(rede_social_id)
+            if associacao is None:
+                valores = {
+                    self.campo_proprietario: proprietario,
+                    coluna_rede_social: rede_social_id,
+                }
+                if self.campo_usuario:
+                    valores[self.campo_usuario] = usuario
+                a_criar.append(self.associacao_model(**valores))
+            elif self.campo_usuario and getattr(associacao, self.campo_usuario) != usuario:
+                setattr(associacao, self.campo_usuario, usuario)
+                a_atualizar.append(associacao)
+
+        a_remover = [
+            associacao.pk for rede_social_id, associacao in existentes.items()
+            if rede_social_id not in redes_sociais
+        ]
+
+        if a_criar:
+            self.associacao_model.objects.bulk_create(a_criar)
+        if a_atualizar:
+            self.associacao_model.objects.bulk_update(a_atualizar, [self.campo_usuario])
+        if a_remover:
+            self.associacao_model.objects.filter(pk__in=a_remover).delete()
+
+        return {
+            'criadas': len(a_criar),
+            'atualizadas': len(a_atualizar),
+            'removidas': len(a_remover),
+        }
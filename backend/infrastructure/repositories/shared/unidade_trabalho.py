@@ -0,0 +1,273 @@
+"""
+Módulo responsável pela unidade de trabalho (unit of work) e pelo mapa de
+identidade (identity map) dos repositórios.
+
+A unidade de trabalho acompanha, durante uma requisição, as instâncias de
+models carregadas pelos repositórios:
+
+    - o mapa de identidade garante que cada linha, identificada por
+    (model, pk), seja carregada uma única vez; chamadas repetidas a
+    `get_by_id` devolvem a mesma instância, sem nova consulta;
+    - o estado de cada instância é fotografado ao ser carregado, de modo que
+    as alterações feitas pelos serviços são detectadas sem chamadas
+    explícitas;
+    - `concluir` grava todas as inclusões, alterações e exclusões em uma
+    única transação. Inclusões e alterações são gravadas instância a
+    instância com `save` (as alterações, apenas nos campos alterados), para
+    que as normalizações de `Model.save` e os sinais `post_save`, como a
+    invalidação do CacheReferencia, sejam aplicados.
+
+A conclusão é explícita: o caso de uso chama `concluir` quando as alterações
+devem ser gravadas. Alterações em instâncias do mapa que não forem concluídas
+são descartadas ao final da requisição.
+
+Classes:
+    UnidadeDeTrabalho: Mapa de identidade e rastreamento de alterações.
+
+Funções:
+    unidade_trabalho_atual: Retorna a unidade de trabalho da requisição atual.
+    ativar_unidade_trabalho: Define a unidade de trabalho do contexto atual.
+    desativar_unidade_trabalho: Restaura a unidade de trabalho anterior.
+"""
+from collections import defaultdict
+from contextvars import ContextVar, Token
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from django.db import models, transaction
+from django.utils.timezone import now
+from domain.shared.exceptions.entity_not_found_exception import (
+                                            EntityNotFoundException)
+from domain.shared.exceptions.operation_failed_exception import (
+                                            OperationFailedException)
+from infrastructure.mixins.audit import AuditMixin
+from infrastructure.mixins.softdelete import SoftDeleteMixin
+
+_unidade_atual: ContextVar[Optional['UnidadeDeTrabalho']] = ContextVar(
+    'unidade_trabalho', default=None
+)
+
+Chave = Tuple[type, Hashable]
+
+
+def unidade_trabalho_atual() -> Optional['UnidadeDeTrabalho']:
+    """
+    Retorna a unidade de trabalho ativa no contexto atual (requisição,
+    comando ou tarefa), ou None se não houver.
+    """
+    return _unidade_atual.get()
+
+
+def ativar_unidade_trabalho(unidade: Optional['UnidadeDeTrabalho']) -> Token:
+    """
+    Define a unidade de trabalho do contexto atual.
+
+    Returns:
+        Token: Token para restaurar o contexto anterior com
+        `desativar_unidade_trabalho`.
+    """
+    return _unidade_atual.set(unidade)
+
+
+def desativar_unidade_trabalho(token: Token) -> None:
+    """Restaura a unidade de trabalho anterior à ativação do token."""
+    _unidade_atual.reset(token)
+
+
+class UnidadeDeTrabalho:
+    """
+    Mapa de identidade e rastreamento de alterações de uma requisição.
+
+    As instâncias devolvidas são compartilhadas por todos os repositórios que
+    usam a mesma unidade; as alterações feitas nelas são gravadas quando o
+    caso de uso chama `concluir`.
+    """
+
+    def __init__(self):
+        self._mapa: Dict[Chave, models.Model] = {}
+        self._fotografias: Dict[Chave, Dict[str, object]] = {}
+        self._novas: List[models.Model] = []
+        self._removidas: Dict[Chave, models.Model] = {}
+
+    # Mapa de identidade
+
+    def obter(self, model: type[models.Model], pk: Hashable) -> models.Model:
+        """
+        Retorna a instância de `model` com a chave `pk`, consultando o banco
+        apenas na primeira vez.
+
+        Raises:
+            EntityNotFoundException: Se a instância não existir.
+        """
+        instancia = self._mapa.get((model, pk))
+        if instancia is None:
+            try:
+                instancia = self.registrar(model._default_manager.get(pk=pk))
+            except model.DoesNotExist as exc:
+                raise EntityNotFoundException(
+                    f"{model.__name__} com ID {pk} não encontrado(a)."
+                ) from exc
+        return instancia
+
+    def obter_varios(
+        self, model: type[models.Model], pks: Iterable[Hashable]
+    ) -> List[models.Model]:
+        """
+        Retorna as instâncias de `model` com as chaves informadas, na ordem
+        informada, carregando as ausentes do mapa em uma única consulta.
+        Chaves inexistentes no banco são ignoradas.
+        """
+        pks = list(dict.fromkeys(pks))
+        faltantes = [pk for pk in pks if (model, pk) not in self._mapa]
+        if faltantes:
+            for instancia in model._default_manager.filter(pk__in=faltantes):
+                self.registrar(instancia)
+        return [self._mapa[(model, pk)] for pk in pks if (model, pk) in self._mapa]
+
+    def registrar(self, instancia: models.Model) -> models.Model:
+        """
+        Registra uma instância carregada fora da unidade (por exemplo, por um
+        queryset com filtros próprios).
+
+        Returns:
+            models.Model: A instância já mapeada para a mesma linha, se houver,
+            preservando a identidade; caso contrário, a própria instância.
+        """
+        chave = self._chave(instancia)
+        existente = self._mapa.get(chave)
+        if existente is not None:
+            return existente
+        self._mapa[chave] = instancia
+        self._fotografias[chave] = self._fotografar(instancia)
+        return instancia
+
+    # Alterações
+
+    def adicionar(self, instancia: models.Model) -> None:
+        """Agenda a inclusão de uma nova instância na conclusão da unidade."""
+        self._novas.append(instancia)
+
+    def remover(self, instancia: models.Model) -> None:
+        """
+        Agenda a exclusão da instância na conclusão da unidade. Models com
+        SoftDeleteMixin são excluídas logicamente.
+        """
+        if instancia.pk is None:
+            self._novas = [nova for nova in self._novas if nova is not instancia]
+            return
+        registrada = self.registrar(instancia)
+        self._removidas[self._chave(registrada)] = registrada
+
+    def alteradas(self) -> List[Tuple[models.Model, List[str]]]:
+        """
+        Retorna as instâncias do mapa alteradas desde o carregamento, com os
+        nomes dos campos alterados.
+        """
+        alteradas = []
+        for chave, instancia in self._mapa.items():
+            if chave in self._removidas and not isinstance(instancia, SoftDeleteMixin):
+                continue
+            fotografia = self._fotografias[chave]
+            campos = [
+                campo.name for campo in instancia._meta.concrete_fields
+                if not campo.primary_key
+                and getattr(instancia, campo.attname) != fotografia[campo.attname]
+            ]
+            if campos:
+                alteradas.append((instancia, campos))
+        return alteradas
+
+    @property
+    def tem_pendencias(self) -> bool:
+        """Indica se há inclusões, alterações ou exclusões a gravar."""
+        return bool(self._novas or self._removidas or self.alteradas())
+
+    def concluir(self, user=None) -> None:
+        """
+        Grava as inclusões, alterações e exclusões pendentes em uma única
+        transação.
+
+        Args:
+            user: Usuário registrado nos campos de auditoria e de exclusão
+            lógica, quando autenticado.
+
+        Raises:
+            OperationFailedException: Se a gravação falhar; nada é gravado.
+        """
+        autenticado = user if getattr(user, 'is_authenticated', False) else None
+        momento = now()
+
+        for instancia in self._removidas.values():
+            if isinstance(instancia, SoftDeleteMixin):
+                instancia.is_deleted = True
+                instancia.deleted_at = momento
+                if autenticado:
+                    instancia.deleted_by = autenticado
+
+        try:
+            with transaction.atomic():
+                self._gravar_novas(autenticado)
+                self._gravar_alteradas(autenticado)
+                self._gravar_removidas()
+        except Exception as e:
+            raise OperationFailedException(
+                f"Erro ao concluir a unidade de trabalho: {str(e)}"
+            ) from e
+
+        for instancia in self._novas:
+            if instancia.pk is not None:
+                self.registrar(instancia)
+        for chave in [c for c, i in self._removidas.items()
+                      if not isinstance(i, SoftDeleteMixin)]:
+            self._mapa.pop(chave, None)
+            self._fotografias.pop(chave, None)
+        self._novas = []
+        self._removidas = {}
+        for chave, instancia in self._mapa.items():
+            self._fotografias[chave] = self._fotografar(instancia)
+
+    def descartar(self) -> None:
+        """Esquece o mapa e as alterações pendentes, sem gravá-las."""
+        self._mapa.clear()
+        self._fotografias.clear()
+        self._novas = []
+        self._removidas = {}
+
+    # Auxiliares
+
+    def _gravar_novas(self, user) -> None:
+        for instancia in self._novas:
+            if user and isinstance(instancia, AuditMixin):
+                instancia.created_by = user
+                instancia.updated_by = user
+            instancia.save()
+
+    def _gravar_alteradas(self, user) -> None:
+        for instancia, campos in self.alteradas():
+            # save(update_fields=...) só aplica auto_now aos campos listados
+            campos += [
+                campo.name for campo in instancia._meta.concrete_fields
+                if getattr(campo, 'auto_now', False)
+            ]
+            if user and isinstance(instancia, AuditMixin):
+                instancia.updated_by = user
+                campos.append('updated_by')
+            instancia.save(update_fields=sorted(set(campos)))
+
+    def _gravar_removidas(self) -> None:
+        por_model = defaultdict(list)
+        for (model, pk), instancia in self._removidas.items():
+            if isinstance(instancia, SoftDeleteMixin):
+                continue  # Gravadas como alteração de is_deleted
+            por_model[model].append(pk)
+        for model, pks in por_model.items():
+            model._base_manager.filter(pk__in=pks).delete()
+
+    @staticmethod
+    def _chave(instancia: models.Model) -> Chave:
+        return (type(instancia), instancia.pk)
+
+    @staticmethod
+    def _fotografar(instancia: models.Model) -> Dict[str, object]:
+        return {
+            campo.attname: getattr(instancia, campo.attname)
+            for campo in instancia._meta.concrete_fields
+        }
@@ -0,0 +1,52 @@
+"""
+Receptores de sinais que mantêm o vetor da busca textual dos posts
+atualizado: ao salvar um post, ao alterar as suas tags e ao renomear uma
+tag. O vetor é gravado com uma instrução UPDATE, sem salvar o post
+novamente, na mesma transação da alteração.
+
+No admin, o post é salvo antes das suas tags; o vetor é recalculado nas duas
+etapas.
+
+Os receptores são conectados em InfrastructureConfig.ready.
+"""
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+from infrastructure.models.blog.post import Post
+from infrastructure.models.blog.tag_post import TagPost
+from infrastructure.repositories.blog.busca_posts import DjangoBuscaPostsRepository
+
+
+@receiver(post_save, sender=Post)
+def atualizar_vetor_post(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Recalcula o vetor do post salvo, se algum campo indexado puder ter mudado."""
+    if raw:
+        return
+    if update_fields is not None and not {'title', 'content'} & set(update_fields):
+        return
+    DjangoBuscaPostsRepository().atualizar_vetores([instance.pk])
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def atualizar_vetor_tags_post(sender, instance, action, reverse, pk_set, **kwargs):
+    """Recalcula o vetor dos posts cujas tags foram alteradas."""
+    if reverse and action == 'pre_clear':
+        # Ao limpar os posts de uma tag, o sinal posterior não informa os posts
+        instance._posts_busca = list(
+            sender.objects.filter(tagpost_id=instance.pk).values_list('post_id', flat=True)
+        )
+    elif action in ('post_add', 'post_remove'):
+        DjangoBuscaPostsRepository().atualizar_vetores(pk_set if reverse else [instance.pk])
+    elif action == 'post_clear':
+        DjangoBuscaPostsRepository().atualizar_vetores(
+            instance.__dict__.pop('_posts_busca', []) if reverse else [instance.pk]
+        )
+
+
+@receiver(post_save, sender=TagPost)
+def atualizar_vetor_posts_tag(sender, instance, created, raw=False, **kwargs):
+    """Recalcula o vetor dos posts da tag salva, cujo nome pode ter mudado."""
+    if created or raw:
+        return
+    DjangoBuscaPostsRepository().atualizar_vetores(
+        Post.tags.through.objects.filter(tagpost_id=instance.pk).values_list('post_id', flat=True)
+    )
@@ -0,0 +1,22 @@
+"""
+Receptor de sinal que renderiza o conteúdo do post quando ele é salvo (o que
+inclui a publicação), gravando o HTML sanitizado e os campos derivados no
+próprio post. Conteúdos inalterados, identificados pelo hash, não são
+renderizados de novo.
+
+O receptor é conectado em InfrastructureConfig.ready.
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from infrastructure.models.blog.post import Post
+from infrastructure.repositories.blog.conteudo_post import DjangoConteudoPostRepository
+
+
+@receiver(post_save, sender=Post)
+def renderizar_conteudo_post(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Renderiza o conteúdo do post salvo, se ele puder ter mudado."""
+    if raw:
+        return
+    if update_fields is not None and 'content' not in update_fields:
+        return
+    DjangoConteudoPostRepository().atualizar(instance)
@@ -0,0 +1,108 @@
+"""
+Receptores de sinais que mantêm os contadores de engajamento de posts.
+
+Cada criação ou exclusão de VisualizacaoPost, PostReacao, VotacaoPost e
+CompartilhamentoPost incrementa ou decrementa o contador correspondente na
+mesma transação do evento; visualizações também atualizam o sketch de
+visitantes únicos do dia. Comentários salvos individualmente (ex.: pelo
+formulário do admin) mantêm o contador de comentários aprovados.
+
+Gravações em lote (`bulk_create`, `update`), que não disparam sinais, devem
+chamar EngajamentoPostRepository.incrementar_varios diretamente, como fazem
+a ingestão de visualizações e a moderação de comentários em massa.
+
+Os receptores são conectados em InfrastructureConfig.ready.
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+from domain.blog.value_objects.comentario_moderacao import STATUS_APROVADO
+from infrastructure.models.blog.comentario_post import ComentarioPost
+from infrastructure.models.blog.compartilhamento_post import CompartilhamentoPost
+from infrastructure.models.blog.contador_engajamento_post import (
+    METRICA_COMENTARIOS_APROVADOS, METRICA_COMPARTILHAMENTOS,
+    METRICA_VISUALIZACOES)
+from infrastructure.models.blog.post_reacao import PostReacao
+from infrastructure.models.blog.visualizacao_post import VisualizacaoPost
+from infrastructure.models.blog.votacao_post import VotacaoPost
+from infrastructure.repositories.blog.engajamento_post import (
+    METRICA_POR_VOTO, EngajamentoPostRepository, metrica_reacao)
+from infrastructure.repositories.blog.visitantes_unicos import (
+    DjangoVisitantesUnicosRepository, identificar_visitante)
+
+_repositorio = EngajamentoPostRepository()
+
+
+def _metrica(instancia) -> str:
+    if isinstance(instancia, VisualizacaoPost):
+        return METRICA_VISUALIZACOES
+    if isinstance(instancia, CompartilhamentoPost):
+        return METRICA_COMPARTILHAMENTOS
+    if isinstance(instancia, PostReacao):
+        return metrica_reacao(instancia.reacao_tipo)
+    if isinstance(instancia, ComentarioPost):
+        return METRICA_COMENTARIOS_APROVADOS if instancia.status == STATUS_APROVADO else None
+    return METRICA_POR_VOTO.get(instancia.voto)
+
+
+@receiver(post_save, sender=VisualizacaoPost)
+@receiver(post_save, sender=CompartilhamentoPost)
+@receiver(post_save, sender=PostReacao)
+@receiver(post_save, sender=VotacaoPost)
+@receiver(post_save, sender=ComentarioPost)
+def contar_evento_criado(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
+    """Incrementa o contador do evento criado."""
+    if created and _metrica(instance):
+        _repositorio.incrementar(instance.post_id, _metrica(instance))
+
+
+@receiver(post_delete, sender=VisualizacaoPost)
+@receiver(post_delete, sender=CompartilhamentoPost)
+@receiver(post_delete, sender=PostReacao)
+@receiver(post_delete, sender=VotacaoPost)
+@receiver(post_delete, sender=ComentarioPost)
+def descontar_evento_removido(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Decrementa o contador do evento removido."""
+    if _metrica(instance):
+        _repositorio.incrementar(instance.post_id, _metrica(instance), -1)
+
+
+@receiver(pre_save, sender=VotacaoPost)
+@receiver(pre_save, sender=PostReacao)
+@receiver(pre_save, sender=ComentarioPost)
+def transferir_evento_alterado(sender, instance, **kwargs):
+    """
+    Move a contagem entre métricas quando um voto muda de positivo para
+    negativo (ou vice-versa), uma reação muda de tipo ou um comentário é
+    aprovado ou deixa de estar aprovado.
+    """
+    if instance.pk is None:
+        return
+    anterior = sender.objects.filter(pk=instance.pk).first()
+    if anterior is None:
+        return
+    metrica_anterior, metrica_nova = _metrica(anterior), _metrica(instance)
+    if metrica_anterior == metrica_nova and anterior.post_id == instance.post_id:
+        return
+    incrementos = {}
+    if metrica_anterior:
+        incrementos[(anterior.post_id, metrica_anterior)] = -1
+    if metrica_nova:
+        chave = (instance.post_id, metrica_nova)
+        incrementos[chave] = incrementos.get(chave, 0) + 1
+    _repositorio.incrementar_varios(incrementos)
+
+
+@receiver(post_save, sender=VisualizacaoPost)
+def registrar_visitante(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
+    """Adiciona o visitante ao sketch de visitantes únicos do dia."""
+    if not created:
+        return
+    visitante = identificar_visitante(
+        instance.pessoa_fisica_id,
+        instance.localizacao.ip_address if instance.localizacao_id else None,
+    )
+    if visitante:
+        DjangoVisitantesUnicosRepository().registrar_lote([
+            (instance.post_id, timezone.localdate(instance.data_visualizacao), visitante)
+        ])
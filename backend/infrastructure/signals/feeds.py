@@ -0,0 +1,110 @@
+"""
+Receptores de sinais que agendam a regeneração dos feeds cujo escopo foi
+alterado: ao salvar ou excluir um post (incluindo o blog anterior de um post
+movido para outro blog), ao alterar as suas tags e ao alterar um blog, as
+categorias de um blog, uma tag ou uma categoria. Os feeds são
+gerados após o commit, uma única vez por escopo e por transação (veja
+DjangoFeedsRepository.marcar_alterados).
+
+Os receptores são conectados em InfrastructureConfig.ready.
+"""
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_delete, pre_save)
+from django.dispatch import receiver
+from infrastructure.models.blog.blog import Blog
+from infrastructure.models.blog.categoria_post import CategoriaPost
+from infrastructure.models.blog.feed_gerado import (
+    ESCOPO_BLOG, ESCOPO_CATEGORIA, ESCOPO_TAG)
+from infrastructure.models.blog.post import Post
+from infrastructure.models.blog.tag_post import TagPost
+from infrastructure.repositories.blog.feeds import DjangoFeedsRepository
+
+
+@receiver(pre_save, sender=Post)
+def guardar_blog_anterior_feeds(sender, instance, raw=False, **kwargs):
+    """Guarda o blog anterior do post, se ele estiver sendo movido para outro blog."""
+    if raw or instance.pk is None:
+        return
+    blog_id = Post.objects.all_with_deleted().filter(pk=instance.pk).values_list(
+        'blog_id', flat=True
+    ).first()
+    if blog_id is not None and blog_id != instance.blog_id:
+        instance._blog_anterior_feeds = blog_id
+
+
+@receiver(post_save, sender=Post)
+def marcar_feeds_post(sender, instance, raw=False, **kwargs):
+    """
+    Agenda a regeneração dos feeds do post salvo e, se ele mudou de blog, dos
+    feeds do blog anterior e das suas categorias.
+    """
+    if raw:
+        return
+    repository = DjangoFeedsRepository()
+    blog_anterior = instance.__dict__.pop('_blog_anterior_feeds', None)
+    escopos = repository.escopos_blogs({blog_anterior}) if blog_anterior else ()
+    repository.marcar_alterados(escopos, post_ids=[instance.pk])
+
+
+@receiver(pre_delete, sender=Post)
+def marcar_feeds_post_excluido(sender, instance, **kwargs):
+    """Agenda a regeneração dos feeds do post, antes que as suas tags sejam removidas."""
+    repository = DjangoFeedsRepository()
+    repository.marcar_alterados(repository.escopos_posts({instance.pk}))
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def marcar_feeds_tags_post(sender, instance, action, reverse, pk_set, **kwargs):
+    """Agenda a regeneração dos feeds das tags adicionadas ou removidas de posts."""
+    _marcar_relacao(sender, instance, action, reverse, pk_set, ESCOPO_TAG, 'post_id', 'tagpost_id')
+
+
+@receiver(m2m_changed, sender=Blog.categorias.through)
+def marcar_feeds_categorias_blog(sender, instance, action, reverse, pk_set, **kwargs):
+    """Agenda a regeneração dos feeds das categorias adicionadas ou removidas de blogs."""
+    _marcar_relacao(
+        sender, instance, action, reverse, pk_set, ESCOPO_CATEGORIA, 'blog_id', 'categoriapost_id'
+    )
+
+
+def _marcar_relacao(sender, instance, action, reverse, pk_set, escopo, campo_origem, campo_escopo):
+    """
+    Agenda a regeneração dos feeds dos escopos (tags ou categorias) cuja
+    relação muda. Quando a relação é alterada a partir do escopo, o escopo é
+    a própria instância.
+    """
+    if reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            DjangoFeedsRepository().marcar_alterados([(escopo, instance.pk)])
+    elif action == 'pre_clear':
+        # O sinal posterior à limpeza não informa os escopos removidos
+        instance._escopos_feeds = list(
+            sender.objects.filter(**{campo_origem: instance.pk}).values_list(campo_escopo, flat=True)
+        )
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        escopo_ids = pk_set if action != 'post_clear' else instance.__dict__.pop('_escopos_feeds', [])
+        DjangoFeedsRepository().marcar_alterados((escopo, pk) for pk in escopo_ids)
+
+
+@receiver(post_save, sender=Blog)
+@receiver(post_delete, sender=Blog)
+def marcar_feeds_blog(sender, instance, raw=False, **kwargs):
+    """Agenda a regeneração dos feeds do blog alterado ou excluído."""
+    if not raw:
+        DjangoFeedsRepository().marcar_alterados([(ESCOPO_BLOG, instance.pk)])
+
+
+@receiver(post_save, sender=TagPost)
+@receiver(post_delete, sender=TagPost)
+def marcar_feeds_tag(sender, instance, raw=False, **kwargs):
+    """Agenda a regeneração dos feeds da tag alterada ou excluída."""
+    if not raw:
+        DjangoFeedsRepository().marcar_alterados([(ESCOPO_TAG, instance.pk)])
+
+
+@receiver(post_save, sender=CategoriaPost)
+@receiver(post_delete, sender=CategoriaPost)
+def marcar_feeds_categoria(sender, instance, raw=False, **kwargs):
+    """Agenda a regeneração dos feeds da categoria alterada ou excluída."""
+    if not raw:
+        DjangoFeedsRepository().marcar_alterados([(ESCOPO_CATEGORIA, instance.pk)])
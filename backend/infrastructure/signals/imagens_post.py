@@ -0,0 +1,37 @@
+"""
+Receptores de sinais que mantêm as versões redimensionadas (derivadas) das
+imagens dos posts: ao salvar uma imagem cujo arquivo mudou, as derivadas são
+geradas após o commit, em segundo plano; ao excluir uma imagem, os arquivos
+das suas derivadas são removidos do storage após o commit.
+
+Os receptores são conectados em InfrastructureConfig.ready.
+"""
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+from infrastructure.models.blog.derivada_imagem_post import DerivadaImagemPost
+from infrastructure.models.blog.imagem_post import ImagemPost
+from infrastructure.repositories.blog.imagens_post import DjangoImagensPostRepository
+
+
+@receiver(post_save, sender=ImagemPost)
+def agendar_derivadas_imagem(sender, instance, raw=False, **kwargs):
+    """Agenda a geração das derivadas da imagem, se o seu arquivo mudou."""
+    if raw or not instance.imagem or instance.imagem.name == instance.origem_derivadas:
+        return
+    transaction.on_commit(
+        partial(DjangoImagensPostRepository().agendar, instance.pk), robust=True
+    )
+
+
+@receiver(pre_delete, sender=ImagemPost)
+def excluir_derivadas_imagem(sender, instance, **kwargs):
+    """Agenda a remoção dos arquivos das derivadas da imagem excluída."""
+    nomes = list(
+        DerivadaImagemPost.objects.filter(imagem_id=instance.pk).values_list('arquivo', flat=True)
+    )
+    if nomes:
+        transaction.on_commit(
+            partial(DjangoImagensPostRepository().excluir_arquivos, nomes), robust=True
+        )
@@ -0,0 +1,77 @@
+"""
+Receptores de sinais que alimentam o motor de tendências com os eventos de
+engajamento criados individualmente (visualizações, reações, votos e
+compartilhamentos) e com os comentários salvos individualmente que passam a
+estar aprovados; comentários aguardando moderação não contam. Os eventos são
+registrados somente após a confirmação da transação. Um post movido para
+outro blog tem a sua pontuação transferida para os rankings do novo blog.
+
+A ingestão em lote de visualizações registra seus eventos diretamente em
+VisualizacaoPostRepository.gravar_lote, e a moderação de comentários em massa
+em DjangoModeracaoComentariosRepository.alterar_status.
+
+Os receptores são conectados em InfrastructureConfig.ready.
+"""
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+from domain.blog.value_objects.comentario_moderacao import STATUS_APROVADO
+from infrastructure.models.blog.comentario_post import ComentarioPost
+from infrastructure.models.blog.compartilhamento_post import CompartilhamentoPost
+from infrastructure.models.blog.post import Post
+from infrastructure.models.blog.post_reacao import PostReacao
+from infrastructure.models.blog.visualizacao_post import VisualizacaoPost
+from infrastructure.models.blog.votacao_post import VotacaoPost
+from infrastructure.repositories.blog.tendencias import (
+    EVENTO_COMENTARIO, EVENTO_COMPARTILHAMENTO, EVENTO_REACAO,
+    EVENTO_VISUALIZACAO, EVENTO_VOTO, MotorTendencias)
+
+EVENTO_POR_MODEL = {
+    VisualizacaoPost: EVENTO_VISUALIZACAO,
+    PostReacao: EVENTO_REACAO,
+    VotacaoPost: EVENTO_VOTO,
+    CompartilhamentoPost: EVENTO_COMPARTILHAMENTO,
+}
+
+
+@receiver(post_save, sender=VisualizacaoPost)
+@receiver(post_save, sender=PostReacao)
+@receiver(post_save, sender=VotacaoPost)
+@receiver(post_save, sender=CompartilhamentoPost)
+def registrar_evento_tendencia(sender, instance, created, **kwargs):
+    """Registra o evento criado no motor de tendências após o commit."""
+    if created:
+        transaction.on_commit(
+            partial(MotorTendencias.padrao().registrar, instance.post_id, EVENTO_POR_MODEL[sender]),
+            using=kwargs.get('using'),
+        )
+
+
+@receiver(pre_save, sender=ComentarioPost)
+def guardar_status_anterior_tendencia(sender, instance, raw=False, **kwargs):
+    """Guarda o status anterior do comentário alterado."""
+    if raw or instance.pk is None:
+        return
+    instance._status_anterior_tendencia = sender.objects.filter(pk=instance.pk).values_list(
+        'status', flat=True
+    ).first()
+
+
+@receiver(post_save, sender=ComentarioPost)
+def registrar_comentario_aprovado(sender, instance, raw=False, **kwargs):
+    """Registra o comentário no motor de tendências quando ele passa a estar aprovado."""
+    anterior = instance.__dict__.pop('_status_anterior_tendencia', None)
+    if raw or instance.status != STATUS_APROVADO or anterior == STATUS_APROVADO:
+        return
+    transaction.on_commit(
+        partial(MotorTendencias.padrao().registrar, instance.post_id, EVENTO_COMENTARIO),
+        using=kwargs.get('using'),
+    )
+
+
+@receiver(post_save, sender=Post)
+def mover_pontuacao_tendencia(sender, instance, created, raw=False, **kwargs):
+    """Transfere a pontuação do post para os rankings do novo blog, se ele mudou de blog."""
+    if not created and not raw:
+        MotorTendencias.padrao().mover_post(instance.pk, instance.blog_id)
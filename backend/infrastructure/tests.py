@@ -1,3 +1,235 @@
-from django.test import TestCase
+"""
+Testes da camada de infraestrutura.
+"""
+import datetime
+import os
+import tempfile
+from uuid import uuid4
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from domain.blog.value_objects.comentario_moderacao import STATUS_AGUARDANDO
+from infrastructure.models.blog.blog import Blog
+from infrastructure.models.blog.comentario_post import ComentarioPost
+from infrastructure.models.blog.post import Post
+from infrastructure.models.marketing.endereco import EnderecoModel
+from infrastructure.models.marketing.pessoa_fisica import PessoaFisicaModel
+from infrastructure.models.marketing.pessoa_fisica_tipo import PessoaFisicaTipoModel
+from infrastructure.models.marketing.usuario_tipo import UsuarioTipoModel
+from infrastructure.models.shared.plugins.categoria_plugin import CategoriaPlugin
+from infrastructure.models.shared.plugins.plugin import PluginModel
+from infrastructure.models.shared.plugins.tag_plugin import TagPluginModel
+from infrastructure.models.shared.plugins.tipo_plugin import TipoPluginModel
+from infrastructure.models.website.site import CustomSite
+from infrastructure.repositories.blog.listagem_posts import (
+    DjangoListagemPostsRepository)
+from infrastructure.repositories.blog.moderacao_comentarios import (
+    DjangoModeracaoComentariosRepository)
+from infrastructure.repositories.shared.ingestao_bufferizada import (
+    reprocessar_spool)
+from infrastructure.repositories.shared.paginacao import paginar_por_chave
+from infrastructure.repositories.shared.plugins.plugin import (
+    DjangoPluginRepository)
 
-# Create your tests here.
+
+class DjangoPluginRepositoryListTest(TestCase):
+    """
+    Garante que a listagem de plugins não sofre de N+1: o número de
+    consultas deve ser o mesmo para qualquer quantidade de plugins.
+    """
+
+    def setUp(self):
+        self.repository = DjangoPluginRepository()
+        self.categoria = CategoriaPlugin.objects.create(nome='Categoria')
+        self.tipo = TipoPluginModel.objects.create(nome='Tipo')
+        self.tags = [
+            TagPluginModel.objects.create(nome=f'tag-{indice}')
+            for indice in range(3)
+        ]
+
+    def _criar_plugins(self, quantidade: int) -> None:
+        for _ in range(quantidade):
+            plugin_model = PluginModel.objects.create(
+                id=uuid4(),
+                nome='Plugin',
+                categoria=self.categoria,
+                tipo_plugin=self.tipo,
+                versao='1.0',
+                caminho_arquivo='plugins/plugin.py',
+            )
+            plugin_model.tags.set(self.tags)
+
+    def _contar_consultas_listagem(self) -> int:
+        with CaptureQueriesContext(connection) as consultas:
+            plugins = self.repository.list()
+        self.assertEqual(len(plugins), PluginModel.objects.count())
+        return len(consultas)
+
+    def test_numero_de_consultas_constante(self):
+        self._criar_plugins(2)
+        consultas_poucos_plugins = self._contar_consultas_listagem()
+
+        self._criar_plugins(20)
+        consultas_muitos_plugins = self._contar_consultas_listagem()
+
+        self.assertEqual(consultas_poucos_plugins, consultas_muitos_plugins)
+
+    def test_relacoes_carregadas_como_ids(self):
+        self._criar_plugins(2)
+
+        for plugin in self.repository.list():
+            self.assertCountEqual(plugin.tags, [tag.pk for tag in self.tags])
+            self.assertEqual(plugin.templates, [])
+            self.assertEqual(plugin.dependencias, [])
+
+
+class PaginacaoPorChaveDataTest(TestCase):
+    """
+    Garante que a paginação por chave de data e hora não repete nem pula
+    itens quando as chaves diferem apenas nos microssegundos.
+    """
+
+    def setUp(self):
+        # Três chaves no mesmo milissegundo
+        base = datetime.datetime(2026, 1, 1, 12, 0, 0, 123000, tzinfo=datetime.timezone.utc)
+        self.ids = []
+        for microssegundos in (100, 200, 300):
+            endereco = EnderecoModel.objects.create(
+                rua='Rua', numero='1', bairro='Centro', cidade='Cidade',
+                estado='SP', cep='01000-000', tipo='residencial',
+            )
+            EnderecoModel.objects.filter(pk=endereco.pk).update(
+                data_inicio=base + datetime.timedelta(microseconds=microssegundos)
+            )
+            self.ids.append(endereco.pk)
+
+    def _percorrer(self, order_by: str) -> list:
+        ids, cursor = [], None
+        for _ in range(len(self.ids) + 1):
+            pagina = paginar_por_chave(
+                EnderecoModel.objects.all(), lambda endereco: endereco.pk,
+                after=cursor, limit=1, order_by=order_by,
+                campos_ordenacao=('data_inicio',),
+            )
+            ids += pagina.itens
+            cursor = pagina.proximo_cursor
+            if cursor is None:
+                break
+        return ids
+
+    def test_crescente_sem_repeticao(self):
+        self.assertEqual(self._percorrer('data_inicio'), self.ids)
+
+    def test_decrescente_sem_omissao(self):
+        self.assertEqual(self._percorrer('-data_inicio'), self.ids[::-1])
+
+
+def _criar_blog():
+    """Cria um blog e o autor dos seus posts."""
+    pessoa_fisica = PessoaFisicaModel.objects.create(
+        username='autor', cpf='52998224725', email='autor@example.com'
+    )
+    autor = PessoaFisicaTipoModel.objects.create(
+        pessoa_fisica=pessoa_fisica,
+        usuario_tipo=UsuarioTipoModel.objects.create(nome='Autor'),
+    )
+    site = CustomSite.objects.create(
+        domain='example.com', name='Exemplo',
+        owner=User.objects.create_user(username='dono'),
+    )
+    return autor, Blog.objects.create(title='Blog', proprietario=pessoa_fisica, site=site)
+
+
+class FilaModeracaoPaginacaoTest(TestCase):
+    """
+    Garante que a fila de moderação percorre os comentários uma única vez,
+    mesmo com datas no mesmo milissegundo e uma página por comentário.
+    """
+
+    def setUp(self):
+        autor, blog = _criar_blog()
+        post = Post.objects.create(
+            title='Post', slug='post', content='<p>Conteúdo</p>', autor=autor, blog=blog
+        )
+        base = datetime.datetime(2026, 1, 1, 12, 0, 0, 123000, tzinfo=datetime.timezone.utc)
+        self.ids = []
+        for microssegundos in (100, 200, 300):
+            comentario = ComentarioPost.objects.create(post=post, comentario='Comentário')
+            ComentarioPost.objects.filter(pk=comentario.pk).update(
+                data_comentario=base + datetime.timedelta(microseconds=microssegundos)
+            )
+            self.ids.append(comentario.pk)
+        self.repository = DjangoModeracaoComentariosRepository()
+
+    def test_pagina_unitaria_percorre_a_fila(self):
+        ids, cursor = [], None
+        for _ in range(len(self.ids) + 1):
+            pagina = self.repository.fila(STATUS_AGUARDANDO, after=cursor, limit=1)
+            ids += [comentario.id for comentario in pagina.itens]
+            cursor = pagina.proximo_cursor
+            if cursor is None:
+                break
+        self.assertEqual(ids, self.ids)
+
+
+class ListagemPostsPaginacaoTest(TestCase):
+    """
+    Garante que a listagem decrescente por data de publicação não omite
+    posts publicados no mesmo milissegundo.
+    """
+
+    def setUp(self):
+        autor, self.blog = _criar_blog()
+        base = datetime.datetime(2026, 1, 1, 12, 0, 0, 123000, tzinfo=datetime.timezone.utc)
+        self.ids = []
+        for microssegundos in (100, 200, 300):
+            post = Post.objects.create(
+                title='Post', slug=f'post-{microssegundos}', content='<p>Conteúdo</p>',
+                autor=autor, blog=self.blog, status='publicado',
+            )
+            Post.objects.filter(pk=post.pk).update(
+                published_date=base + datetime.timedelta(microseconds=microssegundos)
+            )
+            self.ids.append(post.pk)
+
+    def test_pagina_unitaria_lista_todos(self):
+        repository = DjangoListagemPostsRepository()
+        ids, cursor = [], None
+        for _ in range(len(self.ids) + 1):
+            pagina = repository.listar(self.blog.pk, after=cursor, limit=1)
+            ids += [post.post_id for post in pagina.itens]
+            cursor = pagina.proximo_cursor
+            if cursor is None:
+                break
+        self.assertEqual(ids, self.ids[::-1])
+
+
+class IngestaoIsolamentoLoteTest(SimpleTestCase):
+    """
+    Testa se um evento com erro de gravação não impede a gravação dos demais
+    eventos do segmento.
+    """
+
+    def test_somente_evento_com_erro_permanece_no_spool(self):
+        gravados = []
+
+        def gravar_lote(eventos):
+            if any(evento['post_id'] == 7 for evento in eventos):
+                raise ValueError('Post 7 inexistente.')
+            gravados.extend(evento['post_id'] for evento in eventos)
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            # Segmento de um processo encerrado (PID inexistente)
+            caminho = os.path.join(diretorio, 'teste-99999999-abc.pronto')
+            with open(caminho, 'w', encoding='utf-8') as segmento:
+                segmento.writelines(f'{{"post_id": {post_id}}}\n' for post_id in range(20))
+
+            with self.assertLogs('ocorrencias', 'ERROR'):
+                regravados = reprocessar_spool('teste', gravar_lote, diretorio, idade_minima=0)
+
+            self.assertEqual(regravados, 19)
+            self.assertEqual(sorted(gravados), [i for i in range(20) if i != 7])
+            (arquivo,) = os.listdir(diretorio)
+            with open(os.path.join(diretorio, arquivo), encoding='utf-8') as segmento:
+                self.assertEqual(segmento.read(), '{"post_id": 7}\n')
@@ -3,6 +3,11 @@ ASGI config for ritmo_digital project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Requests under EVENTOS_ASGI_PREFIXO (engagement events: views, reactions,
+votes and shares) are served by AplicacaoEventosEngajamento, and requests
+under FEEDS_ASGI_PREFIXO (RSS/Atom/JSON feeds) by AplicacaoFeeds, both
+bypassing the Django/CMS middleware stack; everything else goes to Django.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
@@ -13,4 +18,13 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.ritmo_digital.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# pylint: disable=wrong-import-position
+# Importado após a inicialização do Django (apps e settings carregados)
+from infrastructure.asgi.eventos_engajamento import (  # noqa: E402
+    AplicacaoEventosEngajamento)
+from infrastructure.asgi.feeds import AplicacaoFeeds  # noqa: E402
+from infrastructure.asgi.roteamento import rotear  # noqa: E402
+
+application = rotear(django_application, AplicacaoEventosEngajamento(), AplicacaoFeeds())
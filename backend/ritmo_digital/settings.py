@@ -32,6 +32,10 @@ SECRET_KEY = 'django-insecure-hpt4v(%1w%jv4h@%gnt$sna)9t^07#bkpr^o'
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
+# Registra chamadas, consultas SQL, linhas e tempos de cada método dos
+# repositórios (cabeçalho X-Repositorios e logger 'ocorrencias').
+INSTRUMENTAR_REPOSITORIOS = DEBUG
+
 ALLOWED_HOSTS = []
 
 
@@ -46,6 +50,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sites',
+    'django.contrib.postgres',
     'rest_framework',
     'corsheaders',
     'rest_framework_simplejwt',
@@ -95,11 +100,13 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'infrastructure.middleware.instrumentacao.InstrumentacaoRepositoriosMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'infrastructure.middleware.unidade_trabalho.UnidadeDeTrabalhoMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'cms.middleware.user.CurrentUserMiddleware',
@@ -218,6 +225,18 @@ DATABASES = {
     }
 }
 
+# Cache compartilhado entre os processos (servidor, ASGI e comandos): as
+# invalidações do CacheReferencia e as publicações dos feeds só alcançam os
+# demais processos por meio dele
+# https://docs.djangoproject.com/en/5.1/ref/settings/#caches
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://localhost:6379/1',
+    }
+}
+
 # Validação de senhas
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -285,6 +304,93 @@ CKEDITOR_UPLOAD_PATH = "uploads/"
 # comando para servir o storage python manage.py collectstatic
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# Ingestão bufferizada de eventos de alto volume (visualizações, reações,
+# votos e compartilhamentos de posts). Um segmento do spool cuja gravação
+# falhou INGESTAO_MAX_TENTATIVAS vezes vai para a fila de mensagens mortas
+# (arquivos .morto; veja reprocessar_spool_visualizacoes --mortos).
+INGESTAO_SPOOL_DIR = os.path.join(BASE_DIR, 'spool')
+INGESTAO_TAMANHO_LOTE = 500
+INGESTAO_INTERVALO = 2.0
+INGESTAO_MAX_TENTATIVAS = 10
+
+# Prefixo dos endpoints assíncronos de eventos de engajamento, atendidos pela
+# aplicação ASGI (ritmo_digital/asgi.py) fora da pilha de middlewares.
+EVENTOS_ASGI_PREFIXO = '/eventos/'
+
+# Limite de visualizações registradas por IP nos endpoints de eventos (as
+# reações, votos e compartilhamentos usam o limitador de reações)
+EVENTOS_VISUALIZACOES_LIMITE_POR_JANELA = 120
+EVENTOS_VISUALIZACOES_JANELA_LIMITE = 60
+
+# Feeds RSS/Atom/JSON dos blogs, tags e categorias, atendidos pela aplicação
+# ASGI: prefixo, posts por feed, URLs públicas, validade informada aos
+# leitores (segundos), validade/tamanho dos caches dos feeds serializados
+# (o LRU local é revalidado pelo ETag em FeedGerado ao expirar) e validade do
+# registro de escopos inexistentes
+FEEDS_ASGI_PREFIXO = '/feeds/'
+FEEDS_QUANTIDADE_POSTS = 20
+FEEDS_URL_SITE = 'https://{dominio}'
+FEEDS_URL_POST = 'https://{dominio}/blog/{slug}/'
+FEEDS_MAX_AGE = 60
+FEEDS_TIMEOUT = 86400
+FEEDS_TTL_LOCAL = 5.0
+FEEDS_TAMANHO_CACHE = 1024
+FEEDS_TIMEOUT_AUSENTE = 60
+
+# Versões redimensionadas das imagens dos posts, geradas após o upload por um
+# pool de processos: larguras (px), formatos (o AVIF só é gerado se o Pillow
+# instalado suportá-lo; o JPEG é sempre gerado), qualidade por formato e
+# quantidade de processos
+IMAGENS_POST_LARGURAS = (320, 640, 960, 1280, 1920)
+IMAGENS_POST_FORMATOS = ('avif', 'webp', 'jpeg')
+IMAGENS_POST_QUALIDADE = {'avif': 55, 'webp': 75, 'jpeg': 82}
+IMAGENS_POST_PROCESSOS = 2
+
+# Base local de geolocalização por faixas de IP (CSV, opcionalmente .gz; veja
+# infrastructure/repositories/shared/resources/geoip.py) e tamanho dos LRUs
+# de IPs resolvidos e de localizações canônicas (IP, dia).
+GEOIP_ARQUIVO = os.path.join(BASE_DIR, 'geoip', 'faixas_ip.csv.gz')
+GEOIP_TAMANHO_CACHE = 65536
+LOCALIZACAO_TAMANHO_CACHE = 100000
+
+# Deduplicação e limitação de taxa das reações a posts
+REACOES_JANELA_DEDUPLICACAO = 86400
+REACOES_LIMITE_POR_JANELA = 30
+REACOES_JANELA_LIMITE = 60
+REACOES_LIMITADOR_COMPARTILHADO = False
+
+# Ranking de posts em alta: meia-vida da pontuação (segundos), pesos dos
+# eventos, posts mantidos por blog/site e intervalo entre snapshots
+TENDENCIAS_MEIA_VIDA = 6 * 3600
+TENDENCIAS_PESOS = {
+    'visualizacao': 1.0,
+    'reacao': 3.0,
+    'voto': 2.0,
+    'compartilhamento': 5.0,
+    'comentario': 4.0,
+}
+TENDENCIAS_TAMANHO_TOPK = 50
+TENDENCIAS_INTERVALO = 30.0
+
+# Retenção das partições mensais das tabelas de eventos do blog, em meses
+# completos além do atual (None: sem retenção). Partições mais antigas são
+# apagadas ou, com PARTICIONAMENTO_ARQUIVAR, movidas para o esquema de arquivo
+# (o comando manter_particoes_eventos aceita --arquivar/--no-arquivar).
+PARTICIONAMENTO_RETENCAO_MESES = {
+    'infrastructure_visualizacao_post': 13,
+    'infrastructure_post_reacao': 25,
+    'infrastructure_votacao_post': 25,
+    'infrastructure_compartilhamento_post': 25,
+    'infrastructure_reacao_comentario': 25,
+}
+PARTICIONAMENTO_ARQUIVAR = True
+PARTICIONAMENTO_ESQUEMA_ARQUIVO = 'arquivo_eventos'
+
+# Conteúdo pré-renderizado dos posts: palavras do resumo e velocidade de
+# leitura usada no tempo de leitura (palavras por minuto)
+POST_RESUMO_PALAVRAS = 55
+POST_PALAVRAS_POR_MINUTO = 200
+
 STATICFILES_FINDERS = [
     'django.contrib.staticfiles.finders.FileSystemFinder',
     'django.contrib.staticfiles.finders.AppDirectoriesFinder',